@@ -15,7 +15,7 @@ from . import (
     wf,
 )
 from ._version import __version__, __version_info__
-from .attach import Wrapper, annotate, attach, detach
+from .attach import Wrapper, annotate, attach, attach_all, detach
 from .bundle import LilyPondFormatBundle, SlotContributions
 from .configuration import (
     Configuration,
@@ -676,6 +676,7 @@ __all__ = [
     "activate",
     "annotate",
     "attach",
+    "attach_all",
     "beam",
     "bow_contact_spanner",
     "deactivate",
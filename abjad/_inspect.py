@@ -63,6 +63,75 @@ def _get_annotation_wrappers(ARGUMENT):
     return result
 
 
+def _get_dependent_wrapper(
+    CONTEXT, prototype, offset, *, attributes=None, command=None, ignore=None
+):
+    """
+    Gets (start offset, wrapper) pair of last dependent wrapper of ``CONTEXT``
+    starting no later than ``offset``.
+
+    Skips wrappers for which ``ignore`` returns true.
+
+    Returns none when no dependent wrapper matches.
+    """
+    result = None
+    index = _get_dependent_wrapper_index(CONTEXT)
+    for class_, (offsets, wrappers) in index.items():
+        if not issubclass(class_, prototype):
+            continue
+        i = bisect.bisect_right(offsets, offset)
+        while 0 < i:
+            j = bisect.bisect_left(offsets, offsets[i - 1])
+            for wrapper in wrappers[j:i]:
+                if ignore is not None and ignore(wrapper):
+                    continue
+                if _is_matching_wrapper(wrapper, attributes, command):
+                    break
+            else:
+                i = j
+                continue
+            break
+        else:
+            continue
+        if result is None or result[0] < offsets[j]:
+            result = (offsets[j], wrapper)
+        elif result[0] == offsets[j]:
+            # dependent wrappers of different classes tie at same offset:
+            for wrapper_ in CONTEXT._dependent_wrappers:
+                if wrapper_ is result[1]:
+                    break
+                if wrapper_ is wrapper:
+                    result = (offsets[j], wrapper)
+                    break
+    return result
+
+
+def _get_dependent_wrapper_index(CONTEXT):
+    """
+    Gets dependent wrappers of ``CONTEXT`` indexed by indicator class.
+
+    Each indicator class maps to a pair of parallel lists: sorted start
+    offsets and the wrappers at those offsets (in order of attachment when
+    offsets are equal).
+
+    Index clears whenever offsets of ``CONTEXT`` update; attach and detach
+    maintain index in between.
+    """
+    if CONTEXT._dependent_wrapper_index is None:
+        pairs: typing.Dict = {}
+        for wrapper in CONTEXT._dependent_wrappers:
+            if wrapper.annotation:
+                continue
+            pair = (wrapper.start_offset, wrapper)
+            pairs.setdefault(type(wrapper.indicator), []).append(pair)
+        index = {}
+        for class_, pairs_ in pairs.items():
+            pairs_.sort(key=lambda _: _[0])
+            index[class_] = ([_[0] for _ in pairs_], [_[1] for _ in pairs_])
+        CONTEXT._dependent_wrapper_index = index
+    return CONTEXT._dependent_wrapper_index
+
+
 def _get_duration(ARGUMENT, in_seconds: bool = None):
     if isinstance(ARGUMENT, Component):
         if in_seconds is True:
@@ -97,34 +166,27 @@ def _get_duration_in_seconds(COMPONENT):
 
 
 def _get_effective(
-    COMPONENT, prototype, *, attributes=None, command=None, n=0, unwrap=True
+    COMPONENT,
+    prototype,
+    *,
+    attributes=None,
+    command=None,
+    ignore=None,
+    n=0,
+    unwrap=True,
 ):
     COMPONENT._update_now(indicators=True)
     candidate_wrappers = {}
-    parentage = COMPONENT._get_parentage()
-    enclosing_voice_name = None
-    for component in parentage:
-        if isinstance(component, Voice):
-            if (
-                enclosing_voice_name is not None
-                and component.name != enclosing_voice_name
-            ):
-                continue
-            else:
-                enclosing_voice_name = component.name or id(component)
+    start_offset = None
+    for component in _get_effective_parentage(COMPONENT):
         local_wrappers = []
         for wrapper in component._wrappers:
             if wrapper.annotation:
                 continue
+            if ignore is not None and ignore(wrapper):
+                continue
             if isinstance(wrapper.indicator, prototype):
-                append_wrapper = True
-                if command is not None and wrapper.indicator.command != command:
-                    continue
-                if attributes is not None:
-                    for name, value in attributes.items():
-                        if getattr(wrapper.indicator, name, None) != value:
-                            append_wrapper = False
-                if not append_wrapper:
+                if not _is_matching_wrapper(wrapper, attributes, command):
                     continue
                 local_wrappers.append(wrapper)
         # active indicator takes precendence over inactive indicator
@@ -137,25 +199,40 @@ def _get_effective(
             candidate_wrappers.setdefault(offset, []).append(wrapper)
         if not isinstance(component, Context):
             continue
+        # effective indicator needs only last dependent wrapper at or before
+        # start offset; other values of n need all dependent wrappers
+        if n == 0:
+            if not component._dependent_wrappers:
+                continue
+            if start_offset is None:
+                start_offset = COMPONENT._get_timespan().start_offset
+            pair = _get_dependent_wrapper(
+                component,
+                prototype,
+                start_offset,
+                attributes=attributes,
+                command=command,
+                ignore=ignore,
+            )
+            if pair is not None:
+                offset, wrapper = pair
+                candidate_wrappers.setdefault(offset, []).append(wrapper)
+            continue
         for wrapper in component._dependent_wrappers:
             if wrapper.annotation:
                 continue
+            if ignore is not None and ignore(wrapper):
+                continue
             if isinstance(wrapper.indicator, prototype):
-                append_wrapper = True
-                if command is not None and wrapper.indicator.command != command:
-                    continue
-                if attributes is not None:
-                    for name, value in attributes.items():
-                        if getattr(wrapper.indicator, name, None) != value:
-                            append_wrapper = False
-                if not append_wrapper:
+                if not _is_matching_wrapper(wrapper, attributes, command):
                     continue
                 offset = wrapper.start_offset
                 candidate_wrappers.setdefault(offset, []).append(wrapper)
     if not candidate_wrappers:
         return
+    if start_offset is None:
+        start_offset = COMPONENT._get_timespan().start_offset
     all_offsets = sorted(candidate_wrappers)
-    start_offset = COMPONENT._get_timespan().start_offset
     index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
     if index < 0:
         return
@@ -167,6 +244,27 @@ def _get_effective(
     return wrapper
 
 
+def _get_effective_parentage(COMPONENT):
+    """
+    Gets components whose indicators may be effective for ``COMPONENT``.
+
+    Skips voices named differently than the innermost enclosing voice.
+    """
+    result = []
+    enclosing_voice_name = None
+    for component in COMPONENT._get_parentage():
+        if isinstance(component, Voice):
+            if (
+                enclosing_voice_name is not None
+                and component.name != enclosing_voice_name
+            ):
+                continue
+            else:
+                enclosing_voice_name = component.name or id(component)
+        result.append(component)
+    return result
+
+
 def _get_grace_container(COMPONENT):
     prototype = (
         AfterGraceContainer,
@@ -400,3 +498,40 @@ def _get_timespan(ARGUMENT, in_seconds: bool = False):
         if stop_offset < timespan.stop_offset:
             stop_offset = timespan.stop_offset
     return Timespan(start_offset, stop_offset)
+
+
+def _index_dependent_wrapper(CONTEXT, wrapper):
+    index = CONTEXT._dependent_wrapper_index
+    if index is None or wrapper.annotation:
+        return
+    # reading start offset must not trigger offset update:
+    if not CONTEXT._get_parentage()[-1]._offsets_are_current:
+        CONTEXT._dependent_wrapper_index = None
+        return
+    offset = wrapper.start_offset
+    offsets, wrappers = index.setdefault(type(wrapper.indicator), ([], []))
+    i = bisect.bisect_right(offsets, offset)
+    offsets.insert(i, offset)
+    wrappers.insert(i, wrapper)
+
+
+def _is_matching_wrapper(wrapper, attributes, command):
+    if command is not None and wrapper.indicator.command != command:
+        return False
+    if attributes is not None:
+        for name, value in attributes.items():
+            if getattr(wrapper.indicator, name, None) != value:
+                return False
+    return True
+
+
+def _unindex_dependent_wrapper(CONTEXT, wrapper):
+    index = CONTEXT._dependent_wrapper_index
+    if index is None or type(wrapper.indicator) not in index:
+        return
+    offsets, wrappers = index[type(wrapper.indicator)]
+    for i, wrapper_ in enumerate(wrappers):
+        if wrapper_ is wrapper:
+            del offsets[i]
+            del wrappers[i]
+            break
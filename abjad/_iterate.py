@@ -17,6 +17,12 @@ def _coerce_exclude(exclude):
     return exclude
 
 
+def _is_grace_container(component):
+    if isinstance(component, (score.AfterGraceContainer, score.BeforeGraceContainer)):
+        return True
+    return component.__class__.__name__ == "OnBeatGraceContainer"
+
+
 def _is_unpitched(LEAF):
     if hasattr(LEAF, "written_pitch"):
         return False
@@ -66,104 +72,51 @@ def _iterate_components(
     grace=None,
     reverse=None,
 ):
-    argument = client
     prototype = prototype or score.Component
-    before_grace_container = None
-    after_grace_container = None
     exclude = _coerce_exclude(exclude)
     assert isinstance(exclude, tuple), repr(exclude)
-    if grace is not False and isinstance(argument, score.Leaf):
-        before_grace_container = argument._before_grace_container
-        after_grace_container = argument._after_grace_container
-    if not reverse:
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and before_grace_container
-        ):
-            yield from _iterate_components(
-                before_grace_container,
-                prototype,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
-        if isinstance(argument, prototype):
-            if (
-                grace is None
-                or (grace is True and _inspect._get_grace_container(argument))
-                or (grace is False and not _inspect._get_grace_container(argument))
-            ):
-                if not _should_exclude(argument, exclude):
-                    yield argument
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and after_grace_container
-        ):
-            yield from _iterate_components(
-                after_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
-        if isinstance(argument, collections.abc.Iterable):
-            for item in argument:
-                yield from _iterate_components(
-                    item,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-    else:
+    iterate_grace_containers = (
+        not do_not_iterate_grace_containers and grace is not False
+    )
+    is_grace = False
+    if isinstance(client, score.Component):
+        is_grace = _inspect._get_grace_container(client)
+    # each stack entry is (component, is_grace, graces_are_expanded)
+    stack = [(client, is_grace, False)]
+    while stack:
+        argument, is_grace, graces_are_expanded = stack.pop()
         if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and after_grace_container
+            iterate_grace_containers
+            and not graces_are_expanded
+            and isinstance(argument, score.Leaf)
+            and (argument._before_grace_container or argument._after_grace_container)
         ):
-            yield from _iterate_components(
-                after_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
+            if not reverse:
+                first = argument._before_grace_container
+                last = argument._after_grace_container
+            else:
+                first = argument._after_grace_container
+                last = argument._before_grace_container
+            if last:
+                stack.append((last, True, False))
+            stack.append((argument, is_grace, True))
+            if first:
+                stack.append((first, True, False))
+            continue
         if isinstance(argument, prototype):
-            if (
-                grace is None
-                or (grace is True and _inspect._get_grace_container(argument))
-                or (grace is False and not _inspect._get_grace_container(argument))
-            ):
-                if not _should_exclude(argument, exclude):
+            if grace is None or grace is is_grace:
+                if not exclude or not _should_exclude(argument, exclude):
                     yield argument
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and before_grace_container
-        ):
-            yield from _iterate_components(
-                before_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
-        if isinstance(argument, collections.abc.Iterable):
-            for item in reversed(argument):
-                yield from _iterate_components(
-                    item,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
+        if isinstance(argument, score.Container):
+            if is_grace:
+                items = [(_, True, False) for _ in argument._components]
+            else:
+                items = [
+                    (_, _is_grace_container(_), False) for _ in argument._components
+                ]
+            if not reverse:
+                items.reverse()
+            stack.extend(items)
 
 
 def _iterate_descendants(component, cross_offset=None):
@@ -223,6 +176,40 @@ def _iterate_logical_ties(
                 yield leaves
 
 
+def _make_order_index(root):
+    # positions map component to (index in parent, leaf start, leaf stop)
+    leaves, graces, positions = [], [], {}
+    is_grace = False
+    if isinstance(root, score.Component):
+        is_grace = _inspect._get_grace_container(root)
+    # each stack entry is (component, index_in_parent, is_grace, is_exit)
+    stack = [(root, None, is_grace, False)]
+    while stack:
+        component, index, is_grace, is_exit = stack.pop()
+        if is_exit and isinstance(component, score.Leaf):
+            positions[component] = (index, len(leaves), len(leaves) + 1)
+            leaves.append(component)
+            graces.append(is_grace)
+        elif is_exit:
+            positions[component] = (index, positions[component], len(leaves))
+        elif isinstance(component, score.Leaf):
+            before_grace_container = component._before_grace_container
+            after_grace_container = component._after_grace_container
+            if after_grace_container:
+                stack.append((after_grace_container, None, True, False))
+            stack.append((component, index, is_grace, True))
+            if before_grace_container:
+                stack.append((before_grace_container, None, True, False))
+        else:
+            positions[component] = len(leaves)
+            stack.append((component, index, is_grace, True))
+            for i in reversed(range(len(component._components))):
+                child = component._components[i]
+                is_grace_ = is_grace or _is_grace_container(child)
+                stack.append((child, i, is_grace_, False))
+    return leaves, graces, positions
+
+
 def _get_leaf(ARGUMENT, n: int = 0):
     if n not in (-1, 0, 1):
         message = "n must be -1, 0 or 1:\n"
@@ -245,10 +232,50 @@ def _get_leaf(ARGUMENT, n: int = 0):
     return None
 
 
+def _get_indexed_leaves(
+    CONTAINER, prototype, *, exclude=None, grace=None, reverse=None
+):
+    prototype = prototype or score.Component
+    prototypes = prototype if isinstance(prototype, tuple) else (prototype,)
+    if not all(issubclass(_, score.Leaf) for _ in prototypes):
+        return None
+    root = CONTAINER._get_root()
+    if root._order_index is None:
+        if root is not CONTAINER:
+            return None
+        root._order_index = _make_order_index(root)
+    leaves, graces, positions = root._order_index
+    if CONTAINER not in positions:
+        return None
+    start, stop = positions[CONTAINER][1:]
+    if grace is None:
+        result = leaves[start:stop]
+    else:
+        pairs = zip(leaves[start:stop], graces[start:stop])
+        result = [leaf for leaf, is_grace in pairs if is_grace is grace]
+    if prototype is not score.Leaf:
+        result = [_ for _ in result if isinstance(_, prototype)]
+    if exclude:
+        result = [_ for _ in result if not _should_exclude(_, exclude)]
+    if reverse:
+        result.reverse()
+    return result
+
+
 def _public_iterate_components(
     ARGUMENT, prototype=None, *, exclude=None, grace=None, reverse=None
 ):
     if isinstance(ARGUMENT, score.Container):
+        leaves = _get_indexed_leaves(
+            ARGUMENT,
+            prototype,
+            exclude=_coerce_exclude(exclude),
+            grace=grace,
+            reverse=reverse,
+        )
+        if leaves is not None:
+            yield from leaves
+            return
         for component in _iterate_components(
             ARGUMENT,
             prototype,
@@ -9,16 +9,16 @@ Updates start offsets, stop offsets and indicators everywhere in score.
     implementation of the update manager.
 
 """
-from . import math
+import bisect
+
 from .duration import Duration, Multiplier, Offset
 from .indicators.MetronomeMark import MetronomeMark
 from .indicators.TimeSignature import TimeSignature
 from .iterate import Iteration
 from .obgc import OnBeatGraceContainer
 from .parentage import Parentage
-from .score import AfterGraceContainer, BeforeGraceContainer
+from .score import AfterGraceContainer, BeforeGraceContainer, Container, Context
 from .sequence import Sequence
-from .timespan import AnnotatedTimespan, TimespanList
 
 
 def _get_after_grace_leaf_offsets(leaf):
@@ -64,40 +64,78 @@ def _get_before_grace_leaf_offsets(leaf):
     return start_offset, stop_offset
 
 
+def _get_dirty_offset_index(position, component_to_index):
+    """
+    Gets index of first component to update for dirty ``position``, together
+    with parent whose ancestors (inclusive) also update.
+
+    Dirty position is either a component or a (container, index) pair left
+    behind by removal from container.
+
+    Returns none when dirty position is no longer in score.
+    """
+    if isinstance(position, tuple):
+        container, i = position
+        if id(container) in component_to_index:
+            if i < len(container):
+                return _get_dirty_offset_index(container[i], component_to_index)
+            last = container
+            while getattr(last, "_components", None):
+                last = last._components[-1]
+            index = component_to_index.get(id(last))
+            if index is not None:
+                return index + 1, container
+        position = container
+    for component in position._get_parentage():
+        index = component_to_index.get(id(component))
+        if index is not None:
+            return index, component._parent
+    return None
+
+
 def _get_measure_start_offsets(component):
-    wrappers = []
-    prototype = TimeSignature
+    """
+    Gets sorted measure start offsets of score, cached on score root.
+
+    Cache clears when offsets change or when time signatures attach or detach.
+    """
     root = Parentage(component).root
-    for component_ in _iterate_entire_score(root):
-        wrappers_ = component_._get_indicators(prototype, unwrap=False)
-        wrappers.extend(wrappers_)
-    pairs = []
-    for wrapper in wrappers:
-        component = wrapper.component
-        start_offset = component._get_timespan().start_offset
-        time_signature = wrapper.indicator
-        pair = start_offset, time_signature
-        pairs.append(pair)
-    offset_zero = Offset(0)
-    default_time_signature = TimeSignature((4, 4))
-    default_pair = (offset_zero, default_time_signature)
-    if pairs and not pairs[0] == offset_zero:
-        pairs.insert(0, default_pair)
-    elif not pairs:
-        pairs = [default_pair]
-    pairs.sort(key=lambda x: x[0])
-    score_stop_offset = root._get_timespan().stop_offset
-    dummy_last_pair = (score_stop_offset, None)
-    pairs.append(dummy_last_pair)
-    measure_start_offsets = []
-    for current_pair, next_pair in Sequence(pairs).nwise():
-        current_start_offset, current_time_signature = current_pair
-        next_start_offset, next_time_signature = next_pair
-        measure_start_offset = current_start_offset
-        while measure_start_offset < next_start_offset:
-            measure_start_offsets.append(measure_start_offset)
-            measure_start_offset += current_time_signature.duration
-    return measure_start_offsets
+    if root._measure_start_offsets is None:
+        root._measure_start_offsets = _make_measure_start_offsets(root)
+    return root._measure_start_offsets
+
+
+def _get_offset_index(root):
+    """
+    Gets nongrace components of ``root`` in score order, index of each and
+    grace components paired with index of last nongrace component whose
+    offsets they depend on.
+
+    Caches on root until structural change clears ``root._offset_index``.
+    """
+    if root._offset_index is None:
+        components = list(Iteration(root).components(grace=False))
+        component_to_index = {id(_): i for i, _ in enumerate(components)}
+        graces = []
+        for grace in Iteration(root).components(grace=True):
+            anchor = grace
+            while anchor is not None and id(anchor) not in component_to_index:
+                if getattr(anchor, "_main_leaf", None) is not None:
+                    anchor = anchor._main_leaf
+                else:
+                    anchor = anchor._parent
+            if anchor is None:
+                graces.append((len(components), grace))
+                continue
+            while isinstance(anchor, Container):
+                children = anchor._components
+                children = [_ for _ in children if id(_) in component_to_index]
+                if not children:
+                    break
+                anchor = children[-1]
+            graces.append((component_to_index[id(anchor)], grace))
+        root._offset_index = (components, component_to_index, graces)
+    return root._offset_index
 
 
 def _get_on_beat_grace_leaf_offsets(leaf):
@@ -152,7 +190,53 @@ def _iterate_entire_score(root):
     return components
 
 
+def _make_measure_start_offsets(root):
+    wrappers = []
+    prototype = TimeSignature
+    for component_ in _iterate_entire_score(root):
+        wrappers_ = component_._get_indicators(prototype, unwrap=False)
+        wrappers.extend(wrappers_)
+    pairs = []
+    for wrapper in wrappers:
+        component = wrapper.component
+        start_offset = component._get_timespan().start_offset
+        time_signature = wrapper.indicator
+        pair = start_offset, time_signature
+        pairs.append(pair)
+    offset_zero = Offset(0)
+    default_time_signature = TimeSignature((4, 4))
+    default_pair = (offset_zero, default_time_signature)
+    if pairs and not pairs[0] == offset_zero:
+        pairs.insert(0, default_pair)
+    elif not pairs:
+        pairs = [default_pair]
+    pairs.sort(key=lambda x: x[0])
+    score_stop_offset = root._get_timespan().stop_offset
+    dummy_last_pair = (score_stop_offset, None)
+    pairs.append(dummy_last_pair)
+    measure_start_offsets = []
+    for current_pair, next_pair in Sequence(pairs).nwise():
+        current_start_offset, current_time_signature = current_pair
+        next_start_offset, next_time_signature = next_pair
+        measure_start_offset = current_start_offset
+        while measure_start_offset < next_start_offset:
+            measure_start_offsets.append(measure_start_offset)
+            measure_start_offset += current_time_signature.duration
+    return measure_start_offsets
+
+
 def _make_metronome_mark_map(root):
+    """
+    Makes metronome mark map of score.
+
+    Map is a triple of lists: start offsets of metronome marks (followed by
+    score stop offset); cumulative clocktime offsets at those start offsets;
+    and clocktime multipliers of metronome marks. Start offsets are sorted for
+    bisection.
+
+    Returns empty tuple when score carries no precise metronome mark at
+    offset zero.
+    """
     pairs = []
     all_stop_offsets = set()
     for component in _iterate_entire_score(root):
@@ -166,34 +250,38 @@ def _make_metronome_mark_map(root):
             all_stop_offsets.add(component._stop_offset)
     pairs.sort(key=lambda _: _[0])
     if not pairs:
-        return
+        return ()
     if pairs[0][0] != 0:
-        return
+        return ()
     score_stop_offset = max(all_stop_offsets)
-    timespans = TimespanList()
-    clocktime_start_offset = Offset(0)
-    for left, right in Sequence(pairs).nwise(wrapped=True):
-        metronome_mark = left[-1]
-        start_offset = left[0]
-        stop_offset = right[0]
-        # last timespan
-        if stop_offset == 0:
+    start_offsets, clocktime_offsets, multipliers = [], [Offset(0)], []
+    for i, (start_offset, metronome_mark) in enumerate(pairs):
+        if i + 1 < len(pairs):
+            stop_offset = pairs[i + 1][0]
+        else:
             stop_offset = score_stop_offset
-        duration = stop_offset - start_offset
         multiplier = Multiplier(60, metronome_mark.units_per_minute)
-        clocktime_duration = duration / metronome_mark.reference_duration
-        clocktime_duration *= multiplier
-        timespan = AnnotatedTimespan(
-            start_offset=start_offset,
-            stop_offset=stop_offset,
-            annotation=(clocktime_start_offset, clocktime_duration),
-        )
-        timespans.append(timespan)
-        clocktime_start_offset += clocktime_duration
-    return timespans
-
-
-# TODO: reimplement with some type of bisection
+        multiplier /= metronome_mark.reference_duration
+        clocktime_duration = (stop_offset - start_offset) * multiplier
+        start_offsets.append(start_offset)
+        clocktime_offsets.append(clocktime_offsets[-1] + clocktime_duration)
+        multipliers.append(multiplier)
+    start_offsets.append(score_stop_offset)
+    return start_offsets, clocktime_offsets, multipliers
+
+
+def _to_clocktime_offset(offset, metronome_mark_map):
+    start_offsets, clocktime_offsets, multipliers = metronome_mark_map
+    if start_offsets[-1] < offset:
+        raise Exception(f"can not find {offset} in {start_offsets}.")
+    index = bisect.bisect_right(start_offsets, offset) - 1
+    # score-initial grace music displaces offsets before the first mark:
+    index = max(0, min(index, len(multipliers) - 1))
+    local_offset = offset - start_offsets[index]
+    clocktime_offset = clocktime_offsets[index] + local_offset * multipliers[index]
+    return Offset(clocktime_offset)
+
+
 def _to_measure_number(component, measure_start_offsets):
     component_start_offset = component._get_timespan().start_offset
     displacement = component_start_offset.displacement
@@ -203,17 +291,12 @@ def _to_measure_number(component, measure_start_offsets):
         if displacement < 0 and component_start_offset == 0:
             measure_number = 0
             return measure_number
-    measure_start_offsets = measure_start_offsets[:]
-    measure_start_offsets.append(math.Infinity())
-    pairs = Sequence(measure_start_offsets)
-    pairs = pairs.nwise()
-    for measure_index, pair in enumerate(pairs):
-        if pair[0] <= component_start_offset < pair[-1]:
-            measure_number = measure_index + 1
-            return measure_number
-    message = f"can not find measure number for {repr(component)}:\n"
-    message += f"   {repr(measure_start_offsets)}"
-    raise ValueError(message)
+    measure_number = bisect.bisect_right(measure_start_offsets, component_start_offset)
+    if measure_number == 0:
+        message = f"can not find measure number for {repr(component)}:\n"
+        message += f"   {repr(measure_start_offsets)}"
+        raise ValueError(message)
+    return measure_number
 
 
 def _update_all_indicators(root):
@@ -236,56 +319,31 @@ def _update_all_offsets(root):
     Updating offsets does not update indicators.
     Updating offsets does not update offsets in seconds.
     """
-    on_beat_grace_music = []
-    for component in _iterate_entire_score(root):
-        if isinstance(component, OnBeatGraceContainer) or isinstance(
-            component._parent, OnBeatGraceContainer
-        ):
-            on_beat_grace_music.append(component)
-        else:
-            _update_component_offsets(component)
-            component._offsets_are_current = True
-    for component in on_beat_grace_music:
-        _update_component_offsets(component)
-        component._offsets_are_current = True
+    components, component_to_index, graces = _get_offset_index(root)
+    components = components + [grace for index, grace in graces]
+    _update_components_offsets(components)
+    root._dirty_offset_positions = []
 
 
 def _update_all_offsets_in_seconds(root):
-    _update_all_offsets(root)
-    timespans = _make_metronome_mark_map(root)
+    _update_dirty_offsets(root)
+    if root._metronome_mark_map is None:
+        root._metronome_mark_map = _make_metronome_mark_map(root)
+    metronome_mark_map = root._metronome_mark_map
     for component in _iterate_entire_score(root):
-        _update_clocktime_offsets(component, timespans)
+        _update_clocktime_offsets(component, metronome_mark_map)
         component._offsets_in_seconds_are_current = True
 
 
-def _update_clocktime_offsets(component, timespans):
-    if not timespans:
+def _update_clocktime_offsets(component, metronome_mark_map):
+    if not metronome_mark_map:
+        component._start_offset_in_seconds = None
+        component._stop_offset_in_seconds = None
         return
-    for timespan in timespans:
-        if timespan.start_offset <= component._start_offset < timespan.stop_offset:
-            pair = timespan.annotation
-            clocktime_start_offset, clocktime_duration = pair
-            local_offset = component._start_offset - timespan.start_offset
-            multiplier = local_offset / timespan.duration
-            duration = multiplier * clocktime_duration
-            offset = clocktime_start_offset + duration
-            component._start_offset_in_seconds = Offset(offset)
-        if timespan.start_offset <= component._stop_offset < timespan.stop_offset:
-            pair = timespan.annotation
-            clocktime_start_offset, clocktime_duration = pair
-            local_offset = component._stop_offset - timespan.start_offset
-            multiplier = local_offset / timespan.duration
-            duration = multiplier * clocktime_duration
-            offset = clocktime_start_offset + duration
-            component._stop_offset_in_seconds = Offset(offset)
-            return
-    if component._stop_offset == timespans[-1].stop_offset:
-        pair = timespans[-1].annotation
-        clocktime_start_offset, clocktime_duration = pair
-        offset = clocktime_start_offset + clocktime_duration
-        component._stop_offset_in_seconds = Offset(offset)
-        return
-    raise Exception(f"can not find {offset} in {timespans}.")
+    start_offset = _to_clocktime_offset(component._start_offset, metronome_mark_map)
+    stop_offset = _to_clocktime_offset(component._stop_offset, metronome_mark_map)
+    component._start_offset_in_seconds = start_offset
+    component._stop_offset_in_seconds = stop_offset
 
 
 def _update_component_offsets(component):
@@ -346,6 +404,69 @@ def _update_component_offsets(component):
     component._timespan._stop_offset = stop_offset
 
 
+def _update_components_offsets(components):
+    on_beat_grace_music = []
+    for component in components:
+        if isinstance(component, OnBeatGraceContainer) or isinstance(
+            component._parent, OnBeatGraceContainer
+        ):
+            on_beat_grace_music.append(component)
+        else:
+            _update_component_offsets(component)
+            component._offsets_are_current = True
+            if isinstance(component, Context):
+                component._dependent_wrapper_index = None
+    for component in on_beat_grace_music:
+        _update_component_offsets(component)
+        component._offsets_are_current = True
+
+
+def _update_dirty_offsets(root):
+    """
+    Updates offsets only at or after earliest dirty position in score.
+
+    Components before earliest dirty position keep their offsets; ancestors
+    of dirty positions update because their stop offsets may change. Grace
+    music updates after structural change or when it depends on components
+    at or after earliest dirty position.
+
+    Falls back to full update when root does not know its dirty positions (as
+    happens on first update) or when ``root._incremental_offsets`` is false.
+    """
+    positions = root._dirty_offset_positions
+    if not root._incremental_offsets or positions is None:
+        _update_all_offsets(root)
+        return
+    # structural change clears offset index and may move or add grace music:
+    is_new_index = root._offset_index is None
+    components, component_to_index, graces = _get_offset_index(root)
+    start_index, ancestors = len(components), {}
+    for position in positions:
+        pair = _get_dirty_offset_index(position, component_to_index)
+        if pair is None:
+            continue
+        index, parent = pair
+        start_index = min(index, start_index)
+        while parent is not None:
+            ancestors[id(parent)] = parent
+            parent = parent._parent
+    components_ = [_ for _ in ancestors.values() if id(_) in component_to_index]
+    components_ = [_ for _ in components_ if component_to_index[id(_)] < start_index]
+    components_.sort(key=lambda _: component_to_index[id(_)])
+    components_.extend(components[start_index:])
+    for index, grace in graces:
+        if is_new_index or start_index <= index:
+            components_.append(grace)
+    _update_components_offsets(components_)
+    root._dirty_offset_positions = []
+
+
+def _update_measure_number(component):
+    measure_start_offsets = _get_measure_start_offsets(component)
+    measure_number = _to_measure_number(component, measure_start_offsets)
+    component._measure_number = measure_number
+
+
 def _update_measure_numbers(component):
     measure_start_offsets = _get_measure_start_offsets(component)
     root = Parentage(component).root
@@ -358,18 +479,18 @@ def _update_now(component, offsets=False, offsets_in_seconds=False, indicators=F
     assert offsets or offsets_in_seconds or indicators
     if component._is_forbidden_to_update:
         return
-    parentage = Parentage(component)
+    parentage = component._get_parentage()
     for parent in parentage:
         if parent._is_forbidden_to_update:
             return
-        (
-            offsets_are_current,
-            indicators_are_current,
-            offsets_in_seconds_are_current,
-        ) = _get_score_tree_state_flags(parentage)
-    root = parentage.root
+    (
+        offsets_are_current,
+        indicators_are_current,
+        offsets_in_seconds_are_current,
+    ) = _get_score_tree_state_flags(parentage)
+    root = parentage[-1]
     if offsets and not offsets_are_current:
-        _update_all_offsets(root)
+        _update_dirty_offsets(root)
     if offsets_in_seconds and not offsets_in_seconds_are_current:
         _update_all_offsets_in_seconds(root)
     if indicators and not indicators_are_current:
@@ -349,13 +349,19 @@ class Wrapper:
             self._update_effective_context()
             if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
                 self._component._update_later(offsets_in_seconds=True)
+        if getattr(self.indicator, "_mutates_measure_numbers", False):
+            component._update_later(measure_numbers=True)
         component._wrappers.append(self)
+        component._clear_format_cache(descendants=True)
 
     def _bind_effective_context(self, correct_effective_context):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            _inspect._index_dependent_wrapper(correct_effective_context, self)
         self._effective_context = correct_effective_context
+        if self._component is not None:
+            self._component._clear_format_cache()
         self._update_effective_context()
         if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
             correct_effective_context._update_later(offsets_in_seconds=True)
@@ -445,14 +451,22 @@ class Wrapper:
     def _unbind_component(self):
         if self._component is not None and self in self._component._wrappers:
             self._component._wrappers.remove(self)
+            if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
+                self._component._update_later(offsets_in_seconds=True)
+            if getattr(self.indicator, "_mutates_measure_numbers", False):
+                self._component._update_later(measure_numbers=True)
+            self._component._clear_format_cache(descendants=True)
         self._component = None
 
     def _unbind_effective_context(self):
-        if (
-            self._effective_context is not None
-            and self in self._effective_context._dependent_wrappers
-        ):
-            self._effective_context._dependent_wrappers.remove(self)
+        if self._effective_context is not None:
+            dependent_wrappers = self._effective_context._dependent_wrappers
+            # equal wrappers may attach to different components:
+            for i, wrapper in enumerate(dependent_wrappers):
+                if wrapper is self:
+                    del dependent_wrappers[i]
+                    _inspect._unindex_dependent_wrapper(self._effective_context, self)
+                    break
         self._effective_context = None
 
     def _update_effective_context(self):
@@ -461,7 +475,7 @@ class Wrapper:
         if self._effective_context is not correct_effective_context:
             self._bind_effective_context(correct_effective_context)
 
-    def _warn_duplicate_indicator(self, component):
+    def _warn_duplicate_indicator(self, component, ignore=None):
         if self.deactivate is True:
             return
         prototype = type(self.indicator)
@@ -470,6 +484,7 @@ class Wrapper:
             component,
             prototype,
             attributes={"command": command},
+            ignore=ignore,
             unwrap=False,
         )
         wrapper_format_slot = None
@@ -567,6 +582,8 @@ class Wrapper:
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        if self._component is not None:
+            self._component._clear_format_cache(descendants=True)
 
     @property
     def indicator(self) -> typing.Any:
@@ -663,11 +680,307 @@ class Wrapper:
             raise Exception(f"string or tag: {argument!r}.")
         tag = _tag.Tag(argument)
         self._tag = tag
+        if self._component is not None:
+            self._component._clear_format_cache(descendants=True)
 
 
 ### FUNCTIONS ###
 
 
+def _bind_unchecked(wrapper, component, updated_roots):
+    """
+    Binds ``wrapper`` to ``component`` like ``Wrapper._bind_component()``
+    but checks no duplicate indicators and updates no score state.
+
+    Updates indicators of scores not in ``updated_roots``; binding leaves
+    indicators current.
+    """
+    wrapper._component = component
+    if getattr(wrapper.indicator, "context", None) is not None:
+        # update indicators where Wrapper._bind_component() looks them up:
+        root = component._get_parentage()[-1]
+        if wrapper.deactivate is not True and id(root) not in updated_roots:
+            component._update_now(indicators=True)
+            updated_roots.add(id(root))
+        effective_context = wrapper._find_correct_effective_context()
+        if effective_context is not None:
+            effective_context._dependent_wrappers.append(wrapper)
+            _inspect._index_dependent_wrapper(effective_context, wrapper)
+        wrapper._effective_context = effective_context
+    component._wrappers.append(wrapper)
+
+
+def _check_bound_wrappers(wrappers):
+    """
+    Checks ``wrappers`` bound with ``_bind_unchecked()`` for duplicate
+    indicators and updates score state once per component.
+
+    Unbinds wrappers from first duplicate on before raising, like one call to
+    ``abjad.attach()`` per wrapper.
+    """
+    try:
+        indices = _get_possible_duplicate_indicators(wrappers)
+        order = {}
+        if indices:
+            order = {id(_): i for i, _ in enumerate(wrappers)}
+        for i in indices:
+
+            def ignore(wrapper, i=i):
+                return i <= order.get(id(wrapper), -1)
+
+            wrapper = wrappers[i]
+            try:
+                wrapper._warn_duplicate_indicator(wrapper.component, ignore=ignore)
+            except exceptions.PersistentIndicatorError:
+                for wrapper_ in reversed(wrappers[i:]):
+                    wrapper_._unbind_effective_context()
+                    wrappers_ = wrapper_.component._wrappers
+                    for j, wrapper__ in enumerate(wrappers_):
+                        if wrapper__ is wrapper_:
+                            del wrappers_[j]
+                            break
+                del wrappers[i:]
+                raise
+    finally:
+        component_to_flags: typing.Dict = {}
+        for wrapper in wrappers:
+            indicator = wrapper.indicator
+            flags = component_to_flags.setdefault(
+                id(wrapper.component), [wrapper.component, False, False]
+            )
+            if getattr(indicator, "context", None) is not None:
+                if getattr(indicator, "_mutates_offsets_in_seconds", False):
+                    flags[1] = True
+            if getattr(indicator, "_mutates_measure_numbers", False):
+                flags[2] = True
+        for (
+            component,
+            offsets_in_seconds,
+            measure_numbers,
+        ) in component_to_flags.values():
+            if offsets_in_seconds or measure_numbers:
+                component._update_later(
+                    offsets_in_seconds=offsets_in_seconds,
+                    measure_numbers=measure_numbers,
+                )
+            component._clear_format_cache(descendants=True)
+
+
+def _get_innermost_context(component):
+    for parent in component._get_parentage():
+        if hasattr(parent, "_lilypond_type"):
+            return parent
+    return None
+
+
+def _get_possible_duplicate_indicators(wrappers):
+    """
+    Gets indices of bound ``wrappers`` that may duplicate a persistent
+    indicator attached before them, in one sweep.
+
+    ``_inspect._get_effective()`` reads wrappers of the effective parentage
+    of a component and dependent wrappers of the contexts in that parentage.
+    Groups active contexted wrappers of each such component by class and start
+    offset once; a wrapper may duplicate only an earlier wrapper in the same
+    group that ``Wrapper._warn_duplicate_indicator()`` would not excuse.
+    """
+    checked = []
+    for wrapper in wrappers:
+        if getattr(wrapper.indicator, "context", None) is None:
+            continue
+        if wrapper.deactivate is not True:
+            checked.append(wrapper)
+    if not checked:
+        return []
+    prototype = tuple(set(type(_.indicator) for _ in checked))
+    order = {id(_): i for i, _ in enumerate(wrappers)}
+    component_to_groups: typing.Dict = {}
+    component_to_context: typing.Dict = {}
+    component_to_parentage: typing.Dict = {}
+
+    def get_parentage(component):
+        # only voices change which enclosing components are effective
+        if id(component) not in component_to_parentage:
+            parentage = component._get_parentage()
+            if component.__class__.__name__ == "Voice" or len(parentage) == 1:
+                result = _inspect._get_effective_parentage(component)
+            else:
+                result = [component] + get_parentage(parentage[1])
+            component_to_parentage[id(component)] = result
+        return component_to_parentage[id(component)]
+
+    def get_groups(component):
+        # maps class to first wrapper order and wrappers, then to offset index
+        if id(component) not in component_to_groups:
+            groups: typing.Dict = {}
+            wrappers_ = component._wrappers
+            wrappers_ = wrappers_ + getattr(component, "_dependent_wrappers", [])
+            for wrapper_ in wrappers_:
+                if wrapper_.annotation or wrapper_.context is None:
+                    continue
+                if wrapper_.deactivate is True:
+                    continue
+                if not isinstance(wrapper_.indicator, prototype):
+                    continue
+                i = order.get(id(wrapper_), -1)
+                group = groups.setdefault(type(wrapper_.indicator), [i, []])
+                group[0] = min(group[0], i)
+                group[1].append(wrapper_)
+            component_to_groups[id(component)] = groups
+        return component_to_groups[id(component)]
+
+    def get_context(component):
+        if id(component) not in component_to_context:
+            context = _get_innermost_context(component)
+            component_to_context[id(component)] = context
+        return component_to_context[id(component)]
+
+    def is_possible_duplicate(wrapper):
+        i = order[id(wrapper)]
+        indicator = wrapper.indicator
+        command = getattr(indicator, "command", None)
+        format_slot = getattr(indicator, "format_slot", None)
+        leak = getattr(indicator, "leak", None)
+        start_offset = None
+        for component in get_parentage(wrapper.component):
+            for class_, group in get_groups(component).items():
+                # read start offsets only when earlier wrappers exist:
+                if i <= group[0] or not issubclass(class_, type(indicator)):
+                    continue
+                if isinstance(group[1], list):
+                    offset_to_wrappers: typing.Dict = {}
+                    for wrapper_ in group[1]:
+                        offset = wrapper_.start_offset
+                        offset_to_wrappers.setdefault(offset, []).append(wrapper_)
+                    group[1] = offset_to_wrappers
+                if start_offset is None:
+                    start_offset = wrapper.start_offset
+                for wrapper_ in group[1].get(start_offset, []):
+                    if i <= order.get(id(wrapper_), -1):
+                        continue
+                    indicator_ = wrapper_.indicator
+                    if getattr(indicator_, "command", None) != command:
+                        continue
+                    if getattr(indicator_, "format_slot", None) != format_slot:
+                        continue
+                    if getattr(indicator_, "leak", None) != leak:
+                        continue
+                    if indicator_ == indicator:
+                        context = get_context(wrapper.component)
+                        if get_context(wrapper_.component) is not context:
+                            continue
+                    return True
+        return False
+
+    return [order[id(_)] for _ in checked if is_possible_duplicate(_)]
+
+
+def _prepare_attach(
+    attachable,
+    target,
+    *,
+    context=None,
+    deactivate=None,
+    do_not_test=None,
+    synthetic_offset=None,
+    tag=None,
+):
+    if isinstance(attachable, _tag.Tag):
+        message = "use the tag=None keyword instead of attach():\n"
+        message += f"   {repr(attachable)}"
+        raise Exception(message)
+
+    if tag is not None and not isinstance(tag, _tag.Tag):
+        raise Exception(f"must be be tag: {repr(tag)}")
+
+    if isinstance(attachable, Multiplier):
+        message = "use the Leaf.multiplier property to multiply leaf duration."
+        raise Exception(message)
+
+    assert attachable is not None, repr(attachable)
+    assert target is not None, repr(target)
+
+    if context is not None and hasattr(attachable, "_main_leaf"):
+        raise Exception(f"set context only for indicators, not {attachable!r}.")
+
+    if deactivate is True and tag is None:
+        raise Exception("tag must exist when deactivate is true.")
+
+    if hasattr(attachable, "_before_attach"):
+        attachable._before_attach(target)
+
+    if hasattr(attachable, "_attachment_test_all") and not do_not_test:
+        result = attachable._attachment_test_all(target)
+        if result is not True:
+            assert isinstance(result, list), repr(result)
+            result = ["  " + _ for _ in result]
+            message = f"{attachable!r}._attachment_test_all():"
+            result.insert(0, message)
+            message = "\n".join(result)
+            raise Exception(message)
+
+    prototype = (AfterGraceContainer, BeforeGraceContainer)
+    if isinstance(attachable, prototype):
+        if not hasattr(target, "written_duration"):
+            raise Exception("grace containers attach to single leaf only.")
+        attachable._attach(target)
+        return
+
+    assert isinstance(target, Component), repr(target)
+
+    if isinstance(target, Container):
+        acceptable = False
+        if isinstance(attachable, (dict, str, _tag.Tag, Wrapper)):
+            acceptable = True
+        if getattr(attachable, "_can_attach_to_containers", False):
+            acceptable = True
+        if not acceptable:
+            message = f"can not attach {attachable!r} to containers: {target!r}"
+            raise Exception(message)
+    elif not isinstance(target, Leaf):
+        message = f"indicator {attachable!r} must attach to leaf, not {target!r}."
+        raise Exception(message)
+
+    component = target
+    assert isinstance(component, Component), repr(component)
+
+    annotation = None
+    if isinstance(attachable, Wrapper):
+        annotation = attachable.annotation
+        context = context or attachable.context
+        deactivate = deactivate or attachable.deactivate
+        synthetic_offset = synthetic_offset or attachable.synthetic_offset
+        tag = tag or attachable.tag
+        attachable._detach()
+        attachable = attachable.indicator
+
+    if hasattr(attachable, "context"):
+        context = context or attachable.context
+
+    return dict(
+        annotation=annotation,
+        component=component,
+        context=context,
+        deactivate=deactivate,
+        indicator=attachable,
+        synthetic_offset=synthetic_offset,
+        tag=tag,
+    )
+
+
+def _replaces_wrapper(wrapper, component):
+    """
+    Is true when ``Wrapper._bind_component()`` would replace a wrapper equal
+    to ``wrapper`` on ``component``.
+    """
+    if getattr(wrapper.indicator, "context", None) is None:
+        return False
+    for wrapper_ in component._wrappers:
+        if type(wrapper_.indicator) is type(wrapper.indicator) and wrapper_ == wrapper:
+            return True
+    return False
+
+
 def annotate(component, annotation, indicator) -> None:
     r"""
     Annotates ``component`` with ``indicator``.
@@ -918,90 +1231,128 @@ def attach(  # noqa: 302
 
     Otherwise returns none.
     """
-    if isinstance(attachable, _tag.Tag):
-        message = "use the tag=None keyword instead of attach():\n"
-        message += f"   {repr(attachable)}"
-        raise Exception(message)
+    keywords = _prepare_attach(
+        attachable,
+        target,
+        context=context,
+        deactivate=deactivate,
+        do_not_test=do_not_test,
+        synthetic_offset=synthetic_offset,
+        tag=tag,
+    )
+    if keywords is None:
+        return
+    wrapper_ = Wrapper(**keywords)
+    if wrapper is True:
+        return wrapper_
 
-    if tag is not None and not isinstance(tag, _tag.Tag):
-        raise Exception(f"must be be tag: {repr(tag)}")
 
-    if isinstance(attachable, Multiplier):
-        message = "use the Leaf.multiplier property to multiply leaf duration."
-        raise Exception(message)
+def attach_all(
+    pairs,
+    *,
+    context=None,
+    deactivate=None,
+    do_not_test=None,
+    synthetic_offset=None,
+    tag=None,
+) -> None:
+    r"""
+    Attaches each attachable to each target in ``pairs``.
 
-    assert attachable is not None, repr(attachable)
-    assert target is not None, repr(target)
+    ``pairs`` is a sequence of (attachable, target) pairs. Keywords apply to
+    every pair and mean the same as in ``abjad.attach()``.
 
-    if context is not None and hasattr(attachable, "_main_leaf"):
-        raise Exception(f"set context only for indicators, not {attachable!r}.")
+    Works like one call to ``abjad.attach()`` per pair, but binds all pairs
+    before checking duplicate indicators in one sweep and invalidates score
+    state once per target instead of once per pair. Use when attaching many
+    indicators at a time.
 
-    if deactivate is True and tag is None:
-        raise Exception("tag must exist when deactivate is true.")
+    ..  container:: example
 
-    if hasattr(attachable, "_before_attach"):
-        attachable._before_attach(target)
+        Attaches staccati to every note and clef to first note:
 
-    if hasattr(attachable, "_attachment_test_all") and not do_not_test:
-        result = attachable._attachment_test_all(target)
-        if result is not True:
-            assert isinstance(result, list), repr(result)
-            result = ["  " + _ for _ in result]
-            message = f"{attachable!r}._attachment_test_all():"
-            result.insert(0, message)
-            message = "\n".join(result)
-            raise Exception(message)
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> pairs = [(abjad.Articulation("."), _) for _ in staff]
+        >>> pairs.append((abjad.Clef("bass"), staff[0]))
+        >>> abjad.attach_all(pairs)
+        >>> abjad.show(staff) # doctest: +SKIP
 
-    prototype = (AfterGraceContainer, BeforeGraceContainer)
-    if isinstance(attachable, prototype):
-        if not hasattr(target, "written_duration"):
-            raise Exception("grace containers attach to single leaf only.")
-        attachable._attach(target)
-        return
+        ..  docs::
 
-    assert isinstance(target, Component), repr(target)
+            >>> abjad.f(staff)
+            \new Staff
+            {
+                \clef "bass"
+                c'4
+                - \staccato
+                d'4
+                - \staccato
+                e'4
+                - \staccato
+                f'4
+                - \staccato
+            }
 
-    if isinstance(target, Container):
-        acceptable = False
-        if isinstance(attachable, (dict, str, _tag.Tag, Wrapper)):
-            acceptable = True
-        if getattr(attachable, "_can_attach_to_containers", False):
-            acceptable = True
-        if not acceptable:
-            message = f"can not attach {attachable!r} to containers: {target!r}"
-            raise Exception(message)
-    elif not isinstance(target, Leaf):
-        message = f"indicator {attachable!r} must attach to leaf, not {target!r}."
-        raise Exception(message)
+    ..  container:: example
 
-    component = target
-    assert isinstance(component, Component), repr(component)
+        Two contexted indicators can not be attached at the same offset if both
+        indicators are active:
 
-    annotation = None
-    if isinstance(attachable, Wrapper):
-        annotation = attachable.annotation
-        context = context or attachable.context
-        deactivate = deactivate or attachable.deactivate
-        synthetic_offset = synthetic_offset or attachable.synthetic_offset
-        tag = tag or attachable.tag
-        attachable._detach()
-        attachable = attachable.indicator
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> pairs = [
+        ...     (abjad.Dynamic("p"), staff[0]),
+        ...     (abjad.Clef("treble"), staff[0]),
+        ...     (abjad.Clef("alto"), staff[0]),
+        ...     (abjad.Dynamic("f"), staff[1]),
+        ... ]
+        >>> abjad.attach_all(pairs)
+        Traceback (most recent call last):
+            ...
+        abjad...PersistentIndicatorError: Can not attach ...
 
-    if hasattr(attachable, "context"):
-        context = context or attachable.context
+        Pairs before the duplicate remain attached, like with
+        ``abjad.attach()``:
 
-    wrapper_ = Wrapper(
-        annotation=annotation,
-        component=component,
-        context=context,
-        deactivate=deactivate,
-        indicator=attachable,
-        synthetic_offset=synthetic_offset,
-        tag=tag,
-    )
+        >>> abjad.get.indicators(staff[0])
+        [Dynamic('p'), Clef('treble')]
 
-    if wrapper is True:
-        return wrapper_
+        >>> abjad.get.indicators(staff[1])
+        []
+
+    """
+    wrappers: typing.List[Wrapper] = []
+    updated_roots: typing.Set[int] = set()
+    prototype = (AfterGraceContainer, BeforeGraceContainer, Wrapper)
+    try:
+        for attachable, target in pairs:
+            # preparing these changes score; check earlier pairs first:
+            if isinstance(attachable, prototype):
+                wrappers_, wrappers = wrappers, []
+                _check_bound_wrappers(wrappers_)
+                updated_roots.clear()
+            keywords = _prepare_attach(
+                attachable,
+                target,
+                context=context,
+                deactivate=deactivate,
+                do_not_test=do_not_test,
+                synthetic_offset=synthetic_offset,
+                tag=tag,
+            )
+            if keywords is None:
+                continue
+            component = keywords.pop("component")
+            wrapper = Wrapper(**keywords)
+            wrapper._component = component
+            if _replaces_wrapper(wrapper, component):
+                wrappers_, wrappers = wrappers, []
+                _check_bound_wrappers(wrappers_)
+                wrapper._bind_component(component)
+                continue
+            _bind_unchecked(wrapper, component, updated_roots)
+            wrappers.append(wrapper)
+    finally:
+        _check_bound_wrappers(wrappers)
 
 
 def detach(argument, target=None, by_id=False):
@@ -1,3 +1,4 @@
+import functools
 import math
 import re
 import typing
@@ -8,6 +9,35 @@ from . import exceptions
 from . import math as _math
 from . import storage
 
+### FUNCTIONS ###
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_lilypond_duration_string(numerator, denominator):
+    duration = Duration(numerator, denominator)
+    undotted_rational = duration.equal_or_lesser_power_of_two
+    if undotted_rational <= 1:
+        undotted_duration_string = str(undotted_rational.denominator)
+    elif undotted_rational == Duration(2, 1):
+        undotted_duration_string = r"\breve"
+    elif undotted_rational == Duration(4, 1):
+        undotted_duration_string = r"\longa"
+    elif undotted_rational == Duration(8, 1):
+        undotted_duration_string = r"\maxima"
+    else:
+        raise ValueError(f"can not process undotted rational: {undotted_rational}")
+    dot_string = "." * duration.dot_count
+    return undotted_duration_string + dot_string
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_assignable(numerator, denominator):
+    if 0 < numerator and numerator < 16 * denominator:
+        if _math.is_nonnegative_integer_power_of_two(denominator):
+            if _math.is_assignable_integer(numerator):
+                return True
+    return False
+
 
 class Duration(quicktions.Fraction):
     """
@@ -116,6 +146,10 @@ class Duration(quicktions.Fraction):
             argument = arguments[0]
             if type(argument) is class_:
                 return argument
+            if type(argument) in (int, quicktions.Fraction) or isinstance(
+                argument, Duration
+            ):
+                return quicktions.Fraction.__new__(class_, argument)
             if isinstance(argument, NonreducedFraction):
                 return quicktions.Fraction.__new__(class_, *argument.pair)
             try:
@@ -920,11 +954,7 @@ class Duration(quicktions.Fraction):
             16/16   True
 
         """
-        if 0 < self < 16:
-            if _math.is_nonnegative_integer_power_of_two(self.denominator):
-                if _math.is_assignable_integer(self.numerator):
-                    return True
-        return False
+        return _is_assignable(self.numerator, self.denominator)
 
     @property
     def lilypond_duration_string(self) -> str:
@@ -942,21 +972,7 @@ class Duration(quicktions.Fraction):
         """
         if not self.is_assignable:
             raise exceptions.AssignabilityError(self)
-        undotted_rational = self.equal_or_lesser_power_of_two
-        if undotted_rational <= 1:
-            undotted_duration_string = str(undotted_rational.denominator)
-        elif undotted_rational == type(self)(2, 1):
-            undotted_duration_string = r"\breve"
-        elif undotted_rational == type(self)(4, 1):
-            undotted_duration_string = r"\longa"
-        elif undotted_rational == type(self)(8, 1):
-            undotted_duration_string = r"\maxima"
-        else:
-            raise ValueError(f"can not process undotted rational: {undotted_rational}")
-        dot_count = self.dot_count
-        dot_string = "." * dot_count
-        dotted_duration_string = undotted_duration_string + dot_string
-        return dotted_duration_string
+        return _get_lilypond_duration_string(self.numerator, self.denominator)
 
     @property
     def pair(self) -> typing.Tuple[int, int]:
@@ -1438,6 +1454,8 @@ class Offset(Duration):
     def __new__(class_, *arguments, **keywords):
         displacement = None
         for argument in arguments:
+            if type(argument) in (int, quicktions.Fraction):
+                continue
             try:
                 displacement = argument.displacement
                 break
@@ -1448,7 +1466,7 @@ class Offset(Duration):
             displacement = Duration(displacement)
         displacement = displacement or None
         if len(arguments) == 1 and isinstance(arguments[0], Duration):
-            arguments = arguments[0].pair
+            arguments = (arguments[0].numerator, arguments[0].denominator)
         self = Duration.__new__(class_, *arguments)
         self._displacement = displacement
         return self
@@ -1873,7 +1891,7 @@ class Offset(Duration):
 
         """
         if isinstance(argument, type(self)):
-            return Duration(super().__sub__(argument))
+            return Duration(quicktions.Fraction.__sub__(self, argument))
         elif isinstance(argument, Duration):
             return super().__sub__(argument)
         else:
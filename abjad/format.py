@@ -25,6 +25,18 @@ class LilyPondFormatManager:
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _align_tag(line, n):
+        if "%!" not in line:
+            return line
+        location = line.find("%!")
+        left = line[:location].rstrip()
+        right = line[location:]
+        pad = n - len(left)
+        if pad < 1:
+            pad = 1
+        return left + pad * " " + right
+
     @staticmethod
     def _collect_indicators(component):
         wrappers = []
@@ -81,11 +93,15 @@ class LilyPondFormatManager:
     @staticmethod
     def _populate_context_setting_format_contributions(component, bundle):
         result = []
+        # read interface directly; overrides.setting() clears format cache:
+        setting = component._lilypond_setting_name_manager
+        if setting is None:
+            setting = overrides.SettingInterface()
         if hasattr(component, "_lilypond_type"):
-            strings = overrides.setting(component)._format_in_with_block()
+            strings = setting._format_in_with_block()
             result.extend(strings)
         else:
-            strings = overrides.setting(component)._format_inline()
+            strings = setting._format_inline()
             result.extend(strings)
         result.sort()
         bundle.context_settings.extend(result)
@@ -106,7 +122,9 @@ class LilyPondFormatManager:
     def _populate_grob_override_format_contributions(component, bundle):
         result = []
         once = hasattr(component, "_written_duration")
-        grob = overrides.override(component)
+        grob = component._overrides
+        if grob is None:
+            grob = overrides.OverrideInterface()
         contributions = grob._list_format_contributions("override", once=once)
         for string in result[:]:
             if "NoteHead" in string and "pitch" in string:
@@ -124,9 +142,10 @@ class LilyPondFormatManager:
     @staticmethod
     def _populate_grob_revert_format_contributions(component, bundle):
         if not hasattr(component, "_written_duration"):
-            contributions = overrides.override(component)._list_format_contributions(
-                "revert"
-            )
+            grob = component._overrides
+            if grob is None:
+                grob = overrides.OverrideInterface()
+            contributions = grob._list_format_contributions("revert")
             bundle.grob_reverts.extend(contributions)
 
     @staticmethod
@@ -232,17 +251,7 @@ class LilyPondFormatManager:
             raise Exception(f"must be integer:\n    {repr(n)}")
         lines = []
         for line in string.split("\n"):
-            if "%!" not in line:
-                lines.append(line)
-                continue
-            location = line.find("%!")
-            left = line[:location].rstrip()
-            right = line[location:]
-            pad = n - len(left)
-            if pad < 1:
-                pad = 1
-            line = left + pad * " " + right
-            lines.append(line)
+            lines.append(LilyPondFormatManager._align_tag(line, n))
         string = "\n".join(lines)
         return string
 
@@ -3191,7 +3191,7 @@ def measure_number(argument) -> int:
     """
     if not isinstance(argument, Component):
         raise Exception("can only get measure number on component.")
-    argument._update_measure_numbers()
+    argument._update_measure_number()
     assert isinstance(argument._measure_number, int)
     return argument._measure_number
 
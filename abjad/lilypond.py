@@ -1,7 +1,98 @@
-def lilypond(argument):
+import concurrent.futures
+import multiprocessing
+
+from .score import Component, Score
+
+_subtrees = None
+
+
+def _format_subtree(i):
+    return _subtrees[i]._get_lilypond_format()
+
+
+def _get_roots(argument):
+    if isinstance(argument, Component):
+        return [argument._get_root()]
+    roots = []
+    for item in getattr(argument, "items", ()):
+        if not isinstance(item, str):
+            roots.extend(_get_roots(item))
+    return roots
+
+
+def _get_scores(argument):
+    if isinstance(argument, Score):
+        return [argument]
+    if isinstance(argument, Component):
+        from ._iterate import _public_iterate_components
+
+        return list(_public_iterate_components(argument, Score))
+    scores = []
+    for item in getattr(argument, "items", ()):
+        if not isinstance(item, str):
+            scores.extend(_get_scores(item))
+    return scores
+
+
+def _initialize_worker(subtrees):
+    global _subtrees
+    _subtrees = subtrees
+
+
+def _lilypond_in_parallel(argument, workers):
+    subtrees = []
+    for score in _get_scores(argument):
+        score._update_now(indicators=True)
+        subtrees.extend(score)
+    if len(subtrees) < 2:
+        return argument._get_lilypond_format()
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(workers, len(subtrees)),
+        mp_context=context,
+        initializer=_initialize_worker,
+        initargs=(subtrees,),
+    ) as executor:
+        strings = list(executor.map(_format_subtree, range(len(subtrees))))
+    for subtree, string in zip(subtrees, strings):
+        subtree._format_cache = string
+        subtree._mark_caches()
+    return argument._get_lilypond_format()
+
+
+def lilypond(argument, *, cache=False, workers=None):
     """
     Gets LilyPond format of ``argument``.
+
+    Memoizes the format of each component in ``argument`` when ``cache`` is
+    true. Later calls with ``cache`` set to true reformat only those components
+    changed (or attached to) since the last call.
+
+    Formats the staves and staff groups of each score in ``argument`` in a pool
+    of ``workers`` processes when ``workers`` is greater than 1. Output is
+    identical to serial formatting.
     """
     if not hasattr(argument, "_get_lilypond_format"):
         raise Exception(f"no LilyPond format defined for {argument!r}.")
-    return argument._get_lilypond_format()
+    if workers is not None:
+        assert isinstance(workers, int) and 0 < workers, repr(workers)
+    parallel = workers is not None and 1 < workers
+    if not cache and not parallel:
+        return argument._get_lilypond_format()
+    roots = _get_roots(argument)
+    for root in roots:
+        if not cache:
+            root._clear_format_cache(descendants=True)
+        root._memoizes_format = True
+    try:
+        if parallel:
+            return _lilypond_in_parallel(argument, workers)
+        return argument._get_lilypond_format()
+    finally:
+        for root in roots:
+            root._memoizes_format = False
+            if not cache:
+                root._clear_format_cache(descendants=True)
@@ -155,34 +155,37 @@ class Block:
 
     ### PRIVATE METHODS ###
 
-    def _format_item(self, item, depth=1):
+    def _format_item(self, item, write, depth=1):
         indent = LilyPondFormatBundle.indent * depth
-        result = []
+
+        def write_piece(piece):
+            if piece.isspace():
+                piece = ""
+            else:
+                piece = indent + piece
+            write(piece)
+
         if isinstance(item, (list, tuple)):
-            result.append(indent + "{")
+            write(indent + "{")
             depth_ = depth + 1
             for x in item:
-                pieces = self._format_item(x, depth=depth_)
-                result.extend(pieces)
-            result.append(indent + "}")
+                self._format_item(x, write, depth=depth_)
+            write(indent + "}")
         elif isinstance(item, str):
             if item.isspace():
                 string = ""
             else:
                 string = indent + item
-            result.append(string)
+            write(string)
+        elif hasattr(item, "_write_format_pieces"):
+            item._write_format_pieces(write_piece)
         elif "_get_format_pieces" in dir(item):
             try:
                 pieces = item._get_format_pieces()
             except TypeError:
                 pieces = item._get_format_pieces()
             for piece in pieces:
-                if piece.isspace():
-                    piece = ""
-                else:
-                    piece = indent + piece
-                result.append(piece)
-        return result
+                write_piece(piece)
 
     def _formatted_context_blocks(self):
         result = []
@@ -195,40 +198,8 @@ class Block:
         return result
 
     def _get_format_pieces(self, tag=None):
-        indent = LilyPondFormatBundle.indent
         result = []
-        if (
-            not self._get_formatted_user_attributes()
-            and not getattr(self, "contexts", None)
-            and not getattr(self, "context_blocks", None)
-            and not len(self.items)
-        ):
-            string = f"{self._escaped_name} {{}}"
-            result.append(string)
-            return result
-        string = f"{self._escaped_name} {{"
-        if tag is not None:
-            strings = _tag.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-        for item in self.items:
-            if isinstance(item, ContextBlock):
-                continue
-            if isinstance(item, (Leaf, Markup)):
-                item = [item]
-            result.extend(self._format_item(item))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + _ for _ in formatted_attributes]
-        result.extend(formatted_attributes)
-        formatted_context_blocks = self._formatted_context_blocks()
-        formatted_context_blocks = [indent + _ for _ in formatted_context_blocks]
-        result.extend(formatted_context_blocks)
-        string = "}"
-        if tag is not None:
-            strings = _tag.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-
+        self._write_format_pieces(result.append, tag=tag)
         return result
 
     def _get_format_specification(self):
@@ -271,6 +242,38 @@ class Block:
     def _get_lilypond_format(self, tag=None):
         return "\n".join(self._get_format_pieces(tag=tag))
 
+    def _write_format_pieces(self, write, tag=None):
+        indent = LilyPondFormatBundle.indent
+        if (
+            not self._get_formatted_user_attributes()
+            and not getattr(self, "contexts", None)
+            and not getattr(self, "context_blocks", None)
+            and not len(self.items)
+        ):
+            string = f"{self._escaped_name} {{}}"
+            write(string)
+            return
+        string = f"{self._escaped_name} {{"
+        if tag is not None:
+            strings = _tag.tag([string], tag=tag)
+            string = strings[0]
+        write(string)
+        for item in self.items:
+            if isinstance(item, ContextBlock):
+                continue
+            if isinstance(item, (Leaf, Markup)):
+                item = [item]
+            self._format_item(item, write)
+        for string in self._get_formatted_user_attributes():
+            write(indent + string)
+        for string in self._formatted_context_blocks():
+            write(indent + string)
+        string = "}"
+        if tag is not None:
+            strings = _tag.tag([string], tag=tag)
+            string = strings[0]
+        write(string)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -406,58 +409,56 @@ class ContextBlock(Block):
 
     ### PRIVATE METHODS ###
 
-    def _get_format_pieces(self, tag=None):
+    def _write_format_pieces(self, write, tag=None):
         indent = LilyPondFormatBundle.indent
-        result = []
         string = f"{self._escaped_name} {{"
-        result.append(string)
+        write(string)
         # CAUTION: source context name must come before type_ to allow
         # context redefinition.
         if self.source_lilypond_type is not None:
             string = indent + rf"\{self.source_lilypond_type}"
-            result.append(string)
+            write(string)
         if self.name is not None:
             string = indent + rf"\name {self.name}"
-            result.append(string)
+            write(string)
         if self.type_ is not None:
             string = indent + rf"\type {self.type_}"
-            result.append(string)
+            write(string)
         if self.alias is not None:
             string = indent + rf"\alias {self.alias}"
-            result.append(string)
+            write(string)
         for statement in self.remove_commands:
             string = indent + rf"\remove {statement}"
-            result.append(string)
+            write(string)
         # CAUTION: LilyPond \consists statements are order-significant!
         for statement in self.consists_commands:
             string = indent + rf"\consists {statement}"
-            result.append(string)
+            write(string)
         for statement in self.accepts_commands:
             string = indent + rf"\accepts {statement}"
-            result.append(string)
+            write(string)
         overrides = override(self)._list_format_contributions("override")
         for statement in overrides:
             string = indent + statement
-            result.append(string)
+            write(string)
         setting_contributions = setting(self)._format_in_with_block()
         for setting_contribution in sorted(setting_contributions):
             string = indent + setting_contribution
-            result.append(string)
+            write(string)
         for item in self.items:
             if isinstance(item, str):
                 string = indent + f"{item}"
-                result.append(string)
+                write(string)
             elif "_get_format_pieces" in dir(item):
                 for piece in item._get_format_pieces():
                     if piece.isspace():
                         piece = ""
                     else:
                         piece = indent + piece
-                    result.append(piece)
+                    write(piece)
             else:
                 pass
-        result.append("}")
-        return result
+        write("}")
 
     ### PUBLIC PROPERTIES ###
 
@@ -1369,30 +1370,7 @@ class LilyPondFile:
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self, tag=None):
-        result = []
-        if self.date_time_token is not None:
-            string = f"% {self.date_time_token}"
-            result.append(string)
-        result.extend(self._get_formatted_comments())
-        includes = []
-        if self.lilypond_version_token is not None:
-            string = f"{self.lilypond_version_token._get_lilypond_format()}"
-            includes.append(string)
-        if self.lilypond_language_token is not None:
-            string = f"{self.lilypond_language_token._get_lilypond_format()}"
-            includes.append(string)
-        tag = _tag.Tag("abjad.LilyPondFile._get_format_pieces()")
-        includes = _tag.tag(includes, tag=self.get_tag(tag))
-        includes = "\n".join(includes)
-        if includes:
-            result.append(includes)
-        postincludes = []
-        if self.use_relative_includes:
-            string = "#(ly:set-option 'relative-includes #t)"
-            postincludes.append(string)
-        postincludes.extend(self._get_formatted_includes())
-        postincludes.extend(self._get_formatted_scheme_settings())
-        result.extend(postincludes)
+        result = self._get_formatted_preamble()
         result.extend(self._get_formatted_blocks())
         return result
 
@@ -1403,18 +1381,7 @@ class LilyPondFile:
 
     def _get_formatted_blocks(self):
         result = []
-        tag = _tag.Tag("abjad.LilyPondFile._get_formatted_blocks()")
-        tag = self.get_tag(tag)
-        for item in self.items:
-            if "_get_lilypond_format" in dir(item) and not isinstance(item, str):
-                try:
-                    string = item._get_lilypond_format(tag=tag)
-                except TypeError:
-                    string = item._get_lilypond_format()
-                if string:
-                    result.append(string)
-            else:
-                result.append(str(item))
+        self._write_formatted_blocks(result.append)
         return result
 
     def _get_formatted_comments(self):
@@ -1453,6 +1420,33 @@ class LilyPondFile:
             result = ["\n".join(result)]
         return result
 
+    def _get_formatted_preamble(self):
+        result = []
+        if self.date_time_token is not None:
+            string = f"% {self.date_time_token}"
+            result.append(string)
+        result.extend(self._get_formatted_comments())
+        includes = []
+        if self.lilypond_version_token is not None:
+            string = f"{self.lilypond_version_token._get_lilypond_format()}"
+            includes.append(string)
+        if self.lilypond_language_token is not None:
+            string = f"{self.lilypond_language_token._get_lilypond_format()}"
+            includes.append(string)
+        tag = _tag.Tag("abjad.LilyPondFile._get_format_pieces()")
+        includes = _tag.tag(includes, tag=self.get_tag(tag))
+        includes = "\n".join(includes)
+        if includes:
+            result.append(includes)
+        postincludes = []
+        if self.use_relative_includes:
+            string = "#(ly:set-option 'relative-includes #t)"
+            postincludes.append(string)
+        postincludes.extend(self._get_formatted_includes())
+        postincludes.extend(self._get_formatted_scheme_settings())
+        result.extend(postincludes)
+        return result
+
     def _get_formatted_scheme_settings(self):
         result = []
         tag = _tag.Tag("abjad.LilyPondFile._get_formatted_scheme_settings()")
@@ -1503,6 +1497,58 @@ class LilyPondFile:
         grob.default_staff_staff_spacing = spacing_vector
         return block
 
+    def _write_formatted_blocks(self, write, write_item=None):
+        """
+        Writes formatted string of each item.
+
+        Calls ``write_item`` with blocks and containers, and their tag, in
+        place of formatting them when ``write_item`` is not none.
+        """
+        tag = _tag.Tag("abjad.LilyPondFile._get_formatted_blocks()")
+        tag = self.get_tag(tag)
+        for item in self.items:
+            if write_item is not None and isinstance(item, (Block, Container)):
+                write_item(item, tag)
+            elif "_get_lilypond_format" in dir(item) and not isinstance(item, str):
+                try:
+                    string = item._get_lilypond_format(tag=tag)
+                except TypeError:
+                    string = item._get_lilypond_format()
+                if string:
+                    write(string)
+            else:
+                write(str(item))
+
+    def _write_lilypond_format(self, write):
+        separates = False
+
+        def write_lines(string):
+            for line in string.split("\n"):
+                if line.isspace():
+                    line = ""
+                write(line)
+
+        def write_separator():
+            nonlocal separates
+            if separates:
+                write("")
+            separates = True
+
+        def write_piece(string):
+            write_separator()
+            write_lines(string)
+
+        def write_item(item, tag):
+            write_separator()
+            if isinstance(item, Block):
+                item._write_format_pieces(write_lines, tag=tag)
+            else:
+                item._write_lilypond_format(write)
+
+        for piece in self._get_formatted_preamble():
+            write_piece(piece)
+        self._write_formatted_blocks(write_piece, write_item)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -6,7 +6,9 @@ import typing
 from . import _inspect, exceptions
 from . import math as _math
 from . import typings
+from .attach import attach
 from .duration import Duration, Multiplier, NonreducedFraction
+from .indicators.Tie import Tie
 from .pitch.pitchclasses import PitchClass
 from .pitch.pitches import NamedPitch, NumberedPitch
 from .ratio import NonreducedRatio, Ratio
@@ -605,6 +607,30 @@ class LeafMaker:
         pitches=None,
         tag=None,
         tie_parts=True,
+    ):
+        written_durations = LeafMaker._make_written_durations(
+            duration,
+            forbidden_duration=forbidden_duration,
+            increase_monotonic=increase_monotonic,
+        )
+        # make one leaf per written duration
+        result = []
+        for written_duration in written_durations:
+            if pitches is not None:
+                arguments = (pitches, written_duration)
+            else:
+                arguments = (written_duration,)
+            result.append(class_(*arguments, multiplier=multiplier, tag=tag))
+        result = Selection(result)
+        # tie if required
+        if tie_parts and 1 < len(result):
+            if not issubclass(class_, (Rest, Skip)):
+                tie(result)
+        return result
+
+    @staticmethod
+    def _make_written_durations(
+        duration, forbidden_duration=None, increase_monotonic=None
     ):
         duration = Duration(duration)
         if forbidden_duration is not None:
@@ -641,21 +667,7 @@ class LeafMaker:
         # reverse numerators if necessary
         if increase_monotonic:
             numerators = list(reversed(numerators))
-        # make one leaf per written duration
-        result = []
-        for numerator in numerators:
-            written_duration = Duration(numerator, duration.denominator)
-            if pitches is not None:
-                arguments = (pitches, written_duration)
-            else:
-                arguments = (written_duration,)
-            result.append(class_(*arguments, multiplier=multiplier, tag=tag))
-        result = Selection(result)
-        # tie if required
-        if tie_parts and 1 < len(result):
-            if not issubclass(class_, (Rest, Skip)):
-                tie(result)
-        return result
+        return tuple(Duration(_, duration.denominator) for _ in numerators)
 
     @staticmethod
     def _partition_less_than_double(n, m):
@@ -738,6 +750,177 @@ class LeafMaker:
         """
         return self._use_multimeasure_rests
 
+    ### PUBLIC METHODS ###
+
+    def batch(self, pitches, numerators, denominators, *, ties=None) -> Selection:
+        r"""
+        Calls leaf-maker on parallel sequences of ``pitches``, duration
+        ``numerators`` and duration ``denominators``.
+
+        ..  container:: example
+
+            >>> maker = abjad.LeafMaker()
+            >>> pitches = [0, 2, None, 4, 5]
+            >>> numerators = [1, 5, 1, 1, 1]
+            >>> denominators = [8, 16, 16, 12, 12]
+            >>> leaves = maker.batch(pitches, numerators, denominators)
+            >>> staff = abjad.Staff(leaves)
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    c'8
+                    d'4
+                    ~
+                    d'16
+                    r16
+                    \tweak edge-height #'(0.7 . 0)
+                    \times 8/12 {
+                        e'8
+                        f'8
+                    }
+                }
+
+        ..  container:: example
+
+            Ties notes to the notes that follow when ``ties`` is true:
+
+            >>> maker = abjad.LeafMaker()
+            >>> pitches = [0, 0, 2, 2]
+            >>> numerators = [1, 1, 1, 1]
+            >>> denominators = [4, 8, 8, 4]
+            >>> ties = [True, False, True, False]
+            >>> leaves = maker.batch(pitches, numerators, denominators, ties=ties)
+            >>> staff = abjad.Staff(leaves)
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    c'4
+                    ~
+                    c'8
+                    d'8
+                    ~
+                    d'4
+                }
+
+        Integer (or NumPy) arrays work as input. Pitches may also be strings or
+        pitch objects, or none for rests. Output equals that of ``maker(pitches,
+        durations)``; leaf-maker normalizes each distinct pitch and duration
+        only once.
+
+        Returns selection.
+        """
+        pitches = list(pitches)
+        numerators = [int(_) for _ in numerators]
+        denominators = [int(_) for _ in denominators]
+        assert len(pitches) == len(numerators) == len(denominators)
+        if ties is None:
+            ties = [False] * len(pitches)
+        else:
+            ties = [bool(_) for _ in ties]
+            assert len(ties) == len(pitches), repr(ties)
+        factors_by_denominator: typing.Dict[int, typing.FrozenSet] = {}
+        for denominator in set(denominators):
+            factors = set(_math.factors(denominator))
+            factors.discard(2)
+            factors_by_denominator[denominator] = frozenset(factors)
+        note_prototype = (numbers.Number, str, NamedPitch, NumberedPitch, PitchClass)
+        named_pitches: typing.Dict = {}
+        written_durations: typing.Dict = {}
+        result: typing.List[typing.Union[Tuplet, Leaf]] = []
+        items: typing.List[typing.List[Leaf]] = []
+        start = 0
+        while start < len(pitches):
+            factors = factors_by_denominator[denominators[start]]
+            stop = start + 1
+            while stop < len(pitches):
+                if factors_by_denominator[denominators[stop]] != factors:
+                    break
+                stop += 1
+            denominator = denominators[start]
+            if factors - {1}:
+                numerator = _math.greatest_power_of_two_less_equal(denominator)
+                multiplier = (numerator, denominator)
+                ratio = 1 / Duration(*multiplier)
+            else:
+                multiplier = None
+            group_leaves: typing.List[Leaf] = []
+            for i in range(start, stop):
+                pitch = pitches[i]
+                duration = (numerators[i], denominators[i])
+                if (
+                    pitch is None
+                    and self.use_multimeasure_rests
+                    and not self.skips_instead_of_rests
+                ):
+                    if multiplier is None:
+                        duration = NonreducedFraction(duration)
+                    else:
+                        duration = ratio * Duration(duration)
+                    item = list(
+                        self._make_leaf_on_pitch(
+                            pitch,
+                            duration,
+                            tag=self.tag,
+                            use_multimeasure_rests=True,
+                        )
+                    )
+                    group_leaves.extend(item)
+                    items.append(item)
+                    continue
+                is_note = isinstance(pitch, note_prototype)
+                if not is_note and pitch is not None:
+                    raise ValueError(f"unknown pitch: {pitch!r}.")
+                key = (is_note, duration, multiplier)
+                if key not in written_durations:
+                    if multiplier is not None:
+                        duration = ratio * Duration(duration)
+                    forbidden_duration = None
+                    if multiplier is None and is_note:
+                        forbidden_duration = self.forbidden_note_duration
+                    elif multiplier is None:
+                        forbidden_duration = self.forbidden_rest_duration
+                    written_durations[key] = self._make_written_durations(
+                        duration,
+                        forbidden_duration=forbidden_duration,
+                        increase_monotonic=self.increase_monotonic,
+                    )
+                item = []
+                if is_note:
+                    if pitch not in named_pitches:
+                        named_pitches[pitch] = NamedPitch(pitch)
+                    named_pitch = named_pitches[pitch]
+                    for written_duration in written_durations[key]:
+                        item.append(Note(named_pitch, written_duration, tag=self.tag))
+                    for leaf in item[:-1]:
+                        attach(Tie(), leaf)
+                elif self.skips_instead_of_rests:
+                    for written_duration in written_durations[key]:
+                        item.append(Skip(written_duration, tag=self.tag))
+                else:
+                    for written_duration in written_durations[key]:
+                        item.append(Rest(written_duration, tag=self.tag))
+                group_leaves.extend(item)
+                items.append(item)
+            if multiplier is None:
+                result.extend(group_leaves)
+            else:
+                result.append(Tuplet(multiplier, group_leaves))
+            start = stop
+        for i, item in enumerate(items[:-1]):
+            if not ties[i]:
+                continue
+            if isinstance(item[-1], Note) and isinstance(items[i + 1][0], Note):
+                attach(Tie(), item[-1])
+        return Selection(result)
+
 
 class NoteMaker:
     r"""
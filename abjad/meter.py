@@ -3,6 +3,7 @@ Tools for modeling musical meter.
 """
 import bisect
 import collections
+import functools
 import typing
 
 import uqbar.graphs
@@ -20,6 +21,15 @@ from .storage import FormatSpecification, StorageFormatManager
 from .timespan import OffsetCounter, Timespan, TimespanList
 from .typedcollections import TypedList
 
+### FUNCTIONS ###
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_prototype(argument, increase_monotonic):
+    meter = Meter.__new__(Meter)
+    meter._initialize(argument, increase_monotonic)
+    return meter
+
 
 class Meter:
     """
@@ -247,11 +257,17 @@ class Meter:
     and ``3`` summing to that prime. Summands are arranged from greatest
     to least by default. This means that ``5`` becomes ``3+2`` and ``7``
     becomes ``3+2+2`` in the examples above.
+
+    Meters initialized with the same pair (or RTM string) and the same
+    ``increase_monotonic`` share one rhythm tree and its derived offset
+    inventory and kernels; the most recently used 1024 are kept. Treat
+    ``root_node`` as read-only.
     """
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_cache",
         "_increase_monotonic",
         "_denominator",
         "_numerator",
@@ -259,6 +275,14 @@ class Meter:
         "_root_node",
     )
 
+    _shared_slots = (
+        "_cache",
+        "_increase_monotonic",
+        "_denominator",
+        "_numerator",
+        "_root_node",
+    )
+
     ### INITIALIZER ###
 
     def __init__(
@@ -270,112 +294,23 @@ class Meter:
         argument = argument or (4, 4)
         assert isinstance(preferred_boundary_depth, (int, type(None)))
         self._preferred_boundary_depth = preferred_boundary_depth
-
-        def recurse(node, factors, denominator, increase_monotonic):
-            if factors:
-                factor, factors = factors[0], factors[1:]
-                preprolated_duration = node.preprolated_duration.__div__(factor)
-                # if factor in (2, 3, 4, 5):
-                if factor in (2, 3, 4):
-                    if factors:
-                        for _ in range(factor):
-                            child = rhythmtrees.RhythmTreeContainer(
-                                preprolated_duration=preprolated_duration
-                            )
-                            node.append(child)
-                            recurse(child, factors, denominator, increase_monotonic)
-                    else:
-                        for _ in range(factor):
-                            node.append(
-                                rhythmtrees.RhythmTreeLeaf(
-                                    preprolated_duration=(1, denominator)
-                                )
-                            )
-                else:
-                    parts = [3]
-                    total = 3
-                    while total < factor:
-                        if not increase_monotonic:
-                            parts.append(2)
-                        else:
-                            parts.insert(0, 2)
-                        total += 2
-                    for part in parts:
-                        grouping = rhythmtrees.RhythmTreeContainer(
-                            preprolated_duration=part * preprolated_duration
-                        )
-                        if factors:
-                            for _ in range(part):
-                                child = rhythmtrees.RhythmTreeContainer(
-                                    preprolated_duration=preprolated_duration
-                                )
-                                grouping.append(child)
-                                recurse(
-                                    child,
-                                    factors,
-                                    denominator,
-                                    increase_monotonic,
-                                )
-                        else:
-                            for _ in range(part):
-                                grouping.append(
-                                    rhythmtrees.RhythmTreeLeaf(
-                                        preprolated_duration=(1, denominator)
-                                    )
-                                )
-                        node.append(grouping)
-            else:
-                node.extend(
-                    [
-                        rhythmtrees.RhythmTreeLeaf(
-                            preprolated_duration=(1, denominator)
-                        )
-                        for _ in range(node.preprolated_duration.numerator)
-                    ]
-                )
-
         increase_monotonic = bool(increase_monotonic)
-        try:
-            numerator = argument.numerator
-            denominator = argument.denominator
-            is_fraction_like = True
-        except AttributeError:
-            is_fraction_like = False
         if isinstance(argument, type(self)):
-            root = argument.root_node
-            numerator, denominator = argument.numerator, argument.denominator
-            increase_monotonic = argument.increase_monotonic
-        elif isinstance(argument, (str, rhythmtrees.RhythmTreeContainer)):
-            if isinstance(argument, str):
-                parsed = rhythmtrees.RhythmTreeParser()(argument)
-                assert len(parsed) == 1
-                root = parsed[0]
-            else:
-                root = argument
-            for node in [root] + list(root.depth_first()):
-                assert node.prolation == 1
-            numerator = root.preprolated_duration.numerator
-            denominator = root.preprolated_duration.denominator
-        elif is_fraction_like or isinstance(argument, tuple):
-            if isinstance(argument, tuple):
-                fraction = NonreducedFraction(argument)
-            else:
-                fraction = NonreducedFraction(argument.numerator, argument.denominator)
-            numerator, denominator = fraction.numerator, fraction.denominator
-            factors = math.factors(numerator)
-            # group two nested levels of 2s into a 4
-            if 1 < len(factors) and factors[0] == factors[1] == 2:
-                factors[0:2] = [4]
-            root = rhythmtrees.RhythmTreeContainer(preprolated_duration=fraction)
-            recurse(root, factors, denominator, increase_monotonic)
+            self._copy_state(argument)
+            return
+        if isinstance(argument, str):
+            key = argument
+        elif isinstance(argument, tuple):
+            fraction = NonreducedFraction(argument)
+            key = (fraction.numerator, fraction.denominator)
+        elif hasattr(argument, "numerator") and not isinstance(
+            argument, rhythmtrees.RhythmTreeContainer
+        ):
+            key = (argument.numerator, argument.denominator)
         else:
-            name = type(self).__name__
-            raise ValueError(f"can not initialize {name}: {argument!r}.")
-
-        self._root_node = root
-        self._numerator = numerator
-        self._denominator = denominator
-        self._increase_monotonic = increase_monotonic
+            self._initialize(argument, increase_monotonic)
+            return
+        self._copy_state(_get_prototype(key, increase_monotonic))
 
     ### SPECIAL METHODS ###
 
@@ -671,6 +606,10 @@ class Meter:
 
     ### PRIVATE METHODS ###
 
+    def _copy_state(self, meter):
+        for name in self._shared_slots:
+            setattr(self, name, getattr(meter, name))
+
     def _get_format_specification(self):
         return FormatSpecification(
             client=self,
@@ -679,6 +618,109 @@ class Meter:
             storage_format_keyword_names=[],
         )
 
+    def _initialize(self, argument, increase_monotonic):
+        def recurse(node, factors, denominator, increase_monotonic):
+            if factors:
+                factor, factors = factors[0], factors[1:]
+                preprolated_duration = node.preprolated_duration.__div__(factor)
+                # if factor in (2, 3, 4, 5):
+                if factor in (2, 3, 4):
+                    if factors:
+                        for _ in range(factor):
+                            child = rhythmtrees.RhythmTreeContainer(
+                                preprolated_duration=preprolated_duration
+                            )
+                            node.append(child)
+                            recurse(child, factors, denominator, increase_monotonic)
+                    else:
+                        for _ in range(factor):
+                            node.append(
+                                rhythmtrees.RhythmTreeLeaf(
+                                    preprolated_duration=(1, denominator)
+                                )
+                            )
+                else:
+                    parts = [3]
+                    total = 3
+                    while total < factor:
+                        if not increase_monotonic:
+                            parts.append(2)
+                        else:
+                            parts.insert(0, 2)
+                        total += 2
+                    for part in parts:
+                        grouping = rhythmtrees.RhythmTreeContainer(
+                            preprolated_duration=part * preprolated_duration
+                        )
+                        if factors:
+                            for _ in range(part):
+                                child = rhythmtrees.RhythmTreeContainer(
+                                    preprolated_duration=preprolated_duration
+                                )
+                                grouping.append(child)
+                                recurse(
+                                    child,
+                                    factors,
+                                    denominator,
+                                    increase_monotonic,
+                                )
+                        else:
+                            for _ in range(part):
+                                grouping.append(
+                                    rhythmtrees.RhythmTreeLeaf(
+                                        preprolated_duration=(1, denominator)
+                                    )
+                                )
+                        node.append(grouping)
+            else:
+                node.extend(
+                    [
+                        rhythmtrees.RhythmTreeLeaf(
+                            preprolated_duration=(1, denominator)
+                        )
+                        for _ in range(node.preprolated_duration.numerator)
+                    ]
+                )
+
+        try:
+            numerator = argument.numerator
+            denominator = argument.denominator
+            is_fraction_like = True
+        except AttributeError:
+            is_fraction_like = False
+        if isinstance(argument, (str, rhythmtrees.RhythmTreeContainer)):
+            if isinstance(argument, str):
+                parsed = rhythmtrees.RhythmTreeParser._get_shared_parser()(argument)
+                assert len(parsed) == 1
+                root = parsed[0]
+            else:
+                root = argument
+            for node in [root] + list(root.depth_first()):
+                assert node.prolation == 1
+            numerator = root.preprolated_duration.numerator
+            denominator = root.preprolated_duration.denominator
+        elif is_fraction_like or isinstance(argument, tuple):
+            if isinstance(argument, tuple):
+                fraction = NonreducedFraction(argument)
+            else:
+                fraction = NonreducedFraction(argument.numerator, argument.denominator)
+            numerator, denominator = fraction.numerator, fraction.denominator
+            factors = math.factors(numerator)
+            # group two nested levels of 2s into a 4
+            if 1 < len(factors) and factors[0] == factors[1] == 2:
+                factors[0:2] = [4]
+            root = rhythmtrees.RhythmTreeContainer(preprolated_duration=fraction)
+            recurse(root, factors, denominator, increase_monotonic)
+        else:
+            name = type(self).__name__
+            raise ValueError(f"can not initialize {name}: {argument!r}.")
+
+        self._root_node = root
+        self._numerator = numerator
+        self._denominator = denominator
+        self._increase_monotonic = increase_monotonic
+        self._cache = {}
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -713,6 +755,8 @@ class Meter:
 
         Returns dictionary.
         """
+        if "depthwise_offset_inventory" in self._cache:
+            return self._cache["depthwise_offset_inventory"]
         inventory = []
         all_offsets = set()
         all_offsets.add(Offset(self.numerator, self.denominator))
@@ -720,7 +764,9 @@ class Meter:
             for node in nodes:
                 all_offsets.add(Offset(node.start_offset))
             inventory.append(tuple(sorted(all_offsets)))
-        return tuple(inventory)
+        inventory = tuple(inventory)
+        self._cache["depthwise_offset_inventory"] = inventory
+        return inventory
 
     @property
     def duration(self):
@@ -1093,7 +1139,9 @@ class Meter:
 
         Returns string.
         """
-        return self._root_node.rtm_format
+        if "rtm_format" not in self._cache:
+            self._cache["rtm_format"] = self._root_node.rtm_format
+        return self._cache["rtm_format"]
 
     ### PUBLIC METHODS ###
 
@@ -1105,6 +1153,8 @@ class Meter:
         discard_final_orphan_downbeat=True,
         maximum_run_length=None,
         starting_offset=None,
+        optimal=False,
+        report=False,
     ):
         """
         Finds the best-matching sequence of meters for the offsets
@@ -1142,20 +1192,66 @@ class Meter:
             5/4
             5/4
 
+        ..  container:: example
+
+            Set ``optimal=True`` to maximize the metric weight of the whole
+            meter sequence instead of choosing meters one at a time:
+
+            >>> meters_ = abjad.Meter.fit_meters(argument, meters, optimal=True)
+            >>> for meter in meters_:
+            ...     print(meter.implied_time_signature)
+            ...
+            5/4
+            5/4
+            5/4
+            5/4
+
+        ..  container:: example
+
+            Set ``report=True`` to also return the start offset and score of
+            each selected meter:
+
+            >>> meters_, scores = abjad.Meter.fit_meters(
+            ...     argument, meters, optimal=True, report=True
+            ... )
+            >>> for score in scores:
+            ...     print(score.offset, score.meter.implied_time_signature, score.score)
+            ...
+            0 5/4 11/6
+            5/4 5/4 1
+            5/2 5/4 1
+            15/4 5/4 2
+
         Coerces offsets from ``argument`` via
         ``MetricAccentKernel.count_offsets()``.
 
         Coerces Meters from ``meters`` via ``MeterList``.
 
-        Returns list.
+        The default greedy fit chooses each meter by its kernel response
+        plus a one-measure lookahead. The optimal fit scales offsets and
+        kernels to integers over ``denominator`` and finds the meter sequence
+        with the greatest total weight by dynamic programming. There each
+        offset counts once, in the measure that contains it, with kernels
+        scaled so that every downbeat weighs 1; the last offset counts as the
+        closing barline of the last measure. Offsets that do not fall on a
+        multiple of ``1 / denominator`` weigh nothing. Both fits honor
+        ``maximum_run_length``.
+
+        Returns meter list; or pair of meter list and tuple of
+        ``(offset, meter, score)`` named tuples when ``report`` is true.
+        Scores are kernel responses for the greedy fit and downbeat-scaled
+        weights for the optimal fit.
         """
         session = _MeterFittingSession(
             kernel_denominator=denominator,
             maximum_run_length=maximum_run_length,
             meters=meters,
             offset_counter=argument,
+            optimal=optimal,
         )
         meters = session()
+        if report:
+            return meters, session.get_scores(meters)
         return meters
 
     def generate_offset_kernel_to_denominator(self, denominator, normalize=True):
@@ -1189,6 +1285,9 @@ class Meter:
         Returns dictionary.
         """
         assert math.is_positive_integer_power_of_two(denominator // self.denominator)
+        key = ("offset_kernel", denominator, normalize)
+        if key in self._cache:
+            return self._cache[key]
         inventory = list(self.depthwise_offset_inventory)
         old_flag_count = Duration(1, self.denominator).flag_count
         new_flag_count = Duration(1, denominator).flag_count
@@ -1212,7 +1311,9 @@ class Meter:
         if normalize:
             for offset, response in kernel.items():
                 kernel[offset] = Multiplier(response, total)
-        return MetricAccentKernel(kernel)
+        kernel = MetricAccentKernel(kernel)
+        self._cache[key] = kernel
+        return kernel
 
     def rewrite_meter(
         components,
@@ -2484,6 +2585,246 @@ class Meter:
                     maximum_dot_count=maximum_dot_count,
                 )
 
+    @staticmethod
+    def rewrite_meters(
+        components,
+        meters,
+        boundary_depth=None,
+        maximum_dot_count=None,
+        rewrite_tuplets=True,
+    ):
+        r"""
+        Rewrites the contents of logical ties in ``components`` to match
+        consecutive ``meters``.
+
+        ..  container:: example
+
+            Rewrites every measure in a staff in one call:
+
+            >>> string = "| 2/4 c'2 ~ |"
+            >>> string += "| 4/4 c'32 d'2.. ~ d'16 e'32 ~ |"
+            >>> string += "| 2/4 e'2 |"
+            >>> container = abjad.parsers.reduced.parse_reduced_ly_syntax(string)
+            >>> staff = abjad.Staff()
+            >>> staff[:] = container
+            >>> meters = abjad.MeterList([(2, 4), (4, 4), (2, 4)])
+            >>> abjad.Meter.rewrite_meters(staff[:], meters)
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    {
+                        \time 2/4
+                        c'2
+                        ~
+                    }
+                    {
+                        \time 4/4
+                        c'32
+                        d'8..
+                        ~
+                        d'2
+                        ~
+                        d'8..
+                        e'32
+                        ~
+                    }
+                    {
+                        \time 2/4
+                        e'2
+                    }
+                }
+
+        ..  container:: example
+
+            Measures may also be runs of components in a flat staff:
+
+            >>> staff = abjad.Staff("c'4. d'4. e'4 ~ e'8 f'4.")
+            >>> meters = abjad.MeterList([(3, 4), (3, 4)])
+            >>> abjad.Meter.rewrite_meters(staff[:], meters)
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    c'4.
+                    d'4.
+                    e'4.
+                    f'4.
+                }
+
+        Lays ``meters`` end to end from the start of ``components`` and
+        rewrites the components that start in each meter as
+        ``Meter.rewrite_meter()`` would. A single container that exactly
+        fills a meter is rewritten by its contents.
+
+        Computes offset inventories once per distinct meter and plans every
+        split and fuse against the offsets of ``components`` before changing
+        the score. Then applies all splits and fuses in one pass, so that
+        offsets are updated only once afterwards.
+
+        Operates in place and returns none.
+        """
+
+        def recurse(
+            boundary_depth=None,
+            boundary_offsets=None,
+            depth=0,
+            offset_inventory=None,
+            ratio=None,
+            segments=None,
+            start_offset=None,
+            stop_offset=None,
+        ):
+            offsets = _MeterManager.get_offsets_at_depth(depth, offset_inventory)
+            duration = Duration((stop_offset - start_offset) * ratio)
+            starts_in_offsets = start_offset in offsets
+            stops_in_offsets = stop_offset in offsets
+            split_offset, next_depth = None, depth
+            if not _MeterManager.is_acceptable_logical_tie(
+                logical_tie_duration=duration,
+                logical_tie_starts_in_offsets=starts_in_offsets,
+                logical_tie_stops_in_offsets=stops_in_offsets,
+                maximum_dot_count=maximum_dot_count,
+            ):
+                if starts_in_offsets:
+                    offsets = reversed(offsets)
+                for offset in offsets:
+                    if start_offset < offset < stop_offset:
+                        split_offset = offset
+                        break
+                if split_offset is None:
+                    next_depth = depth + 1
+            elif _MeterManager.is_boundary_crossing_logical_tie(
+                boundary_depth=boundary_depth,
+                boundary_offsets=boundary_offsets,
+                logical_tie_start_offset=start_offset,
+                logical_tie_stop_offset=stop_offset,
+            ):
+                offsets = boundary_offsets
+                if start_offset in boundary_offsets:
+                    offsets = reversed(boundary_offsets)
+                for offset in offsets:
+                    if start_offset < offset < stop_offset:
+                        split_offset = offset
+                        break
+                assert split_offset is not None
+            else:
+                segments.append(stop_offset - start_offset)
+                return
+            if split_offset is None:
+                pairs = [(start_offset, stop_offset)]
+            else:
+                pairs = [(start_offset, split_offset), (split_offset, stop_offset)]
+            for start_offset, stop_offset in pairs:
+                recurse(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=next_depth,
+                    offset_inventory=offset_inventory,
+                    ratio=ratio,
+                    segments=segments,
+                    start_offset=start_offset,
+                    stop_offset=stop_offset,
+                )
+
+        def plan(components, meter, boundary_depth):
+            boundary_depth = boundary_depth or meter.preferred_boundary_depth
+            if boundary_depth is not None:
+                boundary_depth = int(boundary_depth)
+            first_offset = components[0]._get_timespan().start_offset
+            last_offset = components[-1]._get_timespan().start_offset
+            assert last_offset - first_offset < meter.implied_time_signature.duration
+            if components[0]._parent is None:
+                prolation = 1
+            else:
+                prolation = Parentage(components[0]._parent).prolation
+            # offsets are kept relative to the first component, so one
+            # inventory serves every measure with the same meter and prolation
+            key = (meter.rtm_format, prolation)
+            if key not in offset_inventories:
+                offset_inventory = []
+                for offsets in meter.depthwise_offset_inventory:
+                    offsets = [_ * prolation for _ in offsets]
+                    offset_inventory.append(tuple(offsets))
+                offset_inventories[key] = offset_inventory
+            offset_inventory = offset_inventories[key]
+            if boundary_depth is not None:
+                boundary_offsets = offset_inventory[boundary_depth]
+            else:
+                boundary_offsets = None
+            for item in _MeterManager.iterate_rewrite_inputs(components):
+                if isinstance(item, LogicalTie):
+                    timespan = _inspect._get_timespan(item)
+                    ratio = item._get_preprolated_duration() / timespan.duration
+                    segments = []
+                    recurse(
+                        boundary_depth=boundary_depth,
+                        boundary_offsets=boundary_offsets,
+                        offset_inventory=offset_inventory,
+                        ratio=ratio,
+                        segments=segments,
+                        start_offset=timespan.start_offset - first_offset,
+                        stop_offset=timespan.stop_offset - first_offset,
+                    )
+                    rewrites.append((item, segments))
+                elif isinstance(item, Tuplet) and not rewrite_tuplets:
+                    pass
+                else:
+                    preprolated_duration = sum(
+                        [_._get_preprolated_duration() for _ in item]
+                    )
+                    if preprolated_duration.numerator == 1:
+                        preprolated_duration = NonreducedFraction(preprolated_duration)
+                        preprolated_duration = preprolated_duration.with_denominator(
+                            preprolated_duration.denominator * 4
+                        )
+                    sub_boundary_depth = 1
+                    if boundary_depth is None:
+                        sub_boundary_depth = None
+                    plan(item[:], Meter(preprolated_duration), sub_boundary_depth)
+
+        assert isinstance(components, Selection), repr(components)
+        assert components.are_contiguous_logical_voice()
+        meters = MeterList(meters)
+        if maximum_dot_count is not None:
+            maximum_dot_count = int(maximum_dot_count)
+            assert 0 <= maximum_dot_count
+        if not components:
+            return
+        groups = [[] for _ in meters]
+        start_offset = components[0]._get_timespan().start_offset
+        stop_offsets = math.cumulative_sums(
+            [_.implied_time_signature.duration for _ in meters], start=start_offset
+        )[1:]
+        for component in components:
+            start_offset = component._get_timespan().start_offset
+            index = bisect.bisect_right(stop_offsets, start_offset)
+            assert index < len(meters), repr(component)
+            groups[index].append(component)
+        offset_inventories, rewrites = {}, []
+        for group, meter in zip(groups, meters):
+            if not group:
+                continue
+            if (
+                len(group) == 1
+                and type(group[0]) is Container
+                and group[0]._get_duration() == meter.implied_time_signature.duration
+            ):
+                group = group[0][:]
+            plan(Selection(group), meter, boundary_depth)
+        for logical_tie, segments in rewrites:
+            if len(segments) == 1:
+                mutate._fuse(logical_tie[:])
+                continue
+            for shard in mutate.split(logical_tie[:], segments[:-1]):
+                mutate._fuse(shard)
+
 
 class MeterList(TypedList):
     """
@@ -2999,11 +3340,14 @@ class _MeterFittingSession:
         "_maximum_run_length",
         "_meters",
         "_offset_counter",
+        "_optimal",
         "_ordered_offsets",
     )
 
     KernelScore = collections.namedtuple("KernelScore", ("kernel", "score"))
 
+    MeterScore = collections.namedtuple("MeterScore", ("offset", "meter", "score"))
+
     ### INITIALIZER ###
 
     def __init__(
@@ -3012,8 +3356,10 @@ class _MeterFittingSession:
         maximum_run_length=None,
         meters=None,
         offset_counter=None,
+        optimal=False,
     ):
         self._cached_offset_counters = {}
+        self._optimal = bool(optimal)
         if maximum_run_length is not None:
             maximum_run_length = int(maximum_run_length)
             assert 0 < maximum_run_length
@@ -3045,6 +3391,10 @@ class _MeterFittingSession:
 
         Returns meter list.
         """
+        if self.optimal:
+            selected_kernels = self._fit_optimally()
+            selected_meters = (self.kernels[_] for _ in selected_kernels)
+            return MeterList(selected_meters)
         selected_kernels = []
         current_offset = Offset(0)
         while current_offset < self.ordered_offsets[-1]:
@@ -3083,6 +3433,83 @@ class _MeterFittingSession:
 
     ### PRIVATE METHODS ###
 
+    def _fit_optimally(self):
+        if not self.ordered_offsets or not self.kernels:
+            return []
+        kernels = tuple(self.kernels)
+        _, weight_arrays = self._get_weight_arrays(kernels)
+        durations = [len(_) - 1 for _ in weight_arrays]
+        counts, stop = self._get_integer_offset_counts()
+        positions, frontier = {0}, [0]
+        while frontier:
+            position = frontier.pop()
+            if stop <= position:
+                continue
+            for duration in durations:
+                if position + duration not in positions:
+                    positions.add(position + duration)
+                    frontier.append(position + duration)
+        # scatters each offset count into every kernel placement covering it;
+        # windows are half-open so that each offset is weighted only once
+        scores = [collections.Counter() for _ in kernels]
+        for offset, count in counts.items():
+            for weight_array, scores_ in zip(weight_arrays, scores):
+                for index, weight in enumerate(weight_array[:-1]):
+                    if weight and offset - index in positions:
+                        scores_[offset - index] += weight * count
+        maximum_run_length = self.maximum_run_length
+        if len(kernels) == 1:
+            maximum_run_length = None
+        states = [(None, 0)]
+        for i in range(len(kernels)):
+            if maximum_run_length is None:
+                states.append((i, 0))
+            else:
+                states.extend((i, _) for _ in range(1, maximum_run_length + 1))
+        # maps (position, previous kernel, run length) to (total, kernel);
+        # ties prefer repeating the previous kernel, then the longer kernel
+        best = {}
+        for position in sorted(positions, reverse=True):
+            if stop <= position:
+                continue
+            for previous, run in states:
+                winner = None
+                for i, duration in enumerate(durations):
+                    next_run = 0
+                    if maximum_run_length is not None:
+                        next_run = run + 1 if i == previous else 1
+                        if maximum_run_length < next_run:
+                            continue
+                    total = scores[i][position]
+                    if stop <= position + duration:
+                        total += weight_arrays[i][-1] * counts[position + duration]
+                    else:
+                        total += best[position + duration, i, next_run][0]
+                    candidate = (total, i == previous, duration, -i)
+                    if winner is None or winner < candidate:
+                        winner = candidate
+                best[position, previous, run] = (winner[0], -winner[-1])
+        selected_kernels = []
+        position, previous, run = 0, None, 0
+        while position < stop:
+            i = best[position, previous, run][1]
+            selected_kernels.append(kernels[i])
+            if maximum_run_length is not None:
+                run = run + 1 if i == previous else 1
+            position, previous = position + durations[i], i
+        return selected_kernels
+
+    def _get_integer_offset_counts(self):
+        denominator = int(self.kernel_denominator)
+        counts = collections.Counter()
+        for offset, count in self.offset_counter.items():
+            offset *= denominator
+            if offset.denominator == 1 and 0 <= offset:
+                counts[offset.numerator] += count
+        stop = self.ordered_offsets[-1] * denominator
+        stop = -(-stop.numerator // stop.denominator)
+        return counts, stop
+
     def _get_kernels(self, selected_kernels):
         return tuple(self.kernels)
 
@@ -3114,6 +3541,73 @@ class _MeterFittingSession:
         self.cached_offset_counters[start_offset] = offset_counter
         return offset_counter
 
+    def _get_weight_arrays(self, kernels):
+        # scales every kernel so that its downbeat weighs the same integer
+        # and every other weight stays exact
+        denominator = int(self.kernel_denominator)
+        kernel_to_ratios = {}
+        for kernel in kernels:
+            downbeat_weight = kernel._kernel[Offset(0)]
+            kernel_to_ratios[kernel] = [
+                (offset, Multiplier(weight) / downbeat_weight)
+                for offset, weight in kernel._kernel.items()
+            ]
+        multiple = math.least_common_multiple(
+            1,
+            *(
+                ratio.denominator
+                for ratios in kernel_to_ratios.values()
+                for _, ratio in ratios
+            ),
+        )
+        weight_arrays = []
+        for kernel in kernels:
+            duration = kernel.duration * denominator
+            assert duration.denominator == 1, repr(kernel)
+            weight_array = [0] * (duration.numerator + 1)
+            for offset, ratio in kernel_to_ratios[kernel]:
+                index = offset * denominator
+                assert index.denominator == 1, repr(offset)
+                weight = ratio * multiple
+                assert weight.denominator == 1, repr(weight)
+                weight_array[index.numerator] = weight.numerator
+            weight_arrays.append(weight_array)
+        return multiple, weight_arrays
+
+    ### PUBLIC METHODS ###
+
+    def get_scores(self, meters):
+        """
+        Gets start offset and kernel response of each meter in ``meters``.
+
+        Returns tuple of meter scores.
+        """
+        rtm_format_to_kernel = {
+            _.rtm_format: kernel for kernel, _ in self.kernels.items()
+        }
+        kernels = [rtm_format_to_kernel[_.rtm_format] for _ in meters]
+        if self.optimal and kernels:
+            multiple, weight_arrays = self._get_weight_arrays(tuple(self.kernels))
+            kernel_to_weight_array = dict(zip(self.kernels, weight_arrays))
+            counts, _ = self._get_integer_offset_counts()
+        meter_scores, offset, position = [], Offset(0), 0
+        for i, (meter, kernel) in enumerate(zip(meters, kernels)):
+            if not self.optimal:
+                score = kernel(self._get_offset_counter_at(offset))
+            else:
+                weight_array = kernel_to_weight_array[kernel]
+                score = sum(
+                    weight * counts[position + index]
+                    for index, weight in enumerate(weight_array[:-1])
+                )
+                position += len(weight_array) - 1
+                if i == len(kernels) - 1:
+                    score += weight_array[-1] * counts[position]
+                score = Multiplier(score, multiple)
+            meter_scores.append(self.MeterScore(offset, meter, score))
+            offset += kernel.duration
+        return tuple(meter_scores)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -3179,6 +3673,15 @@ class _MeterFittingSession:
         """
         return self._offset_counter
 
+    @property
+    def optimal(self):
+        """
+        Is true when session fits meters by dynamic programming.
+
+        Returns true or false.
+        """
+        return self._optimal
+
     @property
     def ordered_offsets(self):
         """
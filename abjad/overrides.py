@@ -1370,6 +1370,8 @@ def override(argument):
     """
     if getattr(argument, "_overrides", None) is None:
         argument._overrides = OverrideInterface()
+    if hasattr(argument, "_clear_format_cache"):
+        argument._clear_format_cache()
     return argument._overrides
 
 
@@ -1556,6 +1558,8 @@ def setting(argument):
     """
     if getattr(argument, "_lilypond_setting_name_manager", None) is None:
         argument._lilypond_setting_name_manager = SettingInterface()
+    if hasattr(argument, "_clear_format_cache"):
+        argument._clear_format_cache()
     return argument._lilypond_setting_name_manager
 
 
@@ -2183,4 +2187,8 @@ def tweak(argument, *, deactivate=None, expression=None, literal=None, tag=None)
     else:
         interface = argument._tweaks
         interface.__init__(deactivate=deactivate, literal=literal, tag=tag)
+    if hasattr(argument, "_clear_format_cache"):
+        argument._clear_format_cache()
+    elif getattr(argument, "_client", None) is not None:
+        argument._client._clear_format_cache()
     return interface
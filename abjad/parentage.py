@@ -1,7 +1,6 @@
 import collections
 import typing
 
-from . import math
 from .duration import Multiplier
 from .ordereddict import OrderedDict
 from .score import (
@@ -113,14 +112,6 @@ class Parentage(collections.abc.Sequence):
         rhs = getattr(component, "name", None) or id(component)
         return f"{lhs}-{rhs!r}"
 
-    def _prolations(self):
-        prolations = []
-        default = Multiplier(1)
-        for parent in self:
-            prolation = getattr(parent, "implied_prolation", default)
-            prolations.append(prolation)
-        return prolations
-
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -660,9 +651,9 @@ class Parentage(collections.abc.Sequence):
             Note("fs'16")                  Multiplier(2, 3)
 
         """
-        prolations = [Multiplier(1)] + self._prolations()
-        products = math.cumulative_products(prolations)
-        return products[-1]
+        if self.component is None:
+            return Multiplier(1)
+        return self.component._get_prolation()
 
     @property
     def root(self) -> Component:
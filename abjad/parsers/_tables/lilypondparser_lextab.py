@@ -0,0 +1,10 @@
+# lilypondparser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ANGLE_CLOSE', 'ANGLE_OPEN', 'BACKUP', 'CHANGE', 'CHORD_REPETITION', 'CONTEXT', 'CONTEXT_DEF_IDENTIFIER', 'CONTEXT_MOD_IDENTIFIER', 'DEFAULT', 'DOUBLE_ANGLE_CLOSE', 'DOUBLE_ANGLE_OPEN', 'DURATION_IDENTIFIER', 'EVENT_FUNCTION', 'EVENT_IDENTIFIER', 'EXPECT_DURATION', 'EXPECT_MARKUP', 'EXPECT_MARKUP_LIST', 'EXPECT_NO_MORE_ARGS', 'EXPECT_OPTIONAL', 'EXPECT_PITCH', 'EXPECT_SCM', 'EXTENDER', 'E_ANGLE_CLOSE', 'E_ANGLE_OPEN', 'E_BACKSLASH', 'E_CLOSE', 'E_EXCLAMATION', 'E_OPEN', 'E_UNSIGNED', 'FRACTION', 'HEADER', 'HYPHEN', 'LAYOUT', 'MARKUP', 'MARKUPLIST', 'MARKUPLIST_IDENTIFIER', 'MARKUP_FUNCTION', 'MARKUP_IDENTIFIER', 'MARKUP_LIST_FUNCTION', 'MIDI', 'MULTI_MEASURE_REST', 'MUSIC_FUNCTION', 'MUSIC_IDENTIFIER', 'NEWCONTEXT', 'NOTENAME_PITCH', 'NUMBER_IDENTIFIER', 'OUTPUT_DEF_IDENTIFIER', 'OVERRIDE', 'PAPER', 'PITCH_IDENTIFIER', 'REAL', 'REPARSE', 'REST', 'RESTNAME', 'REVERT', 'SCM_FUNCTION', 'SCM_IDENTIFIER', 'SCM_TOKEN', 'SCORE', 'SCORE_IDENTIFIER', 'SEQUENTIAL', 'SET', 'SIMULTANEOUS', 'STRING', 'STRING_IDENTIFIER', 'TEMPO', 'TONICNAME_PITCH', 'UNSET', 'UNSIGNED', 'WITH'))
+_lexreflags   = 64
+_lexliterals  = "!'()*+,-./:<=>?[\\^_{|}~]"
+_lexstateinfo = {'INITIAL': 'inclusive', 'longcomment': 'exclusive', 'markup': 'exclusive', 'notes': 'exclusive', 'quote': 'exclusive', 'version': 'exclusive', 'scheme': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ANY_165>\\r)|(?P<t_INITIAL_markup_notes_210>%{)|(?P<t_INITIAL_markup_notes_214>%[^{\\n\\r][^\\n\\r]*[\\n\\r])|(?P<t_INITIAL_markup_notes_214_EOF>%[^{\\n\\r][^\\n\\r]*$)|(?P<t_INITIAL_markup_notes_216>%[^{\\n\\r])|(?P<t_INITIAL_markup_notes_218>%[\\n\\r])|(?P<t_INITIAL_markup_notes_220>%[^{\\n\\r][^\\n\\r]*)|(?P<t_INITIAL_markup_notes_222>[ \n\t\x0c\r])|(?P<t_INITIAL_markup_notes_227>\\")|(?P<t_INITIAL_notes_233>\\\\version[ \\n\\t\\f\\r]*)|(?P<t_INITIAL_markup_notes_353>\\#)|(?P<t_INITIAL_notes_387>\\<\\<)|(?P<t_INITIAL_notes_390>\\>\\>)|(?P<t_INITIAL_notes_396>\\<)|(?P<t_INITIAL_notes_399>\\>)|(?P<t_INITIAL_643>[a-zA-Z\\200-\\377]((([a-zA-Z\\200-\\377]|_)|[0-9])|-)*)|(?P<t_INITIAL_646>\\\\[a-zA-Z\\200-\\377]((([a-zA-Z\\200-\\377]|_)|[0-9])|-)*)|(?P<t_651_a>(((-?[0-9]+)\\.[0-9]*)|(-?\\.[0-9]+)))|(?P<t_651_b>-[0-9]+)|(?P<t_661>-\\.)|(?P<t_666>[0-9]+)|(?P<t_INITIAL_notes_686>\\\\.)|(?P<t_newline>\\n+)', [None, ('t_ANY_165', '165'), ('t_INITIAL_markup_notes_210', '210'), ('t_INITIAL_markup_notes_214', '214'), ('t_INITIAL_markup_notes_214_EOF', '214_EOF'), ('t_INITIAL_markup_notes_216', '216'), ('t_INITIAL_markup_notes_218', '218'), ('t_INITIAL_markup_notes_220', '220'), ('t_INITIAL_markup_notes_222', '222'), ('t_INITIAL_markup_notes_227', '227'), ('t_INITIAL_notes_233', '233'), ('t_INITIAL_markup_notes_353', '353'), ('t_INITIAL_notes_387', '387'), ('t_INITIAL_notes_390', '390'), ('t_INITIAL_notes_396', '396'), ('t_INITIAL_notes_399', '399'), ('t_INITIAL_643', '643'), None, None, None, ('t_INITIAL_646', '646'), None, None, None, ('t_651_a', '651_a'), None, None, None, None, ('t_651_b', '651_b'), ('t_661', '661'), ('t_666', '666'), ('t_INITIAL_notes_686', '686'), ('t_newline', 'newline')])], 'longcomment': [('(?P<t_ANY_165>\\r)|(?P<t_longcomment_296>%})|(?P<t_longcomment_291>[^%]+)|(?P<t_longcomment_293>%+[^}%]*)', [None, ('t_ANY_165', '165'), ('t_longcomment_296', '296'), ('t_longcomment_291', '291'), ('t_longcomment_293', '293')])], 'markup': [('(?P<t_ANY_165>\\r)|(?P<t_INITIAL_markup_notes_210>%{)|(?P<t_INITIAL_markup_notes_214>%[^{\\n\\r][^\\n\\r]*[\\n\\r])|(?P<t_INITIAL_markup_notes_214_EOF>%[^{\\n\\r][^\\n\\r]*$)|(?P<t_INITIAL_markup_notes_216>%[^{\\n\\r])|(?P<t_INITIAL_markup_notes_218>%[\\n\\r])|(?P<t_INITIAL_markup_notes_220>%[^{\\n\\r][^\\n\\r]*)|(?P<t_INITIAL_markup_notes_222>[ \n\t\x0c\r])|(?P<t_INITIAL_markup_notes_227>\\")|(?P<t_INITIAL_markup_notes_353>\\#)|(?P<t_markup_545>\\\\score)|(?P<t_markup_548>\\\\([a-zA-Z\\200-\\377]|[-_])+)|(?P<t_markup_601>[^#{}\\"\\\\ \\t\\n\\r\\f]+)', [None, ('t_ANY_165', '165'), ('t_INITIAL_markup_notes_210', '210'), ('t_INITIAL_markup_notes_214', '214'), ('t_INITIAL_markup_notes_214_EOF', '214_EOF'), ('t_INITIAL_markup_notes_216', '216'), ('t_INITIAL_markup_notes_218', '218'), ('t_INITIAL_markup_notes_220', '220'), ('t_INITIAL_markup_notes_222', '222'), ('t_INITIAL_markup_notes_227', '227'), ('t_INITIAL_markup_notes_353', '353'), ('t_markup_545', '545'), ('t_markup_548', '548'), None, ('t_markup_601', '601')])], 'notes': [('(?P<t_ANY_165>\\r)|(?P<t_INITIAL_markup_notes_210>%{)|(?P<t_INITIAL_markup_notes_214>%[^{\\n\\r][^\\n\\r]*[\\n\\r])|(?P<t_INITIAL_markup_notes_214_EOF>%[^{\\n\\r][^\\n\\r]*$)|(?P<t_INITIAL_markup_notes_216>%[^{\\n\\r])|(?P<t_INITIAL_markup_notes_218>%[\\n\\r])|(?P<t_INITIAL_markup_notes_220>%[^{\\n\\r][^\\n\\r]*)|(?P<t_INITIAL_markup_notes_222>[ \n\t\x0c\r])|(?P<t_INITIAL_markup_notes_227>\\")|(?P<t_INITIAL_notes_233>\\\\version[ \\n\\t\\f\\r]*)|(?P<t_INITIAL_markup_notes_353>\\#)|(?P<t_INITIAL_notes_387>\\<\\<)|(?P<t_INITIAL_notes_390>\\>\\>)|(?P<t_INITIAL_notes_396>\\<)|(?P<t_INITIAL_notes_399>\\>)|(?P<t_notes_417>[a-zA-Z\\200-\\377]+)|(?P<t_notes_421>\\\\[a-zA-Z\\200-\\377]+)|(?P<t_notes_424>[0-9]+\\/[0-9]+)|(?P<t_notes_428>[0-9]+/\\/)|(?P<t_notes_428b>[0-9]+)|(?P<t_notes_433>\\\\[0-9]+)|(?P<t_INITIAL_notes_686>\\\\.)', [None, ('t_ANY_165', '165'), ('t_INITIAL_markup_notes_210', '210'), ('t_INITIAL_markup_notes_214', '214'), ('t_INITIAL_markup_notes_214_EOF', '214_EOF'), ('t_INITIAL_markup_notes_216', '216'), ('t_INITIAL_markup_notes_218', '218'), ('t_INITIAL_markup_notes_220', '220'), ('t_INITIAL_markup_notes_222', '222'), ('t_INITIAL_markup_notes_227', '227'), ('t_INITIAL_notes_233', '233'), ('t_INITIAL_markup_notes_353', '353'), ('t_INITIAL_notes_387', '387'), ('t_INITIAL_notes_390', '390'), ('t_INITIAL_notes_396', '396'), ('t_INITIAL_notes_399', '399'), ('t_notes_417', '417'), ('t_notes_421', '421'), ('t_notes_424', '424'), ('t_notes_428', '428'), ('t_notes_428b', '428b'), ('t_notes_433', '433'), ('t_INITIAL_notes_686', '686')])], 'quote': [('(?P<t_ANY_165>\\r)|(?P<t_quote_440>\\[nt\\\\\'"])|(?P<t_quote_XXX>\\\\")|(?P<t_quote_443>[^\\\\""]+)|(?P<t_quote_446>\\")|(?P<t_quote_456>.)', [None, ('t_ANY_165', '165'), ('t_quote_440', '440'), ('t_quote_XXX', 'XXX'), ('t_quote_443', '443'), ('t_quote_446', '446'), ('t_quote_456', '456')])], 'version': [('(?P<t_ANY_165>\\r)|(?P<t_version_242>\\"[^"]*\\")|(?P<t_version_278>(.|\\n))|(?P<t_version_341>"[^"]*)', [None, ('t_ANY_165', '165'), ('t_version_242', '242'), ('t_version_278', '278'), None, ('t_version_341', '341')])], 'scheme': [('(?P<t_ANY_165>\\r)', [None, ('t_ANY_165', '165')])]}
+_lexstateignore = {'INITIAL': '', 'longcomment': '', 'markup': '', 'notes': '', 'quote': '', 'scheme': '', 'version': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'longcomment': 't_error', 'markup': 't_error', 'notes': 't_error', 'quote': 't_error', 'scheme': 't_error', 'version': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,398 @@
+
+# lilypondparser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "start_symbolnonassocCOMPOSITEnonassocDEFAULTnonassocFUNCTION_ARGLISTrightPITCH_IDENTIFIERNOTENAME_PITCHTONICNAME_PITCHUNSIGNEDREALDURATION_IDENTIFIER:nonassocNUMBER_IDENTIFIER/left+-ANGLE_CLOSE ANGLE_OPEN BACKUP CHANGE CHORD_REPETITION CONTEXT CONTEXT_DEF_IDENTIFIER CONTEXT_MOD_IDENTIFIER DEFAULT DOUBLE_ANGLE_CLOSE DOUBLE_ANGLE_OPEN DURATION_IDENTIFIER EVENT_FUNCTION EVENT_IDENTIFIER EXPECT_DURATION EXPECT_MARKUP EXPECT_MARKUP_LIST EXPECT_NO_MORE_ARGS EXPECT_OPTIONAL EXPECT_PITCH EXPECT_SCM EXTENDER E_ANGLE_CLOSE E_ANGLE_OPEN E_BACKSLASH E_CLOSE E_EXCLAMATION E_OPEN E_UNSIGNED FRACTION HEADER HYPHEN LAYOUT MARKUP MARKUPLIST MARKUPLIST_IDENTIFIER MARKUP_FUNCTION MARKUP_IDENTIFIER MARKUP_LIST_FUNCTION MIDI MULTI_MEASURE_REST MUSIC_FUNCTION MUSIC_IDENTIFIER NEWCONTEXT NOTENAME_PITCH NUMBER_IDENTIFIER OUTPUT_DEF_IDENTIFIER OVERRIDE PAPER PITCH_IDENTIFIER REAL REPARSE REST RESTNAME REVERT SCM_FUNCTION SCM_IDENTIFIER SCM_TOKEN SCORE SCORE_IDENTIFIER SEQUENTIAL SET SIMULTANEOUS STRING STRING_IDENTIFIER TEMPO TONICNAME_PITCH UNSET UNSIGNED WITHstart_symbol : lilypondassignment : assignment_id '=' identifier_initassignment : embedded_scmassignment_id : STRINGbare_number : REAL NUMBER_IDENTIFIERbare_number : UNSIGNED NUMBER_IDENTIFIERbare_number : bare_number_closedbare_number_closed : NUMBER_IDENTIFIERbare_number_closed : REALbare_number_closed : UNSIGNEDbare_unsigned : UNSIGNEDbraced_music_list : '{' music_list '}'chord_body : ANGLE_OPEN chord_body_elements ANGLE_CLOSEchord_body_element : music_function_chord_bodychord_body_element : pitch exclamations questions octave_check post_eventschord_body_elements : chord_body_elements : chord_body_elements chord_body_elementclosed_music : complex_music_prefix closed_musicclosed_music : music_barecommand_element : '|'command_element : E_BACKSLASHcommand_element : command_eventcommand_event : tempo_eventcomplex_music : complex_music_prefix musiccomplex_music : music_function_callcomplex_music_prefix : CONTEXT simple_string optional_id optional_context_modcomplex_music_prefix : NEWCONTEXT simple_string optional_id optional_context_modcomposite_music : complex_musiccomposite_music : music_barecontext_change : CHANGE STRING '=' STRINGcontext_def_spec_block : CONTEXT '{' context_def_spec_body '}'context_def_spec_body : CONTEXT_DEF_IDENTIFIERcontext_def_spec_body : context_def_spec_body : context_def_spec_body context_modcontext_def_spec_body : context_def_spec_body context_modificationcontext_def_spec_body : context_def_spec_body embedded_scmcontext_mod : property_operationcontext_mod_list : context_mod_list : context_mod_list CONTEXT_MOD_IDENTIFIERcontext_mod_list : context_mod_list context_modcontext_mod_list : context_mod_list embedded_scmcontext_modification : CONTEXT_MOD_IDENTIFIERcontext_modification : WITH CONTEXT_MOD_IDENTIFIERcontext_modification : WITH '{' context_mod_list '}'context_modification : WITH embedded_scm_closedcontext_prop_spec : simple_stringcontext_prop_spec : simple_string '.' simple_stringdirection_less_char : '~'direction_less_char : '('direction_less_char : ')'direction_less_char : '['direction_less_char : ']'direction_less_char : E_ANGLE_CLOSEdirection_less_char : E_ANGLE_OPENdirection_less_char : E_CLOSEdirection_less_char : E_EXCLAMATIONdirection_less_char : E_OPENdirection_less_event : EVENT_IDENTIFIERdirection_less_event : direction_less_chardirection_less_event : event_function_eventdirection_less_event : tremolo_typedirection_reqd_event : gen_text_defdirection_reqd_event : script_abbreviationdots : dots : dots '.'duration_length : multiplied_durationembedded_scm : embedded_scm_bareembedded_scm : scm_function_callembedded_scm_arg : embedded_scm_bare_argembedded_scm_arg : music_argembedded_scm_arg : scm_function_callembedded_scm_arg_closed : closed_musicembedded_scm_arg_closed : embedded_scm_bare_argembedded_scm_arg_closed : scm_function_call_closedembedded_scm_bare : SCM_IDENTIFIERembedded_scm_bare : SCM_TOKENembedded_scm_bare_arg : STRINGembedded_scm_bare_arg : STRING_IDENTIFIERembedded_scm_bare_arg : context_def_spec_blockembedded_scm_bare_arg : context_modificationembedded_scm_bare_arg : embedded_scm_bareembedded_scm_bare_arg : full_markupembedded_scm_bare_arg : full_markup_listembedded_scm_bare_arg : output_defembedded_scm_bare_arg : score_blockembedded_scm_chord_body : SCM_FUNCTION music_function_chord_body_arglistembedded_scm_chord_body : bare_numberembedded_scm_chord_body : chord_body_elementembedded_scm_chord_body : embedded_scm_bare_argembedded_scm_chord_body : fractionembedded_scm_closed : embedded_scm_bareembedded_scm_closed : scm_function_call_closedevent_chord : CHORD_REPETITION optional_notemode_duration post_eventsevent_chord : MULTI_MEASURE_REST optional_notemode_duration post_eventsevent_chord : command_elementevent_chord : note_chord_elementevent_chord : simple_chord_elements post_eventsevent_function_event : EVENT_FUNCTION function_arglist_closedexclamations : exclamations : exclamations '!'fingering : UNSIGNEDfraction : FRACTIONfraction : UNSIGNED '/' UNSIGNEDfull_markup : MARKUP_IDENTIFIERfull_markup : MARKUP markup_topfull_markup_list : MARKUPLIST_IDENTIFIERfull_markup_list : MARKUPLIST markup_listfunction_arglist : function_arglist_commonfunction_arglist : function_arglist_nonbackupfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed_keep duration_lengthfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_PITCH function_arglist_keep pitch_also_in_chordsfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_backup BACKUPfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep '-' NUMBER_IDENTIFIERfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep '-' REALfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep '-' UNSIGNEDfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep FRACTIONfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep NUMBER_IDENTIFIERfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep REALfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep UNSIGNEDfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep post_event_nofingerfunction_arglist_backup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_keep embedded_scm_arg_closedfunction_arglist_backup : function_arglist_backup REPARSE bare_numberfunction_arglist_backup : function_arglist_backup REPARSE embedded_scm_arg_closedfunction_arglist_backup : function_arglist_backup REPARSE fractionfunction_arglist_bare : EXPECT_DURATION function_arglist_closed_optional duration_lengthfunction_arglist_bare : EXPECT_NO_MORE_ARGSfunction_arglist_bare : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_skip DEFAULTfunction_arglist_bare : EXPECT_OPTIONAL EXPECT_PITCH function_arglist_skip DEFAULTfunction_arglist_bare : EXPECT_OPTIONAL EXPECT_SCM function_arglist_skip DEFAULTfunction_arglist_bare : EXPECT_PITCH function_arglist_optional pitch_also_in_chordsfunction_arglist_closed : function_arglist_closed_commonfunction_arglist_closed : function_arglist_nonbackupfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional '-' NUMBER_IDENTIFIERfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional '-' REALfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional '-' UNSIGNEDfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional bare_numberfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional fractionfunction_arglist_closed_common : EXPECT_SCM function_arglist_closed_optional post_event_nofingerfunction_arglist_closed_common : EXPECT_SCM function_arglist_optional embedded_scm_arg_closedfunction_arglist_closed_common : function_arglist_barefunction_arglist_closed_keep : function_arglist_backupfunction_arglist_closed_keep : function_arglist_closed_commonfunction_arglist_closed_optional : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed_optionalfunction_arglist_closed_optional : EXPECT_OPTIONAL EXPECT_PITCH function_arglist_closed_optionalfunction_arglist_closed_optional : function_arglist_backup BACKUPfunction_arglist_closed_optional : function_arglist_closed_keep %prec FUNCTION_ARGLISTfunction_arglist_common : EXPECT_SCM function_arglist_closed_optional bare_numberfunction_arglist_common : EXPECT_SCM function_arglist_closed_optional fractionfunction_arglist_common : EXPECT_SCM function_arglist_closed_optional post_event_nofingerfunction_arglist_common : EXPECT_SCM function_arglist_optional embedded_scm_argfunction_arglist_common : function_arglist_barefunction_arglist_common : function_arglist_common_minusfunction_arglist_common_minus : EXPECT_SCM function_arglist_closed_optional '-' NUMBER_IDENTIFIERfunction_arglist_common_minus : EXPECT_SCM function_arglist_closed_optional '-' REALfunction_arglist_common_minus : EXPECT_SCM function_arglist_closed_optional '-' UNSIGNEDfunction_arglist_common_minus : function_arglist_common_minus REPARSE bare_numberfunction_arglist_keep : function_arglist_backupfunction_arglist_keep : function_arglist_commonfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed duration_lengthfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_PITCH function_arglist pitch_also_in_chordsfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist embedded_scm_arg_closedfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed '-' NUMBER_IDENTIFIERfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed '-' REALfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed '-' UNSIGNEDfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed FRACTIONfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed bare_number_closedfunction_arglist_nonbackup : EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed post_event_nofingerfunction_arglist_optional : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_optionalfunction_arglist_optional : EXPECT_OPTIONAL EXPECT_PITCH function_arglist_optionalfunction_arglist_optional : function_arglist_backup BACKUPfunction_arglist_optional : function_arglist_keep %prec FUNCTION_ARGLISTfunction_arglist_skip : EXPECT_OPTIONAL EXPECT_DURATION function_arglist_skip %prec FUNCTION_ARGLISTfunction_arglist_skip : EXPECT_OPTIONAL EXPECT_PITCH function_arglist_skip %prec FUNCTION_ARGLISTfunction_arglist_skip : EXPECT_OPTIONAL EXPECT_SCM function_arglist_skip %prec FUNCTION_ARGLISTfunction_arglist_skip : function_arglist_commongen_text_def : full_markupgen_text_def : simple_stringgrouped_music_list : sequential_musicgrouped_music_list : simultaneous_musicidentifier_init : context_def_spec_blockidentifier_init : context_modificationidentifier_init : embedded_scmidentifier_init : full_markupidentifier_init : full_markup_listidentifier_init : musicidentifier_init : number_expressionidentifier_init : output_defidentifier_init : post_event_nofingeridentifier_init : score_blockidentifier_init : stringlilypond : lilypond : lilypond assignmentlilypond : lilypond errorlilypond : lilypond toplevel_expressionlilypond_header : HEADER '{' lilypond_header_body '}'lilypond_header_body : lilypond_header_body : lilypond_header_body assignmentmarkup : markup_head_1_list simple_markupmarkup : simple_markupmarkup_braced_list : '{' markup_braced_list_body '}'markup_braced_list_body : markup_braced_list_body : markup_braced_list_body markupmarkup_braced_list_body : markup_braced_list_body markup_listmarkup_command_basic_arguments : EXPECT_MARKUP_LIST markup_command_list_arguments markup_listmarkup_command_basic_arguments : EXPECT_NO_MORE_ARGSmarkup_command_basic_arguments : EXPECT_SCM markup_command_list_arguments embedded_scm_closedmarkup_command_list : MARKUP_LIST_FUNCTION markup_command_list_argumentsmarkup_command_list_arguments : EXPECT_MARKUP markup_command_list_arguments markupmarkup_command_list_arguments : markup_command_basic_argumentsmarkup_composed_list : markup_head_1_list markup_braced_listmarkup_head_1_item : MARKUP_FUNCTION EXPECT_MARKUP markup_command_list_argumentsmarkup_head_1_list : markup_head_1_itemmarkup_head_1_list : markup_head_1_list markup_head_1_itemmarkup_list : MARKUPLIST_IDENTIFIERmarkup_list : markup_braced_listmarkup_list : markup_command_listmarkup_list : markup_composed_listmarkup_list : markup_scm MARKUPLIST_IDENTIFIERmarkup_scm : embedded_scm_bare BACKUPmarkup_top : markup_head_1_list simple_markupmarkup_top : markup_listmarkup_top : simple_markupmultiplied_duration : multiplied_duration '*' FRACTIONmultiplied_duration : multiplied_duration '*' bare_unsignedmultiplied_duration : steno_durationmusic : composite_music %prec COMPOSITEmusic : simple_musicmusic_arg : composite_music %prec COMPOSITEmusic_arg : simple_musicmusic_bare : MUSIC_IDENTIFIERmusic_bare : grouped_music_listmusic_function_call : MUSIC_FUNCTION function_arglistmusic_function_chord_body : MUSIC_FUNCTION music_function_chord_body_arglistmusic_function_chord_body_arglist : EXPECT_SCM music_function_chord_body_arglist embedded_scm_chord_bodymusic_function_chord_body_arglist : function_arglist_baremusic_function_event : MUSIC_FUNCTION function_arglist_closedmusic_list : music_list : music_list embedded_scmmusic_list : music_list errormusic_list : music_list musicmusic_property_def : simple_music_property_defnote_chord_element : chord_body optional_notemode_duration post_eventsnumber_expression : number_expression '+' number_termnumber_expression : number_expression '-' number_termnumber_expression : number_termnumber_factor : '-' number_factornumber_factor : bare_numbernumber_term : number_factornumber_term : number_factor '*' number_factornumber_term : number_factor '/' number_factoroctave_check : '='octave_check : '=' sub_quotesoctave_check : '=' sup_quotesoctave_check : optional_context_mod : optional_context_mod : context_modificationoptional_id : '=' simple_stringoptional_id : optional_notemode_duration : optional_notemode_duration : multiplied_durationoptional_rest : optional_rest : RESToutput_def : output_def_body '}'output_def_body : output_def_body assignmentoutput_def_body : output_def_head_with_mode_switch '{'output_def_body : output_def_head_with_mode_switch '{' OUTPUT_DEF_IDENTIFIERoutput_def_head : LAYOUToutput_def_head : MIDIoutput_def_head : PAPERoutput_def_head_with_mode_switch : output_def_headpitch : PITCH_IDENTIFIERpitch : steno_pitchpitch_also_in_chords : pitchpitch_also_in_chords : steno_tonic_pitchpost_event : '-' fingeringpost_event : post_event_nofingerpost_event_nofinger : '^' fingeringpost_event_nofinger : '_' fingeringpost_event_nofinger : EXTENDERpost_event_nofinger : HYPHENpost_event_nofinger : direction_less_eventpost_event_nofinger : script_dir direction_less_eventpost_event_nofinger : script_dir direction_reqd_eventpost_event_nofinger : script_dir music_function_eventpost_event_nofinger : string_number_eventpost_events : post_events : post_events post_eventproperty_operation : OVERRIDE simple_string property_path '=' scalarproperty_operation : REVERT simple_string embedded_scmproperty_operation : STRING '=' scalarproperty_operation : UNSET simple_stringproperty_path : property_path_revvedproperty_path_revved : embedded_scm_closedproperty_path_revved : property_path_revved embedded_scm_closedquestions : questions : questions '?'scalar : bare_numberscalar : embedded_scm_argscalar_closed : bare_numberscalar_closed : embedded_scm_arg_closedscm_function_call : SCM_FUNCTION function_arglistscm_function_call_closed : SCM_FUNCTION function_arglist_closed %prec FUNCTION_ARGLISTscore_block : SCORE '{' score_body '}'score_body : SCORE_IDENTIFIERscore_body : musicscore_body : score_body lilypond_headerscore_body : score_body output_defscript_abbreviation : ANGLE_CLOSEscript_abbreviation : '!'script_abbreviation : '+'script_abbreviation : '-'script_abbreviation : '.'script_abbreviation : '^'script_abbreviation : '_'script_dir : '-'script_dir : '^'script_dir : '_'sequential_music : SEQUENTIAL braced_music_listsequential_music : braced_music_listsimple_chord_elements : simple_elementsimple_element : RESTNAME optional_notemode_durationsimple_element : pitch exclamations questions octave_check optional_notemode_duration optional_restsimple_markup : MARKUP_FUNCTION markup_command_basic_argumentssimple_markup : MARKUP_IDENTIFIERsimple_markup : SCORE '{' score_body '}'simple_markup : STRINGsimple_markup : STRING_IDENTIFIERsimple_markup : markup_scm MARKUP_IDENTIFIERsimple_music : context_changesimple_music : event_chordsimple_music : music_property_defsimple_music_property_def : OVERRIDE context_prop_spec property_path '=' scalarsimple_music_property_def : REVERT context_prop_spec embedded_scmsimple_music_property_def : SET context_prop_spec '=' scalarsimple_music_property_def : UNSET context_prop_specsimple_string : STRINGsimple_string : STRING_IDENTIFIERsimultaneous_music : DOUBLE_ANGLE_OPEN music_list DOUBLE_ANGLE_CLOSEsimultaneous_music : SIMULTANEOUS braced_music_liststeno_duration : DURATION_IDENTIFIER dotssteno_duration : bare_unsigned dotssteno_pitch : NOTENAME_PITCHsteno_pitch : NOTENAME_PITCH sub_quotessteno_pitch : NOTENAME_PITCH sup_quotessteno_tonic_pitch : TONICNAME_PITCHsteno_tonic_pitch : TONICNAME_PITCH sub_quotessteno_tonic_pitch : TONICNAME_PITCH sup_quotesstring : STRINGstring : STRING_IDENTIFIERstring : string '+' stringstring_number_event : E_UNSIGNEDsub_quotes : ','sub_quotes : sub_quotes ','sup_quotes : '\\''sup_quotes : sup_quotes '\\''tempo_event : TEMPO scalartempo_event : TEMPO scalar_closed steno_duration '=' tempo_rangetempo_event : TEMPO steno_duration '=' tempo_rangetempo_range : bare_unsignedtempo_range : bare_unsigned '-' bare_unsignedtoplevel_expression : composite_musictoplevel_expression : full_markuptoplevel_expression : full_markup_listtoplevel_expression : lilypond_headertoplevel_expression : output_deftoplevel_expression : score_blocktremolo_type : ':'tremolo_type : ':' bare_unsigned"
+    
+_lr_action_items = {'error':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,31,32,33,38,39,42,43,49,51,52,54,55,56,57,60,63,64,67,72,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,193,194,195,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,329,330,331,333,334,335,336,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,422,426,427,428,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,520,541,542,543,544,545,546,549,550,551,554,560,561,562,563,584,585,586,],[-191,4,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,-25,-230,-231,-178,-179,-319,-237,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,194,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,194,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-238,-239,-240,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,-147,-148,-149,-10,-102,-150,-69,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-139,-153,-154,-155,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-103,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-322,-262,-360,]),'STRING':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,25,27,28,31,32,33,35,36,38,39,42,48,49,50,51,52,53,54,55,56,57,60,62,63,64,67,71,73,74,76,77,78,80,81,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,116,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,186,187,189,191,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,269,271,273,276,277,278,279,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,316,317,318,319,320,321,322,323,324,328,329,330,331,332,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,370,371,373,374,375,376,377,378,379,383,384,385,386,388,389,391,392,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,425,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,461,462,463,464,465,466,467,472,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,508,509,511,512,513,514,515,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-191,14,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,63,-106,14,-75,-76,-25,-230,-231,118,118,-178,-179,-319,149,-105,63,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,-196,-263,-264,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,221,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,118,118,118,118,-23,-259,-99,251,-271,-272,-342,-265,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,118,-42,-245,-315,-316,-317,-279,-280,-281,118,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,63,-207,-209,14,-12,251,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-266,118,-338,149,-33,-43,-38,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,-200,-202,-203,63,-199,63,-195,-197,-303,251,-147,-148,-149,-315,-10,-102,-150,-69,-170,251,-156,-108,251,-109,-151,-125,-66,251,-130,-273,-274,-345,482,-93,-341,-340,-94,-287,-315,-276,-242,118,-333,251,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,510,-32,510,-236,-249,-250,-204,-206,-325,-198,-208,63,-315,-147,-148,-149,-139,-69,118,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,251,-122,-123,-124,-73,-19,-159,-127,-160,-128,251,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,251,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,118,118,118,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,251,-261,-252,-253,-357,251,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,251,-288,]),'MARKUP_IDENTIFIER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,27,28,31,32,33,38,39,42,48,49,50,51,52,53,54,55,56,57,58,60,62,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,177,178,179,180,183,186,187,189,190,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,316,317,318,319,320,321,322,324,328,329,330,331,332,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,377,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,461,462,463,464,465,466,467,472,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,19,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,60,-106,-75,-76,-25,-230,-231,-178,-179,-319,19,-105,60,-222,-221,-212,-214,-215,-216,-217,179,-324,-201,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,19,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-315,-316,-317,-279,-280,-281,19,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,179,-218,-328,-323,-205,60,-207,-209,-219,-12,19,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,-200,-202,-203,60,-199,60,-195,-303,19,-147,-148,-149,-315,-10,-102,-150,-69,-170,19,-156,-108,19,-109,-151,-125,-66,19,-130,-273,-274,-345,-93,-341,-340,-94,-287,-315,-276,-242,-333,19,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,60,-315,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,19,-122,-123,-124,-73,-19,-159,-127,-160,-128,19,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,19,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,19,-261,-252,-253,-357,19,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,19,]),'MARKUP':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,332,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,377,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,418,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,461,462,463,464,465,466,467,472,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,20,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,20,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,20,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-315,-316,-317,-279,-280,-281,20,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,20,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,20,-147,-148,-149,-315,-10,-102,-150,-69,-170,20,-156,-108,20,-109,-151,-125,-66,20,-130,-273,-274,-345,-93,-341,-340,-94,-287,-315,-276,-242,-333,20,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-315,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,20,-122,-123,-124,-73,-19,-159,-127,-160,-128,20,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,20,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,20,-261,-252,-253,-357,20,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,20,]),'MARKUPLIST_IDENTIFIER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,22,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,58,60,62,63,64,67,68,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,186,187,189,190,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,313,316,317,318,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,21,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,54,-106,54,-75,-76,-25,-230,-231,-178,-179,-319,21,-105,-222,-221,-214,-215,-216,-217,178,-324,-201,-326,-327,-107,178,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,21,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,54,-207,-209,-219,-12,21,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,54,-200,-202,-203,-199,-195,-303,21,-147,-148,-149,-10,-102,-150,-69,-170,21,-156,-108,21,-109,-151,-125,-66,21,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,21,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,21,-122,-123,-124,-73,-19,-159,-127,-160,-128,21,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,21,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,21,-261,-252,-253,-357,21,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,21,]),'MARKUPLIST':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,22,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,22,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,22,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,22,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,22,-147,-148,-149,-10,-102,-150,-69,-170,22,-156,-108,22,-109,-151,-125,-66,22,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,22,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,22,-122,-123,-124,-73,-19,-159,-127,-160,-128,22,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,22,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,22,-261,-252,-253,-357,22,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,22,]),'HEADER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,196,197,198,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,315,316,320,322,324,325,326,329,330,331,333,334,335,336,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,422,426,427,428,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,520,541,542,543,544,545,546,549,550,551,554,560,561,562,563,584,585,586,],[-191,23,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,23,-304,-305,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,23,-200,-199,-195,-303,-306,-307,-147,-148,-149,-10,-102,-150,-69,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-139,-153,-154,-155,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-103,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-322,-262,-360,]),'SCORE':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,27,28,31,32,33,38,39,42,48,49,50,51,52,53,54,55,56,57,60,62,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,186,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,316,317,318,319,320,321,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,417,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,26,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,61,-106,-75,-76,-25,-230,-231,-178,-179,-319,26,-105,61,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,26,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,61,-207,-209,-12,26,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,-200,-202,-203,61,-199,61,-195,-303,26,-147,-148,-149,-10,-102,-150,-69,-170,26,-156,-108,26,-109,-151,-125,-66,26,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,26,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,61,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,26,-122,-123,-124,-73,-19,-159,-127,-160,-128,26,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,26,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,26,-261,-252,-253,-357,26,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,26,]),'SCM_IDENTIFIER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,22,24,25,27,28,31,32,33,38,39,42,43,48,49,50,51,52,53,54,55,56,57,60,62,63,64,67,71,72,73,74,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,116,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,186,187,189,191,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,231,232,233,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,269,273,277,278,279,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,313,314,316,317,318,319,320,321,322,323,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,381,382,384,385,386,388,389,391,392,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,488,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,565,566,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-191,27,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,27,-106,27,-237,27,-75,-76,-25,-230,-231,-178,-179,-319,-237,27,-105,27,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,-196,27,-263,-264,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,27,-271,-272,-342,-265,-336,-337,-232,-318,27,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,27,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,27,-207,-209,27,-12,-238,-239,-240,27,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,27,-46,27,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-266,-338,-33,-43,-38,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,27,27,-200,-202,-203,27,-199,27,-195,-197,-303,27,-147,-148,-149,-10,-102,-150,-69,-170,27,-156,-108,27,-109,-151,-125,-66,27,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,27,-293,-333,27,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,27,-32,27,-236,-249,-250,-204,-206,-325,-198,-208,27,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,27,-122,-123,-124,-73,-19,-159,-127,-160,-128,27,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,27,-294,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,27,-261,-252,-253,-357,27,27,27,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,27,-288,]),'SCM_TOKEN':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,22,24,25,27,28,31,32,33,38,39,42,43,48,49,50,51,52,53,54,55,56,57,60,62,63,64,67,71,72,73,74,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,116,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,186,187,189,191,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,231,232,233,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,269,273,277,278,279,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,313,314,316,317,318,319,320,321,322,323,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,381,382,384,385,386,388,389,391,392,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,488,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,565,566,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-191,28,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,28,-106,28,-237,28,-75,-76,-25,-230,-231,-178,-179,-319,-237,28,-105,28,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,-196,28,-263,-264,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,28,-271,-272,-342,-265,-336,-337,-232,-318,28,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,28,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,28,-207,-209,28,-12,-238,-239,-240,28,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,28,-46,28,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-266,-338,-33,-43,-38,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,28,28,-200,-202,-203,28,-199,28,-195,-197,-303,28,-147,-148,-149,-10,-102,-150,-69,-170,28,-156,-108,28,-109,-151,-125,-66,28,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,28,-293,-333,28,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,28,-32,28,-236,-249,-250,-204,-206,-325,-198,-208,28,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,28,-122,-123,-124,-73,-19,-159,-127,-160,-128,28,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,28,-294,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,28,-261,-252,-253,-357,28,28,28,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,28,-288,]),'SCM_FUNCTION':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,25,27,28,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,71,72,73,74,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,116,118,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,191,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,231,232,233,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,269,273,277,278,279,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,314,316,320,322,323,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,381,382,384,385,386,388,389,391,392,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,488,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,565,566,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-191,29,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,29,-75,-76,-25,-230,-231,-178,-179,-319,-237,29,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-196,29,-263,-264,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,262,-271,-272,-342,-265,-336,-337,-232,-318,29,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,283,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,29,-12,-238,-239,-240,29,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,283,-46,29,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-266,-338,-33,-43,-38,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,283,-200,-199,-195,-197,-303,424,-147,-148,-149,-10,-102,-150,-69,-170,283,-156,-108,283,-109,-151,-125,-66,283,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,283,-293,-333,29,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,29,-32,29,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,283,-122,-123,-124,-73,-19,-159,-127,-160,-128,262,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,29,-294,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,577,-261,-252,-253,-357,283,29,29,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,29,-288,]),'MUSIC_IDENTIFIER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-191,32,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,32,-25,-230,-231,-178,-179,-319,-237,32,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,32,-263,32,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,32,-271,-272,-342,-258,-336,-337,-258,-232,-318,32,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,32,-207,-209,-12,-238,-239,-240,32,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,32,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,32,-147,-148,-149,-10,-102,-150,-69,-170,32,-156,-108,32,-109,-151,-125,-66,32,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,32,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,32,-122,-123,-124,-73,32,-19,-159,-127,-160,-128,32,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,32,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,32,-113,-114,-115,-322,-262,-360,32,]),'CONTEXT':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,35,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,35,-25,-230,-231,-178,-179,-319,-237,137,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,35,-263,35,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,137,-271,-272,-342,-258,-336,-337,-258,-232,-318,35,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,35,-207,-209,-12,-238,-239,-240,137,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,35,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,425,-147,-148,-149,-10,-102,-150,-69,-170,425,-156,-108,425,-109,-151,-125,-66,425,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,137,-13,-14,-99,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,425,-122,-123,-124,-73,35,-19,-159,-127,-160,-128,137,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,137,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,582,-261,-252,-253,-357,137,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,137,]),'NEWCONTEXT':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-191,36,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,36,-25,-230,-231,-178,-179,-319,-237,36,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,36,-263,36,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,36,-271,-272,-342,-258,-336,-337,-258,-232,-318,36,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,36,-207,-209,-12,-238,-239,-240,36,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,36,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,36,-147,-148,-149,-10,-102,-150,-69,-170,36,-156,-108,36,-109,-151,-125,-66,36,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,36,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,36,-122,-123,-124,-73,36,-19,-159,-127,-160,-128,36,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,36,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,36,-113,-114,-115,-322,-262,-360,36,]),'MUSIC_FUNCTION':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,236,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,332,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,377,378,379,384,385,386,387,388,389,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,418,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,461,462,463,464,465,466,467,472,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,37,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,37,-25,-230,-231,-178,-179,-319,-237,37,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,37,-263,37,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-16,-259,-99,37,-271,-272,-342,-258,-336,-337,-258,-232,-318,37,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-315,-316,-317,-279,-280,-281,294,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,37,-207,-209,-12,-238,-239,-240,37,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,390,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,37,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,37,-147,-148,-149,-315,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-315,-276,-242,-333,37,-13,-17,-14,-99,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-315,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,37,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,37,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,390,-261,-252,-253,-357,37,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,37,]),'SEQUENTIAL':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-191,41,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,41,-25,-230,-231,-178,-179,-319,-237,41,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,41,-263,41,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,41,-271,-272,-342,-258,-336,-337,-258,-232,-318,41,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,41,-207,-209,-12,-238,-239,-240,41,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,41,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,41,-147,-148,-149,-10,-102,-150,-69,-170,41,-156,-108,41,-109,-151,-125,-66,41,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,41,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,41,-122,-123,-124,-73,41,-19,-159,-127,-160,-128,41,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,41,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,41,-113,-114,-115,-322,-262,-360,41,]),'DOUBLE_ANGLE_OPEN':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-191,43,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,43,-25,-230,-231,-178,-179,-319,-237,43,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,43,-263,43,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,43,-271,-272,-342,-258,-336,-337,-258,-232,-318,43,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,43,-207,-209,-12,-238,-239,-240,43,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,43,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,43,-147,-148,-149,-10,-102,-150,-69,-170,43,-156,-108,43,-109,-151,-125,-66,43,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,43,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,43,-122,-123,-124,-73,43,-19,-159,-127,-160,-128,43,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,43,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,43,-113,-114,-115,-322,-262,-360,43,]),'SIMULTANEOUS':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-191,44,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-237,-75,-76,44,-25,-230,-231,-178,-179,-319,-237,44,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,44,-263,44,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,44,-271,-272,-342,-258,-336,-337,-258,-232,-318,44,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,44,-207,-209,-12,-238,-239,-240,44,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,44,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,44,-147,-148,-149,-10,-102,-150,-69,-170,44,-156,-108,44,-109,-151,-125,-66,44,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,44,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,44,-122,-123,-124,-73,44,-19,-159,-127,-160,-128,44,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,44,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,44,-113,-114,-115,-322,-262,-360,44,]),'LAYOUT':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,196,197,198,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,315,316,320,322,324,325,326,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,45,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,45,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,45,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,45,-304,-305,45,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,45,-200,-199,-195,-303,-306,-307,45,-147,-148,-149,-10,-102,-150,-69,-170,45,-156,-108,45,-109,-151,-125,-66,45,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,45,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,45,-122,-123,-124,-73,-19,-159,-127,-160,-128,45,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,45,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,45,-261,-252,-253,-357,45,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,45,]),'MIDI':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,196,197,198,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,315,316,320,322,324,325,326,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,46,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,46,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,46,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,46,-304,-305,46,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,46,-200,-199,-195,-303,-306,-307,46,-147,-148,-149,-10,-102,-150,-69,-170,46,-156,-108,46,-109,-151,-125,-66,46,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,46,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,46,-122,-123,-124,-73,-19,-159,-127,-160,-128,46,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,46,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,46,-261,-252,-253,-357,46,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,46,]),'PAPER':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,196,197,198,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,315,316,320,322,324,325,326,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-191,47,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,47,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,47,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,47,-304,-305,47,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,47,-200,-199,-195,-303,-306,-307,47,-147,-148,-149,-10,-102,-150,-69,-170,47,-156,-108,47,-109,-151,-125,-66,47,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,47,-13,-14,-99,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,47,-122,-123,-124,-73,-19,-159,-127,-160,-128,47,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,47,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,47,-261,-252,-253,-357,47,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,47,]),'{':([0,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,20,21,22,23,24,26,27,28,30,31,32,33,34,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,62,63,64,67,69,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,185,186,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,313,316,317,318,319,320,322,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,403,404,405,409,410,411,412,413,414,415,416,419,420,421,422,423,425,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,449,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,582,584,585,586,597,],[-191,24,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,62,-106,62,71,-237,75,-75,-76,24,-25,-230,-231,116,-178,-179,-270,24,-319,-237,24,-267,-268,-269,24,-105,62,-222,-221,-212,-214,-215,-216,-217,-324,185,-201,-326,-327,-107,62,24,-263,24,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,24,-271,-272,-342,-258,-336,-337,-258,-232,-318,24,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,277,-42,279,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,24,62,-207,-209,-12,-238,-239,-240,24,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,24,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,62,-200,-202,-203,62,-199,-195,-303,24,-147,-148,-149,-10,-102,-150,-69,-170,24,-156,-108,24,-109,-151,-125,-66,24,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,24,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,277,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,24,-122,-123,-124,-73,24,-19,-159,-127,-160,-128,24,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,24,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,24,-113,-114,-115,277,-322,-262,-360,24,]),'$end':([0,1,2,3,4,5,7,8,9,10,11,12,13,15,16,17,18,19,21,27,28,31,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,322,324,329,330,331,333,334,335,336,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,403,404,405,409,410,411,412,413,414,415,416,422,426,427,428,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,520,541,542,543,544,545,546,549,550,551,554,560,561,562,563,584,585,586,],[-191,0,-1,-192,-193,-194,-3,-361,-362,-363,-364,-365,-366,-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-195,-303,-147,-148,-149,-10,-102,-150,-69,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-243,-244,-350,-236,-249,-250,-204,-206,-325,-198,-208,-139,-153,-154,-155,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-103,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-322,-262,-360,]),'=':([6,14,19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,85,111,113,114,115,117,118,119,120,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,217,221,224,225,226,227,232,234,238,241,245,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,333,334,356,357,363,364,365,366,373,374,380,381,382,389,391,392,393,395,396,397,398,409,412,413,414,415,416,422,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,488,489,492,498,503,510,512,520,544,545,546,549,550,551,555,587,],[48,-4,-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-99,-271,-272,-342,271,-336,-337,271,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-140,370,-64,-225,-64,-11,-46,385,-295,394,-11,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-10,-102,-125,-66,-130,-273,-274,-345,-341,-340,487,-292,-293,-99,499,-100,500,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-139,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-294,-47,-295,-296,-31,567,-44,-103,-162,-163,-164,-133,-134,-135,499,597,]),'}':([7,15,16,17,18,19,21,24,25,27,28,31,32,33,38,39,42,49,51,52,54,55,56,57,60,62,63,64,67,71,72,73,74,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,116,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,144,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,186,187,189,191,192,193,194,195,196,197,198,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,269,273,277,278,279,280,281,282,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,315,316,317,318,320,322,323,324,325,326,329,330,331,333,334,335,336,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,422,426,427,428,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,520,541,542,543,544,545,546,549,550,551,554,560,561,562,563,568,584,585,586,588,589,598,],[-3,-67,-68,-28,-29,-104,-106,-237,73,-75,-76,-25,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-201,-326,-327,-107,-196,192,-263,-264,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-265,-336,-337,-232,-318,-339,-2,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-42,-245,-279,-280,-281,-285,-348,-349,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,316,-207,-209,322,-12,-238,-239,-240,324,-304,-305,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-266,-338,-33,-43,-38,-45,-91,-92,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,414,-200,-202,-203,-199,-195,-197,-303,-306,-307,-147,-148,-149,-10,-102,-150,-69,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-243,-244,-350,503,-32,512,-236,-249,-250,-204,-206,-325,-198,-208,-139,-153,-154,-155,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-103,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-291,-322,-262,-360,-289,-290,-288,]),'CHANGE':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,92,-25,-230,-231,-178,-179,-319,-237,92,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,92,-263,92,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,92,-271,-272,-342,-258,-336,-337,-258,-232,-318,92,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,92,-207,-209,-12,-238,-239,-240,92,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,92,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,92,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,92,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,92,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,92,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,92,-113,-114,-115,-322,-262,-360,92,]),'CHORD_REPETITION':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,93,-25,-230,-231,-178,-179,-319,-237,93,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,93,-263,93,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,93,-271,-272,-342,-258,-336,-337,-258,-232,-318,93,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,93,-207,-209,-12,-238,-239,-240,93,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,93,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,93,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,93,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,93,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,93,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,93,-113,-114,-115,-322,-262,-360,93,]),'MULTI_MEASURE_REST':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,94,-25,-230,-231,-178,-179,-319,-237,94,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,94,-263,94,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,94,-271,-272,-342,-258,-336,-337,-258,-232,-318,94,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,94,-207,-209,-12,-238,-239,-240,94,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,94,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,94,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,94,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,94,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,94,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,94,-113,-114,-115,-322,-262,-360,94,]),'|':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,99,-25,-230,-231,-178,-179,-319,-237,99,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,99,-263,99,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,99,-271,-272,-342,-258,-336,-337,-258,-232,-318,99,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,99,-207,-209,-12,-238,-239,-240,99,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,99,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,99,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,99,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,99,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,99,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,99,-113,-114,-115,-322,-262,-360,99,]),'E_BACKSLASH':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,100,-25,-230,-231,-178,-179,-319,-237,100,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,100,-263,100,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,100,-271,-272,-342,-258,-336,-337,-258,-232,-318,100,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,100,-207,-209,-12,-238,-239,-240,100,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,100,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,100,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,100,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,100,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,100,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,100,-113,-114,-115,-322,-262,-360,100,]),'OVERRIDE':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,277,278,279,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,406,407,408,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,568,572,573,574,584,585,586,588,589,597,598,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,104,-25,-230,-231,-178,-179,-319,-237,104,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,104,-263,104,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,104,-271,-272,-342,-258,-336,-337,-258,-232,-318,104,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,104,-207,-209,-12,-238,-239,-240,104,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,104,-29,-343,-344,-352,-354,-255,-255,-338,-33,-43,-38,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,104,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,104,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,508,-32,508,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,104,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,104,-47,-334,-297,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,104,-291,-113,-114,-115,-322,-262,-360,-289,-290,104,-288,]),'REVERT':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,277,278,279,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,406,407,408,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,568,572,573,574,584,585,586,588,589,597,598,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,105,-25,-230,-231,-178,-179,-319,-237,105,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,105,-263,105,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,105,-271,-272,-342,-258,-336,-337,-258,-232,-318,105,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,105,-207,-209,-12,-238,-239,-240,105,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,105,-29,-343,-344,-352,-354,-255,-255,-338,-33,-43,-38,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,105,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,105,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,509,-32,509,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,105,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,105,-47,-334,-297,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,105,-291,-113,-114,-115,-322,-262,-360,-289,-290,105,-288,]),'SET':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,106,-25,-230,-231,-178,-179,-319,-237,106,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,106,-263,106,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,106,-271,-272,-342,-258,-336,-337,-258,-232,-318,106,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,106,-207,-209,-12,-238,-239,-240,106,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,106,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,106,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,106,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,106,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,106,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,106,-113,-114,-115,-322,-262,-360,106,]),'UNSET':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,277,278,279,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,406,407,408,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,568,572,573,574,584,585,586,588,589,597,598,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,107,-25,-230,-231,-178,-179,-319,-237,107,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,107,-263,107,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,107,-271,-272,-342,-258,-336,-337,-258,-232,-318,107,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,107,-207,-209,-12,-238,-239,-240,107,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,107,-29,-343,-344,-352,-354,-255,-255,-338,-33,-43,-38,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,107,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,107,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,511,-32,511,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,107,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,107,-47,-334,-297,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,107,-291,-113,-114,-115,-322,-262,-360,-289,-290,107,-288,]),'ANGLE_OPEN':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,109,-25,-230,-231,-178,-179,-319,-237,109,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,109,-263,109,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,109,-271,-272,-342,-258,-336,-337,-258,-232,-318,109,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,109,-207,-209,-12,-238,-239,-240,109,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,109,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,109,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,109,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,109,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,109,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,109,-113,-114,-115,-322,-262,-360,109,]),'RESTNAME':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,110,-25,-230,-231,-178,-179,-319,-237,110,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,110,-263,110,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,110,-271,-272,-342,-258,-336,-337,-258,-232,-318,110,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,110,-207,-209,-12,-238,-239,-240,110,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,110,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,110,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,110,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,110,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,110,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,110,-113,-114,-115,-322,-262,-360,110,]),'TEMPO':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,385,386,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,554,560,561,562,563,567,572,573,574,584,585,586,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,112,-25,-230,-231,-178,-179,-319,-237,112,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,112,-263,112,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,112,-271,-272,-342,-258,-336,-337,-258,-232,-318,112,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,112,-207,-209,-12,-238,-239,-240,112,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,112,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,112,-147,-148,-149,-10,-102,-150,-69,-170,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,112,-13,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,112,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,112,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,112,-113,-114,-115,-322,-262,-360,112,]),'PITCH_IDENTIFIER':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,218,220,222,223,224,225,226,227,228,229,230,232,235,236,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,347,349,354,355,356,357,363,364,365,366,369,371,373,374,375,376,378,379,384,385,386,387,388,389,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,470,471,473,474,475,476,477,480,481,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,571,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,113,-25,-230,-231,-178,-179,-319,-237,113,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,113,-263,113,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-16,-259,-99,113,-271,-272,-342,-258,-336,-337,-258,-232,-318,113,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,113,-207,-209,-12,-238,-239,-240,113,-157,-171,-158,-151,-140,113,-157,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,113,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,113,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,113,-147,-148,-149,-10,-102,-150,-69,-170,-156,113,-108,-109,-151,-125,-66,-130,-273,-274,-345,-170,-93,-341,-340,-94,-287,-276,-242,-333,113,-13,-17,-14,-99,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,113,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,113,-161,-9,-10,-165,-166,-167,-129,113,-157,-136,-137,-138,-346,-347,-157,-157,-30,-223,-224,-65,-275,113,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,113,-261,-252,-253,-357,113,-157,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,113,]),'NOTENAME_PITCH':([15,16,17,18,19,21,24,27,28,30,31,32,33,38,39,42,43,48,49,51,52,54,55,56,57,60,63,64,67,72,73,75,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,115,117,118,119,120,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,185,187,189,192,193,194,195,201,203,205,207,208,217,218,220,222,223,224,225,226,227,228,229,230,232,235,236,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,263,264,265,266,267,268,270,272,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,342,347,349,354,355,356,357,363,364,365,366,369,371,373,374,375,376,378,379,384,385,386,387,388,389,391,392,395,396,397,398,399,400,401,402,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,470,471,473,474,475,476,477,480,481,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,571,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-67,-68,-28,-29,-104,-106,-237,-75,-76,115,-25,-230,-231,-178,-179,-319,-237,115,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,115,-263,115,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-16,-259,-99,115,-271,-272,-342,-258,-336,-337,-258,-232,-318,115,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,115,-207,-209,-12,-238,-239,-240,115,-157,-171,-158,-151,-140,115,-157,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,115,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,115,-29,-343,-344,-352,-354,-255,-255,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,115,-147,-148,-149,-10,-102,-150,-69,-170,-156,115,-108,-109,-151,-125,-66,-130,-273,-274,-345,-170,-93,-341,-340,-94,-287,-276,-242,-333,115,-13,-17,-14,-99,-254,-100,-302,-18,-353,-355,-26,-256,-257,-27,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,115,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,115,-161,-9,-10,-165,-166,-167,-129,115,-157,-136,-137,-138,-346,-347,-157,-157,-30,-223,-224,-65,-275,115,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,115,-261,-252,-253,-357,115,-157,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,115,]),'DOUBLE_ANGLE_CLOSE':([15,16,17,18,19,21,27,28,31,32,33,38,39,42,43,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,123,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,193,194,195,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,329,330,331,333,334,335,336,342,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,409,412,413,414,415,416,422,426,427,428,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,520,541,542,543,544,545,546,549,550,551,554,560,561,562,563,584,585,586,],[-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,-237,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,273,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-238,-239,-240,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-147,-148,-149,-10,-102,-150,-69,-156,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-139,-153,-154,-155,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-103,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-322,-262,-360,]),'STRING_IDENTIFIER':([15,16,17,18,19,20,21,27,28,31,32,33,35,36,38,39,42,48,49,50,51,52,53,54,55,56,57,60,62,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,112,113,114,115,118,119,121,122,124,137,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,175,176,178,179,180,183,186,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,271,273,276,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,316,317,318,319,320,321,324,328,329,330,331,332,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,377,378,379,383,384,385,386,388,389,391,392,395,396,397,398,409,412,413,414,415,416,417,418,419,420,421,422,423,425,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,461,462,463,464,465,466,467,472,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,508,509,511,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,572,573,574,575,576,578,579,580,581,584,585,586,592,593,597,],[-67,-68,-28,-29,-104,64,-106,-75,-76,-25,-230,-231,119,119,-178,-179,-319,150,-105,64,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,119,119,119,119,-23,-259,-99,252,-271,-272,-342,-336,-337,-232,-318,-339,119,-42,-315,-316,-317,-279,-280,-281,119,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-213,-210,-218,-328,-323,-205,64,-207,-209,-12,252,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,119,-338,150,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,-200,-202,-203,64,-199,64,-303,252,-147,-148,-149,-315,-10,-102,-150,-69,-170,252,-156,-108,252,-109,-151,-125,-66,252,-130,-273,-274,-345,-93,-341,-340,-94,-287,-315,-276,-242,119,-333,252,-13,-14,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,64,-315,-147,-148,-149,-139,-69,119,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,252,-122,-123,-124,-73,-19,-159,-127,-160,-128,252,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,252,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,119,119,119,-44,-153,-154,-155,-109,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,252,-261,-252,-253,-357,252,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-15,-86,252,]),'CONTEXT_MOD_IDENTIFIER':([15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,124,138,139,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,270,272,273,277,278,279,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,401,406,407,408,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,512,513,514,515,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,138,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,138,-271,-272,-342,-258,-336,-337,-258,-232,-318,-339,-42,278,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,138,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,138,138,-338,-33,-43,-38,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,138,-147,-148,-149,-10,-102,-150,-69,-170,138,-156,-108,138,-109,-151,-125,-66,138,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,138,-13,-14,-99,-254,-100,-302,-18,-353,-355,-257,138,-32,513,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,138,-122,-123,-124,-73,-19,-159,-127,-160,-128,138,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,138,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-39,-40,-41,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,138,-261,-252,-253,-357,138,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,138,-288,]),'WITH':([15,16,17,18,19,21,27,28,31,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,112,113,114,115,117,118,119,120,121,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,201,203,205,207,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,270,272,273,277,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,328,329,330,331,333,334,335,336,340,341,342,349,351,354,355,356,357,362,363,364,365,366,371,373,374,375,376,378,379,384,385,386,388,389,391,392,395,396,397,398,401,406,407,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,434,435,437,438,439,440,442,444,445,446,447,448,450,454,455,456,457,459,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,487,489,490,491,492,493,495,497,498,499,501,502,503,504,505,506,507,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,555,556,560,561,562,563,567,568,572,573,574,575,576,578,579,580,581,584,585,586,588,589,592,593,597,598,],[-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,139,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,139,-271,-272,-342,-258,-336,-337,-258,-232,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,139,-157,-171,-158,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,139,139,-338,-33,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,139,-147,-148,-149,-10,-102,-150,-69,-170,139,-156,-108,139,-109,-151,-125,-66,139,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,139,-13,-14,-99,-254,-100,-302,-18,-353,-355,-257,139,-32,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-157,-158,-169,-171,-157,-158,-157,139,-122,-123,-124,-73,-19,-159,-127,-160,-128,139,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,139,-47,-334,-297,-295,-233,-235,-259,-296,-251,-358,-359,-31,-34,-35,-36,-37,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-254,139,-261,-252,-253,-357,139,-291,-113,-114,-115,-286,-234,-87,-88,-89,-90,-322,-262,-360,-289,-290,-15,-86,139,-288,]),'DEFAULT':([15,16,17,18,19,21,27,28,31,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,208,217,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,329,330,331,333,334,335,336,342,345,346,348,349,353,354,355,356,357,363,364,365,366,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,426,427,428,435,440,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,537,538,539,540,541,542,543,544,545,546,549,550,551,554,560,561,562,563,584,585,586,],[-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-151,-140,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-147,-148,-149,-10,-102,-150,-69,-156,455,-175,457,-175,467,-109,-151,-125,-66,-130,-273,-274,-345,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-175,-175,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-172,-173,-175,-174,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-322,-262,-360,]),'TONICNAME_PITCH':([15,16,17,18,19,21,27,28,31,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,76,77,78,80,81,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,108,110,111,113,114,115,118,119,121,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,205,207,208,217,218,220,222,223,224,225,226,227,228,229,230,232,235,237,238,239,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,329,330,331,333,334,335,336,342,347,349,354,355,356,357,363,364,365,366,369,371,373,374,375,376,378,379,384,386,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,426,427,428,432,435,437,438,439,440,445,446,447,448,450,454,455,456,457,460,462,463,464,465,466,467,470,471,473,474,475,476,477,480,481,482,483,484,485,486,489,490,491,497,498,499,501,502,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,539,541,542,543,544,545,546,549,550,551,554,560,561,562,563,571,572,573,574,584,585,586,],[-67,-68,-28,-29,-104,-106,-75,-76,-25,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-301,-108,-109,-151,-152,-126,-24,-226,-227,-329,-330,-331,-259,-259,-95,-96,-286,-241,-20,-21,-22,-259,-320,-23,-259,-99,-271,-272,-342,-336,-337,-232,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-171,-158,-151,-140,366,-157,-286,-260,-64,-225,-64,-11,-286,-97,-286,-46,-335,-321,-295,-356,-297,-298,-10,-69,-70,-71,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-228,-229,-29,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-147,-148,-149,-10,-102,-150,-69,-156,366,-108,-109,-151,-125,-66,-130,-273,-274,-345,-170,-93,-341,-340,-94,-287,-276,-242,-333,-13,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-147,-148,-149,-139,-69,-153,-154,-155,-168,-158,-169,366,-157,-158,-122,-123,-124,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,366,-157,-136,-137,-138,-346,-347,-157,-157,-30,-223,-224,-65,-275,-47,-334,-297,-259,-296,-251,-358,-359,-31,-44,-153,-154,-155,-109,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-108,-147,-148,-149,-162,-163,-164,-133,-134,-135,-332,-261,-252,-253,-357,-157,-113,-114,-115,-322,-262,-360,]),'DURATION_IDENTIFIER':([19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,102,110,111,112,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,204,206,208,213,215,217,224,225,226,227,238,240,242,244,245,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,333,334,344,354,355,356,357,360,363,364,365,366,373,374,386,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,431,433,434,436,445,446,447,448,450,454,455,456,457,460,462,463,464,465,466,467,469,471,473,474,475,476,477,479,480,483,484,485,497,498,499,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,561,562,570,572,573,574,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,226,226,226,226,-99,226,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-146,-142,-140,226,-141,-140,-64,-225,-64,-11,-295,226,-299,-300,-10,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-10,-102,226,-132,-140,-125,-66,-145,-130,-273,-274,-345,-341,-340,-13,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-136,-137,-138,-139,-73,-143,226,-141,-144,-122,-123,-124,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-141,-141,-136,-137,-138,-346,-347,226,-141,-223,-224,-65,226,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-252,-253,-141,-113,-114,-115,]),'UNSIGNED':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,102,110,111,112,113,114,115,118,119,122,124,138,141,142,143,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,209,213,215,217,224,225,226,227,238,240,242,244,245,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,274,275,278,280,281,282,284,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,316,320,324,327,332,333,334,340,341,344,352,354,355,356,357,360,361,363,364,365,366,372,373,374,376,377,378,385,386,388,389,391,392,394,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,429,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,469,471,472,473,474,475,476,477,479,480,483,484,485,486,487,492,493,495,497,498,499,500,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,556,561,562,564,567,570,572,573,574,575,576,578,579,580,581,592,593,597,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,172,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,227,227,227,227,-99,245,-271,-272,-342,-336,-337,-318,-339,-42,172,287,287,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,227,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,333,-141,-146,-142,-140,172,227,-141,-140,-64,-225,-64,-11,-295,227,-299,-300,-10,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,172,172,-43,-45,-91,-92,172,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,172,172,-98,-131,-132,-368,-5,-6,-200,-199,-303,333,428,-10,-102,-145,333,227,463,-132,-140,-125,-66,-145,333,-130,-273,-274,-345,227,-341,-340,-287,287,-276,172,-13,-14,-99,-254,-100,227,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,518,-136,-137,-138,-139,-73,520,-143,227,-141,-144,-141,-141,533,-122,-123,-124,-73,-19,-159,-127,-160,-128,333,-161,546,-9,-10,-165,-166,-167,-129,-141,-141,551,-136,-137,-138,-346,-347,227,-141,-223,-224,-65,-275,172,-295,-233,-235,227,-296,-251,227,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,574,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,333,-252,-253,227,172,-141,-113,-114,-115,-286,-234,-87,-88,-89,-90,-15,-86,172,]),'-':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,132,138,140,141,142,143,144,145,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,274,275,278,280,281,282,284,285,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,403,404,409,410,411,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,502,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,141,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,275,-42,-245,-315,-316,-317,-279,-280,-281,300,-285,-248,-58,-59,-60,-61,-351,-247,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,332,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,377,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,284,284,-43,-45,-91,-92,284,-246,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,284,284,-98,-131,-132,-368,-5,-6,-200,-199,-303,418,-315,-10,-102,-145,461,-132,-140,-125,-66,472,-130,-273,-274,-345,377,-341,-340,377,-287,-315,-276,377,-13,-99,-254,-100,-302,-18,-353,-355,-243,-244,-236,-249,-250,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,530,-122,-123,-124,-73,-19,-159,-127,-160,-128,418,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,564,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,377,]),'^':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,142,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,302,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,142,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,142,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,142,-315,-10,-102,-145,142,-132,-140,-125,-66,142,-130,-273,-274,-345,142,-341,-340,142,-287,-315,-276,142,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,142,-122,-123,-124,-73,-19,-159,-127,-160,-128,142,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,142,]),'_':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,143,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,303,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,143,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,143,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,143,-315,-10,-102,-145,143,-132,-140,-125,-66,143,-130,-273,-274,-345,143,-341,-340,143,-287,-315,-276,143,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,143,-122,-123,-124,-73,-19,-159,-127,-160,-128,143,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,143,]),'EXTENDER':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,144,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,144,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,144,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,144,-10,-102,-145,144,-132,-140,-125,-66,144,-130,-273,-274,-345,144,-341,-340,144,-287,-276,144,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,144,-122,-123,-124,-73,-19,-159,-127,-160,-128,144,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,144,]),'HYPHEN':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,145,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,145,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,145,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,145,-10,-102,-145,145,-132,-140,-125,-66,145,-130,-273,-274,-345,145,-341,-340,145,-287,-276,145,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,145,-122,-123,-124,-73,-19,-159,-127,-160,-128,145,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,145,]),'EVENT_IDENTIFIER':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,152,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,152,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,152,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,152,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,152,-315,-10,-102,-145,152,-132,-140,-125,-66,152,-130,-273,-274,-345,152,-341,-340,152,-287,-315,-276,152,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,152,-122,-123,-124,-73,-19,-159,-127,-160,-128,152,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,152,]),'E_UNSIGNED':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,156,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,156,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,156,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,156,-10,-102,-145,156,-132,-140,-125,-66,156,-130,-273,-274,-345,156,-341,-340,156,-287,-276,156,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,156,-122,-123,-124,-73,-19,-159,-127,-160,-128,156,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,156,]),'~':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,158,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,158,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,158,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,158,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,158,-315,-10,-102,-145,158,-132,-140,-125,-66,158,-130,-273,-274,-345,158,-341,-340,158,-287,-315,-276,158,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,158,-122,-123,-124,-73,-19,-159,-127,-160,-128,158,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,158,]),'(':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,159,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,159,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,159,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,159,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,159,-315,-10,-102,-145,159,-132,-140,-125,-66,159,-130,-273,-274,-345,159,-341,-340,159,-287,-315,-276,159,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,159,-122,-123,-124,-73,-19,-159,-127,-160,-128,159,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,159,]),')':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,160,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,160,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,160,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,160,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,160,-315,-10,-102,-145,160,-132,-140,-125,-66,160,-130,-273,-274,-345,160,-341,-340,160,-287,-315,-276,160,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,160,-122,-123,-124,-73,-19,-159,-127,-160,-128,160,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,160,]),'[':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,161,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,161,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,161,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,161,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,161,-315,-10,-102,-145,161,-132,-140,-125,-66,161,-130,-273,-274,-345,161,-341,-340,161,-287,-315,-276,161,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,161,-122,-123,-124,-73,-19,-159,-127,-160,-128,161,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,161,]),']':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,162,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,162,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,162,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,162,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,162,-315,-10,-102,-145,162,-132,-140,-125,-66,162,-130,-273,-274,-345,162,-341,-340,162,-287,-315,-276,162,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,162,-122,-123,-124,-73,-19,-159,-127,-160,-128,162,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,162,]),'E_ANGLE_CLOSE':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,163,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,163,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,163,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,163,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,163,-315,-10,-102,-145,163,-132,-140,-125,-66,163,-130,-273,-274,-345,163,-341,-340,163,-287,-315,-276,163,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,163,-122,-123,-124,-73,-19,-159,-127,-160,-128,163,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,163,]),'E_ANGLE_OPEN':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,164,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,164,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,164,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,164,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,164,-315,-10,-102,-145,164,-132,-140,-125,-66,164,-130,-273,-274,-345,164,-341,-340,164,-287,-315,-276,164,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,164,-122,-123,-124,-73,-19,-159,-127,-160,-128,164,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,164,]),'E_CLOSE':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,165,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,165,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,165,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,165,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,165,-315,-10,-102,-145,165,-132,-140,-125,-66,165,-130,-273,-274,-345,165,-341,-340,165,-287,-315,-276,165,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,165,-122,-123,-124,-73,-19,-159,-127,-160,-128,165,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,165,]),'E_EXCLAMATION':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,166,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,166,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,166,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,166,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,166,-315,-10,-102,-145,166,-132,-140,-125,-66,166,-130,-273,-274,-345,166,-341,-340,166,-287,-315,-276,166,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,166,-122,-123,-124,-73,-19,-159,-127,-160,-128,166,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,166,]),'E_OPEN':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,167,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,167,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,167,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,167,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,167,-315,-10,-102,-145,167,-132,-140,-125,-66,167,-130,-273,-274,-345,167,-341,-340,167,-287,-315,-276,167,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,167,-122,-123,-124,-73,-19,-159,-127,-160,-128,167,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,167,]),'EVENT_FUNCTION':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,168,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,168,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,168,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,168,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,168,-315,-10,-102,-145,168,-132,-140,-125,-66,168,-130,-273,-274,-345,168,-341,-340,168,-287,-315,-276,168,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,168,-122,-123,-124,-73,-19,-159,-127,-160,-128,168,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,168,]),':':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,93,94,97,102,103,110,111,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,222,223,224,225,226,227,228,229,230,237,238,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,332,333,334,340,352,354,355,356,357,361,363,364,365,366,371,373,374,375,376,377,378,379,386,389,391,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,497,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,560,561,562,572,573,574,575,584,585,592,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,169,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-259,-259,-286,-259,-320,-259,-99,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,169,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,169,-141,-146,-142,-140,-140,-286,-260,-64,-225,-64,-11,-286,169,-286,-321,-295,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,169,-315,-10,-102,-145,169,-132,-140,-125,-66,169,-130,-273,-274,-345,169,-341,-340,169,-287,-315,-276,169,-13,-99,-254,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,169,-122,-123,-124,-73,-19,-159,-127,-160,-128,169,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-259,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-315,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,-261,-252,-253,-113,-114,-115,-286,-322,-262,169,]),'REAL':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,112,113,114,115,118,119,122,124,138,141,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,209,217,224,225,226,227,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,274,275,278,280,281,282,284,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,316,320,324,327,332,333,334,340,341,352,354,355,356,357,361,363,364,365,366,373,374,376,378,385,388,389,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,487,492,493,495,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,556,561,562,567,572,573,574,575,576,578,579,580,581,592,593,597,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,170,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,170,-271,-272,-342,-336,-337,-318,-339,-42,170,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,170,-141,-146,-142,-140,170,-140,-64,-225,-64,-11,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,170,170,-43,-45,-91,-92,170,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,170,170,-98,-131,-132,-368,-5,-6,-200,-199,-303,170,427,-10,-102,-145,170,462,-132,-140,-125,-66,170,-130,-273,-274,-345,-341,-340,-287,-276,170,-14,-99,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,517,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,532,-122,-123,-124,-73,-19,-159,-127,-160,-128,170,-161,545,-9,-10,-165,-166,-167,-129,550,-136,-137,-138,-346,-347,-223,-224,-65,-275,170,-295,-233,-235,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,573,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,170,-252,-253,170,-113,-114,-115,-286,-234,-87,-88,-89,-90,-15,-86,170,]),'FRACTION':([19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,85,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,217,224,225,226,227,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,327,333,334,340,341,352,354,355,356,357,361,363,364,365,366,372,373,374,376,378,388,389,392,395,396,397,398,409,412,413,414,415,416,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,486,492,493,495,498,499,503,512,516,517,518,519,520,524,525,529,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,556,561,562,572,573,574,575,576,578,579,580,581,592,593,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,334,-141,-146,-142,-140,-140,-64,-225,-64,-11,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,334,-10,-102,-145,334,464,-132,-140,-125,-66,334,-130,-273,-274,-345,483,-341,-340,-287,-276,-14,-99,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,534,-122,-123,-124,-73,-19,-159,-127,-160,-128,334,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-233,-235,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,334,-252,-253,-113,-114,-115,-286,-234,-87,-88,-89,-90,-15,-86,]),'NUMBER_IDENTIFIER':([19,21,27,28,32,33,38,39,42,48,49,51,52,54,55,56,57,60,63,64,67,73,85,112,113,114,115,118,119,122,124,138,141,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,200,203,204,206,208,209,217,224,225,226,227,245,246,249,250,251,252,253,254,255,256,257,258,259,264,265,266,267,268,273,274,275,278,280,281,282,284,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,316,320,324,327,332,333,334,340,341,352,354,355,356,357,361,363,364,365,366,373,374,376,378,385,388,389,392,395,396,397,398,409,412,413,414,415,416,418,419,420,421,422,423,431,433,434,436,439,442,443,445,446,447,448,450,454,455,456,457,458,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,487,492,493,495,498,499,503,512,516,517,518,519,520,524,525,529,530,531,532,533,534,535,536,541,542,543,544,545,546,549,550,551,555,556,561,562,567,572,573,574,575,576,578,579,580,581,592,593,597,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,171,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,171,-271,-272,-342,-336,-337,-318,-339,-42,171,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,310,-8,311,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,171,-141,-146,-142,-140,171,-140,-64,-225,-64,-11,311,-73,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-19,-343,-344,-352,-354,-338,171,171,-43,-45,-91,-92,171,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,171,171,-98,-131,-132,-368,-5,-6,-200,-199,-303,171,426,311,-102,-145,171,171,-132,-140,-125,-66,171,-130,-273,-274,-345,-341,-340,-287,-276,171,-14,-99,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,516,-136,-137,-138,-139,-73,-143,-146,-141,-144,-141,-141,531,-122,-123,-124,-73,-19,-159,-127,-160,-128,171,-161,544,-9,-10,-165,-166,-167,-129,549,-136,-137,-138,-346,-347,-223,-224,-65,-275,171,-295,-233,-235,-296,-251,-31,-44,-133,-134,-135,-132,-103,-110,-111,-112,572,-117,-118,-119,-116,-120,-121,-136,-137,-138,-162,-163,-164,-133,-134,-135,-254,171,-252,-253,171,-113,-114,-115,-286,-234,-87,-88,-89,-90,-15,-86,171,]),'BACKUP':([19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,66,67,73,85,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,203,215,217,220,224,225,226,227,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,333,334,356,357,363,364,365,366,373,374,395,396,397,398,409,412,413,414,415,416,422,434,439,442,445,446,447,448,450,454,455,456,457,460,462,463,464,465,466,467,469,471,473,474,475,476,477,480,481,483,484,485,503,512,520,524,525,529,531,532,533,534,535,536,544,545,546,549,550,551,572,573,574,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,190,-107,-263,-126,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,340,360,-140,369,-64,-225,-64,-11,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-10,-102,-125,-66,-130,-273,-274,-345,-341,-340,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-139,340,340,529,-122,-123,-124,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,360,360,-136,-137,-138,-346,-347,369,369,-223,-224,-65,-31,-44,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-162,-163,-164,-133,-134,-135,-113,-114,-115,]),'REPARSE':([19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,81,85,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,178,179,180,183,187,189,192,203,215,217,220,224,225,226,227,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,333,334,342,356,357,363,364,365,366,373,374,395,396,397,398,409,412,413,414,415,416,422,426,427,428,434,439,442,445,446,447,448,450,454,455,456,457,460,462,463,464,465,466,467,469,471,473,474,475,476,477,480,481,483,484,485,503,512,516,517,518,520,524,525,529,531,532,533,534,535,536,544,545,546,549,550,551,570,571,572,573,574,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,209,-126,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-10,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,341,341,-140,341,-64,-225,-64,-11,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-10,-102,-156,-125,-66,-130,-273,-274,-345,-341,-340,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-139,-153,-154,-155,341,341,341,-122,-123,-124,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,341,341,-136,-137,-138,-346,-347,341,341,-223,-224,-65,-31,-44,-153,-154,-155,-103,-110,-111,-112,-117,-118,-119,-116,-120,-121,-162,-163,-164,-133,-134,-135,341,341,-113,-114,-115,]),'ANGLE_CLOSE':([19,21,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,63,64,67,73,85,109,113,114,115,118,119,122,124,138,141,142,143,144,145,146,147,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,187,189,192,217,224,225,226,227,236,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,316,320,324,332,333,334,356,357,363,364,365,366,373,374,376,377,378,387,388,389,392,395,396,397,398,409,412,413,414,415,416,418,422,448,450,454,455,456,457,460,461,462,463,464,465,466,467,472,473,474,475,476,477,483,484,485,486,492,493,495,498,499,503,512,520,530,544,545,546,549,550,551,555,561,562,575,576,578,579,580,581,592,593,],[-104,-106,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-326,-327,-107,-263,-126,-16,-271,-272,-342,-336,-337,-318,-339,-42,-315,-316,-317,-279,-280,-281,297,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,-207,-209,-12,-140,-64,-225,-64,-11,386,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-200,-199,-303,-315,-10,-102,-125,-66,-130,-273,-274,-345,-341,-340,-287,-315,-276,-17,-14,-99,-100,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-315,-139,-73,-19,-159,-127,-160,-128,-161,-315,-9,-10,-165,-166,-167,-129,-315,-136,-137,-138,-346,-347,-223,-224,-65,-275,-295,-233,-235,-296,-251,-31,-44,-103,-315,-162,-163,-164,-133,-134,-135,-254,-252,-253,-286,-234,-87,-88,-89,-90,-15,-86,]),'MARKUP_FUNCTION':([19,20,21,22,27,28,32,33,38,39,42,49,50,51,52,53,54,55,56,57,60,62,63,64,67,69,73,85,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,175,176,178,179,180,183,186,187,189,192,217,224,225,226,227,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,312,313,316,317,318,319,320,321,324,333,334,356,357,363,364,365,366,373,374,395,396,397,398,409,412,413,414,415,416,417,422,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,503,512,520,544,545,546,549,550,551,],[-104,59,-106,70,-75,-76,-230,-231,-178,-179,-319,-105,59,-222,-221,-212,-214,-215,-216,-217,-324,-201,-326,-327,-107,70,-263,-126,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-213,-210,-218,-328,-323,-205,59,-207,-209,-12,-140,-64,-225,-64,-11,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,-211,70,-200,-202,-203,59,-199,59,-303,-10,-102,-125,-66,-130,-273,-274,-345,-341,-340,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,59,-139,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-31,-44,-103,-162,-163,-164,-133,-134,-135,]),'MARKUP_LIST_FUNCTION':([19,20,21,22,27,28,32,33,38,39,42,49,51,52,54,55,56,57,60,62,63,64,67,73,85,113,114,115,118,119,122,124,138,144,145,146,148,152,153,154,155,156,158,159,160,161,162,163,164,165,166,167,169,170,171,173,174,176,178,179,180,183,186,187,189,192,217,224,225,226,227,249,250,251,252,253,254,255,256,257,258,259,265,266,267,268,273,278,280,281,282,286,287,288,289,290,291,292,293,295,296,297,298,299,300,301,302,303,306,307,308,309,310,311,313,316,317,318,320,324,333,334,356,357,363,364,365,366,373,374,395,396,397,398,409,412,413,414,415,416,422,448,450,454,455,456,457,460,462,463,464,465,466,467,473,474,475,476,477,483,484,485,503,512,520,544,545,546,549,550,551,],[-104,65,-106,65,-75,-76,-230,-231,-178,-179,-319,-105,-222,-221,-214,-215,-216,-217,-324,-201,-326,-327,-107,-263,-126,-271,-272,-342,-336,-337,-318,-339,-42,-279,-280,-281,-285,-58,-59,-60,-61,-351,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-367,-9,-8,-7,-220,-210,-218,-328,-323,-205,65,-207,-209,-12,-140,-64,-225,-64,-11,-72,-74,-77,-78,-79,-80,-81,-82,-83,-84,-85,-343,-344,-352,-354,-338,-43,-45,-91,-92,-277,-101,-278,-282,-283,-284,-62,-63,-176,-177,-308,-309,-310,-311,-312,-313,-314,-98,-131,-132,-368,-5,-6,65,-200,-202,-203,-199,-303,-10,-102,-125,-66,-130,-273,-274,-345,-341,-340,-302,-18,-353,-355,-236,-204,-206,-325,-198,-208,-139,-73,-19,-159,-127,-160,-128,-161,-9,-10,-165,-166,-167,-129,-136,-137,-138,-346,-347,-223,-224,-65,-31,-44,-103,-162,-163,-164,-133,-134,-135,]),'EXPECT_SCM':([29,37,59,65,79,82,83,84,168,181,182,184,188,199,202,210,211,212,214,216,219,262,283,294,337,338,339,343,350,358,359,367,368,390,424,430,441,451,452,453,468,478,494,496,521,522,523,526,527,528,547,548,552,553,557,558,559,569,577,583,590,591,594,595,596,],[79,79,184,184,199,212,216,79,216,184,184,184,184,199,339,199,79,350,339,199,339,350,216,216,199,350,199,453,199,199,350,199,79,494,199,523,528,350,79,350,523,523,494,559,350,350,350,199,79,199,350,350,350,79,79,79,79,523,494,596,350,79,79,79,79,]),'EXPECT_OPTIONAL':([29,37,79,83,84,168,199,210,211,212,216,262,283,294,337,338,339,350,358,359,367,368,390,424,451,452,453,494,521,522,523,526,527,528,547,548,552,553,557,558,559,577,590,591,594,595,596,],[82,82,202,214,219,82,202,343,343,343,202,82,82,82,430,430,441,202,468,468,478,478,496,82,343,343,343,496,430,430,569,569,569,441,468,468,478,478,583,583,583,496,569,569,583,583,583,]),'EXPECT_DURATION':([29,37,79,82,83,84,168,199,202,210,211,212,214,216,219,262,283,294,337,338,339,343,350,358,359,367,368,390,424,430,441,451,452,453,468,478,494,496,521,522,523,526,527,528,547,548,552,553,557,558,559,569,577,583,590,591,594,595,596,],[83,83,83,210,83,83,83,83,337,83,83,83,358,83,367,83,83,83,83,83,83,451,83,83,83,83,83,83,83,521,526,83,83,83,547,552,83,557,83,83,83,83,83,83,83,83,83,83,83,83,83,590,83,594,83,83,83,83,83,]),'EXPECT_NO_MORE_ARGS':([29,37,59,65,79,83,84,168,181,182,184,188,199,210,211,212,216,262,283,294,337,338,339,350,358,359,367,368,390,424,451,452,453,494,521,522,523,526,527,528,547,548,552,553,557,558,559,577,590,591,594,595,596,],[85,85,183,183,85,85,85,85,183,183,183,183,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'EXPECT_PITCH':([29,37,79,82,83,84,168,199,202,210,211,212,214,216,219,262,283,294,337,338,339,343,350,358,359,367,368,390,424,430,441,451,452,453,468,478,494,496,521,522,523,526,527,528,547,548,552,553,557,558,559,569,577,583,590,591,594,595,596,],[84,84,84,211,84,84,84,84,338,84,84,84,359,84,368,84,84,84,84,84,84,452,84,84,84,84,84,84,84,522,527,84,84,84,548,553,84,558,84,84,84,84,84,84,84,84,84,84,84,84,84,591,84,595,84,84,84,84,84,]),'EXPECT_MARKUP':([59,65,70,181,182,184,188,],[181,188,181,188,188,188,188,]),'EXPECT_MARKUP_LIST':([59,65,181,182,184,188,],[182,182,182,182,182,182,]),'SCORE_IDENTIFIER':([75,185,],[197,197,]),'!':([111,113,114,115,141,142,143,147,238,265,266,267,268,332,377,389,392,397,398,418,461,472,492,530,],[-99,-271,-272,-342,-315,-316,-317,298,392,-343,-344,-352,-354,-315,-315,-99,-100,-353,-355,-315,-315,-315,392,-315,]),'?':([111,113,114,115,238,265,266,267,268,389,391,392,397,398,492,498,555,],[-99,-271,-272,-342,-295,-343,-344,-352,-354,-99,498,-100,-353,-355,-295,-296,498,]),'REST':([111,113,114,115,223,224,225,226,227,238,265,266,267,268,373,374,391,392,397,398,483,484,485,497,498,499,560,561,562,],[-99,-271,-272,-342,-260,-64,-225,-64,-11,-295,-343,-344,-352,-354,-341,-340,-254,-100,-353,-355,-223,-224,-65,-259,-296,-251,585,-252,-253,]),',':([115,265,267,366,397,476,499,561,],[267,397,-352,267,-353,397,267,397,]),"'":([115,266,268,366,398,477,499,562,],[268,398,-354,268,-355,398,268,398,]),'OUTPUT_DEF_IDENTIFIER':([116,],[269,]),'.':([118,119,141,142,143,147,224,226,227,232,245,332,373,374,377,418,461,472,485,530,],[-336,-337,-315,-316,-317,301,-64,-64,-11,383,-11,-315,485,485,-315,-315,-315,-315,-65,-315,]),'+':([132,136,140,141,142,143,147,149,150,151,157,170,171,172,173,285,310,311,332,377,403,404,405,410,411,418,461,472,530,],[274,276,-245,-315,-316,-317,299,-348,-349,-248,-247,-9,-8,-10,-7,-246,-5,-6,-315,-315,-243,-244,-350,-249,-250,-315,-315,-315,-315,]),'*':([151,157,170,171,172,173,223,224,225,226,227,285,310,311,357,373,374,483,484,485,],[304,-247,-9,-8,-10,-7,372,-64,-225,-64,-11,-246,-5,-6,372,-341,-340,-223,-224,-65,]),'/':([151,157,170,171,172,173,285,310,311,333,],[305,-247,-9,-8,-10,-7,-246,-5,-6,429,]),'CONTEXT_DEF_IDENTIFIER':([277,],[407,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start_symbol':([0,],[1,]),'lilypond':([0,],[2,]),'assignment':([2,25,191,],[3,74,323,]),'toplevel_expression':([2,],[5,]),'assignment_id':([2,25,191,],[6,6,6,]),'embedded_scm':([2,25,48,72,123,191,233,406,408,566,],[7,7,128,193,193,7,384,506,515,588,]),'composite_music':([2,30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[8,87,87,87,87,260,87,87,260,87,260,260,260,260,260,260,]),'full_markup':([2,48,112,147,201,328,341,351,362,385,444,459,487,556,567,597,],[9,129,256,295,256,256,256,256,256,256,256,256,256,256,256,256,]),'full_markup_list':([2,48,112,201,328,341,351,362,385,444,459,487,556,567,597,],[10,130,257,257,257,257,257,257,257,257,257,257,257,257,257,]),'lilypond_header':([2,196,315,],[11,325,325,]),'output_def':([2,48,112,196,201,315,328,341,351,362,385,444,459,487,556,567,597,],[12,133,258,326,258,326,258,258,258,258,258,258,258,258,258,258,258,]),'score_block':([2,48,112,201,328,341,351,362,385,444,459,487,556,567,597,],[13,135,259,259,259,259,259,259,259,259,259,259,259,259,259,]),'embedded_scm_bare':([2,20,22,25,48,50,72,112,123,139,186,191,201,231,233,313,314,319,321,328,341,351,362,381,385,406,408,417,444,459,487,556,565,566,567,597,],[15,66,66,15,15,66,15,255,15,281,66,15,255,281,15,66,281,66,66,255,255,255,255,281,255,15,15,66,255,255,255,255,281,15,255,255,]),'scm_function_call':([2,25,48,72,112,123,191,201,233,328,385,406,408,459,487,566,567,597,],[16,16,16,16,248,16,16,248,16,248,248,16,16,248,248,16,248,248,]),'complex_music':([2,30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'music_bare':([2,30,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[18,18,18,18,18,264,18,18,18,264,264,450,450,450,18,450,450,264,18,18,18,]),'output_def_body':([2,48,112,196,201,315,328,341,351,362,385,444,459,487,556,567,597,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'complex_music_prefix':([2,30,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[30,30,30,30,30,263,30,30,30,263,263,449,449,449,30,449,449,263,30,30,30,]),'music_function_call':([2,30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'grouped_music_list':([2,30,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'output_def_head_with_mode_switch':([2,48,112,196,201,315,328,341,351,362,385,444,459,487,556,567,597,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'sequential_music':([2,30,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'simultaneous_music':([2,30,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'output_def_head':([2,48,112,196,201,315,328,341,351,362,385,444,459,487,556,567,597,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'braced_music_list':([2,30,41,44,48,72,75,112,123,185,201,263,328,341,351,362,385,444,449,459,487,567,597,],[42,42,122,124,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'markup_top':([20,],[49,]),'markup_head_1_list':([20,22,186,313,321,],[50,69,319,69,417,]),'simple_markup':([20,50,186,319,321,417,],[51,174,320,415,320,415,]),'markup_list':([20,22,186,313,],[52,67,318,412,]),'markup_head_1_item':([20,22,50,69,186,313,319,321,417,],[53,53,175,175,53,53,175,53,175,]),'markup_braced_list':([20,22,50,69,186,313,319,],[55,55,176,176,55,55,176,]),'markup_command_list':([20,22,186,313,],[56,56,56,56,]),'markup_composed_list':([20,22,186,313,],[57,57,57,57,]),'markup_scm':([20,22,50,186,313,319,321,417,],[58,68,177,58,68,177,177,177,]),'music_list':([24,43,],[72,123,]),'function_arglist':([29,37,211,212,262,424,452,453,],[76,121,347,351,76,76,347,351,]),'function_arglist_common':([29,37,79,84,199,210,211,212,216,262,337,338,339,350,358,359,367,368,424,451,452,453,521,522,523,526,527,528,547,548,552,553,557,558,559,590,591,594,595,596,],[77,77,207,207,207,346,349,349,207,77,435,440,440,207,346,440,435,440,77,346,539,539,435,435,435,346,440,440,346,435,435,435,346,346,346,346,435,346,346,346,]),'function_arglist_nonbackup':([29,37,168,210,211,212,262,283,294,424,451,452,453,],[78,78,308,308,78,354,354,308,308,519,308,78,354,]),'function_arglist_bare':([29,37,79,83,84,168,199,210,211,212,216,262,283,294,337,338,339,350,358,359,367,368,390,424,451,452,453,494,521,522,523,526,527,528,547,548,552,553,557,558,559,577,590,591,594,595,596,],[80,80,208,217,80,217,208,208,80,355,208,355,217,217,208,355,208,208,208,355,208,80,495,208,355,80,355,495,355,355,355,208,80,208,355,355,355,80,80,80,80,495,355,80,80,80,80,]),'function_arglist_common_minus':([29,37,79,84,199,210,211,212,216,262,337,338,339,350,358,359,367,368,424,451,452,453,521,522,523,526,527,528,547,548,552,553,557,558,559,590,591,594,595,596,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'music':([30,48,72,75,123,185,263,],[86,131,195,198,195,198,86,]),'simple_music':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[88,88,88,88,261,88,88,261,88,261,261,261,261,261,261,]),'context_change':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'event_chord':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'music_property_def':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'command_element':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'note_chord_element':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,]),'simple_chord_elements':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'simple_music_property_def':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'command_event':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'chord_body':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'simple_element':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'tempo_event':([30,48,72,75,112,123,185,201,263,328,385,459,487,567,597,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'pitch':([30,48,72,75,112,123,185,201,218,236,263,328,347,385,438,459,470,487,556,567,597,],[111,111,111,111,111,111,111,111,364,389,111,111,364,111,364,111,364,111,389,111,111,]),'steno_pitch':([30,48,72,75,112,123,185,201,218,236,263,328,347,385,438,459,470,487,556,567,597,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'simple_string':([35,36,104,105,106,107,137,147,271,383,425,508,509,511,],[117,120,232,232,232,232,117,296,401,489,117,565,566,568,]),'identifier_init':([48,],[125,]),'context_def_spec_block':([48,112,201,328,341,351,362,385,444,459,487,556,567,597,],[126,253,253,253,253,253,253,253,253,253,253,253,253,253,]),'context_modification':([48,112,201,270,272,328,341,351,362,385,406,444,459,487,556,567,597,],[127,254,254,400,400,254,254,254,254,254,505,254,254,254,254,254,254,]),'number_expression':([48,],[132,]),'post_event_nofinger':([48,200,229,327,352,361,371,375,379,443,458,592,],[134,331,378,421,466,475,378,378,378,535,543,378,]),'string':([48,276,],[136,405,]),'number_term':([48,274,275,],[140,403,404,]),'direction_less_event':([48,147,200,229,327,352,361,371,375,379,443,458,592,],[146,289,146,146,146,146,146,146,146,146,146,146,146,]),'script_dir':([48,200,229,327,352,361,371,375,379,443,458,592,],[147,147,147,147,147,147,147,147,147,147,147,147,]),'string_number_event':([48,200,229,327,352,361,371,375,379,443,458,592,],[148,148,148,148,148,148,148,148,148,148,148,148,]),'number_factor':([48,141,274,275,284,304,305,],[151,285,151,151,285,410,411,]),'direction_less_char':([48,147,200,229,327,352,361,371,375,379,443,458,592,],[153,153,153,153,153,153,153,153,153,153,153,153,153,]),'event_function_event':([48,147,200,229,327,352,361,371,375,379,443,458,592,],[154,154,154,154,154,154,154,154,154,154,154,154,154,]),'tremolo_type':([48,147,200,229,327,352,361,371,375,379,443,458,592,],[155,155,155,155,155,155,155,155,155,155,155,155,155,]),'bare_number':([48,112,141,200,209,274,275,284,304,305,327,341,361,385,458,487,556,567,597,],[157,242,157,329,342,157,157,157,157,157,419,445,473,491,541,491,578,491,491,]),'bare_number_closed':([48,112,141,200,209,274,275,284,304,305,327,341,352,361,385,458,487,556,567,597,],[173,173,173,173,173,173,173,173,173,173,173,173,465,173,173,173,173,173,173,173,]),'markup_command_basic_arguments':([59,65,181,182,184,188,],[180,189,189,189,189,189,]),'markup_braced_list_body':([62,],[186,]),'markup_command_list_arguments':([65,181,182,184,188,],[187,312,313,314,321,]),'lilypond_header_body':([71,],[191,]),'score_body':([75,185,],[196,315,]),'function_arglist_closed_optional':([79,83,199,216,337,338,350,358,359,521,522,547,548,],[200,213,327,361,431,436,458,431,436,431,436,431,436,]),'function_arglist_optional':([79,84,199,216,337,338,350,367,368,521,522,552,553,],[201,218,328,362,432,437,459,432,437,432,437,432,437,]),'function_arglist_backup':([79,83,84,199,216,337,338,339,350,358,359,367,368,521,522,523,526,527,528,547,548,552,553,590,591,],[203,215,220,203,203,434,439,442,203,469,471,480,481,434,439,442,570,571,442,469,471,480,481,570,571,]),'function_arglist_closed_keep':([79,83,199,216,337,338,339,350,358,359,367,521,522,523,526,528,547,548,552,590,],[204,204,204,204,433,204,443,204,433,204,479,433,204,443,479,443,433,204,479,479,]),'function_arglist_keep':([79,84,199,216,337,338,339,350,359,367,368,521,522,523,527,528,548,552,553,591,],[205,205,205,205,205,438,444,205,470,205,438,205,438,444,470,444,470,205,438,470,]),'function_arglist_closed_common':([79,83,168,199,210,212,216,262,283,294,337,338,339,350,358,359,367,424,451,453,521,522,523,526,528,547,548,552,590,],[206,206,307,206,307,307,206,307,307,307,206,206,206,206,206,206,206,307,307,307,206,206,206,206,206,206,206,206,206,]),'optional_notemode_duration':([93,94,102,110,497,],[222,228,230,237,560,]),'multiplied_duration':([93,94,102,110,213,344,433,479,497,],[223,223,223,223,357,357,357,357,223,]),'bare_unsigned':([93,94,102,110,112,169,213,240,344,372,394,433,479,497,500,564,],[224,224,224,224,224,309,224,224,224,484,502,224,224,224,502,586,]),'steno_duration':([93,94,102,110,112,213,240,344,433,479,497,],[225,225,225,225,241,225,393,225,225,225,225,]),'post_events':([97,222,228,230,575,],[229,371,375,379,592,]),'context_prop_spec':([104,105,106,107,],[231,233,234,235,]),'chord_body_elements':([109,],[236,]),'exclamations':([111,389,],[238,492,]),'scalar':([112,385,487,567,597,],[239,490,554,589,598,]),'scalar_closed':([112,],[240,]),'embedded_scm_arg':([112,201,328,385,459,487,567,597,],[243,335,335,243,335,243,243,243,]),'embedded_scm_arg_closed':([112,328,341,351,362,444,459,],[244,422,446,460,422,536,422,]),'embedded_scm_bare_arg':([112,201,328,341,351,362,385,444,459,487,556,567,597,],[246,336,423,448,448,448,336,448,246,336,580,336,336,]),'music_arg':([112,201,328,385,459,487,567,597,],[247,247,247,247,247,247,247,247,]),'closed_music':([112,263,328,341,351,362,444,449,459,],[249,396,249,249,249,249,249,396,249,]),'scm_function_call_closed':([112,139,231,314,328,341,351,362,381,444,459,565,],[250,282,282,282,250,250,250,250,282,250,250,282,]),'sub_quotes':([115,366,499,],[265,476,561,]),'sup_quotes':([115,366,499,],[266,477,562,]),'optional_id':([117,120,],[270,272,]),'embedded_scm_closed':([139,231,314,381,565,],[280,382,413,488,382,]),'fingering':([142,143,377,],[286,288,486,]),'direction_reqd_event':([147,],[290,]),'music_function_event':([147,],[291,]),'gen_text_def':([147,],[292,]),'script_abbreviation':([147,],[293,]),'function_arglist_closed':([168,210,212,262,283,294,424,451,453,],[306,344,352,395,395,409,395,344,352,]),'markup':([186,321,],[317,416,]),'fraction':([200,327,341,361,458,556,],[330,420,447,474,542,581,]),'function_arglist_skip':([210,211,212,337,338,339,358,359,367,368,451,452,453,521,522,523,526,527,528,547,548,552,553,557,558,559,590,591,594,595,596,],[345,348,353,345,348,353,345,348,345,348,537,538,540,537,538,540,537,538,540,537,538,537,538,345,348,353,537,538,537,538,540,]),'duration_length':([213,344,433,479,],[356,454,524,524,]),'pitch_also_in_chords':([218,347,438,470,],[363,456,525,525,]),'steno_tonic_pitch':([218,347,438,470,],[365,365,365,365,]),'dots':([224,226,],[373,374,]),'post_event':([229,371,375,379,592,],[376,376,376,376,376,]),'property_path':([231,565,],[380,587,]),'property_path_revved':([231,565,],[381,381,]),'chord_body_element':([236,556,],[387,579,]),'music_function_chord_body':([236,556,],[388,388,]),'questions':([238,492,],[391,555,]),'optional_context_mod':([270,272,],[399,402,]),'context_def_spec_body':([277,],[406,]),'context_mod_list':([279,],[408,]),'music_function_chord_body_arglist':([390,494,577,],[493,556,593,]),'octave_check':([391,555,],[497,575,]),'tempo_range':([394,500,],[501,563,]),'context_mod':([406,408,],[504,514,]),'property_operation':([406,408,],[507,507,]),'embedded_scm_chord_body':([556,],[576,]),'optional_rest':([560,],[584,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start_symbol","S'",1,None,None,None),
+  ('start_symbol -> lilypond','start_symbol',1,'p_start_symbol__lilypond','parser.py',3831),
+  ('assignment -> assignment_id = identifier_init','assignment',3,'p_assignment__assignment_id__Chr61__identifier_init','parser.py',3844),
+  ('assignment -> embedded_scm','assignment',1,'p_assignment__embedded_scm','parser.py',3852),
+  ('assignment_id -> STRING','assignment_id',1,'p_assignment_id__STRING','parser.py',3862),
+  ('bare_number -> REAL NUMBER_IDENTIFIER','bare_number',2,'p_bare_number__REAL__NUMBER_IDENTIFIER','parser.py',3868),
+  ('bare_number -> UNSIGNED NUMBER_IDENTIFIER','bare_number',2,'p_bare_number__UNSIGNED__NUMBER_IDENTIFIER','parser.py',3872),
+  ('bare_number -> bare_number_closed','bare_number',1,'p_bare_number__bare_number_closed','parser.py',3876),
+  ('bare_number_closed -> NUMBER_IDENTIFIER','bare_number_closed',1,'p_bare_number_closed__NUMBER_IDENTIFIER','parser.py',3882),
+  ('bare_number_closed -> REAL','bare_number_closed',1,'p_bare_number_closed__REAL','parser.py',3886),
+  ('bare_number_closed -> UNSIGNED','bare_number_closed',1,'p_bare_number_closed__UNSIGNED','parser.py',3890),
+  ('bare_unsigned -> UNSIGNED','bare_unsigned',1,'p_bare_unsigned__UNSIGNED','parser.py',3896),
+  ('braced_music_list -> { music_list }','braced_music_list',3,'p_braced_music_list__Chr123__music_list__Chr125','parser.py',4048),
+  ('chord_body -> ANGLE_OPEN chord_body_elements ANGLE_CLOSE','chord_body',3,'p_chord_body__ANGLE_OPEN__chord_body_elements__ANGLE_CLOSE','parser.py',4054),
+  ('chord_body_element -> music_function_chord_body','chord_body_element',1,'p_chord_body_element__music_function_chord_body','parser.py',4064),
+  ('chord_body_element -> pitch exclamations questions octave_check post_events','chord_body_element',5,'p_chord_body_element__pitch__exclamations__questions__octave_check__post_events','parser.py',4068),
+  ('chord_body_elements -> <empty>','chord_body_elements',0,'p_chord_body_elements__Empty','parser.py',4088),
+  ('chord_body_elements -> chord_body_elements chord_body_element','chord_body_elements',2,'p_chord_body_elements__chord_body_elements__chord_body_element','parser.py',4092),
+  ('closed_music -> complex_music_prefix closed_music','closed_music',2,'p_closed_music__complex_music_prefix__closed_music','parser.py',4140),
+  ('closed_music -> music_bare','closed_music',1,'p_closed_music__music_bare','parser.py',4144),
+  ('command_element -> |','command_element',1,'p_command_element__Chr124','parser.py',4150),
+  ('command_element -> E_BACKSLASH','command_element',1,'p_command_element__E_BACKSLASH','parser.py',4154),
+  ('command_element -> command_event','command_element',1,'p_command_element__command_event','parser.py',4168),
+  ('command_event -> tempo_event','command_event',1,'p_command_event__tempo_event','parser.py',4179),
+  ('complex_music -> complex_music_prefix music','complex_music',2,'p_complex_music__complex_music_prefix__music','parser.py',4185),
+  ('complex_music -> music_function_call','complex_music',1,'p_complex_music__music_function_call','parser.py',4195),
+  ('complex_music_prefix -> CONTEXT simple_string optional_id optional_context_mod','complex_music_prefix',4,'p_complex_music_prefix__CONTEXT__simple_string__optional_id__optional_context_mod','parser.py',4209),
+  ('complex_music_prefix -> NEWCONTEXT simple_string optional_id optional_context_mod','complex_music_prefix',4,'p_complex_music_prefix__NEWCONTEXT__simple_string__optional_id__optional_context_mod','parser.py',4215),
+  ('composite_music -> complex_music','composite_music',1,'p_composite_music__complex_music','parser.py',4223),
+  ('composite_music -> music_bare','composite_music',1,'p_composite_music__music_bare','parser.py',4227),
+  ('context_change -> CHANGE STRING = STRING','context_change',4,'p_context_change__CHANGE__STRING__Chr61__STRING','parser.py',4233),
+  ('context_def_spec_block -> CONTEXT { context_def_spec_body }','context_def_spec_block',4,'p_context_def_spec_block__CONTEXT__Chr123__context_def_spec_body__Chr125','parser.py',4277),
+  ('context_def_spec_body -> CONTEXT_DEF_IDENTIFIER','context_def_spec_body',1,'p_context_def_spec_body__CONTEXT_DEF_IDENTIFIER','parser.py',4285),
+  ('context_def_spec_body -> <empty>','context_def_spec_body',0,'p_context_def_spec_body__Empty','parser.py',4289),
+  ('context_def_spec_body -> context_def_spec_body context_mod','context_def_spec_body',2,'p_context_def_spec_body__context_def_spec_body__context_mod','parser.py',4293),
+  ('context_def_spec_body -> context_def_spec_body context_modification','context_def_spec_body',2,'p_context_def_spec_body__context_def_spec_body__context_modification','parser.py',4297),
+  ('context_def_spec_body -> context_def_spec_body embedded_scm','context_def_spec_body',2,'p_context_def_spec_body__context_def_spec_body__embedded_scm','parser.py',4301),
+  ('context_mod -> property_operation','context_mod',1,'p_context_mod__property_operation','parser.py',4315),
+  ('context_mod_list -> <empty>','context_mod_list',0,'p_context_mod_list__Empty','parser.py',4321),
+  ('context_mod_list -> context_mod_list CONTEXT_MOD_IDENTIFIER','context_mod_list',2,'p_context_mod_list__context_mod_list__CONTEXT_MOD_IDENTIFIER','parser.py',4325),
+  ('context_mod_list -> context_mod_list context_mod','context_mod_list',2,'p_context_mod_list__context_mod_list__context_mod','parser.py',4329),
+  ('context_mod_list -> context_mod_list embedded_scm','context_mod_list',2,'p_context_mod_list__context_mod_list__embedded_scm','parser.py',4333),
+  ('context_modification -> CONTEXT_MOD_IDENTIFIER','context_modification',1,'p_context_modification__CONTEXT_MOD_IDENTIFIER','parser.py',4339),
+  ('context_modification -> WITH CONTEXT_MOD_IDENTIFIER','context_modification',2,'p_context_modification__WITH__CONTEXT_MOD_IDENTIFIER','parser.py',4343),
+  ('context_modification -> WITH { context_mod_list }','context_modification',4,'p_context_modification__WITH__Chr123__context_mod_list__Chr125','parser.py',4347),
+  ('context_modification -> WITH embedded_scm_closed','context_modification',2,'p_context_modification__WITH__embedded_scm_closed','parser.py',4353),
+  ('context_prop_spec -> simple_string','context_prop_spec',1,'p_context_prop_spec__simple_string','parser.py',4359),
+  ('context_prop_spec -> simple_string . simple_string','context_prop_spec',3,'p_context_prop_spec__simple_string__Chr46__simple_string','parser.py',4363),
+  ('direction_less_char -> ~','direction_less_char',1,'p_direction_less_char__Chr126','parser.py',4369),
+  ('direction_less_char -> (','direction_less_char',1,'p_direction_less_char__Chr40','parser.py',4374),
+  ('direction_less_char -> )','direction_less_char',1,'p_direction_less_char__Chr41','parser.py',4379),
+  ('direction_less_char -> [','direction_less_char',1,'p_direction_less_char__Chr91','parser.py',4384),
+  ('direction_less_char -> ]','direction_less_char',1,'p_direction_less_char__Chr93','parser.py',4389),
+  ('direction_less_char -> E_ANGLE_CLOSE','direction_less_char',1,'p_direction_less_char__E_ANGLE_CLOSE','parser.py',4394),
+  ('direction_less_char -> E_ANGLE_OPEN','direction_less_char',1,'p_direction_less_char__E_ANGLE_OPEN','parser.py',4399),
+  ('direction_less_char -> E_CLOSE','direction_less_char',1,'p_direction_less_char__E_CLOSE','parser.py',4404),
+  ('direction_less_char -> E_EXCLAMATION','direction_less_char',1,'p_direction_less_char__E_EXCLAMATION','parser.py',4409),
+  ('direction_less_char -> E_OPEN','direction_less_char',1,'p_direction_less_char__E_OPEN','parser.py',4414),
+  ('direction_less_event -> EVENT_IDENTIFIER','direction_less_event',1,'p_direction_less_event__EVENT_IDENTIFIER','parser.py',4421),
+  ('direction_less_event -> direction_less_char','direction_less_event',1,'p_direction_less_event__direction_less_char','parser.py',4428),
+  ('direction_less_event -> event_function_event','direction_less_event',1,'p_direction_less_event__event_function_event','parser.py',4432),
+  ('direction_less_event -> tremolo_type','direction_less_event',1,'p_direction_less_event__tremolo_type','parser.py',4436),
+  ('direction_reqd_event -> gen_text_def','direction_reqd_event',1,'p_direction_reqd_event__gen_text_def','parser.py',4442),
+  ('direction_reqd_event -> script_abbreviation','direction_reqd_event',1,'p_direction_reqd_event__script_abbreviation','parser.py',4446),
+  ('dots -> <empty>','dots',0,'p_dots__Empty','parser.py',4452),
+  ('dots -> dots .','dots',2,'p_dots__dots__Chr46','parser.py',4456),
+  ('duration_length -> multiplied_duration','duration_length',1,'p_duration_length__multiplied_duration','parser.py',4462),
+  ('embedded_scm -> embedded_scm_bare','embedded_scm',1,'p_embedded_scm__embedded_scm_bare','parser.py',4490),
+  ('embedded_scm -> scm_function_call','embedded_scm',1,'p_embedded_scm__scm_function_call','parser.py',4494),
+  ('embedded_scm_arg -> embedded_scm_bare_arg','embedded_scm_arg',1,'p_embedded_scm_arg__embedded_scm_bare_arg','parser.py',4500),
+  ('embedded_scm_arg -> music_arg','embedded_scm_arg',1,'p_embedded_scm_arg__music_arg','parser.py',4504),
+  ('embedded_scm_arg -> scm_function_call','embedded_scm_arg',1,'p_embedded_scm_arg__scm_function_call','parser.py',4508),
+  ('embedded_scm_arg_closed -> closed_music','embedded_scm_arg_closed',1,'p_embedded_scm_arg_closed__closed_music','parser.py',4514),
+  ('embedded_scm_arg_closed -> embedded_scm_bare_arg','embedded_scm_arg_closed',1,'p_embedded_scm_arg_closed__embedded_scm_bare_arg','parser.py',4518),
+  ('embedded_scm_arg_closed -> scm_function_call_closed','embedded_scm_arg_closed',1,'p_embedded_scm_arg_closed__scm_function_call_closed','parser.py',4522),
+  ('embedded_scm_bare -> SCM_IDENTIFIER','embedded_scm_bare',1,'p_embedded_scm_bare__SCM_IDENTIFIER','parser.py',4528),
+  ('embedded_scm_bare -> SCM_TOKEN','embedded_scm_bare',1,'p_embedded_scm_bare__SCM_TOKEN','parser.py',4532),
+  ('embedded_scm_bare_arg -> STRING','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__STRING','parser.py',4538),
+  ('embedded_scm_bare_arg -> STRING_IDENTIFIER','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__STRING_IDENTIFIER','parser.py',4542),
+  ('embedded_scm_bare_arg -> context_def_spec_block','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__context_def_spec_block','parser.py',4554),
+  ('embedded_scm_bare_arg -> context_modification','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__context_modification','parser.py',4558),
+  ('embedded_scm_bare_arg -> embedded_scm_bare','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__embedded_scm_bare','parser.py',4562),
+  ('embedded_scm_bare_arg -> full_markup','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__full_markup','parser.py',4566),
+  ('embedded_scm_bare_arg -> full_markup_list','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__full_markup_list','parser.py',4570),
+  ('embedded_scm_bare_arg -> output_def','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__output_def','parser.py',4574),
+  ('embedded_scm_bare_arg -> score_block','embedded_scm_bare_arg',1,'p_embedded_scm_bare_arg__score_block','parser.py',4578),
+  ('embedded_scm_chord_body -> SCM_FUNCTION music_function_chord_body_arglist','embedded_scm_chord_body',2,'p_embedded_scm_chord_body__SCM_FUNCTION__music_function_chord_body_arglist','parser.py',4584),
+  ('embedded_scm_chord_body -> bare_number','embedded_scm_chord_body',1,'p_embedded_scm_chord_body__bare_number','parser.py',4590),
+  ('embedded_scm_chord_body -> chord_body_element','embedded_scm_chord_body',1,'p_embedded_scm_chord_body__chord_body_element','parser.py',4594),
+  ('embedded_scm_chord_body -> embedded_scm_bare_arg','embedded_scm_chord_body',1,'p_embedded_scm_chord_body__embedded_scm_bare_arg','parser.py',4598),
+  ('embedded_scm_chord_body -> fraction','embedded_scm_chord_body',1,'p_embedded_scm_chord_body__fraction','parser.py',4602),
+  ('embedded_scm_closed -> embedded_scm_bare','embedded_scm_closed',1,'p_embedded_scm_closed__embedded_scm_bare','parser.py',4612),
+  ('embedded_scm_closed -> scm_function_call_closed','embedded_scm_closed',1,'p_embedded_scm_closed__scm_function_call_closed','parser.py',4616),
+  ('event_chord -> CHORD_REPETITION optional_notemode_duration post_events','event_chord',3,'p_event_chord__CHORD_REPETITION__optional_notemode_duration__post_events','parser.py',4622),
+  ('event_chord -> MULTI_MEASURE_REST optional_notemode_duration post_events','event_chord',3,'p_event_chord__MULTI_MEASURE_REST__optional_notemode_duration__post_events','parser.py',4641),
+  ('event_chord -> command_element','event_chord',1,'p_event_chord__command_element','parser.py',4652),
+  ('event_chord -> note_chord_element','event_chord',1,'p_event_chord__note_chord_element','parser.py',4656),
+  ('event_chord -> simple_chord_elements post_events','event_chord',2,'p_event_chord__simple_chord_elements__post_events','parser.py',4661),
+  ('event_function_event -> EVENT_FUNCTION function_arglist_closed','event_function_event',2,'p_event_function_event__EVENT_FUNCTION__function_arglist_closed','parser.py',4668),
+  ('exclamations -> <empty>','exclamations',0,'p_exclamations__Empty','parser.py',4674),
+  ('exclamations -> exclamations !','exclamations',2,'p_exclamations__exclamations__Chr33','parser.py',4678),
+  ('fingering -> UNSIGNED','fingering',1,'p_fingering__UNSIGNED','parser.py',4732),
+  ('fraction -> FRACTION','fraction',1,'p_fraction__FRACTION','parser.py',4738),
+  ('fraction -> UNSIGNED / UNSIGNED','fraction',3,'p_fraction__UNSIGNED__Chr47__UNSIGNED','parser.py',4742),
+  ('full_markup -> MARKUP_IDENTIFIER','full_markup',1,'p_full_markup__MARKUP_IDENTIFIER','parser.py',4748),
+  ('full_markup -> MARKUP markup_top','full_markup',2,'p_full_markup__MARKUP__markup_top','parser.py',4752),
+  ('full_markup_list -> MARKUPLIST_IDENTIFIER','full_markup_list',1,'p_full_markup_list__MARKUPLIST_IDENTIFIER','parser.py',4760),
+  ('full_markup_list -> MARKUPLIST markup_list','full_markup_list',2,'p_full_markup_list__MARKUPLIST__markup_list','parser.py',4765),
+  ('function_arglist -> function_arglist_common','function_arglist',1,'p_function_arglist__function_arglist_common','parser.py',4772),
+  ('function_arglist -> function_arglist_nonbackup','function_arglist',1,'p_function_arglist__function_arglist_nonbackup','parser.py',4776),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed_keep duration_length','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_closed_keep__duration_length','parser.py',4782),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist_keep pitch_also_in_chords','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist_keep__pitch_also_in_chords','parser.py',4788),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_backup BACKUP','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_backup__BACKUP','parser.py',4794),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep - NUMBER_IDENTIFIER','function_arglist_backup',5,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__Chr45__NUMBER_IDENTIFIER','parser.py',4801),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep - REAL','function_arglist_backup',5,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__Chr45__REAL','parser.py',4811),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep - UNSIGNED','function_arglist_backup',5,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__Chr45__UNSIGNED','parser.py',4822),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep FRACTION','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__FRACTION','parser.py',4835),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep NUMBER_IDENTIFIER','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__NUMBER_IDENTIFIER','parser.py',4845),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep REAL','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__REAL','parser.py',4855),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep UNSIGNED','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__UNSIGNED','parser.py',4866),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed_keep post_event_nofinger','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed_keep__post_event_nofinger','parser.py',4877),
+  ('function_arglist_backup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_keep embedded_scm_arg_closed','function_arglist_backup',4,'p_function_arglist_backup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_keep__embedded_scm_arg_closed','parser.py',4887),
+  ('function_arglist_backup -> function_arglist_backup REPARSE bare_number','function_arglist_backup',3,'p_function_arglist_backup__function_arglist_backup__REPARSE__bare_number','parser.py',4905),
+  ('function_arglist_backup -> function_arglist_backup REPARSE embedded_scm_arg_closed','function_arglist_backup',3,'p_function_arglist_backup__function_arglist_backup__REPARSE__embedded_scm_arg_closed','parser.py',4911),
+  ('function_arglist_backup -> function_arglist_backup REPARSE fraction','function_arglist_backup',3,'p_function_arglist_backup__function_arglist_backup__REPARSE__fraction','parser.py',4917),
+  ('function_arglist_bare -> EXPECT_DURATION function_arglist_closed_optional duration_length','function_arglist_bare',3,'p_function_arglist_bare__EXPECT_DURATION__function_arglist_closed_optional__duration_length','parser.py',4923),
+  ('function_arglist_bare -> EXPECT_NO_MORE_ARGS','function_arglist_bare',1,'p_function_arglist_bare__EXPECT_NO_MORE_ARGS','parser.py',4929),
+  ('function_arglist_bare -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_skip DEFAULT','function_arglist_bare',4,'p_function_arglist_bare__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_skip__DEFAULT','parser.py',4933),
+  ('function_arglist_bare -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist_skip DEFAULT','function_arglist_bare',4,'p_function_arglist_bare__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist_skip__DEFAULT','parser.py',4939),
+  ('function_arglist_bare -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_skip DEFAULT','function_arglist_bare',4,'p_function_arglist_bare__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_skip__DEFAULT','parser.py',4945),
+  ('function_arglist_bare -> EXPECT_PITCH function_arglist_optional pitch_also_in_chords','function_arglist_bare',3,'p_function_arglist_bare__EXPECT_PITCH__function_arglist_optional__pitch_also_in_chords','parser.py',4951),
+  ('function_arglist_closed -> function_arglist_closed_common','function_arglist_closed',1,'p_function_arglist_closed__function_arglist_closed_common','parser.py',4959),
+  ('function_arglist_closed -> function_arglist_nonbackup','function_arglist_closed',1,'p_function_arglist_closed__function_arglist_nonbackup','parser.py',4963),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional - NUMBER_IDENTIFIER','function_arglist_closed_common',4,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__Chr45__NUMBER_IDENTIFIER','parser.py',4969),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional - REAL','function_arglist_closed_common',4,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__Chr45__REAL','parser.py',4975),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional - UNSIGNED','function_arglist_closed_common',4,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__Chr45__UNSIGNED','parser.py',4981),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional bare_number','function_arglist_closed_common',3,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__bare_number','parser.py',4987),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional fraction','function_arglist_closed_common',3,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__fraction','parser.py',4993),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_closed_optional post_event_nofinger','function_arglist_closed_common',3,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_closed_optional__post_event_nofinger','parser.py',4999),
+  ('function_arglist_closed_common -> EXPECT_SCM function_arglist_optional embedded_scm_arg_closed','function_arglist_closed_common',3,'p_function_arglist_closed_common__EXPECT_SCM__function_arglist_optional__embedded_scm_arg_closed','parser.py',5005),
+  ('function_arglist_closed_common -> function_arglist_bare','function_arglist_closed_common',1,'p_function_arglist_closed_common__function_arglist_bare','parser.py',5015),
+  ('function_arglist_closed_keep -> function_arglist_backup','function_arglist_closed_keep',1,'p_function_arglist_closed_keep__function_arglist_backup','parser.py',5021),
+  ('function_arglist_closed_keep -> function_arglist_closed_common','function_arglist_closed_keep',1,'p_function_arglist_closed_keep__function_arglist_closed_common','parser.py',5025),
+  ('function_arglist_closed_optional -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed_optional','function_arglist_closed_optional',3,'p_function_arglist_closed_optional__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_closed_optional','parser.py',5031),
+  ('function_arglist_closed_optional -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist_closed_optional','function_arglist_closed_optional',3,'p_function_arglist_closed_optional__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist_closed_optional','parser.py',5037),
+  ('function_arglist_closed_optional -> function_arglist_backup BACKUP','function_arglist_closed_optional',2,'p_function_arglist_closed_optional__function_arglist_backup__BACKUP','parser.py',5043),
+  ('function_arglist_closed_optional -> function_arglist_closed_keep','function_arglist_closed_optional',1,'p_function_arglist_closed_optional__function_arglist_closed_keep','parser.py',5047),
+  ('function_arglist_common -> EXPECT_SCM function_arglist_closed_optional bare_number','function_arglist_common',3,'p_function_arglist_common__EXPECT_SCM__function_arglist_closed_optional__bare_number','parser.py',5053),
+  ('function_arglist_common -> EXPECT_SCM function_arglist_closed_optional fraction','function_arglist_common',3,'p_function_arglist_common__EXPECT_SCM__function_arglist_closed_optional__fraction','parser.py',5059),
+  ('function_arglist_common -> EXPECT_SCM function_arglist_closed_optional post_event_nofinger','function_arglist_common',3,'p_function_arglist_common__EXPECT_SCM__function_arglist_closed_optional__post_event_nofinger','parser.py',5065),
+  ('function_arglist_common -> EXPECT_SCM function_arglist_optional embedded_scm_arg','function_arglist_common',3,'p_function_arglist_common__EXPECT_SCM__function_arglist_optional__embedded_scm_arg','parser.py',5071),
+  ('function_arglist_common -> function_arglist_bare','function_arglist_common',1,'p_function_arglist_common__function_arglist_bare','parser.py',5077),
+  ('function_arglist_common -> function_arglist_common_minus','function_arglist_common',1,'p_function_arglist_common__function_arglist_common_minus','parser.py',5085),
+  ('function_arglist_common_minus -> EXPECT_SCM function_arglist_closed_optional - NUMBER_IDENTIFIER','function_arglist_common_minus',4,'p_function_arglist_common_minus__EXPECT_SCM__function_arglist_closed_optional__Chr45__NUMBER_IDENTIFIER','parser.py',5101),
+  ('function_arglist_common_minus -> EXPECT_SCM function_arglist_closed_optional - REAL','function_arglist_common_minus',4,'p_function_arglist_common_minus__EXPECT_SCM__function_arglist_closed_optional__Chr45__REAL','parser.py',5107),
+  ('function_arglist_common_minus -> EXPECT_SCM function_arglist_closed_optional - UNSIGNED','function_arglist_common_minus',4,'p_function_arglist_common_minus__EXPECT_SCM__function_arglist_closed_optional__Chr45__UNSIGNED','parser.py',5113),
+  ('function_arglist_common_minus -> function_arglist_common_minus REPARSE bare_number','function_arglist_common_minus',3,'p_function_arglist_common_minus__function_arglist_common_minus__REPARSE__bare_number','parser.py',5119),
+  ('function_arglist_keep -> function_arglist_backup','function_arglist_keep',1,'p_function_arglist_keep__function_arglist_backup','parser.py',5127),
+  ('function_arglist_keep -> function_arglist_common','function_arglist_keep',1,'p_function_arglist_keep__function_arglist_common','parser.py',5131),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_closed duration_length','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_closed__duration_length','parser.py',5137),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist pitch_also_in_chords','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist__pitch_also_in_chords','parser.py',5143),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist embedded_scm_arg_closed','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist__embedded_scm_arg_closed','parser.py',5149),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed - NUMBER_IDENTIFIER','function_arglist_nonbackup',5,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__Chr45__NUMBER_IDENTIFIER','parser.py',5155),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed - REAL','function_arglist_nonbackup',5,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__Chr45__REAL','parser.py',5161),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed - UNSIGNED','function_arglist_nonbackup',5,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__Chr45__UNSIGNED','parser.py',5167),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed FRACTION','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__FRACTION','parser.py',5173),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed bare_number_closed','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__bare_number_closed','parser.py',5179),
+  ('function_arglist_nonbackup -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_closed post_event_nofinger','function_arglist_nonbackup',4,'p_function_arglist_nonbackup__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_closed__post_event_nofinger','parser.py',5185),
+  ('function_arglist_optional -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_optional','function_arglist_optional',3,'p_function_arglist_optional__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_optional','parser.py',5193),
+  ('function_arglist_optional -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist_optional','function_arglist_optional',3,'p_function_arglist_optional__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist_optional','parser.py',5199),
+  ('function_arglist_optional -> function_arglist_backup BACKUP','function_arglist_optional',2,'p_function_arglist_optional__function_arglist_backup__BACKUP','parser.py',5205),
+  ('function_arglist_optional -> function_arglist_keep','function_arglist_optional',1,'p_function_arglist_optional__function_arglist_keep','parser.py',5209),
+  ('function_arglist_skip -> EXPECT_OPTIONAL EXPECT_DURATION function_arglist_skip','function_arglist_skip',3,'p_function_arglist_skip__EXPECT_OPTIONAL__EXPECT_DURATION__function_arglist_skip','parser.py',5215),
+  ('function_arglist_skip -> EXPECT_OPTIONAL EXPECT_PITCH function_arglist_skip','function_arglist_skip',3,'p_function_arglist_skip__EXPECT_OPTIONAL__EXPECT_PITCH__function_arglist_skip','parser.py',5221),
+  ('function_arglist_skip -> EXPECT_OPTIONAL EXPECT_SCM function_arglist_skip','function_arglist_skip',3,'p_function_arglist_skip__EXPECT_OPTIONAL__EXPECT_SCM__function_arglist_skip','parser.py',5227),
+  ('function_arglist_skip -> function_arglist_common','function_arglist_skip',1,'p_function_arglist_skip__function_arglist_common','parser.py',5233),
+  ('gen_text_def -> full_markup','gen_text_def',1,'p_gen_text_def__full_markup','parser.py',5239),
+  ('gen_text_def -> simple_string','gen_text_def',1,'p_gen_text_def__simple_string','parser.py',5243),
+  ('grouped_music_list -> sequential_music','grouped_music_list',1,'p_grouped_music_list__sequential_music','parser.py',5249),
+  ('grouped_music_list -> simultaneous_music','grouped_music_list',1,'p_grouped_music_list__simultaneous_music','parser.py',5253),
+  ('identifier_init -> context_def_spec_block','identifier_init',1,'p_identifier_init__context_def_spec_block','parser.py',5267),
+  ('identifier_init -> context_modification','identifier_init',1,'p_identifier_init__context_modification','parser.py',5271),
+  ('identifier_init -> embedded_scm','identifier_init',1,'p_identifier_init__embedded_scm','parser.py',5275),
+  ('identifier_init -> full_markup','identifier_init',1,'p_identifier_init__full_markup','parser.py',5279),
+  ('identifier_init -> full_markup_list','identifier_init',1,'p_identifier_init__full_markup_list','parser.py',5283),
+  ('identifier_init -> music','identifier_init',1,'p_identifier_init__music','parser.py',5287),
+  ('identifier_init -> number_expression','identifier_init',1,'p_identifier_init__number_expression','parser.py',5291),
+  ('identifier_init -> output_def','identifier_init',1,'p_identifier_init__output_def','parser.py',5295),
+  ('identifier_init -> post_event_nofinger','identifier_init',1,'p_identifier_init__post_event_nofinger','parser.py',5299),
+  ('identifier_init -> score_block','identifier_init',1,'p_identifier_init__score_block','parser.py',5303),
+  ('identifier_init -> string','identifier_init',1,'p_identifier_init__string','parser.py',5307),
+  ('lilypond -> <empty>','lilypond',0,'p_lilypond__Empty','parser.py',5313),
+  ('lilypond -> lilypond assignment','lilypond',2,'p_lilypond__lilypond__assignment','parser.py',5321),
+  ('lilypond -> lilypond error','lilypond',2,'p_lilypond__lilypond__error','parser.py',5327),
+  ('lilypond -> lilypond toplevel_expression','lilypond',2,'p_lilypond__lilypond__toplevel_expression','parser.py',5331),
+  ('lilypond_header -> HEADER { lilypond_header_body }','lilypond_header',4,'p_lilypond_header__HEADER__Chr123__lilypond_header_body__Chr125','parser.py',5337),
+  ('lilypond_header_body -> <empty>','lilypond_header_body',0,'p_lilypond_header_body__Empty','parser.py',5344),
+  ('lilypond_header_body -> lilypond_header_body assignment','lilypond_header_body',2,'p_lilypond_header_body__lilypond_header_body__assignment','parser.py',5349),
+  ('markup -> markup_head_1_list simple_markup','markup',2,'p_markup__markup_head_1_list__simple_markup','parser.py',5401),
+  ('markup -> simple_markup','markup',1,'p_markup__simple_markup','parser.py',5411),
+  ('markup_braced_list -> { markup_braced_list_body }','markup_braced_list',3,'p_markup_braced_list__Chr123__markup_braced_list_body__Chr125','parser.py',5417),
+  ('markup_braced_list_body -> <empty>','markup_braced_list_body',0,'p_markup_braced_list_body__Empty','parser.py',5423),
+  ('markup_braced_list_body -> markup_braced_list_body markup','markup_braced_list_body',2,'p_markup_braced_list_body__markup_braced_list_body__markup','parser.py',5427),
+  ('markup_braced_list_body -> markup_braced_list_body markup_list','markup_braced_list_body',2,'p_markup_braced_list_body__markup_braced_list_body__markup_list','parser.py',5431),
+  ('markup_command_basic_arguments -> EXPECT_MARKUP_LIST markup_command_list_arguments markup_list','markup_command_basic_arguments',3,'p_markup_command_basic_arguments__EXPECT_MARKUP_LIST__markup_command_list_arguments__markup_list','parser.py',5437),
+  ('markup_command_basic_arguments -> EXPECT_NO_MORE_ARGS','markup_command_basic_arguments',1,'p_markup_command_basic_arguments__EXPECT_NO_MORE_ARGS','parser.py',5443),
+  ('markup_command_basic_arguments -> EXPECT_SCM markup_command_list_arguments embedded_scm_closed','markup_command_basic_arguments',3,'p_markup_command_basic_arguments__EXPECT_SCM__markup_command_list_arguments__embedded_scm_closed','parser.py',5447),
+  ('markup_command_list -> MARKUP_LIST_FUNCTION markup_command_list_arguments','markup_command_list',2,'p_markup_command_list__MARKUP_LIST_FUNCTION__markup_command_list_arguments','parser.py',5455),
+  ('markup_command_list_arguments -> EXPECT_MARKUP markup_command_list_arguments markup','markup_command_list_arguments',3,'p_markup_command_list_arguments__EXPECT_MARKUP__markup_command_list_arguments__markup','parser.py',5463),
+  ('markup_command_list_arguments -> markup_command_basic_arguments','markup_command_list_arguments',1,'p_markup_command_list_arguments__markup_command_basic_arguments','parser.py',5469),
+  ('markup_composed_list -> markup_head_1_list markup_braced_list','markup_composed_list',2,'p_markup_composed_list__markup_head_1_list__markup_braced_list','parser.py',5475),
+  ('markup_head_1_item -> MARKUP_FUNCTION EXPECT_MARKUP markup_command_list_arguments','markup_head_1_item',3,'p_markup_head_1_item__MARKUP_FUNCTION__EXPECT_MARKUP__markup_command_list_arguments','parser.py',5487),
+  ('markup_head_1_list -> markup_head_1_item','markup_head_1_list',1,'p_markup_head_1_list__markup_head_1_item','parser.py',5495),
+  ('markup_head_1_list -> markup_head_1_list markup_head_1_item','markup_head_1_list',2,'p_markup_head_1_list__markup_head_1_list__markup_head_1_item','parser.py',5499),
+  ('markup_list -> MARKUPLIST_IDENTIFIER','markup_list',1,'p_markup_list__MARKUPLIST_IDENTIFIER','parser.py',5505),
+  ('markup_list -> markup_braced_list','markup_list',1,'p_markup_list__markup_braced_list','parser.py',5509),
+  ('markup_list -> markup_command_list','markup_list',1,'p_markup_list__markup_command_list','parser.py',5513),
+  ('markup_list -> markup_composed_list','markup_list',1,'p_markup_list__markup_composed_list','parser.py',5517),
+  ('markup_list -> markup_scm MARKUPLIST_IDENTIFIER','markup_list',2,'p_markup_list__markup_scm__MARKUPLIST_IDENTIFIER','parser.py',5521),
+  ('markup_scm -> embedded_scm_bare BACKUP','markup_scm',2,'p_markup_scm__embedded_scm_bare__BACKUP','parser.py',5527),
+  ('markup_top -> markup_head_1_list simple_markup','markup_top',2,'p_markup_top__markup_head_1_list__simple_markup','parser.py',5545),
+  ('markup_top -> markup_list','markup_top',1,'p_markup_top__markup_list','parser.py',5555),
+  ('markup_top -> simple_markup','markup_top',1,'p_markup_top__simple_markup','parser.py',5559),
+  ('multiplied_duration -> multiplied_duration * FRACTION','multiplied_duration',3,'p_multiplied_duration__multiplied_duration__Chr42__FRACTION','parser.py',5615),
+  ('multiplied_duration -> multiplied_duration * bare_unsigned','multiplied_duration',3,'p_multiplied_duration__multiplied_duration__Chr42__bare_unsigned','parser.py',5624),
+  ('multiplied_duration -> steno_duration','multiplied_duration',1,'p_multiplied_duration__steno_duration','parser.py',5631),
+  ('music -> composite_music','music',1,'p_music__composite_music','parser.py',5637),
+  ('music -> simple_music','music',1,'p_music__simple_music','parser.py',5645),
+  ('music_arg -> composite_music','music_arg',1,'p_music_arg__composite_music','parser.py',5651),
+  ('music_arg -> simple_music','music_arg',1,'p_music_arg__simple_music','parser.py',5655),
+  ('music_bare -> MUSIC_IDENTIFIER','music_bare',1,'p_music_bare__MUSIC_IDENTIFIER','parser.py',5661),
+  ('music_bare -> grouped_music_list','music_bare',1,'p_music_bare__grouped_music_list','parser.py',5665),
+  ('music_function_call -> MUSIC_FUNCTION function_arglist','music_function_call',2,'p_music_function_call__MUSIC_FUNCTION__function_arglist','parser.py',5675),
+  ('music_function_chord_body -> MUSIC_FUNCTION music_function_chord_body_arglist','music_function_chord_body',2,'p_music_function_chord_body__MUSIC_FUNCTION__music_function_chord_body_arglist','parser.py',5681),
+  ('music_function_chord_body_arglist -> EXPECT_SCM music_function_chord_body_arglist embedded_scm_chord_body','music_function_chord_body_arglist',3,'p_music_function_chord_body_arglist__EXPECT_SCM__music_function_chord_body_arglist__embedded_scm_chord_body','parser.py',5689),
+  ('music_function_chord_body_arglist -> function_arglist_bare','music_function_chord_body_arglist',1,'p_music_function_chord_body_arglist__function_arglist_bare','parser.py',5695),
+  ('music_function_event -> MUSIC_FUNCTION function_arglist_closed','music_function_event',2,'p_music_function_event__MUSIC_FUNCTION__function_arglist_closed','parser.py',5701),
+  ('music_list -> <empty>','music_list',0,'p_music_list__Empty','parser.py',5707),
+  ('music_list -> music_list embedded_scm','music_list',2,'p_music_list__music_list__embedded_scm','parser.py',5711),
+  ('music_list -> music_list error','music_list',2,'p_music_list__music_list__error','parser.py',5715),
+  ('music_list -> music_list music','music_list',2,'p_music_list__music_list__music','parser.py',5719),
+  ('music_property_def -> simple_music_property_def','music_property_def',1,'p_music_property_def__simple_music_property_def','parser.py',5725),
+  ('note_chord_element -> chord_body optional_notemode_duration post_events','note_chord_element',3,'p_note_chord_element__chord_body__optional_notemode_duration__post_events','parser.py',5751),
+  ('number_expression -> number_expression + number_term','number_expression',3,'p_number_expression__number_expression__Chr43__number_term','parser.py',5772),
+  ('number_expression -> number_expression - number_term','number_expression',3,'p_number_expression__number_expression__Chr45__number_term','parser.py',5776),
+  ('number_expression -> number_term','number_expression',1,'p_number_expression__number_term','parser.py',5780),
+  ('number_factor -> - number_factor','number_factor',2,'p_number_factor__Chr45__number_factor','parser.py',5786),
+  ('number_factor -> bare_number','number_factor',1,'p_number_factor__bare_number','parser.py',5790),
+  ('number_term -> number_factor','number_term',1,'p_number_term__number_factor','parser.py',5796),
+  ('number_term -> number_factor * number_factor','number_term',3,'p_number_term__number_factor__Chr42__number_factor','parser.py',5800),
+  ('number_term -> number_factor / number_factor','number_term',3,'p_number_term__number_factor__Chr47__number_factor','parser.py',5804),
+  ('octave_check -> =','octave_check',1,'p_octave_check__Chr61','parser.py',5810),
+  ('octave_check -> = sub_quotes','octave_check',2,'p_octave_check__Chr61__sub_quotes','parser.py',5814),
+  ('octave_check -> = sup_quotes','octave_check',2,'p_octave_check__Chr61__sup_quotes','parser.py',5818),
+  ('octave_check -> <empty>','octave_check',0,'p_octave_check__Empty','parser.py',5822),
+  ('optional_context_mod -> <empty>','optional_context_mod',0,'p_optional_context_mod__Empty','parser.py',5828),
+  ('optional_context_mod -> context_modification','optional_context_mod',1,'p_optional_context_mod__context_modification','parser.py',5832),
+  ('optional_id -> = simple_string','optional_id',2,'p_optional_id__Chr61__simple_string','parser.py',5838),
+  ('optional_id -> <empty>','optional_id',0,'p_optional_id__Empty','parser.py',5842),
+  ('optional_notemode_duration -> <empty>','optional_notemode_duration',0,'p_optional_notemode_duration__Empty','parser.py',5848),
+  ('optional_notemode_duration -> multiplied_duration','optional_notemode_duration',1,'p_optional_notemode_duration__multiplied_duration','parser.py',5852),
+  ('optional_rest -> <empty>','optional_rest',0,'p_optional_rest__Empty','parser.py',5859),
+  ('optional_rest -> REST','optional_rest',1,'p_optional_rest__REST','parser.py',5863),
+  ('output_def -> output_def_body }','output_def',2,'p_output_def__output_def_body__Chr125','parser.py',5869),
+  ('output_def_body -> output_def_body assignment','output_def_body',2,'p_output_def_body__output_def_body__assignment','parser.py',5878),
+  ('output_def_body -> output_def_head_with_mode_switch {','output_def_body',2,'p_output_def_body__output_def_head_with_mode_switch__Chr123','parser.py',5892),
+  ('output_def_body -> output_def_head_with_mode_switch { OUTPUT_DEF_IDENTIFIER','output_def_body',3,'p_output_def_body__output_def_head_with_mode_switch__Chr123__OUTPUT_DEF_IDENTIFIER','parser.py',5896),
+  ('output_def_head -> LAYOUT','output_def_head',1,'p_output_def_head__LAYOUT','parser.py',5904),
+  ('output_def_head -> MIDI','output_def_head',1,'p_output_def_head__MIDI','parser.py',5909),
+  ('output_def_head -> PAPER','output_def_head',1,'p_output_def_head__PAPER','parser.py',5914),
+  ('output_def_head_with_mode_switch -> output_def_head','output_def_head_with_mode_switch',1,'p_output_def_head_with_mode_switch__output_def_head','parser.py',5921),
+  ('pitch -> PITCH_IDENTIFIER','pitch',1,'p_pitch__PITCH_IDENTIFIER','parser.py',5934),
+  ('pitch -> steno_pitch','pitch',1,'p_pitch__steno_pitch','parser.py',5938),
+  ('pitch_also_in_chords -> pitch','pitch_also_in_chords',1,'p_pitch_also_in_chords__pitch','parser.py',5944),
+  ('pitch_also_in_chords -> steno_tonic_pitch','pitch_also_in_chords',1,'p_pitch_also_in_chords__steno_tonic_pitch','parser.py',5948),
+  ('post_event -> - fingering','post_event',2,'p_post_event__Chr45__fingering','parser.py',5954),
+  ('post_event -> post_event_nofinger','post_event',1,'p_post_event__post_event_nofinger','parser.py',5958),
+  ('post_event_nofinger -> ^ fingering','post_event_nofinger',2,'p_post_event_nofinger__Chr94__fingering','parser.py',5964),
+  ('post_event_nofinger -> _ fingering','post_event_nofinger',2,'p_post_event_nofinger__Chr95__fingering','parser.py',5968),
+  ('post_event_nofinger -> EXTENDER','post_event_nofinger',1,'p_post_event_nofinger__EXTENDER','parser.py',5972),
+  ('post_event_nofinger -> HYPHEN','post_event_nofinger',1,'p_post_event_nofinger__HYPHEN','parser.py',5976),
+  ('post_event_nofinger -> direction_less_event','post_event_nofinger',1,'p_post_event_nofinger__direction_less_event','parser.py',5980),
+  ('post_event_nofinger -> script_dir direction_less_event','post_event_nofinger',2,'p_post_event_nofinger__script_dir__direction_less_event','parser.py',5984),
+  ('post_event_nofinger -> script_dir direction_reqd_event','post_event_nofinger',2,'p_post_event_nofinger__script_dir__direction_reqd_event','parser.py',5996),
+  ('post_event_nofinger -> script_dir music_function_event','post_event_nofinger',2,'p_post_event_nofinger__script_dir__music_function_event','parser.py',6008),
+  ('post_event_nofinger -> string_number_event','post_event_nofinger',1,'p_post_event_nofinger__string_number_event','parser.py',6012),
+  ('post_events -> <empty>','post_events',0,'p_post_events__Empty','parser.py',6018),
+  ('post_events -> post_events post_event','post_events',2,'p_post_events__post_events__post_event','parser.py',6022),
+  ('property_operation -> OVERRIDE simple_string property_path = scalar','property_operation',5,'p_property_operation__OVERRIDE__simple_string__property_path__Chr61__scalar','parser.py',6028),
+  ('property_operation -> REVERT simple_string embedded_scm','property_operation',3,'p_property_operation__REVERT__simple_string__embedded_scm','parser.py',6040),
+  ('property_operation -> STRING = scalar','property_operation',3,'p_property_operation__STRING__Chr61__scalar','parser.py',6046),
+  ('property_operation -> UNSET simple_string','property_operation',2,'p_property_operation__UNSET__simple_string','parser.py',6052),
+  ('property_path -> property_path_revved','property_path',1,'p_property_path__property_path_revved','parser.py',6058),
+  ('property_path_revved -> embedded_scm_closed','property_path_revved',1,'p_property_path_revved__embedded_scm_closed','parser.py',6064),
+  ('property_path_revved -> property_path_revved embedded_scm_closed','property_path_revved',2,'p_property_path_revved__property_path_revved__embedded_scm_closed','parser.py',6068),
+  ('questions -> <empty>','questions',0,'p_questions__Empty','parser.py',6074),
+  ('questions -> questions ?','questions',2,'p_questions__questions__Chr63','parser.py',6078),
+  ('scalar -> bare_number','scalar',1,'p_scalar__bare_number','parser.py',6104),
+  ('scalar -> embedded_scm_arg','scalar',1,'p_scalar__embedded_scm_arg','parser.py',6108),
+  ('scalar_closed -> bare_number','scalar_closed',1,'p_scalar_closed__bare_number','parser.py',6118),
+  ('scalar_closed -> embedded_scm_arg_closed','scalar_closed',1,'p_scalar_closed__embedded_scm_arg_closed','parser.py',6122),
+  ('scm_function_call -> SCM_FUNCTION function_arglist','scm_function_call',2,'p_scm_function_call__SCM_FUNCTION__function_arglist','parser.py',6132),
+  ('scm_function_call_closed -> SCM_FUNCTION function_arglist_closed','scm_function_call_closed',2,'p_scm_function_call_closed__SCM_FUNCTION__function_arglist_closed','parser.py',6138),
+  ('score_block -> SCORE { score_body }','score_block',4,'p_score_block__SCORE__Chr123__score_body__Chr125','parser.py',6144),
+  ('score_body -> SCORE_IDENTIFIER','score_body',1,'p_score_body__SCORE_IDENTIFIER','parser.py',6152),
+  ('score_body -> music','score_body',1,'p_score_body__music','parser.py',6156),
+  ('score_body -> score_body lilypond_header','score_body',2,'p_score_body__score_body__lilypond_header','parser.py',6164),
+  ('score_body -> score_body output_def','score_body',2,'p_score_body__score_body__output_def','parser.py',6168),
+  ('script_abbreviation -> ANGLE_CLOSE','script_abbreviation',1,'p_script_abbreviation__ANGLE_CLOSE','parser.py',6174),
+  ('script_abbreviation -> !','script_abbreviation',1,'p_script_abbreviation__Chr33','parser.py',6179),
+  ('script_abbreviation -> +','script_abbreviation',1,'p_script_abbreviation__Chr43','parser.py',6185),
+  ('script_abbreviation -> -','script_abbreviation',1,'p_script_abbreviation__Chr45','parser.py',6190),
+  ('script_abbreviation -> .','script_abbreviation',1,'p_script_abbreviation__Chr46','parser.py',6195),
+  ('script_abbreviation -> ^','script_abbreviation',1,'p_script_abbreviation__Chr94','parser.py',6200),
+  ('script_abbreviation -> _','script_abbreviation',1,'p_script_abbreviation__Chr95','parser.py',6205),
+  ('script_dir -> -','script_dir',1,'p_script_dir__Chr45','parser.py',6212),
+  ('script_dir -> ^','script_dir',1,'p_script_dir__Chr94','parser.py',6216),
+  ('script_dir -> _','script_dir',1,'p_script_dir__Chr95','parser.py',6220),
+  ('sequential_music -> SEQUENTIAL braced_music_list','sequential_music',2,'p_sequential_music__SEQUENTIAL__braced_music_list','parser.py',6226),
+  ('sequential_music -> braced_music_list','sequential_music',1,'p_sequential_music__braced_music_list','parser.py',6230),
+  ('simple_chord_elements -> simple_element','simple_chord_elements',1,'p_simple_chord_elements__simple_element','parser.py',6244),
+  ('simple_element -> RESTNAME optional_notemode_duration','simple_element',2,'p_simple_element__RESTNAME__optional_notemode_duration','parser.py',6255),
+  ('simple_element -> pitch exclamations questions octave_check optional_notemode_duration optional_rest','simple_element',6,'p_simple_element__pitch__exclamations__questions__octave_check__optional_notemode_duration__optional_rest','parser.py',6266),
+  ('simple_markup -> MARKUP_FUNCTION markup_command_basic_arguments','simple_markup',2,'p_simple_markup__MARKUP_FUNCTION__markup_command_basic_arguments','parser.py',6288),
+  ('simple_markup -> MARKUP_IDENTIFIER','simple_markup',1,'p_simple_markup__MARKUP_IDENTIFIER','parser.py',6294),
+  ('simple_markup -> SCORE { score_body }','simple_markup',4,'p_simple_markup__SCORE__Chr123__score_body__Chr125','parser.py',6298),
+  ('simple_markup -> STRING','simple_markup',1,'p_simple_markup__STRING','parser.py',6302),
+  ('simple_markup -> STRING_IDENTIFIER','simple_markup',1,'p_simple_markup__STRING_IDENTIFIER','parser.py',6306),
+  ('simple_markup -> markup_scm MARKUP_IDENTIFIER','simple_markup',2,'p_simple_markup__markup_scm__MARKUP_IDENTIFIER','parser.py',6310),
+  ('simple_music -> context_change','simple_music',1,'p_simple_music__context_change','parser.py',6317),
+  ('simple_music -> event_chord','simple_music',1,'p_simple_music__event_chord','parser.py',6321),
+  ('simple_music -> music_property_def','simple_music',1,'p_simple_music__music_property_def','parser.py',6325),
+  ('simple_music_property_def -> OVERRIDE context_prop_spec property_path = scalar','simple_music_property_def',5,'p_simple_music_property_def__OVERRIDE__context_prop_spec__property_path__Chr61__scalar','parser.py',6331),
+  ('simple_music_property_def -> REVERT context_prop_spec embedded_scm','simple_music_property_def',3,'p_simple_music_property_def__REVERT__context_prop_spec__embedded_scm','parser.py',6343),
+  ('simple_music_property_def -> SET context_prop_spec = scalar','simple_music_property_def',4,'p_simple_music_property_def__SET__context_prop_spec__Chr61__scalar','parser.py',6347),
+  ('simple_music_property_def -> UNSET context_prop_spec','simple_music_property_def',2,'p_simple_music_property_def__UNSET__context_prop_spec','parser.py',6351),
+  ('simple_string -> STRING','simple_string',1,'p_simple_string__STRING','parser.py',6361),
+  ('simple_string -> STRING_IDENTIFIER','simple_string',1,'p_simple_string__STRING_IDENTIFIER','parser.py',6365),
+  ('simultaneous_music -> DOUBLE_ANGLE_OPEN music_list DOUBLE_ANGLE_CLOSE','simultaneous_music',3,'p_simultaneous_music__DOUBLE_ANGLE_OPEN__music_list__DOUBLE_ANGLE_CLOSE','parser.py',6371),
+  ('simultaneous_music -> SIMULTANEOUS braced_music_list','simultaneous_music',2,'p_simultaneous_music__SIMULTANEOUS__braced_music_list','parser.py',6377),
+  ('steno_duration -> DURATION_IDENTIFIER dots','steno_duration',2,'p_steno_duration__DURATION_IDENTIFIER__dots','parser.py',6383),
+  ('steno_duration -> bare_unsigned dots','steno_duration',2,'p_steno_duration__bare_unsigned__dots','parser.py',6394),
+  ('steno_pitch -> NOTENAME_PITCH','steno_pitch',1,'p_steno_pitch__NOTENAME_PITCH','parser.py',6404),
+  ('steno_pitch -> NOTENAME_PITCH sub_quotes','steno_pitch',2,'p_steno_pitch__NOTENAME_PITCH__sub_quotes','parser.py',6411),
+  ('steno_pitch -> NOTENAME_PITCH sup_quotes','steno_pitch',2,'p_steno_pitch__NOTENAME_PITCH__sup_quotes','parser.py',6415),
+  ('steno_tonic_pitch -> TONICNAME_PITCH','steno_tonic_pitch',1,'p_steno_tonic_pitch__TONICNAME_PITCH','parser.py',6421),
+  ('steno_tonic_pitch -> TONICNAME_PITCH sub_quotes','steno_tonic_pitch',2,'p_steno_tonic_pitch__TONICNAME_PITCH__sub_quotes','parser.py',6425),
+  ('steno_tonic_pitch -> TONICNAME_PITCH sup_quotes','steno_tonic_pitch',2,'p_steno_tonic_pitch__TONICNAME_PITCH__sup_quotes','parser.py',6429),
+  ('string -> STRING','string',1,'p_string__STRING','parser.py',6459),
+  ('string -> STRING_IDENTIFIER','string',1,'p_string__STRING_IDENTIFIER','parser.py',6463),
+  ('string -> string + string','string',3,'p_string__string__Chr43__string','parser.py',6467),
+  ('string_number_event -> E_UNSIGNED','string_number_event',1,'p_string_number_event__E_UNSIGNED','parser.py',6473),
+  ('sub_quotes -> ,','sub_quotes',1,'p_sub_quotes__Chr44','parser.py',6479),
+  ('sub_quotes -> sub_quotes ,','sub_quotes',2,'p_sub_quotes__sub_quotes__Chr44','parser.py',6483),
+  ("sup_quotes -> '",'sup_quotes',1,'p_sup_quotes__Chr39','parser.py',6489),
+  ("sup_quotes -> sup_quotes '",'sup_quotes',2,'p_sup_quotes__sup_quotes__Chr39','parser.py',6493),
+  ('tempo_event -> TEMPO scalar','tempo_event',2,'p_tempo_event__TEMPO__scalar','parser.py',6499),
+  ('tempo_event -> TEMPO scalar_closed steno_duration = tempo_range','tempo_event',5,'p_tempo_event__TEMPO__scalar_closed__steno_duration__Chr61__tempo_range','parser.py',6503),
+  ('tempo_event -> TEMPO steno_duration = tempo_range','tempo_event',4,'p_tempo_event__TEMPO__steno_duration__Chr61__tempo_range','parser.py',6514),
+  ('tempo_range -> bare_unsigned','tempo_range',1,'p_tempo_range__bare_unsigned','parser.py',6520),
+  ('tempo_range -> bare_unsigned - bare_unsigned','tempo_range',3,'p_tempo_range__bare_unsigned__Chr45__bare_unsigned','parser.py',6524),
+  ('toplevel_expression -> composite_music','toplevel_expression',1,'p_toplevel_expression__composite_music','parser.py',6538),
+  ('toplevel_expression -> full_markup','toplevel_expression',1,'p_toplevel_expression__full_markup','parser.py',6542),
+  ('toplevel_expression -> full_markup_list','toplevel_expression',1,'p_toplevel_expression__full_markup_list','parser.py',6546),
+  ('toplevel_expression -> lilypond_header','toplevel_expression',1,'p_toplevel_expression__lilypond_header','parser.py',6550),
+  ('toplevel_expression -> output_def','toplevel_expression',1,'p_toplevel_expression__output_def','parser.py',6554),
+  ('toplevel_expression -> score_block','toplevel_expression',1,'p_toplevel_expression__score_block','parser.py',6558),
+  ('tremolo_type -> :','tremolo_type',1,'p_tremolo_type__Chr58','parser.py',6564),
+  ('tremolo_type -> : bare_unsigned','tremolo_type',2,'p_tremolo_type__Chr58__bare_unsigned','parser.py',6568),
+]
@@ -0,0 +1,10 @@
+# reducedlyparser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('APOSTROPHE', 'BRACE_L', 'BRACE_R', 'BRACKET_L', 'BRACKET_R', 'CARAT_L', 'CARAT_R', 'COMMA', 'DOT', 'FRACTION', 'INTEGER_N', 'INTEGER_P', 'PAREN_L', 'PAREN_R', 'PIPE', 'PITCHNAME', 'RESTNAME', 'TILDE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_FRACTION>([1-9]\\d*/[1-9]\\d*))|(?P<t_INTEGER_N>(-[1-9]\\d*))|(?P<t_INTEGER_P>([1-9]\\d*))|(?P<t_PITCHNAME>[a-g](ff|ss|f|s|tqf|tqs|qs|qf)?)|(?P<t_newline>\\n+)|(?P<t_BRACKET_L>\\[)|(?P<t_BRACKET_R>\\])|(?P<t_CARAT_L>\\<)|(?P<t_CARAT_R>\\>)|(?P<t_DOT>\\.)|(?P<t_PAREN_L>\\()|(?P<t_PAREN_R>\\))|(?P<t_PIPE>\\|)|(?P<t_APOSTROPHE>')|(?P<t_BRACE_L>{)|(?P<t_BRACE_R>})|(?P<t_COMMA>,)|(?P<t_RESTNAME>r)|(?P<t_TILDE>~)", [None, ('t_FRACTION', 'FRACTION'), None, ('t_INTEGER_N', 'INTEGER_N'), None, ('t_INTEGER_P', 'INTEGER_P'), None, ('t_PITCHNAME', 'PITCHNAME'), None, ('t_newline', 'newline'), (None, 'BRACKET_L'), (None, 'BRACKET_R'), (None, 'CARAT_L'), (None, 'CARAT_R'), (None, 'DOT'), (None, 'PAREN_L'), (None, 'PAREN_R'), (None, 'PIPE'), (None, 'APOSTROPHE'), (None, 'BRACE_L'), (None, 'BRACE_R'), (None, 'COMMA'), (None, 'RESTNAME'), (None, 'TILDE')])]}
+_lexstateignore = {'INITIAL': ' \t\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
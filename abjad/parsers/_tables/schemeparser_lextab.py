@@ -0,0 +1,10 @@
+# schemeparser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AMPERSAND', 'ASTERISK', 'BOOLEAN', 'CARAT', 'COLON', 'DECIMAL', 'DOLLAR', 'EQUALS', 'EXCLAMATION', 'HASH', 'HEXADECIMAL', 'IDENTIFIER', 'INTEGER', 'L_CARAT', 'L_PAREN', 'MINUS', 'PERCENT', 'PERIOD', 'PLUS', 'QUESTION', 'QUOTE', 'R_CARAT', 'R_PAREN', 'SLASH', 'STRING', 'TILDE', 'UNDERSCORE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'quote': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_whitespace>[ \\t\\r]+)|(?P<t_BOOLEAN>\\#(T|F|t|f))|(?P<t_HEXADECIMAL>(X|x)[A-Fa-f0-9]+)|(?P<t_DECIMAL>(((-?[0-9]+)\\.[0-9]*)|(-?\\.[0-9]+)))|(?P<t_HASH>\\#)|(?P<t_INTEGER>(-?[0-9]+))|(?P<t_L_PAREN>\\()|(?P<t_R_PAREN>\\))|(?P<t_quote>\\")|(?P<t_IDENTIFIER>([A-Za-z!\\$%&\\*/<>\\?~_\\^:=][A-Za-z0-9!\\$%&\\*/<>\\?~_\\^:=\\.\\+-]*|[\\+-]|\\.\\.\\.))|(?P<t_newline>\\n+)|(?P<t_anything>.)', [None, ('t_whitespace', 'whitespace'), ('t_BOOLEAN', 'BOOLEAN'), None, ('t_HEXADECIMAL', 'HEXADECIMAL'), None, ('t_DECIMAL', 'DECIMAL'), None, None, None, None, ('t_HASH', 'HASH'), ('t_INTEGER', 'INTEGER'), None, ('t_L_PAREN', 'L_PAREN'), ('t_R_PAREN', 'R_PAREN'), ('t_quote', 'quote'), ('t_IDENTIFIER', 'IDENTIFIER'), None, ('t_newline', 'newline'), ('t_anything', 'anything')])], 'quote': [('(?P<t_quote_440>\\\\[nt\\\\\'"])|(?P<t_quote_443>[^\\\\""]+)|(?P<t_quote_446>\\")|(?P<t_quote_456>.)', [None, ('t_quote_440', '440'), ('t_quote_443', '443'), ('t_quote_446', '446'), ('t_quote_456', '456')])]}
+_lexstateignore = {'INITIAL': '', 'quote': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'quote': 't_error'}
+_lexstateeoff = {}
@@ -1,9 +1,11 @@
 import abc
+import importlib.util
 import logging
 import os
 import pickle
 import sys
 import traceback
+import typing
 
 import ply
 from ply import yacc
@@ -12,6 +14,8 @@ from ..configuration import Configuration
 
 configuration = Configuration()
 
+_shared_parsers: typing.Dict = {}
+
 
 class Parser:
     """
@@ -21,6 +25,10 @@ class Parser:
     abstract properties ``lexer_rules_object`` and ``parser_rules_object``.
 
     For most parsers these properties should simply return ``self``.
+
+    Parsers load prebuilt lexing and parsing tables from ``abjad.parsers._tables``
+    when available. Run ``scr/prime-parser-tables`` after changing lexical or
+    syntactical rules.
     """
 
     ### CLASS VARIABLES ###
@@ -48,6 +56,23 @@ class Parser:
         else:
             self._logger = yacc.NullLogger()
 
+        lextab, parsetab = self._get_table_module_names()
+        if (
+            not self.debug
+            and importlib.util.find_spec(lextab) is not None
+            and importlib.util.find_spec(parsetab) is not None
+        ):
+            self._lexer = ply.lex.lex(
+                object=self.lexer_rules_object, optimize=True, lextab=lextab
+            )
+            self._parser = ply.yacc.yacc(
+                debug=False,
+                module=self.parser_rules_object,
+                tabmodule=parsetab,
+                write_tables=False,
+            )
+            return
+
         self._lexer = ply.lex.lex(
             debug=self.debug,
             debuglog=self.logger,
@@ -80,6 +105,7 @@ class Parser:
         Parse ``string`` and return result.
         """
 
+        self._reset_lexer()
         if hasattr(self, "_setup"):
             self._setup()
 
@@ -94,6 +120,39 @@ class Parser:
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _get_shared_parser(class_):
+        if class_ not in _shared_parsers:
+            _shared_parsers[class_] = class_()
+        return _shared_parsers[class_]
+
+    def _get_table_module_names(self):
+        name = type(self).__name__.lower()
+        return (
+            f"{__package__}._tables.{name}_lextab",
+            f"{__package__}._tables.{name}_parsetab",
+        )
+
+    def _reset_lexer(self):
+        # shared instances must not inherit lexer state from a failed parse
+        self.lexer.begin("INITIAL")
+        self.lexer.lexstatestack = []
+        self.lexer.lexpos = 0
+        self.lexer.lineno = 1
+
+    def _write_tables(self, directory):
+        lextab, parsetab = self._get_table_module_names()
+        lexer = ply.lex.lex(object=self.lexer_rules_object)
+        lexer.writetab(lextab, str(directory))
+        ply.yacc.yacc(
+            debug=False,
+            module=self.parser_rules_object,
+            outputdir=str(directory),
+            tabmodule=parsetab.split(".")[-1],
+        )
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, string):
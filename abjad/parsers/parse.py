@@ -1,10 +1,143 @@
+import re
 import typing
 
+from ..duration import Duration
+from ..lyenv import language_pitch_names
+from ..pitch.pitchclasses import NamedPitchClass
+from ..pitch.pitches import NamedPitch
+from ..score import Chord, Container, Note, NoteHead, Rest, Skip
 from .parser import LilyPondParser
 from .reduced import parse_reduced_ly_syntax
 
 _lilypond_parsers_by_language: typing.Dict = {}
 
+_durations_by_token: typing.Dict = {}
+
+_pitch_class_names_by_language: typing.Dict = {}
+
+_whitespace = " \t\n\f\r"
+
+_pitch_regex_atom = r"""
+    ([a-zA-Z]+)            # note name
+    ('*|,*)                # followed by optional octave ticks
+    (!*)                   # followed by optional exclamations
+    (\?*)                  # followed by optional questions
+    """
+
+_simple_leaf_regex_body = r"""
+    [{whitespace}]*
+    (?:
+        <([^<>]*)>         # chord body
+        |
+        {pitch}            # or pitch
+    )
+    ([0-9]*)               # followed by optional duration
+    (\.*)                  # followed by optional dots
+    (?=[{whitespace}]|$)   # followed by whitespace
+    """.format(
+    pitch=_pitch_regex_atom, whitespace=_whitespace
+)
+
+_simple_pitch_regex_body = r"""
+    [{whitespace}]*
+    {pitch}
+    (?=[{whitespace}]|$)
+    """.format(
+    pitch=_pitch_regex_atom, whitespace=_whitespace
+)
+
+_simple_leaf_regex = re.compile(_simple_leaf_regex_body, re.VERBOSE)
+
+_simple_pitch_regex = re.compile(_simple_pitch_regex_body, re.VERBOSE)
+
+
+def _get_duration(token, dots, default_duration):
+    if not token:
+        if dots:
+            return None
+        return default_duration
+    token += dots
+    if token not in _durations_by_token:
+        try:
+            duration = Duration.from_lilypond_duration_string(token)
+        except Exception:
+            return None
+        _durations_by_token[token] = duration
+    return _durations_by_token[token]
+
+
+def _get_pitch(name, quotes, pitch_class_names):
+    if name not in pitch_class_names:
+        return None
+    return NamedPitch(pitch_class_names[name] + quotes)
+
+
+def _get_pitch_class_names(language):
+    if language not in _pitch_class_names_by_language:
+        if language not in language_pitch_names:
+            return None
+        pitch_class_names = {}
+        for name, english_name in language_pitch_names[language].items():
+            pitch_class_names[name] = str(NamedPitchClass(english_name))
+        _pitch_class_names_by_language[language] = pitch_class_names
+    return _pitch_class_names_by_language[language]
+
+
+def _parse_simple_music(string, language):
+    string = string.strip(_whitespace)
+    if not string.startswith("{") or not string.endswith("}"):
+        return None
+    pitch_class_names = _get_pitch_class_names(language)
+    if pitch_class_names is None:
+        return None
+    string = string[1:-1].rstrip(_whitespace)
+    default_duration = Duration(1, 4)
+    leaves = []
+    position = 0
+    while position < len(string):
+        match = _simple_leaf_regex.match(string, position)
+        if match is None:
+            return None
+        body, name, quotes, exclamations, questions, token, dots = match.groups()
+        duration = _get_duration(token, dots, default_duration)
+        if duration is None:
+            return None
+        if body is not None:
+            note_heads = []
+            for match_ in _simple_pitch_regex.finditer(body):
+                pitch = _get_pitch(match_.group(1), match_.group(2), pitch_class_names)
+                if pitch is None:
+                    return None
+                note_head = NoteHead(
+                    written_pitch=pitch,
+                    is_cautionary=bool(match_.group(4)),
+                    is_forced=bool(match_.group(3)),
+                )
+                note_heads.append(note_head)
+            if not note_heads or _simple_pitch_regex.sub("", body).strip(_whitespace):
+                return None
+            leaf = Chord([], duration)
+            leaf.note_heads.extend(note_heads)
+        elif name in ("r", "s"):
+            if quotes or exclamations or questions:
+                return None
+            if name == "r":
+                leaf = Rest(duration)
+            else:
+                leaf = Skip(duration)
+        else:
+            pitch = _get_pitch(name, quotes, pitch_class_names)
+            if pitch is None:
+                return None
+            leaf = Note(pitch, duration)
+            leaf.note_head.is_forced = bool(exclamations)
+            leaf.note_head.is_cautionary = bool(questions)
+        leaves.append(leaf)
+        if token:
+            default_duration = duration
+        position = match.end()
+    return Container(leaves)
+
 
 def parse(string, language="english"):
     r"""
@@ -27,10 +160,17 @@ def parse(string, language="english"):
         ...     )
         >>> abjad.show(container) # doctest: +SKIP
 
+    Builds notes, rests, skips and chords directly when ``string`` is a single
+    braced run of pitch-and-duration tokens like ``"{ c'4 <d' f'>8. r }"``;
+    parses everything else with the full LilyPond parser.
+
     Returns Abjad component.
     """
     if string.startswith("abj:"):
         return parse_reduced_ly_syntax(string[4:])
+    container = _parse_simple_music(string, language)
+    if container is not None:
+        return container
     if language not in _lilypond_parsers_by_language:
         parser = LilyPondParser(default_language=language)
         _lilypond_parsers_by_language[language] = parser
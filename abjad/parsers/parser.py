@@ -1879,7 +1879,7 @@ class LilyPondLexicalDefinition:
 
         # t.type = 'SCHEME_START'
         # t.lexer.push_state('INITIAL')
-        scheme_parser = SchemeParser(debug=False)
+        scheme_parser = SchemeParser._get_shared_parser()
         input_string = t.lexer.lexdata[t.lexpos + 1 :]
         # print 'PREPARSE'
         try:
@@ -690,4 +690,4 @@ def parse_reduced_ly_syntax(string) -> Container:
         Note("c'4")
 
     """
-    return ReducedLyParser()(string)
+    return ReducedLyParser._get_shared_parser()(string)
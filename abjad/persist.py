@@ -9,6 +9,28 @@ from .format import LilyPondFormatManager
 from .illustrators import illustrate
 
 
+def _write_lilypond_format(argument, file_pointer, align_tags=None):
+    if not hasattr(argument, "_write_lilypond_format"):
+        string = argument._get_lilypond_format()
+        if isinstance(align_tags, int):
+            string = LilyPondFormatManager.align_tags(string, align_tags)
+        file_pointer.write(string)
+        return
+    is_first_line = True
+
+    def write(line):
+        nonlocal is_first_line
+        if isinstance(align_tags, int):
+            line = LilyPondFormatManager._align_tag(line, align_tags)
+        if is_first_line:
+            is_first_line = False
+        else:
+            file_pointer.write("\n")
+        file_pointer.write(line)
+
+    argument._write_lilypond_format(write)
+
+
 def as_ly(
     argument,
     ly_file_path,
@@ -21,6 +43,7 @@ def as_ly(
     Persists ``argument`` as LilyPond file.
 
     Returns output path and elapsed formatting time when LilyPond output is written.
+    Formatting time includes writing the file because formatting streams to disk.
     """
     if align_tags is not None:
         assert isinstance(align_tags, int), repr(align_tags)
@@ -34,16 +57,12 @@ def as_ly(
     ly_file_path = str(ly_file_path)
     ly_file_path = os.path.expanduser(ly_file_path)
     assert ly_file_path.endswith(".ly"), ly_file_path
-    timer = Timer()
-    with timer:
-        string = lilypond_file._get_lilypond_format()
-        if isinstance(align_tags, int):
-            string = LilyPondFormatManager.align_tags(string, align_tags)
-    abjad_formatting_time = timer.elapsed_time
     directory = os.path.dirname(ly_file_path)
     io._ensure_directory_existence(directory)
-    with open(ly_file_path, "w") as file_pointer:
-        file_pointer.write(string)
+    timer = Timer()
+    with timer, open(ly_file_path, "w") as file_pointer:
+        _write_lilypond_format(lilypond_file, file_pointer, align_tags=align_tags)
+    abjad_formatting_time = timer.elapsed_time
     return ly_file_path, abjad_formatting_time
 
 
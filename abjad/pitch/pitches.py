@@ -11,6 +11,15 @@ from . import _lib
 from .Accidental import Accidental
 from .Octave import Octave
 
+### FUNCTIONS ###
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _get_prototype(class_, argument, arrow):
+    pitch = class_.__new__(class_)
+    pitch._initialize(argument, arrow=arrow)
+    return pitch
+
 
 @functools.total_ordering
 class Pitch:
@@ -27,6 +36,75 @@ class Pitch:
     ### INITIALIZER ###
 
     def __init__(self, argument, accidental=None, arrow=None, octave=None):
+        if accidental is None and octave is None:
+            if isinstance(argument, (str, numbers.Number)):
+                prototype = _get_prototype(type(self), argument, arrow)
+                self._copy_state(prototype)
+                return
+            if type(argument) is type(self) and arrow in (None, argument.arrow):
+                self._copy_state(argument)
+                return
+        self._initialize(argument, accidental=accidental, arrow=arrow, octave=octave)
+
+    ### SPECIAL METHODS ###
+
+    def __eq__(self, argument) -> bool:
+        """
+        Is true when ``argument`` coerces to a pitch with the same equality
+        values as pitch.
+        """
+        if not isinstance(argument, type(self)):
+            try:
+                argument = type(self)(argument)
+            except (TypeError, ValueError):
+                return False
+        return self._get_equality_values() == argument._get_equality_values()
+
+    def __float__(self):
+        """
+        Coerce to float.
+
+        Returns float.
+        """
+        return float(self.number)
+
+    def __hash__(self) -> int:
+        """
+        Hashes pitch.
+        """
+        return hash((type(self),) + self._get_equality_values())
+
+    def __lt__(self, argument):
+        """
+        Is true when pitch is less than ``argument``.
+
+        Returns true or false.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE PROPERTIES ###
+
+    def _cache_derived_values(self):
+        pass
+
+    def _copy_state(self, pitch):
+        for class_ in type(pitch).__mro__:
+            for name in getattr(class_, "__slots__", ()):
+                setattr(self, name, getattr(pitch, name))
+
+    def _get_equality_values(self):
+        raise NotImplementedError
+
+    def _get_lilypond_format(self):
+        raise NotImplementedError
+
+    def _initialize(self, argument, accidental=None, arrow=None, octave=None):
         from .pitchclasses import NamedPitchClass, PitchClass
 
         if isinstance(argument, str):
@@ -72,53 +150,7 @@ class Pitch:
         if octave is not None:
             octave = Octave(octave)
             self._octave = octave
-
-    ### SPECIAL METHODS ###
-
-    def __eq__(self, argument) -> bool:
-        """
-        Is true when all initialization values of Abjad value object equal
-        the initialization values of ``argument``.
-        """
-        return StorageFormatManager.compare_objects(self, argument)
-
-    def __float__(self):
-        """
-        Coerce to float.
-
-        Returns float.
-        """
-        return float(self.number)
-
-    def __hash__(self) -> int:
-        """
-        Hashes Abjad value object.
-        """
-        hash_values = StorageFormatManager(self).get_hash_values()
-        try:
-            result = hash(hash_values)
-        except TypeError:
-            raise TypeError(f"unhashable type: {self}")
-        return result
-
-    def __lt__(self, argument):
-        """
-        Is true when pitch is less than ``argument``.
-
-        Returns true or false.
-        """
-        raise NotImplementedError
-
-    def __repr__(self) -> str:
-        """
-        Gets interpreter representation.
-        """
-        return StorageFormatManager(self).get_repr_format()
-
-    ### PRIVATE PROPERTIES ###
-
-    def _get_lilypond_format(self):
-        raise NotImplementedError
+        self._cache_derived_values()
 
     @staticmethod
     def _to_nearest_octave(pitch_number, pitch_class_number):
@@ -342,7 +374,7 @@ class NamedPitch(Pitch):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = ("_diatonic_pitch_number", "_name", "_number")
 
     ### INITIALIZER ###
 
@@ -554,6 +586,18 @@ class NamedPitch(Pitch):
         name += self.octave.ticks
         return type(self)(name)
 
+    def _cache_derived_values(self):
+        diatonic_pc_number = self.pitch_class._get_diatonic_pc_number()
+        self._diatonic_pitch_number = 7 * (self.octave.number - 4)
+        self._diatonic_pitch_number += diatonic_pc_number
+        self._name = f"{self.pitch_class!s}{self.octave!s}"
+        pc_number = _lib._diatonic_pc_number_to_pitch_class_number[diatonic_pc_number]
+        alteration = self.pitch_class._get_alteration()
+        octave_base_pitch = (self.octave.number - 4) * 12
+        self._number = _math.integer_equivalent_number_to_integer(
+            pc_number + alteration + octave_base_pitch
+        )
+
     def _from_named_parts(self, dpc_number, alteration, octave):
         from .pitchclasses import NamedPitchClass
 
@@ -604,9 +648,10 @@ class NamedPitch(Pitch):
         return diatonic_pc_number
 
     def _get_diatonic_pitch_number(self):
-        diatonic_pitch_number = 7 * (self.octave.number - 4)
-        diatonic_pitch_number += self._get_diatonic_pc_number()
-        return diatonic_pitch_number
+        return self._diatonic_pitch_number
+
+    def _get_equality_values(self):
+        return (self.name, self.arrow)
 
     def _get_format_specification(self):
         return FormatSpecification(
@@ -737,7 +782,7 @@ class NamedPitch(Pitch):
 
         Returns string.
         """
-        return f"{self.pitch_class!s}{self.octave!s}"
+        return self._name
 
     @property
     def number(self):
@@ -760,13 +805,7 @@ class NamedPitch(Pitch):
 
         Returns number.
         """
-        diatonic_pc_number = self.pitch_class._get_diatonic_pc_number()
-        pc_number = _lib._diatonic_pc_number_to_pitch_class_number[diatonic_pc_number]
-        alteration = self.pitch_class._get_alteration()
-        octave_base_pitch = (self.octave.number - 4) * 12
-        return _math.integer_equivalent_number_to_integer(
-            pc_number + alteration + octave_base_pitch
-        )
+        return self._number
 
     @property
     def octave(self):
@@ -1214,6 +1253,9 @@ class NumberedPitch(Pitch):
         result += self._get_diatonic_pc_number()
         return result
 
+    def _get_equality_values(self):
+        return (self.number, self.arrow, self.octave.number)
+
     def _get_format_specification(self):
         return FormatSpecification(
             client=self,
@@ -555,7 +555,7 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
         Returns new RhythmTreeContainer.
         """
         if isinstance(argument, str):
-            argument = RhythmTreeParser()(argument)
+            argument = RhythmTreeParser._get_shared_parser()(argument)
             assert 1 == len(argument) and isinstance(argument[0], type(self))
             argument = argument[0]
         container = type(self)(
@@ -736,14 +736,14 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
 
     def _prepare_setitem_multiple(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)
+            expr = RhythmTreeParser._get_shared_parser()(expr)
         elif isinstance(expr, list) and len(expr) == 1 and isinstance(expr[0], str):
-            expr = RhythmTreeParser()(expr[0])
+            expr = RhythmTreeParser._get_shared_parser()(expr[0])
         return expr
 
     def _prepare_setitem_single(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)[0]
+            expr = RhythmTreeParser._get_shared_parser()(expr)[0]
             assert len(expr) == 1
             expr = expr[0]
         return expr
@@ -1033,7 +1033,7 @@ def parse_rtm_syntax(rtm):
 
     Returns tuplet or container.
     """
-    result = RhythmTreeParser()(rtm)
+    result = RhythmTreeParser._get_shared_parser()(rtm)
     container = Container()
     for node in result:
         tuplet = node((1, 4))
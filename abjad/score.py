@@ -33,20 +33,32 @@ class Component:
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_dirty_offset_positions",
+        "_format_cache",
+        "_has_caches",
+        "_incremental_offsets",
         "_indicators_are_current",
         "_is_forbidden_to_update",
         "_overrides",
         "_lilypond_setting_name_manager",
         "_measure_number",
+        "_measure_start_offsets",
+        "_memoizes_format",
+        "_metronome_mark_map",
+        "_offset_index",
         "_offsets_are_current",
         "_offsets_in_seconds_are_current",
+        "_order_index",
         "_parent",
+        "_parentage",
+        "_prolation",
         "_start_offset",
         "_start_offset_in_seconds",
         "_stop_offset",
         "_stop_offset_in_seconds",
         "_tag",
         "_timespan",
+        "_wellformedness_cache",
         "_wrappers",
     )
 
@@ -62,13 +74,24 @@ class Component:
 
     @abc.abstractmethod
     def __init__(self, name: str = None, tag: _tag.Tag = None) -> None:
+        self._dirty_offset_positions = None
+        self._format_cache = None
+        self._has_caches = False
+        self._incremental_offsets = True
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
         self._measure_number = None
+        self._measure_start_offsets = None
+        self._memoizes_format = False
+        self._metronome_mark_map = None
+        self._offset_index = None
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
+        self._order_index = None
         self._overrides = None
         self._parent = None
+        self._parentage = None
+        self._prolation = None
         self._lilypond_setting_name_manager = None
         self._start_offset = None
         self._start_offset_in_seconds = None
@@ -78,6 +101,7 @@ class Component:
             assert isinstance(tag, _tag.Tag), repr(tag)
         self._tag = tag
         self._timespan = Timespan()
+        self._wellformedness_cache = None
         self._wrappers: typing.List = []
 
     ### SPECIAL METHODS ###
@@ -99,14 +123,18 @@ class Component:
             component._overrides = copy.copy(override(self))
         if getattr(self, "_lilypond_setting_name_manager", None) is not None:
             component._lilypond_setting_name_manager = copy.copy(setting(self))
-        for wrapper in self._wrappers:
-            if not wrapper.annotation:
-                continue
-            wrapper_ = copy.copy(wrapper)
-            new(wrapper_, component=component)
-        for wrapper in self._get_indicators(unwrap=False):
+        wrappers = [_ for _ in self._wrappers if _.annotation]
+        wrappers.extend(self._get_indicators(unwrap=False))
+        for wrapper in wrappers:
+            # bypass Wrapper._bind_component()
+            # to avoid duplicate-indicator check and score update;
+            # this works because new component is orphan
+            # and carries only copies of already-checked wrappers:
             wrapper_ = copy.copy(wrapper)
-            new(wrapper_, component=component)
+            wrapper_._component = component
+            component._wrappers.append(wrapper_)
+            if getattr(wrapper_.indicator, "context", None) is not None:
+                wrapper_._update_effective_context()
         return component
 
     def __getnewargs__(self):
@@ -148,6 +176,50 @@ class Component:
                 return True
         return False
 
+    def _clear_format_cache(self, descendants=False):
+        if descendants:
+            components = [self]
+            while components:
+                component = components.pop()
+                # no format or wellformedness cache anywhere in subtree:
+                if not getattr(component, "_has_caches", False):
+                    continue
+                component._has_caches = False
+                component._format_cache = None
+                component._wellformedness_cache = None
+                components.extend(getattr(component, "_components", ()))
+                for name in ("_before_grace_container", "_after_grace_container"):
+                    if getattr(component, name, None) is not None:
+                        components.append(getattr(component, name))
+        component = self
+        while component is not None:
+            component._format_cache = None
+            component._wellformedness_cache = None
+            if getattr(component, "_main_leaf", None) is not None:
+                component = component._main_leaf
+            else:
+                component = getattr(component, "_parent", None)
+
+    def _clear_order_index(self):
+        self._offset_index = None
+        self._order_index = None
+        root = self._get_root()
+        root._offset_index = None
+        root._order_index = None
+
+    def _clear_parentage(self):
+        components = [self]
+        while components:
+            component = components.pop()
+            if component._parentage is None and component._prolation is None:
+                continue
+            component._parentage = None
+            component._prolation = None
+            components.extend(getattr(component, "_components", ()))
+            for name in ("_before_grace_container", "_after_grace_container"):
+                if getattr(component, name, None) is not None:
+                    components.append(getattr(component, name))
+
     def _format_absolute_after_slot(self, bundle):
         result = []
         result.append(("literals", bundle.absolute_after.commands))
@@ -173,28 +245,18 @@ class Component:
     def _format_component(self, pieces=False):
         from .format import LilyPondFormatManager
 
-        result = []
+        memoizes_format = not pieces and self._get_root()._memoizes_format
+        if memoizes_format and self._format_cache is not None:
+            return self._format_cache
         bundle = LilyPondFormatManager.bundle_format_contributions(self)
-        result.extend(self._format_absolute_before_slot(bundle))
-        result.extend(self._format_before_slot(bundle))
-        result.extend(self._format_open_brackets_slot(bundle))
-        result.extend(self._format_opening_slot(bundle))
-        result.extend(self._format_contents_slot(bundle))
-        result.extend(self._format_closing_slot(bundle))
-        result.extend(self._format_close_brackets_slot(bundle))
-        result.extend(self._format_after_slot(bundle))
-        result.extend(self._format_absolute_after_slot(bundle))
-        contributions = []
-        for contributor, contribution in result:
-            for line in contribution:
-                if line.isspace():
-                    contributions.append("")
-                else:
-                    contributions.append(line)
+        contributions = list(self._iterate_format_pieces(bundle))
         if pieces:
             return contributions
-        else:
-            return "\n".join(contributions)
+        string = "\n".join(contributions)
+        if memoizes_format:
+            self._format_cache = string
+            self._mark_caches()
+        return string
 
     def _format_contents_slot(self, bundle):
         return []
@@ -233,6 +295,34 @@ class Component:
     def _get_descendants_starting_with(self):
         return [self]
 
+    def _iterate_format_pieces(self, bundle, write_contents=None):
+        """
+        Iterates format pieces of every format slot in format order.
+
+        Calls ``write_contents`` in place of the contents slot when
+        ``write_contents`` is not none.
+        """
+        slots = (
+            self._format_absolute_before_slot,
+            self._format_before_slot,
+            self._format_open_brackets_slot,
+            self._format_opening_slot,
+            self._format_contents_slot,
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+        )
+        for slot in slots:
+            if slot == self._format_contents_slot and write_contents is not None:
+                write_contents()
+                continue
+            for contributor, contribution in slot(bundle):
+                for piece in contribution:
+                    if piece.isspace():
+                        piece = ""
+                    yield piece
+
     def _get_descendants_stopping_with(self):
         return [self]
 
@@ -240,10 +330,7 @@ class Component:
         duration = self._get_preprolated_duration()
         if self._parent is None:
             return duration
-        for parent in self._parent._get_parentage():
-            multiplier = getattr(parent, "implied_prolation", Multiplier(1))
-            duration *= multiplier
-        return duration
+        return duration * self._parent._get_prolation()
 
     def _get_format_contributions_for_slot(self, slot_identifier, bundle=None):
         from .format import LilyPondFormatManager
@@ -349,18 +436,41 @@ class Component:
         return markup
 
     def _get_parentage(self):
-        parentage = []
-        parent = self
-        while parent is not None:
-            parentage.append(parent)
-            if hasattr(parent, "_main_leaf"):
-                if parent._main_leaf is not None:
-                    parent = parent._main_leaf._parent
+        if self._parentage is None:
+            if hasattr(self, "_main_leaf"):
+                if self._main_leaf is not None:
+                    parentage = self._main_leaf._get_parentage()[1:]
                 else:
-                    parent = None
+                    parentage = ()
+            elif self._parent is not None:
+                parentage = self._parent._get_parentage()
+            else:
+                parentage = ()
+            self._parentage = (self,) + parentage
+        return self._parentage
+
+    def _get_prolation(self):
+        if self._prolation is None:
+            prolation = getattr(self, "implied_prolation", Multiplier(1))
+            if hasattr(self, "_main_leaf"):
+                if self._main_leaf is not None:
+                    prolation *= self._main_leaf._get_prolation()
+            elif self._parent is not None:
+                prolation *= self._parent._get_prolation()
+            self._prolation = prolation
+        return self._prolation
+
+    def _get_root(self):
+        root = self
+        while True:
+            if hasattr(root, "_main_leaf"):
+                if root._main_leaf is None or root._main_leaf._parent is None:
+                    return root
+                root = root._main_leaf._parent
+            elif root._parent is None:
+                return root
             else:
-                parent = parent._parent
-        return parentage
+                root = root._parent
 
     def _get_sibling(self, n):
         assert n in (-1, 0, 1), repr(self, n)
@@ -391,7 +501,17 @@ class Component:
         indicators = self._get_indicators(prototype=prototype, attributes=attributes)
         return bool(indicators)
 
+    def _mark_caches(self):
+        component = self
+        while component is not None and not component._has_caches:
+            component._has_caches = True
+            if getattr(component, "_main_leaf", None) is not None:
+                component = component._main_leaf
+            else:
+                component = getattr(component, "_parent", None)
+
     def _remove_from_parent(self):
+        self._clear_format_cache()
         self._update_later(offsets=True)
         for component in self._get_parentage()[1:]:
             if not hasattr(component, "_lilypond_type"):
@@ -399,8 +519,16 @@ class Component:
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._dependent_wrapper_index = None
         if self._parent is not None:
-            self._parent._components.remove(self)
+            index = self._parent.index(self)
+            del self._parent._components[index]
+            root = self._parent._get_parentage()[-1]
+            if root._dirty_offset_positions is not None:
+                root._dirty_offset_positions.append((self._parent, index))
+            root._offset_index = None
+            root._order_index = None
+            self._dirty_offset_positions = None
         self._parent = None
 
     def _remove_named_children_from_parentage(self, name_dictionary):
@@ -431,6 +559,9 @@ class Component:
         self._remove_named_children_from_parentage(named_children)
         self._remove_from_parent()
         self._parent = new_parent
+        self._clear_format_cache(descendants=True)
+        self._clear_parentage()
+        self._clear_order_index()
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
 
@@ -446,13 +577,30 @@ class Component:
     def _tag_strings(self, strings):
         return _tag.tag(strings, tag=self.tag)
 
-    def _update_later(self, offsets=False, offsets_in_seconds=False):
-        assert offsets or offsets_in_seconds
-        for component in self._get_parentage():
+    def _update_later(
+        self, offsets=False, offsets_in_seconds=False, measure_numbers=False
+    ):
+        assert offsets or offsets_in_seconds or measure_numbers
+        self._clear_format_cache()
+        parentage = self._get_parentage()
+        for component in parentage:
             if offsets:
                 component._offsets_are_current = False
-            elif offsets_in_seconds:
+            if offsets or offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
+        root = parentage[-1]
+        if offsets:
+            if root._dirty_offset_positions is not None:
+                root._dirty_offset_positions.append(self)
+        if offsets or offsets_in_seconds:
+            root._metronome_mark_map = None
+        if offsets or measure_numbers:
+            root._measure_start_offsets = None
+
+    def _update_measure_number(self):
+        from ._update import _update_measure_number
+
+        _update_measure_number(self)
 
     def _update_measure_numbers(self):
         from ._update import _update_measure_numbers
@@ -469,6 +617,13 @@ class Component:
             indicators=indicators,
         )
 
+    def _write_lilypond_format(self, write, indent=""):
+        for line in self._get_lilypond_format().split("\n"):
+            line = indent + line
+            if line.isspace():
+                line = ""
+            write(line)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -726,6 +881,7 @@ class Leaf(Component):
         else:
             multiplier = Multiplier(argument)
         self._multiplier = multiplier
+        self._update_later(offsets=True)
 
     @property
     def written_duration(self) -> Duration:
@@ -741,6 +897,7 @@ class Leaf(Component):
             message = f"not assignable duration: {duration!r}."
             raise exceptions.AssignabilityError(message)
         self._written_duration = duration
+        self._update_later(offsets=True)
 
 
 class Container(Component):
@@ -1042,9 +1199,9 @@ class Container(Component):
         from .select import Selection
 
         if isinstance(argument, int):
-            return self.components.__getitem__(argument)
+            return self._components.__getitem__(argument)
         elif isinstance(argument, slice):
-            return Selection(self.components.__getitem__(argument))
+            return Selection(self._components.__getitem__(argument))
         elif isinstance(argument, str):
             if argument not in self._named_children:
                 raise ValueError(f"can not find component named {argument!r}.")
@@ -1102,7 +1259,7 @@ class Container(Component):
         """
         Gets number of components in container.
         """
-        return len(self.components)
+        return len(self._components)
 
     def __setitem__(self, i, argument) -> None:
         """
@@ -1117,14 +1274,28 @@ class Container(Component):
 
     ### PRIVATE METHODS ###
 
-    def _copy_with_children(self):
+    def _copy_subtree(self):
         new_container = self.__copy__()
         for component in self:
             if isinstance(component, Container):
-                new_component = component._copy_with_children()
+                new_component = component._copy_subtree()
             else:
                 new_component = component.__copy__()
-            new_container.append(new_component)
+            # bypass Container._set_item()
+            # to avoid cycle check and score update on every child;
+            # this works because new container is orphan:
+            new_component._parent = new_container
+            new_component._clear_parentage()
+            new_container._components.append(new_component)
+            named_children = new_component._cache_named_children()
+            new_component._restore_named_children_to_parentage(named_children)
+        return new_container
+
+    def _copy_with_children(self):
+        new_container = self._copy_subtree()
+        for component in new_container._get_subtree():
+            for wrapper in component._get_indicators(unwrap=False):
+                wrapper._update_effective_context()
         return new_container
 
     def _eject_contents(self):
@@ -1413,11 +1584,41 @@ class Container(Component):
             start, stop, stride = i.indices(len(self))
         del self[start:stop]
         self._components.__setitem__(slice(start, start), argument)
+        self._clear_order_index()
         for component in argument:
             component._set_parent(self)
         for wrapper in argument_wrappers:
             wrapper._update_effective_context()
 
+    def _write_format_component(self, write, indent="", pieces=False):
+        from .format import LilyPondFormatManager
+
+        def write_contents():
+            indent_ = indent + LilyPondFormatBundle.indent
+            for component in self._components:
+                component._write_lilypond_format(write, indent=indent_)
+
+        bundle = LilyPondFormatManager.bundle_format_contributions(self)
+        for piece in self._iterate_format_pieces(bundle, write_contents):
+            if pieces:
+                write(piece)
+                continue
+            for line in piece.split("\n"):
+                line = indent + line
+                if line.isspace():
+                    line = ""
+                write(line)
+
+    def _write_format_pieces(self, write):
+        self._write_format_component(write, pieces=True)
+
+    def _write_lilypond_format(self, write, indent=""):
+        self._update_now(indicators=True)
+        if self._get_root()._memoizes_format and self._format_cache is not None:
+            Component._write_lilypond_format(self, write, indent=indent)
+        else:
+            self._write_format_component(write, indent=indent)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1455,6 +1656,7 @@ class Container(Component):
     def identifier(self, argument):
         assert isinstance(argument, (str, type(None))), repr(argument)
         self._identifier: typing.Optional[str] = argument
+        self._clear_format_cache()
 
     @property
     def name(self) -> typing.Optional[str]:
@@ -1525,6 +1727,7 @@ class Container(Component):
                     named_children[argument].append(self)
             parent = parent._parent
         self._name = argument
+        self._clear_format_cache()
 
     @property
     def simultaneous(self) -> typing.Optional[bool]:
@@ -1748,7 +1951,13 @@ class Container(Component):
             3
 
         """
-        for i, element in enumerate(self.components):
+        order_index = self._get_root()._order_index
+        if order_index is not None and component in order_index[2]:
+            i = order_index[2][component][0]
+            if i is not None and i < len(self._components):
+                if self._components[i] is component:
+                    return i
+        for i, element in enumerate(self._components):
             if element is component:
                 return i
         else:
@@ -2062,12 +2271,18 @@ class AfterGraceContainer(Container):
             raise TypeError(f"must attach to leaf (not {leaf!r}).")
         leaf._after_grace_container = self
         self._main_leaf = leaf
+        self._clear_format_cache(descendants=True)
+        self._clear_parentage()
+        self._clear_order_index()
 
     def _detach(self):
         if self._main_leaf is not None:
+            self._clear_format_cache()
+            self._clear_order_index()
             main_leaf = self._main_leaf
             main_leaf._after_grace_container = None
             self._main_leaf = None
+            self._clear_parentage()
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -2282,12 +2497,18 @@ class BeforeGraceContainer(Container):
             raise TypeError(f"must attach to leaf {leaf!r}.")
         leaf._before_grace_container = self
         self._main_leaf = leaf
+        self._clear_format_cache(descendants=True)
+        self._clear_parentage()
+        self._clear_order_index()
 
     def _detach(self):
         if self._main_leaf is not None:
+            self._clear_format_cache()
+            self._clear_order_index()
             main_leaf = self._main_leaf
             main_leaf._before_grace_container = None
             self._main_leaf = None
+            self._clear_parentage()
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -2687,7 +2908,7 @@ class Chord(Leaf):
                 is_forced = None
             if not is_parenthesized:
                 is_parenthesized = None
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or written_pitch not in drums:
                 note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -2845,6 +3066,7 @@ class Chord(Leaf):
 
     @note_heads.setter
     def note_heads(self, note_heads):
+        self._clear_format_cache()
         self._note_heads[:] = []
         if isinstance(note_heads, str):
             note_heads = note_heads.split()
@@ -3004,6 +3226,7 @@ class Context(Container):
     __slots__ = (
         "_lilypond_type",
         "_consists_commands",
+        "_dependent_wrapper_index",
         "_dependent_wrappers",
         "_remove_commands",
     )
@@ -3047,6 +3270,7 @@ class Context(Container):
         language: str = "english",
     ) -> None:
         self._consists_commands: typing.List[str] = []
+        self._dependent_wrapper_index: typing.Optional[typing.Dict] = None
         self._dependent_wrappers: typing.List = []
         self._remove_commands: typing.List[str] = []
         self.lilypond_type = lilypond_type
@@ -3072,8 +3296,8 @@ class Context(Container):
         Returns new component.
         """
         new_context = Container.__copy__(self)
-        new_context._consists_commands = copy.copy(self.consists_commands)
-        new_context._remove_commands = copy.copy(self.remove_commands)
+        new_context._consists_commands = copy.copy(self._consists_commands)
+        new_context._remove_commands = copy.copy(self._remove_commands)
         return new_context
 
     def __getnewargs__(self):
@@ -3114,7 +3338,7 @@ class Context(Container):
 
     def _format_consists_commands(self):
         result = []
-        for engraver in self.consists_commands:
+        for engraver in self._consists_commands:
             string = rf"\consists {engraver}"
             result.append(string)
         return result
@@ -3196,7 +3420,7 @@ class Context(Container):
 
     def _format_remove_commands(self):
         result = []
-        for engraver in self.remove_commands:
+        for engraver in self._remove_commands:
             string = rf"\remove {engraver}"
             result.append(string)
         return result
@@ -3238,6 +3462,8 @@ class Context(Container):
             }
 
         """
+        # caller may change list:
+        self._clear_format_cache()
         return self._consists_commands
 
     @property
@@ -3280,6 +3506,7 @@ class Context(Container):
         else:
             argument = str(argument)
         self._lilypond_type = argument
+        self._clear_format_cache(descendants=True)
 
     @property
     def remove_commands(self):
@@ -3302,6 +3529,8 @@ class Context(Container):
             }
 
         """
+        # caller may change list:
+        self._clear_format_cache()
         return self._remove_commands
 
     @property
@@ -3713,6 +3942,8 @@ class NoteHead:
             assert isinstance(argument[1], str), repr(argument)
             assert isinstance(argument[2], str), repr(argument)
         self._alternative = argument
+        if self._client is not None:
+            self._client._clear_format_cache()
 
     @property
     def client(self):
@@ -3762,6 +3993,8 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_cautionary = argument
+        if self._client is not None:
+            self._client._clear_format_cache()
 
     @property
     def is_forced(self) -> bool:
@@ -3796,6 +4029,8 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_forced = argument
+        if self._client is not None:
+            self._client._clear_format_cache()
 
     @property
     def is_parenthesized(self) -> bool:
@@ -3832,6 +4067,8 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_parenthesized = argument
+        if self._client is not None:
+            self._client._clear_format_cache()
 
     @property
     def named_pitch(self) -> NamedPitch:
@@ -3949,8 +4186,14 @@ class NoteHead:
 
     @written_pitch.setter
     def written_pitch(self, argument):
-        written_pitch = NamedPitch(argument)
+        # named pitches are immutable and so may be shared between note-heads
+        if type(argument) is NamedPitch:
+            written_pitch = argument
+        else:
+            written_pitch = NamedPitch(argument)
         self._written_pitch = written_pitch
+        if self._client is not None:
+            self._client._clear_format_cache()
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
 
@@ -4024,9 +4267,13 @@ class NoteHeadList(TypedList):
 
     def _on_insertion(self, item):
         item._client = self.client
+        if self.client is not None:
+            self.client._clear_format_cache()
 
     def _on_removal(self, item):
         item._client = None
+        if self.client is not None:
+            self.client._clear_format_cache()
 
     ### PUBLIC METHODS ###
 
@@ -4342,7 +4589,7 @@ class Note(Leaf):
             raise ValueError("can not initialize note from {arguments!r}.")
         Leaf.__init__(self, written_duration, multiplier=multiplier, tag=tag)
         if written_pitch is not None:
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or written_pitch not in drums:
                 self.note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -4422,10 +4669,12 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._clear_format_cache()
 
     @property
     def written_duration(self) -> Duration:
@@ -5482,6 +5731,7 @@ class Tuplet(Container):
         elif not isinstance(argument, type(None)):
             raise TypeError(argument)
         self._denominator = argument
+        self._clear_format_cache()
 
     @property
     def force_fraction(self) -> typing.Optional[bool]:
@@ -5666,6 +5916,7 @@ class Tuplet(Container):
     def force_fraction(self, argument):
         if isinstance(argument, (bool, type(None))):
             self._force_fraction = argument
+            self._clear_format_cache()
         else:
             raise TypeError(f"force fraction must be boolean (not {argument!r}).")
 
@@ -5743,6 +5994,7 @@ class Tuplet(Container):
     def hide(self, argument):
         assert isinstance(argument, (bool, type(None))), repr(argument)
         self._hide = argument
+        self._clear_format_cache()
 
     @property
     def implied_prolation(self) -> Multiplier:
@@ -5822,6 +6074,8 @@ class Tuplet(Container):
             raise ValueError(f"can not set tuplet multiplier: {argument!r}.")
         if 0 < multiplier:
             self._multiplier = multiplier
+            self._clear_parentage()
+            self._update_later(offsets=True)
         else:
             raise ValueError(f"tuplet multiplier must be positive: {argument!r}.")
 
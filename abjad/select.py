@@ -376,11 +376,11 @@ class Selection(collections.abc.Sequence):
 
     __documentation_section__ = "Selections"
 
-    __slots__ = ("_expression", "_items", "_previous")
+    __slots__ = ("_expression", "_items", "_lazy", "_previous", "_source")
 
     ### INITIALIZER ###
 
-    def __init__(self, items=None, previous=None):
+    def __init__(self, items=None, previous=None, *, lazy=None):
         if items is None:
             items = []
         if isinstance(items, Component):
@@ -389,7 +389,9 @@ class Selection(collections.abc.Sequence):
         self._check(items)
         self._items = tuple(items)
         self._expression = None
+        self._lazy = bool(lazy)
         self._previous = previous
+        self._source = None
 
     ### SPECIAL METHODS ###
 
@@ -504,6 +506,19 @@ class Selection(collections.abc.Sequence):
             self._previous = None
             items = Sequence(self.items).retain_pattern(argument)
             result = type(self)(items, previous=self._previous)
+        elif self._lazy and isinstance(argument, slice):
+
+            def source():
+                start, stop, step = argument.start, argument.stop, argument.step
+                if (
+                    (start is None or 0 <= start)
+                    and (stop is None or 0 <= stop)
+                    and (step is None or 0 < step)
+                ):
+                    return itertools.islice(self._iterate_items(), start, stop, step)
+                return iter(self.items[argument])
+
+            result = self._defer(source, previous=self._previous)
         else:
             result = self.items.__getitem__(argument)
             if isinstance(result, tuple):
@@ -514,6 +529,7 @@ class Selection(collections.abc.Sequence):
         """
         Gets state of selection.
         """
+        self.items
         if hasattr(self, "__dict__"):
             state = vars(self).copy()
         else:
@@ -539,6 +555,12 @@ class Selection(collections.abc.Sequence):
             raise TypeError(f"unhashable type: {self}")
         return result
 
+    def __iter__(self) -> typing.Iterator:
+        """
+        Iterates items in selection.
+        """
+        return iter(self.items)
+
     def __len__(self) -> int:
         """
         Gets number of items in selection.
@@ -598,20 +620,26 @@ class Selection(collections.abc.Sequence):
         prototype = prototype or Component
         if not isinstance(prototype, tuple):
             prototype = (prototype,)
-        result = []
-        generator = _iterate._public_iterate_components(
-            argument, prototype, exclude=exclude, grace=grace
-        )
-        components = list(generator)
-        if components:
-            if trim in (True, enums.Left):
-                components = Selection._trim_subresult(components, trim)
-            if head is not None:
-                components = Selection._head_filter_subresult(components, head)
-            if tail is not None:
-                components = Selection._tail_filter_subresult(components, tail)
-            result.extend(components)
-        return class_(result)
+
+        def function(items):
+            generator = _iterate._public_iterate_components(
+                items, prototype, exclude=exclude, grace=grace
+            )
+            if trim not in (True, enums.Left) and head is None and tail is None:
+                return generator
+            components = list(generator)
+            if components:
+                if trim in (True, enums.Left):
+                    components = Selection._trim_subresult(components, trim)
+                if head is not None:
+                    components = Selection._head_filter_subresult(components, head)
+                if tail is not None:
+                    components = Selection._tail_filter_subresult(components, tail)
+            return components
+
+        if isinstance(argument, Selection) and argument._lazy:
+            return argument._derive(function)
+        return class_(function(argument))
 
     def _copy(self):
         assert self.are_contiguous_logical_voice()
@@ -625,6 +653,24 @@ class Selection(collections.abc.Sequence):
         new_components = type(self)(new_components)
         return new_components
 
+    def _defer(self, source, previous=None):
+        selection = type(self).__new__(type(self))
+        selection._expression = None
+        selection._items = None
+        selection._lazy = True
+        selection._previous = previous
+        selection._source = source
+        return selection
+
+    def _derive(self, function, previous=None):
+        if not self._lazy:
+            return type(self)(function(self), previous=previous)
+
+        def source():
+            return iter(function(self._iterate_items()))
+
+        return self._defer(source, previous=previous)
+
     def _get_component(self, prototype=None, n=0, recurse=True):
         prototype = prototype or (Component,)
         if not isinstance(prototype, tuple):
@@ -652,7 +698,12 @@ class Selection(collections.abc.Sequence):
         values = []
         if self.items:
             values = [list(self.items)]
-        return FormatSpecification(client=self, storage_format_args_values=values)
+        return FormatSpecification(
+            client=self,
+            storage_format_args_values=values,
+            storage_format_keyword_names=["items", "previous"],
+            template_names=["items", "previous"],
+        )
 
     def _get_offset_lists(self):
         start_offsets, stop_offsets = [], []
@@ -773,6 +824,11 @@ class Selection(collections.abc.Sequence):
 
     # TODO: remove this in favor of the abjad.iterpitches module;
     #       force users to initialize pitch segments expicitly after iteration.
+    def _iterate_items(self):
+        if self._items is None:
+            return self._source()
+        return iter(self._items)
+
     def _pitch_segment(self) -> PitchSegment:
         pitches = []
         for leaf in _iterate._public_iterate_leaves(self, pitched=True):
@@ -903,6 +959,11 @@ class Selection(collections.abc.Sequence):
             (Note("c'4"), Note("d'4"), Note("e'4"), Note("f'4"))
 
         """
+        if self._items is None:
+            items = tuple(self._source())
+            self._check(items)
+            self._items = items
+            self._source = None
         return self._items
 
     ### PUBLIC METHODS ###
@@ -1788,10 +1849,19 @@ class Selection(collections.abc.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        generator = _iterate._public_iterate_components(
-            self, prototype=prototype, exclude=exclude, grace=grace, reverse=reverse
-        )
-        return type(self)(generator, previous=self._previous)
+
+        def function(items):
+            if reverse:
+                items = tuple(items)
+            return _iterate._public_iterate_components(
+                items,
+                prototype=prototype,
+                exclude=exclude,
+                grace=grace,
+                reverse=reverse,
+            )
+
+        return self._derive(function, previous=self._previous)
 
     def exclude(
         self, indices: typing.Sequence[int], period: int = None
@@ -2045,9 +2115,13 @@ class Selection(collections.abc.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        if predicate is None:
-            return type(self)(self)
-        return type(self)([_ for _ in self if predicate(_)])
+
+        def function(items):
+            if predicate is None:
+                return items
+            return (_ for _ in items if predicate(_))
+
+        return self._derive(function)
 
     def filter_duration(
         self,
@@ -2802,7 +2876,11 @@ class Selection(collections.abc.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        return type(self)(Sequence(self).flatten(depth=depth))
+
+        def function(items):
+            return Sequence(items).flatten(depth=depth)
+
+        return self._derive(function)
 
     def get(
         self,
@@ -3154,17 +3232,17 @@ class Selection(collections.abc.Sequence):
                 evaluation_template="group_by",
                 map_operand=predicate,
             )
-        items = []
         if predicate is None:
 
             def predicate(argument):
                 return True
 
-        pairs = itertools.groupby(self, predicate)
-        for count, group in pairs:
-            item = type(self)(group)
-            items.append(item)
-        return type(self)(items)
+        def function(items):
+            pairs = itertools.groupby(items, predicate)
+            for count, group in pairs:
+                yield type(self)(group)
+
+        return self._derive(function)
 
     def group_by_contiguity(self) -> typing.Union["Selection", Expression]:
         r'''
@@ -3525,26 +3603,30 @@ class Selection(collections.abc.Sequence):
         '''
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        result = []
-        selection: typing.List[typing.Union[Component, Selection]] = []
-        selection.extend(self[:1])
-        for item in self[1:]:
-            this_timespan = _inspect._get_timespan(selection[-1])
-            that_timespan = _inspect._get_timespan(item)
-            # remove displacement
-            this_stop_offset = this_timespan.stop_offset
-            this_stop_offset = Offset(this_stop_offset.pair)
-            that_start_offset = that_timespan.start_offset
-            that_start_offset = Offset(that_start_offset.pair)
-            # if this_timespan.stop_offset == that_timespan.start_offset:
-            if this_stop_offset == that_start_offset:
-                selection.append(item)
-            else:
-                result.append(type(self)(selection))
-                selection = [item]
-        if selection:
-            result.append(type(self)(selection))
-        return type(self)(result)
+
+        def function(items):
+            selection: typing.List[typing.Union[Component, Selection]] = []
+            for item in items:
+                if not selection:
+                    selection.append(item)
+                    continue
+                this_timespan = _inspect._get_timespan(selection[-1])
+                that_timespan = _inspect._get_timespan(item)
+                # remove displacement
+                this_stop_offset = this_timespan.stop_offset
+                this_stop_offset = Offset(this_stop_offset.pair)
+                that_start_offset = that_timespan.start_offset
+                that_start_offset = Offset(that_start_offset.pair)
+                # if this_timespan.stop_offset == that_timespan.start_offset:
+                if this_stop_offset == that_start_offset:
+                    selection.append(item)
+                else:
+                    yield type(self)(selection)
+                    selection = [item]
+            if selection:
+                yield type(self)(selection)
+
+        return self._derive(function)
 
     def group_by_duration(self) -> typing.Union["Selection", Expression]:
         r"""
@@ -4140,14 +4222,15 @@ class Selection(collections.abc.Sequence):
             assert first_component._measure_number is not None
             return first_component._measure_number
 
-        selections = []
-        first_component = _get_first_component(self)
-        first_component._update_measure_numbers()
-        pairs = itertools.groupby(self, _get_measure_number)
-        for value, group in pairs:
-            selection = type(self)(group)
-            selections.append(selection)
-        return type(self)(selections)
+        def function(items):
+            items = tuple(items)
+            first_component = _get_first_component(items)
+            first_component._update_measure_numbers()
+            pairs = itertools.groupby(items, _get_measure_number)
+            for value, group in pairs:
+                yield type(self)(group)
+
+        return self._derive(function)
 
     def group_by_pitch(self) -> typing.Union["Selection", Expression]:
         r"""
@@ -6315,17 +6398,21 @@ class Selection(collections.abc.Sequence):
         '''
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        # generator = Iteration(self).logical_ties(
-        generator = _iterate._iterate_logical_ties(
-            self,
-            exclude=exclude,
-            grace=grace,
-            nontrivial=nontrivial,
-            pitched=pitched,
-            reverse=reverse,
-            wrapper_class=LogicalTie,
-        )
-        return type(self)(generator, previous=self._previous)
+
+        def function(items):
+            if reverse:
+                items = tuple(items)
+            return _iterate._iterate_logical_ties(
+                items,
+                exclude=exclude,
+                grace=grace,
+                nontrivial=nontrivial,
+                pitched=pitched,
+                reverse=reverse,
+                wrapper_class=LogicalTie,
+            )
+
+        return self._derive(function, previous=self._previous)
 
     def map(self, expression=None) -> typing.Union["Selection", Expression]:
         r'''
@@ -6539,9 +6626,13 @@ class Selection(collections.abc.Sequence):
                 evaluation_template="map",
                 map_operand=expression,
             )
-        if expression is None:
-            return type(self)(self)
-        return type(self)([expression(_) for _ in self])
+
+        def function(items):
+            if expression is None:
+                return items
+            return (expression(_) for _ in items)
+
+        return self._derive(function)
 
     def nontrivial(self) -> typing.Union["Selection", Expression]:
         r"""
@@ -7385,40 +7476,43 @@ class Selection(collections.abc.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        result = []
-        groups = Sequence(self).partition_by_counts(
-            [abs(_) for _ in counts],
-            cyclic=cyclic,
-            enchain=enchain,
-            overhang=overhang,
-        )
-        groups = list(groups)
-        total = len(groups)
-        if overhang and fuse_overhang and 1 < len(groups):
-            last_count = counts[(len(groups) - 1) % len(counts)]
-            if len(groups[-1]) != last_count:
-                last_group = groups.pop()
-                groups[-1] += last_group
-        subresult = []
-        if cyclic:
-            counts = CyclicTuple(counts)
-        for i, group in enumerate(groups):
-            if overhang and i == total - 1:
-                pass
-            else:
-                try:
-                    count = counts[i]
-                except Exception:
-                    raise Exception(counts, i)
-                if count < 0:
-                    continue
-            items = type(self)(group)
-            subresult.append(items)
-        if nonempty and not subresult:
-            group = type(self)(groups[0])
-            subresult.append(group)
-        result.extend(subresult)
-        return type(self)(result)
+
+        def function(items):
+            counts_ = counts
+            groups = Sequence(items).partition_by_counts(
+                [abs(_) for _ in counts_],
+                cyclic=cyclic,
+                enchain=enchain,
+                overhang=overhang,
+            )
+            groups = list(groups)
+            total = len(groups)
+            if overhang and fuse_overhang and 1 < len(groups):
+                last_count = counts_[(len(groups) - 1) % len(counts_)]
+                if len(groups[-1]) != last_count:
+                    last_group = groups.pop()
+                    groups[-1] += last_group
+            subresult = []
+            if cyclic:
+                counts_ = CyclicTuple(counts_)
+            for i, group in enumerate(groups):
+                if overhang and i == total - 1:
+                    pass
+                else:
+                    try:
+                        count = counts_[i]
+                    except Exception:
+                        raise Exception(counts_, i)
+                    if count < 0:
+                        continue
+                items = type(self)(group)
+                subresult.append(items)
+            if nonempty and not subresult:
+                group = type(self)(groups[0])
+                subresult.append(group)
+            return subresult
+
+        return self._derive(function)
 
     def partition_by_durations(
         self,
@@ -9285,15 +9379,21 @@ class Selection(collections.abc.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        result: typing.List[typing.Union[Component, Selection]] = []
-        for component in _iterate._public_iterate_components(self, exclude=exclude):
-            for component_ in Parentage(component):
-                if (
-                    self._is_immediate_child_of_outermost_voice(component_)
-                    and component_ not in result
-                ):
-                    result.append(component_)
-        return type(self)(result)
+
+        def function(items):
+            result: typing.List[typing.Union[Component, Selection]] = []
+            for component in _iterate._public_iterate_components(
+                items, exclude=exclude
+            ):
+                for component_ in Parentage(component):
+                    if (
+                        self._is_immediate_child_of_outermost_voice(component_)
+                        and component_ not in result
+                    ):
+                        result.append(component_)
+            return result
+
+        return self._derive(function)
 
     def tuplet(
         self, n: int, *, exclude: typings.Strings = None, level: int = None
@@ -10458,7 +10558,7 @@ class LogicalTie(Selection):
 ### FUNCTIONS ###
 
 
-def select(items=None, previous=None):
+def select(items=None, previous=None, *, lazy=None):
     r"""
     Selects ``items`` or makes select expression.
 
@@ -10496,10 +10596,42 @@ def select(items=None, previous=None):
         >>> abjad.select()
         abjad.select()
 
+    ..  container:: example
+
+        Composes selector methods as a pipeline when ``lazy`` is true:
+
+        >>> staff = abjad.Staff("c'4 d' ~ d' e' r f'")
+        >>> selection = abjad.select(staff, lazy=True)
+        >>> selection = selection.leaves(pitched=True).logical_ties()[:2]
+
+        Nothing is iterated until the selection is indexed, measured or
+        iterated; intermediate selections are never built:
+
+        >>> len(selection)
+        2
+
+        >>> for logical_tie in selection:
+        ...     logical_tie
+        ...
+        LogicalTie([Note("c'4")])
+        LogicalTie([Note("d'4"), Note("d'4")])
+
+        Lazy selections are evaluated against the score as it is when they
+        are first materialized; they then keep their items like eager
+        selections. Methods without a pipelined implementation materialize
+        their selection and return an eager result.
+
     """
     if items is not None:
-        return Selection(items=items, previous=previous)
+        return Selection(items=items, previous=previous, lazy=lazy)
     expression = Expression(proxy_class=Selection)
-    callback = Expression._make_initializer_callback(Selection, previous=previous)
+    template = "abjad.select()"
+    if lazy:
+        callback = Expression._make_initializer_callback(
+            Selection, lazy=lazy, previous=previous
+        )
+        template = "abjad.select(lazy=True)"
+    else:
+        callback = Expression._make_initializer_callback(Selection, previous=previous)
     expression = expression.append_callback(callback)
-    return new(expression, template="abjad.select()")
+    return new(expression, template=template)
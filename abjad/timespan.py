@@ -1,11 +1,15 @@
 """
 Tools for modeling and manipulating timespans.
 """
+
+import bisect
 import collections
 import copy
 import inspect
 import typing
 
+import quicktions
+
 from . import enums, math
 from .duration import Duration, Multiplier, Offset
 from .expression import Expression, Signature
@@ -937,7 +941,7 @@ class Timespan:
         return False
 
     def _initialize_offset(self, offset):
-        if offset in (negative_infinity, infinity):
+        if isinstance(offset, math.Infinity):
             return offset
         return Offset(offset)
 
@@ -2884,6 +2888,173 @@ class AnnotatedTimespan(Timespan):
         self._annotation = argument
 
 
+class _TimespanIndex:
+    """
+    Timespan index.
+
+    Used internally by TimespanList to answer time-relation queries in
+    logarithmic time.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_denominator",
+        "_maxima",
+        "_minima",
+        "_size",
+        "_start_order",
+        "_starts",
+        "_stop_order",
+        "_stops",
+    )
+
+    # Maps each time relation to the regions of the (start, stop) plane that
+    # satisfy it. Regions give start lower, start upper, stop lower and stop
+    # upper bounds; each bound is a (value, inclusive) pair or none.
+    _regions = {
+        "contains_timespan_improperly": lambda a, b: [
+            (None, (a, True), (b, True), None)
+        ],
+        "curtails_timespan": lambda a, b: [((a, False), (b, True), (b, True), None)],
+        "delays_timespan": lambda a, b: [(None, (a, True), (a, False), None)],
+        "happens_during_timespan": lambda a, b: [((a, True), None, None, (b, True))],
+        "intersects_timespan": lambda a, b: [
+            ((a, True), (b, False), None, None),
+            (None, (a, True), (a, False), None),
+        ],
+        "is_congruent_to_timespan": lambda a, b: [
+            ((a, True), (a, True), (b, True), (b, True))
+        ],
+        "overlaps_all_of_timespan": lambda a, b: [(None, (a, False), (b, False), None)],
+        "overlaps_only_start_of_timespan": lambda a, b: [
+            (None, (a, False), (a, False), (b, True))
+        ],
+        "overlaps_only_stop_of_timespan": lambda a, b: [
+            ((a, True), (b, False), (b, False), None)
+        ],
+        "overlaps_start_of_timespan": lambda a, b: [
+            (None, (a, False), (a, False), None)
+        ],
+        "overlaps_stop_of_timespan": lambda a, b: [
+            (None, (b, False), (b, False), None)
+        ],
+        "starts_after_timespan_starts": lambda a, b: [((a, False), None, None, None)],
+        "starts_after_timespan_stops": lambda a, b: [((b, True), None, None, None)],
+        "starts_before_timespan_starts": lambda a, b: [(None, (a, False), None, None)],
+        "starts_before_timespan_stops": lambda a, b: [(None, (b, False), None, None)],
+        "starts_during_timespan": lambda a, b: [((a, True), (b, False), None, None)],
+        "starts_when_timespan_starts": lambda a, b: [
+            ((a, True), (a, True), None, None)
+        ],
+        "starts_when_timespan_stops": lambda a, b: [((b, True), (b, True), None, None)],
+        "stops_after_timespan_starts": lambda a, b: [(None, None, (a, False), None)],
+        "stops_after_timespan_stops": lambda a, b: [(None, None, (b, False), None)],
+        "stops_before_timespan_starts": lambda a, b: [(None, None, None, (a, False))],
+        "stops_before_timespan_stops": lambda a, b: [(None, None, None, (b, False))],
+        "stops_during_timespan": lambda a, b: [(None, None, (a, False), (b, True))],
+        "stops_when_timespan_starts": lambda a, b: [(None, None, (a, True), (a, True))],
+        "stops_when_timespan_stops": lambda a, b: [(None, None, (b, True), (b, True))],
+        "trisects_timespan": lambda a, b: [((a, False), None, None, (b, False))],
+    }
+
+    ### INITIALIZER ###
+
+    def __init__(self, denominator, starts, stops):
+        self._denominator = denominator
+        self._start_order = sorted(range(len(starts)), key=lambda i: starts[i])
+        self._starts = [starts[i] for i in self._start_order]
+        self._stop_order = sorted(range(len(stops)), key=lambda i: stops[i])
+        self._stops = [stops[i] for i in self._stop_order]
+        size = 1
+        while size < len(starts):
+            size *= 2
+        self._size = size
+        self._maxima = 2 * size * [-float("inf")]
+        self._minima = 2 * size * [float("inf")]
+        for j, i in enumerate(self._start_order):
+            self._maxima[size + j] = self._minima[size + j] = stops[i]
+        for node in range(size - 1, 0, -1):
+            self._maxima[node] = max(self._maxima[2 * node], self._maxima[2 * node + 1])
+            self._minima[node] = min(self._minima[2 * node], self._minima[2 * node + 1])
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_slice(values, lower, upper):
+        start, stop = 0, len(values)
+        if lower is not None:
+            if lower[1]:
+                start = bisect.bisect_left(values, lower[0])
+            else:
+                start = bisect.bisect_right(values, lower[0])
+        if upper is not None:
+            if upper[1]:
+                stop = bisect.bisect_right(values, upper[0])
+            else:
+                stop = bisect.bisect_left(values, upper[0])
+        return start, stop
+
+    @staticmethod
+    def _is_above(value, lower):
+        if lower is None:
+            return True
+        return lower[0] < value or (lower[1] and lower[0] == value)
+
+    @staticmethod
+    def _is_below(value, upper):
+        if upper is None:
+            return True
+        return value < upper[0] or (upper[1] and value == upper[0])
+
+    def _query_region(self, start_lower, start_upper, stop_lower, stop_upper):
+        if stop_lower is None and stop_upper is None:
+            i, j = self._get_slice(self._starts, start_lower, start_upper)
+            return self._start_order[i:j]
+        if start_lower is None and start_upper is None:
+            i, j = self._get_slice(self._stops, stop_lower, stop_upper)
+            return self._stop_order[i:j]
+        i, j = self._get_slice(self._starts, start_lower, start_upper)
+        indices, stack = [], [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi <= i or j <= lo:
+                continue
+            if not self._is_above(self._maxima[node], stop_lower):
+                continue
+            if not self._is_below(self._minima[node], stop_upper):
+                continue
+            if hi - lo == 1:
+                stop = self._maxima[node]
+                if self._is_above(stop, stop_lower) and self._is_below(
+                    stop, stop_upper
+                ):
+                    indices.append(self._start_order[lo])
+                continue
+            middle = (lo + hi) // 2
+            stack.append((2 * node + 1, middle, hi))
+            stack.append((2 * node, lo, middle))
+        return indices
+
+    ### PUBLIC METHODS ###
+
+    def query(self, name, start_offset, stop_offset):
+        """
+        Gets sorted indices of timespans that satisfy time relation ``name``
+        with respect to ``start_offset`` and ``stop_offset``.
+
+        Returns none when time relation is not indexed.
+        """
+        if name not in self._regions:
+            return None
+        a = quicktions.Fraction(start_offset) * self._denominator
+        b = quicktions.Fraction(stop_offset) * self._denominator
+        indices: typing.Set[int] = set()
+        for region in self._regions[name](a, b):
+            indices.update(self._query_region(*region))
+        return sorted(indices)
+
+
 class TimespanList(TypedList):
     """
     Timespan list.
@@ -2998,7 +3169,7 @@ class TimespanList(TypedList):
 
     __documentation_section__ = "Timespans"
 
-    __slots__ = ()
+    __slots__ = ("_index",)
 
     ### SPECIAL METHODS ###
 
@@ -3486,6 +3657,76 @@ class TimespanList(TypedList):
         else:
             return Timespan(item)
 
+    def _explode_integer_offsets(self, inventory_count, denominator, starts, stops):
+        global_durations: typing.List[int] = []
+        max_durations: typing.List[int] = []
+        result_starts: typing.List[typing.List[int]] = []
+        result_stops: typing.List[typing.List[int]] = []
+        result_timespan_lists: typing.List[TimespanList] = []
+        empty_count = inventory_count or 0
+        for i in range(empty_count):
+            global_durations.append(0)
+            max_durations.append(0)
+            result_starts.append([])
+            result_stops.append([])
+            result_timespan_lists.append(type(self)())
+        for timespan, start, stop in zip(self, starts, stops):
+            if empty_count:
+                empty_count -= 1
+                i = empty_count
+            else:
+                nonoverlapping, overlapping = [], []
+                for i, starts_ in enumerate(result_starts):
+                    stops_, overlap = result_stops[i], 0
+                    j = bisect.bisect_left(starts_, stop)
+                    while j and start < starts_[j - 1] + max_durations[i]:
+                        j -= 1
+                        if start < stops_[j]:
+                            overlap += min(stop, stops_[j]) - max(start, starts_[j])
+                    if not overlap:
+                        nonoverlapping.append((i, global_durations[i]))
+                    else:
+                        overlapping.append((i, overlap, global_durations[i]))
+                nonoverlapping.sort(key=lambda x: x[1])
+                overlapping.sort(key=lambda x: (x[1], x[2]))
+                if nonoverlapping:
+                    i = nonoverlapping[0][0]
+                elif inventory_count is None:
+                    i = len(result_timespan_lists)
+                    global_durations.append(0)
+                    max_durations.append(0)
+                    result_starts.append([])
+                    result_stops.append([])
+                    result_timespan_lists.append(type(self)())
+                else:
+                    i = overlapping[0][0]
+            result_timespan_lists[i].append(timespan)
+            global_durations[i] += stop - start
+            max_durations[i] = max(max_durations[i], stop - start)
+            j = bisect.bisect_right(result_starts[i], start)
+            result_starts[i].insert(j, start)
+            result_stops[i].insert(j, stop)
+        return tuple(result_timespan_lists)
+
+    def _get_integer_offsets(self, degenerate=False):
+        if not self:
+            return None
+        offsets = []
+        for timespan in self:
+            if not isinstance(timespan, Timespan):
+                return None
+            start_offset, stop_offset = timespan._start_offset, timespan._stop_offset
+            for offset in (start_offset, stop_offset):
+                if not isinstance(offset, Offset) or offset.displacement is not None:
+                    return None
+            if not degenerate and not start_offset < stop_offset:
+                return None
+            offsets.extend((start_offset, stop_offset))
+        denominators = set(_.denominator for _ in offsets)
+        denominator = math.least_common_multiple(*denominators)
+        numerators = [_.numerator * (denominator // _.denominator) for _ in offsets]
+        return denominator, numerators[::2], numerators[1::2]
+
     def _get_offsets(self, argument):
         try:
             return argument.start_offset, argument.stop_offset
@@ -3501,6 +3742,14 @@ class TimespanList(TypedList):
         start_offset, stop_offset = self._get_offsets(argument)
         return Timespan(start_offset, stop_offset)
 
+    @staticmethod
+    def _make_timespan(timespan, start, stop, denominator):
+        start_offset = Offset(start, denominator)
+        stop_offset = Offset(stop, denominator)
+        if type(timespan) is Timespan:
+            return Timespan(start_offset, stop_offset)
+        return new(timespan, start_offset=start_offset, stop_offset=stop_offset)
+
     @staticmethod
     def _make_timespan_list_markup(
         timespans,
@@ -3571,6 +3820,39 @@ class TimespanList(TypedList):
         string = f"\\column {{\n{fraction_string}\n{lines_string}\n}}"
         return string
 
+    def _on_insertion(self, item):
+        self._index = None
+
+    def _on_removal(self, item):
+        self._index = None
+
+    def _query_index(self, time_relation):
+        callbacks = time_relation.callbacks or ()
+        if len(callbacks) != 2 or not callbacks[0].is_initializer:
+            return None
+        if callbacks[0].evaluation_template != "abjad.Timespan":
+            return None
+        if not callbacks[1].qualified_method_name:
+            return None
+        prefix, _, name = callbacks[1].qualified_method_name.rpartition(".")
+        if prefix != "abjad.Timespan":
+            return None
+        argument_values = callbacks[1].argument_values or {}
+        timespan = argument_values.get("timespan")
+        if list(argument_values) != ["timespan"]:
+            return None
+        if not isinstance(timespan, Timespan):
+            return None
+        for offset in timespan.offsets:
+            if not isinstance(offset, Offset) or offset.displacement is not None:
+                return None
+        if getattr(self, "_index", None) is None:
+            integer_offsets = self._get_integer_offsets(degenerate=True)
+            if integer_offsets is None:
+                return None
+            self._index = _TimespanIndex(*integer_offsets)
+        return self._index.query(name, *timespan.offsets)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -4258,7 +4540,18 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         """
-        if 1 < len(self):
+        integer_offsets = self._get_integer_offsets()
+        if 1 < len(self) and integer_offsets is not None:
+            denominator, starts, stops = integer_offsets
+            start, stop = starts[0], stops[0]
+            for start_, stop_ in zip(starts, stops):
+                if not (start_ < stop and start < stop_):
+                    self[:] = []
+                    return self
+                start, stop = max(start, start_), min(stop, stop_)
+            timespan = self._make_timespan(self[0], start, stop, denominator)
+            self[:] = [timespan]
+        elif 1 < len(self):
             result = self[0]
             for timespan in self:
                 if not timespan.intersects_timespan(result):
@@ -4383,7 +4676,29 @@ class TimespanList(TypedList):
         Operates in place and returns timespan list.
         """
         timespans: typing.List[Timespan] = []
-        if self:
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is not None and integer_offsets[1] == sorted(
+            integer_offsets[1]
+        ):
+            denominator, starts, stops = integer_offsets
+            first, stop = 0, stops[0]
+            for i in range(1, len(self) + 1):
+                if (
+                    i < len(self)
+                    and starts[i] <= stop
+                    and isinstance(self[i], type(self[first]))
+                ):
+                    stop = max(stop, stops[i])
+                    continue
+                timespan = self[first]
+                if first < i - 1:
+                    timespan = self._make_timespan(
+                        timespan, starts[first], stop, denominator
+                    )
+                timespans.append(timespan)
+                if i < len(self):
+                    first, stop = i, stops[i]
+        elif self:
             timespans = [self[0]]
             for timespan in self[1:]:
                 if timespans[-1]._can_fuse(timespan):
@@ -4567,6 +4882,30 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         """
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is not None:
+            denominator, starts, stops = integer_offsets
+            counts: typing.Dict[int, int] = collections.defaultdict(int)
+            owners: typing.Dict[int, int] = collections.defaultdict(int)
+            for i, (start, stop) in enumerate(zip(starts, stops)):
+                counts[start] += 1
+                counts[stop] -= 1
+                owners[start] += i
+                owners[stop] -= i
+            fragments = []
+            count, owner = 0, 0
+            points = sorted(counts)
+            for start, stop in zip(points, points[1:]):
+                count += counts[start]
+                owner += owners[start]
+                if count != 1:
+                    continue
+                fragment = self[owner]
+                if start != starts[owner] or stop != stops[owner]:
+                    fragment = self._make_timespan(fragment, start, stop, denominator)
+                fragments.append(fragment)
+            self[:] = fragments
+            return self
         all_fragments = []
         for i, timespan_1 in enumerate(self):
             timespan_1_fragments = [timespan_1]
@@ -4707,6 +5046,22 @@ class TimespanList(TypedList):
         Returns mapping.
         """
         mapping: collections.OrderedDict = collections.OrderedDict()
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is not None:
+            denominator, starts, stops = integer_offsets
+            counts: typing.Dict[int, int] = collections.defaultdict(int)
+            for start, stop in zip(starts, stops):
+                counts[start] += 1
+                counts[stop] -= 1
+            count = 0
+            points = sorted(counts)
+            for start, stop in zip(points, points[1:]):
+                count += counts[start]
+                timespan = Timespan(
+                    Offset(start, denominator), Offset(stop, denominator)
+                )
+                mapping[timespan] = Multiplier(count)
+            return mapping
         offsets = Sequence(sorted(self.count_offsets()))
         for start_offset, stop_offset in offsets.nwise():
             timespan = Timespan(start_offset, stop_offset)
@@ -4841,7 +5196,18 @@ class TimespanList(TypedList):
 
         Returns counter.
         """
-        return OffsetCounter(self)
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is None:
+            return OffsetCounter(self)
+        denominator, starts, stops = integer_offsets
+        counts: typing.Dict[int, int] = collections.defaultdict(int)
+        for start, stop in zip(starts, stops):
+            counts[start] += 1
+            counts[stop] += 1
+        counter = OffsetCounter()
+        for numerator, count in counts.items():
+            counter[Offset(numerator, denominator)] = count
+        return counter
 
     def explode(self, inventory_count=None) -> typing.Tuple["TimespanList", ...]:
         """
@@ -5023,6 +5389,9 @@ class TimespanList(TypedList):
         assert isinstance(inventory_count, (type(None), int))
         if isinstance(inventory_count, int):
             assert 0 < inventory_count
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is not None:
+            return self._explode_integer_offsets(inventory_count, *integer_offsets)
         bounding_timespan = self.timespan
         global_overlap_factors = []
         empty_timespans_pairs = []
@@ -5151,6 +5520,10 @@ class TimespanList(TypedList):
                 )
 
         """
+        if isinstance(time_relation, Expression):
+            indices = self._query_index(time_relation)
+            if indices is not None:
+                return type(self)([self[i] for i in indices])
         result = []
         for timespan in self:
             if isinstance(time_relation, Expression):
@@ -5370,6 +5743,24 @@ class TimespanList(TypedList):
         if not self:
             return ()
         timespan_lists = []
+        integer_offsets = self._get_integer_offsets()
+        if integer_offsets is not None:
+            denominator, starts, stops = integer_offsets
+            indices = sorted(range(len(self)), key=lambda i: (starts[i], stops[i]))
+            current_list = type(self)()
+            latest_stop = None
+            for i in indices:
+                if latest_stop is not None and not (
+                    starts[i] < latest_stop
+                    or (include_tangent_timespans and starts[i] == latest_stop)
+                ):
+                    timespan_lists.append(current_list)
+                    current_list = type(self)()
+                current_list.append(self[i])
+                if latest_stop is None or latest_stop < stops[i]:
+                    latest_stop = stops[i]
+            timespan_lists.append(current_list)
+            return tuple(timespan_lists)
         timespans = sorted(self[:])
         current_list = type(self)([timespans[0]])
         latest_stop_offset = current_list[0].stop_offset
@@ -5569,6 +5960,13 @@ class TimespanList(TypedList):
                 self[-1] = self[-1].set_offsets(stop_offset=stop_offset)
         return self
 
+    def reverse(self) -> None:
+        """
+        Reverses timespans in place.
+        """
+        self._index = None
+        TypedList.reverse(self)
+
     def rotate(self, count) -> "TimespanList":
         """
         Rotates by ``count`` contiguous timespans.
@@ -5896,6 +6294,13 @@ class TimespanList(TypedList):
         self[:] = timespans
         return self
 
+    def sort(self, cmp=None, key=None, reverse=False) -> None:
+        """
+        Sorts timespans in place.
+        """
+        self._index = None
+        TypedList.sort(self, cmp=cmp, key=key, reverse=reverse)
+
     def split_at_offset(self, offset) -> typing.Tuple["TimespanList", "TimespanList"]:
         """
         Splits timespans at ``offset``.
@@ -1,3 +1,5 @@
+import concurrent.futures
+import multiprocessing
 import typing
 
 from . import _inspect
@@ -11,23 +13,109 @@ from .indicators.StopHairpin import StopHairpin
 from .indicators.StopTextSpan import StopTextSpan
 from .instruments import Instrument
 from .iterate import Iteration
-from .iterpitches import sounding_pitches_are_in_range
 from .parentage import Parentage
-from .score import Container, Context
+from .pitch.pitches import NamedPitch
+from .score import Chord, Component, Container, Context, Leaf, Note
 from .sequence import Sequence
 from .tag import Tag
 
+_partitions = None
+
+### PRIVATE CLASSES ###
+
+
+class _ScoreWalk:
+    """
+    Score walk.
+
+    Used internally by the checks below. Iterates a score once; checks share
+    the components, leaves and context wrappers found, together with one cache
+    of effective indicators.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_allowable_clefs",
+        "_argument",
+        "_components",
+        "_effective_indicators",
+        "_intervals",
+        "_leaves",
+        "_name_to_pairs",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, argument, components=None):
+        self._allowable_clefs: typing.Dict = {}
+        self._argument = argument
+        if components is None:
+            components = list(Iteration(argument).components())
+        self._components = components
+        self._effective_indicators: typing.Dict = {}
+        self._intervals: typing.Dict = {}
+        self._leaves = [_ for _ in self._components if isinstance(_, Leaf)]
+        self._name_to_pairs = None
+
+    ### PRIVATE METHODS ###
+
+    def _get_effective(self, leaf, prototype, unwrap=True):
+        key = (id(leaf), prototype, unwrap)
+        if key not in self._effective_indicators:
+            indicator = _inspect._get_effective(leaf, prototype, unwrap=unwrap)
+            self._effective_indicators[key] = indicator
+        return self._effective_indicators[key]
+
+    def _get_name_to_pairs(self):
+        """
+        Gets (leaked start offset, wrapper) pairs of each context name, sorted
+        by offset.
+        """
+        if self._name_to_pairs is None:
+            self._name_to_pairs = {}
+            name_to_wrappers = _aggregate_context_wrappers(self._components)
+            for name, wrappers in name_to_wrappers.items():
+                pairs = [(_.leaked_start_offset, _) for _ in wrappers]
+                pairs.sort(key=lambda _: _[0])
+                self._name_to_pairs[name] = pairs
+        return self._name_to_pairs
+
+    def _get_sounding_pitches(self, leaf, instrument):
+        if hasattr(leaf, "written_pitch"):
+            pitches = [leaf.written_pitch]
+        else:
+            pitches = list(leaf.written_pitches)
+        if "sounding pitch" in leaf._get_indicators(str):
+            return pitches
+        if id(instrument) not in self._intervals:
+            interval = NamedPitch("C4") - instrument.middle_c_sounding_pitch
+            self._intervals[id(instrument)] = interval
+        interval = self._intervals[id(instrument)]
+        return [interval.transpose(_) for _ in pitches]
+
+    def _is_allowable_clef(self, instrument, clef):
+        key = (id(instrument), id(clef))
+        if key not in self._allowable_clefs:
+            allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
+            allowable_clefs.append(Clef("percussion"))
+            self._allowable_clefs[key] = clef in allowable_clefs
+        return self._allowable_clefs[key]
+
+
 ### PRIVATE FUNCTIONS ###
 
 
-def _aggregate_context_wrappers(argument):
+def _aggregate_context_wrappers(components):
     """
     Special_Voice may contain other instances of Special_Voice.
     This currently happens with OnBeatGraceContainer.
     This method aggregates all Special_Voice wrappers for checks.
     """
     name_to_wrappers: typing.Dict = {}
-    for context in Iteration(argument).components(Context):
+    for context in components:
+        if not isinstance(context, Context):
+            continue
         if context.name not in name_to_wrappers:
             name_to_wrappers[context.name] = []
         wrappers = context._dependent_wrappers[:]
@@ -35,6 +123,326 @@ def _aggregate_context_wrappers(argument):
     return name_to_wrappers
 
 
+def _check_beamed_long_notes(walk):
+    violators, total = [], 0
+    for leaf in walk._leaves:
+        total += 1
+        if leaf.written_duration < Duration((1, 4)):
+            continue
+        start_wrapper = walk._get_effective(leaf, StartBeam, unwrap=False)
+        if start_wrapper is None:
+            continue
+        stop_wrapper = walk._get_effective(leaf, StopBeam, unwrap=False)
+        if stop_wrapper is None:
+            violators.append(leaf)
+            continue
+        if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
+            violators.append(leaf)
+            continue
+        leaf_start_offset = leaf._get_timespan().start_offset
+        if stop_wrapper.leaked_start_offset == leaf_start_offset:
+            violators.append(leaf)
+    return violators, total
+
+
+def _check_duplicate_ids(walk):
+    violators = []
+    components = walk._components
+    total_ids = [id(_) for _ in components]
+    unique_ids = Sequence(total_ids).remove_repeats()
+    if len(unique_ids) < len(total_ids):
+        for current_id in unique_ids:
+            if 1 < total_ids.count(current_id):
+                violators.extend([_ for _ in components if id(_) == current_id])
+    return violators, len(total_ids)
+
+
+def _check_empty_containers(walk):
+    violators, containers = [], set()
+    for container in walk._components:
+        if not isinstance(container, Container):
+            continue
+        containers.add(container)
+        if len(container) == 0:
+            violators.append(container)
+    return violators, len(containers)
+
+
+def _check_missing_parents(walk):
+    violators, total = [], set()
+    for i, component in enumerate(walk._components):
+        total.add(component)
+        if 0 < i:
+            # TODO: figure out why "if component._parent is None" doesn't work
+            if Parentage(component).parent is None:
+                violators.append(component)
+    return violators, len(total)
+
+
+def _check_notes_on_wrong_clef(walk):
+    violators, total = [], set()
+    for leaf in walk._leaves:
+        total.add(leaf)
+        instrument = walk._get_effective(leaf, Instrument)
+        if instrument is None:
+            continue
+        clef = walk._get_effective(leaf, Clef)
+        if clef is None:
+            continue
+        if not walk._is_allowable_clef(instrument, clef):
+            violators.append(leaf)
+    return violators, len(total)
+
+
+def _check_out_of_range_pitches(walk):
+    violators, total = [], set()
+    unpitched = None
+    for leaf in walk._leaves:
+        if not isinstance(leaf, (Chord, Note)):
+            continue
+        total.add(leaf)
+        if leaf._has_indicator("ALLOW_OUT_OF_RANGE"):
+            continue
+        if leaf._has_indicator("HIDDEN"):
+            continue
+        if unpitched is None:
+            unpitched = "unpitched" in walk._argument._get_indicators(str)
+        if unpitched:
+            continue
+        instrument = walk._get_effective(leaf, Instrument)
+        if instrument is None:
+            continue
+        pitch_range = instrument.pitch_range
+        pitches = walk._get_sounding_pitches(leaf, instrument)
+        if not all(pitch_range._contains_pitch(_) for _ in pitches):
+            violators.append(leaf)
+    return violators, len(total)
+
+
+def _check_overlapping_text_spanners(walk):
+    violators, total = [], 0
+
+    def key(pair):
+        if isinstance(pair[1].indicator, StartTextSpan):
+            priority = 1
+        else:
+            priority = 0
+        return (pair[0], priority)
+
+    for name, pairs in walk._get_name_to_pairs().items():
+        open_spanners: typing.Dict = {}
+        for offset, wrapper in sorted(pairs, key=key):
+            if isinstance(wrapper.indicator, StartTextSpan):
+                total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                if open_spanners[command]:
+                    violators.append(wrapper.component)
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command in open_spanners and open_spanners[command]:
+                    open_spanners[command].pop()
+    return violators, total
+
+
+def _check_unmatched_stop_text_spans(walk):
+    violators, total = [], 0
+    for name, pairs in walk._get_name_to_pairs().items():
+        open_spanners: typing.Dict = {}
+        for offset, wrapper in pairs:
+            if isinstance(wrapper.indicator, StartTextSpan):
+                total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command not in open_spanners or not open_spanners[command]:
+                    violators.append(wrapper.component)
+                else:
+                    open_spanners[command].pop()
+    return violators, total
+
+
+def _check_unterminated_hairpins(walk):
+    violators, total = [], 0
+    for name, pairs in walk._get_name_to_pairs().items():
+        last_dynamic = None
+        last_tag = None
+        for offset, wrapper in pairs:
+            parameter = getattr(wrapper.indicator, "parameter", None)
+            if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
+                last_dynamic = wrapper.indicator
+                last_tag = wrapper.tag
+                if isinstance(wrapper.indicator, StartHairpin):
+                    total += 1
+        if isinstance(last_dynamic, StartHairpin) and str(
+            Tag("RIGHT_BROKEN")
+        ) not in str(last_tag):
+            violators.append(wrapper.component)
+    return violators, total
+
+
+def _check_unterminated_text_spanners(walk):
+    violators, total = [], 0
+    for name, pairs in walk._get_name_to_pairs().items():
+        open_spanners: typing.Dict = {}
+        for offset, wrapper in pairs:
+            if isinstance(wrapper.indicator, StartTextSpan):
+                total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command not in open_spanners or not open_spanners[command]:
+                    # unmatched stop text span
+                    pass
+                else:
+                    open_spanners[command].pop()
+        for command, list_ in open_spanners.items():
+            for component in list_:
+                violators.append(component)
+    return violators, total
+
+
+def _check_partitions(walk, names, cache=None, workers=None):
+    """
+    Runs leaf checks ``names`` on the leaves of each top-level component of
+    ``walk`` and merges the results.
+
+    Reuses the results cached on a top-level component when ``cache`` is true,
+    unless the component has changed since then. Runs the remaining partitions
+    in a pool of ``workers`` processes when ``workers`` is greater than 1.
+    """
+    argument = walk._argument
+    partitions = _partition_leaves(walk)
+    key = None
+    if cache and isinstance(argument, Component):
+        key = _get_context_key(argument)
+    results: typing.List = [None] * len(partitions)
+    pending = []
+    for i, (child, leaves, positions) in enumerate(partitions):
+        entry = None
+        if key is not None and child is not None:
+            entry = child._wellformedness_cache
+        if entry is not None and entry[0] == key and all(_ in entry[1] for _ in names):
+            results[i] = entry[1]
+        else:
+            pending.append(i)
+    arguments = [(argument, partitions[i][1], names) for i in pending]
+    if workers is not None and 1 < workers and 1 < len(arguments):
+        argument._update_now(indicators=True)
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(arguments)),
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(arguments,),
+        ) as executor:
+            indices = range(len(arguments))
+            name_to_results = list(executor.map(_run_leaf_checks_in_worker, indices))
+    else:
+        name_to_results = [_run_leaf_checks(*_) for _ in arguments]
+    for i, name_to_result in zip(pending, name_to_results):
+        results[i] = name_to_result
+        child = partitions[i][0]
+        if key is not None and child is not None:
+            child._wellformedness_cache = (key, name_to_result)
+            child._mark_caches()
+    name_to_pair = {}
+    for name in names:
+        pairs, total = [], 0
+        for (child, leaves, positions), name_to_result in zip(partitions, results):
+            indices, count = name_to_result[name]
+            pairs.extend((positions[_], leaves[_]) for _ in indices)
+            total += count
+        pairs.sort(key=lambda _: _[0])
+        name_to_pair[name] = ([_[1] for _ in pairs], total)
+    return name_to_pair
+
+
+def _get_context_key(argument):
+    """
+    Gets wrappers on and above ``argument``, with their start offsets; these
+    may be effective in every top-level component of ``argument``, and move
+    when any top-level component changes duration.
+    """
+    values = []
+    for component in argument._get_parentage():
+        wrappers = component._wrappers + getattr(component, "_dependent_wrappers", [])
+        values.extend((id(_), _.deactivate, _.start_offset) for _ in wrappers)
+    return tuple(values)
+
+
+def _get_violator_indices(leaves, violators):
+    indices, j = [], 0
+    for i, leaf in enumerate(leaves):
+        while j < len(violators) and violators[j] is leaf:
+            indices.append(i)
+            j += 1
+    return indices
+
+
+def _initialize_worker(partitions):
+    global _partitions
+    _partitions = partitions
+
+
+def _partition_leaves(walk):
+    """
+    Partitions leaves of ``walk`` by top-level component.
+
+    Returns (component, leaves, leaf indices) triples.
+    """
+    argument = walk._argument
+    if not isinstance(argument, Container):
+        return [(None, walk._leaves, list(range(len(walk._leaves))))]
+    depth = len(argument._get_parentage())
+    child_to_triple: typing.Dict = {}
+    for i, leaf in enumerate(walk._leaves):
+        parentage = leaf._get_parentage()
+        child = parentage[-depth - 1]
+        if id(child) not in child_to_triple:
+            child_to_triple[id(child)] = (child, [], [])
+        child_to_triple[id(child)][1].append(leaf)
+        child_to_triple[id(child)][2].append(i)
+    return list(child_to_triple.values())
+
+
+def _run_leaf_checks(argument, leaves, names):
+    walk = _ScoreWalk(argument, components=leaves)
+    name_to_result = {}
+    for name in names:
+        violators, total = _globals[f"_{name}"](walk)
+        indices = _get_violator_indices(leaves, violators)
+        name_to_result[name] = (indices, total)
+    return name_to_result
+
+
+def _run_leaf_checks_in_worker(i):
+    return _run_leaf_checks(*_partitions[i])
+
+
 ### PUBLIC FUNCTIONS ###
 
 
@@ -146,40 +554,14 @@ def check_beamed_long_notes(argument) -> typing.Tuple[typing.List, int]:
     The examples above feature Abjad voice containers because beams are
     voice-persistent.
     """
-    violators, total = [], 0
-    for leaf in Iteration(argument).leaves():
-        total += 1
-        if leaf.written_duration < Duration((1, 4)):
-            continue
-        start_wrapper = _inspect._get_effective(leaf, StartBeam, unwrap=False)
-        if start_wrapper is None:
-            continue
-        stop_wrapper = _inspect._get_effective(leaf, StopBeam, unwrap=False)
-        if stop_wrapper is None:
-            violators.append(leaf)
-            continue
-        if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
-            violators.append(leaf)
-            continue
-        leaf_start_offset = leaf._get_timespan().start_offset
-        if stop_wrapper.leaked_start_offset == leaf_start_offset:
-            violators.append(leaf)
-    return violators, total
+    return _check_beamed_long_notes(_ScoreWalk(argument))
 
 
 def check_duplicate_ids(argument) -> typing.Tuple[typing.List, int]:
     """
     Checks duplicate IDs.
     """
-    violators = []
-    components = Iteration(argument).components()
-    total_ids = [id(_) for _ in components]
-    unique_ids = Sequence(total_ids).remove_repeats()
-    if len(unique_ids) < len(total_ids):
-        for current_id in unique_ids:
-            if 1 < total_ids.count(current_id):
-                violators.extend([_ for _ in components if id(_) == current_id])
-    return violators, len(total_ids)
+    return _check_duplicate_ids(_ScoreWalk(argument))
 
 
 def check_empty_containers(argument) -> typing.Tuple[typing.List, int]:
@@ -207,27 +589,14 @@ def check_empty_containers(argument) -> typing.Tuple[typing.List, int]:
         [Container()]
 
     """
-    violators, containers = [], set()
-    for container in Iteration(argument).components(Container):
-        containers.add(container)
-        if len(container) == 0:
-            violators.append(container)
-    return violators, len(containers)
+    return _check_empty_containers(_ScoreWalk(argument))
 
 
 def check_missing_parents(argument) -> typing.Tuple[typing.List, int]:
     """
     Checks missing parents.
     """
-    violators, total = [], set()
-    components = Iteration(argument).components()
-    for i, component in enumerate(components):
-        total.add(component)
-        if 0 < i:
-            # TODO: figure out why "if component._parent is None" doesn't work
-            if Parentage(component).parent is None:
-                violators.append(component)
-    return violators, len(total)
+    return _check_missing_parents(_ScoreWalk(argument))
 
 
 def check_notes_on_wrong_clef(argument) -> typing.Tuple[typing.List, int]:
@@ -303,20 +672,7 @@ def check_notes_on_wrong_clef(argument) -> typing.Tuple[typing.List, int]:
         0 /     0 unterminated text spanners
 
     """
-    violators, total = [], set()
-    for leaf in Iteration(argument).leaves():
-        total.add(leaf)
-        instrument = _inspect._get_effective(leaf, Instrument)
-        if instrument is None:
-            continue
-        clef = _inspect._get_effective(leaf, Clef)
-        if clef is None:
-            continue
-        allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
-        allowable_clefs.append(Clef("percussion"))
-        if clef not in allowable_clefs:
-            violators.append(leaf)
-    return violators, len(total)
+    return _check_notes_on_wrong_clef(_ScoreWalk(argument))
 
 
 def check_out_of_range_pitches(argument) -> typing.Tuple[typing.List, int]:
@@ -389,22 +745,7 @@ def check_out_of_range_pitches(argument) -> typing.Tuple[typing.List, int]:
         0 /     0 unterminated text spanners
 
     """
-    violators, total = [], set()
-    for leaf in Iteration(argument).leaves(pitched=True):
-        total.add(leaf)
-        if leaf._has_indicator("ALLOW_OUT_OF_RANGE"):
-            continue
-        if leaf._has_indicator("HIDDEN"):
-            continue
-        if "unpitched" in argument._get_indicators(str):
-            continue
-        instrument = _inspect._get_effective(leaf, Instrument)
-        if instrument is None:
-            continue
-        # if leaf not in instrument.pitch_range:
-        if not sounding_pitches_are_in_range(leaf, instrument.pitch_range):
-            violators.append(leaf)
-    return violators, len(total)
+    return _check_out_of_range_pitches(_ScoreWalk(argument))
 
 
 def check_overlapping_text_spanners(argument) -> typing.Tuple[typing.List, int]:
@@ -553,37 +894,7 @@ def check_overlapping_text_spanners(argument) -> typing.Tuple[typing.List, int]:
         0 /     2 unterminated text spanners
 
     """
-    violators, total = [], 0
-
-    def key(wrapper):
-        if isinstance(wrapper.indicator, StartTextSpan):
-            priority = 1
-        else:
-            priority = 0
-        return (wrapper.leaked_start_offset, priority)
-
-    name_to_wrappers = _aggregate_context_wrappers(argument)
-    for name, wrappers in name_to_wrappers.items():
-        wrappers.sort(key=key)
-        open_spanners: typing.Dict = {}
-        for wrapper in wrappers:
-            if isinstance(wrapper.indicator, StartTextSpan):
-                total += 1
-                command = wrapper.indicator.command
-                command = command.replace("start", "")
-                command = command.replace("Start", "")
-                if command not in open_spanners:
-                    open_spanners[command] = []
-                if open_spanners[command]:
-                    violators.append(wrapper.component)
-                open_spanners[command].append(wrapper.component)
-            elif isinstance(wrapper.indicator, StopTextSpan):
-                command = wrapper.indicator.command
-                command = command.replace("stop", "")
-                command = command.replace("Stop", "")
-                if command in open_spanners and open_spanners[command]:
-                    open_spanners[command].pop()
-    return violators, total
+    return _check_overlapping_text_spanners(_ScoreWalk(argument))
 
 
 def check_unmatched_stop_text_spans(argument) -> typing.Tuple[typing.List, int]:
@@ -645,29 +956,7 @@ def check_unmatched_stop_text_spans(argument) -> typing.Tuple[typing.List, int]:
         True
 
     """
-    violators, total = [], 0
-    name_to_wrappers = _aggregate_context_wrappers(argument)
-    for name, wrappers in name_to_wrappers.items():
-        wrappers.sort(key=lambda _: _.leaked_start_offset)
-        open_spanners: typing.Dict = {}
-        for wrapper in wrappers:
-            if isinstance(wrapper.indicator, StartTextSpan):
-                total += 1
-                command = wrapper.indicator.command
-                command = command.replace("start", "")
-                command = command.replace("Start", "")
-                if command not in open_spanners:
-                    open_spanners[command] = []
-                open_spanners[command].append(wrapper.component)
-            elif isinstance(wrapper.indicator, StopTextSpan):
-                command = wrapper.indicator.command
-                command = command.replace("stop", "")
-                command = command.replace("Stop", "")
-                if command not in open_spanners or not open_spanners[command]:
-                    violators.append(wrapper.component)
-                else:
-                    open_spanners[command].pop()
-    return violators, total
+    return _check_unmatched_stop_text_spans(_ScoreWalk(argument))
 
 
 def check_unterminated_hairpins(argument) -> typing.Tuple[typing.List, int]:
@@ -786,24 +1075,7 @@ def check_unterminated_hairpins(argument) -> typing.Tuple[typing.List, int]:
         True
 
     """
-    violators, total = [], 0
-    name_to_wrappers = _aggregate_context_wrappers(argument)
-    for name, wrappers in name_to_wrappers.items():
-        last_dynamic = None
-        last_tag = None
-        wrappers.sort(key=lambda _: _.leaked_start_offset)
-        for wrapper in wrappers:
-            parameter = getattr(wrapper.indicator, "parameter", None)
-            if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
-                last_dynamic = wrapper.indicator
-                last_tag = wrapper.tag
-                if isinstance(wrapper.indicator, StartHairpin):
-                    total += 1
-        if isinstance(last_dynamic, StartHairpin) and str(
-            Tag("RIGHT_BROKEN")
-        ) not in str(last_tag):
-            violators.append(wrapper.component)
-    return violators, total
+    return _check_unterminated_hairpins(_ScoreWalk(argument))
 
 
 def check_unterminated_text_spanners(argument) -> typing.Tuple[typing.List, int]:
@@ -865,33 +1137,7 @@ def check_unterminated_text_spanners(argument) -> typing.Tuple[typing.List, int]
         True
 
     """
-    violators, total = [], 0
-    name_to_wrappers = _aggregate_context_wrappers(argument)
-    for name, wrappers in name_to_wrappers.items():
-        wrappers.sort(key=lambda _: _.leaked_start_offset)
-        open_spanners: typing.Dict = {}
-        for wrapper in wrappers:
-            if isinstance(wrapper.indicator, StartTextSpan):
-                total += 1
-                command = wrapper.indicator.command
-                command = command.replace("start", "")
-                command = command.replace("Start", "")
-                if command not in open_spanners:
-                    open_spanners[command] = []
-                open_spanners[command].append(wrapper.component)
-            elif isinstance(wrapper.indicator, StopTextSpan):
-                command = wrapper.indicator.command
-                command = command.replace("stop", "")
-                command = command.replace("Stop", "")
-                if command not in open_spanners or not open_spanners[command]:
-                    # unmatched stop text span
-                    pass
-                else:
-                    open_spanners[command].pop()
-        for command, list_ in open_spanners.items():
-            for component in list_:
-                violators.append(component)
-    return violators, total
+    return _check_unterminated_text_spanners(_ScoreWalk(argument))
 
 
 _globals = globals()
@@ -909,47 +1155,68 @@ def _call_functions(
     check_unmatched_stop_text_spans: bool = True,
     check_unterminated_hairpins: bool = True,
     check_unterminated_text_spanners: bool = True,
+    cache: bool = None,
+    workers: int = None,
 ):
+    if workers is not None:
+        assert isinstance(workers, int) and 0 < workers, repr(workers)
     triples = []
+    walk = _ScoreWalk(component)
+    name_to_pair = {}
+    if cache or (workers is not None and 1 < workers):
+        names = []
+        if check_beamed_long_notes:
+            names.append("check_beamed_long_notes")
+        if check_notes_on_wrong_clef:
+            names.append("check_notes_on_wrong_clef")
+        if check_out_of_range_pitches:
+            names.append("check_out_of_range_pitches")
+        name_to_pair = _check_partitions(walk, names, cache=cache, workers=workers)
+
+    def call(name):
+        if name in name_to_pair:
+            return name_to_pair[name]
+        return _globals[f"_{name}"](walk)
+
     if check_beamed_long_notes:
         name = "check_beamed_long_notes"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_duplicate_ids:
         name = "check_duplicate_ids"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_empty_containers:
         name = "check_empty_containers"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_missing_parents:
         name = "check_missing_parents"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_notes_on_wrong_clef:
         name = "check_notes_on_wrong_clef"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_out_of_range_pitches:
         name = "check_out_of_range_pitches"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_overlapping_text_spanners:
         name = "check_overlapping_text_spanners"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_unmatched_stop_text_spans:
         name = "check_unmatched_stop_text_spans"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_unterminated_hairpins:
         name = "check_unterminated_hairpins"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     if check_unterminated_text_spanners:
         name = "check_unterminated_text_spanners"
-        violators, count = _globals[name](component)
+        violators, count = call(name)
         triples.append((violators, count, name))
     return triples
 
@@ -966,9 +1233,13 @@ def tabulate_wellformedness(
     check_unmatched_stop_text_spans: bool = True,
     check_unterminated_hairpins: bool = True,
     check_unterminated_text_spanners: bool = True,
+    cache: bool = None,
+    workers: int = None,
 ) -> str:
     """
     Tabulates wellformedness.
+
+    Takes ``cache`` and ``workers`` like ``abjad.wf.wellformed()``.
     """
     triples = _call_functions(
         component,
@@ -982,6 +1253,8 @@ def tabulate_wellformedness(
         check_unmatched_stop_text_spans=check_unmatched_stop_text_spans,
         check_unterminated_hairpins=check_unterminated_hairpins,
         check_unterminated_text_spanners=check_unterminated_text_spanners,
+        cache=cache,
+        workers=workers,
     )
     strings = []
     for violators, total, name in triples:
@@ -1005,9 +1278,21 @@ def wellformed(
     check_unmatched_stop_text_spans: bool = True,
     check_unterminated_hairpins: bool = True,
     check_unterminated_text_spanners: bool = True,
+    cache: bool = None,
+    workers: int = None,
 ) -> bool:
     """
     Is true when ``component`` is wellformed.
+
+    Caches the results of leaf checks (beamed long notes, notes on wrong
+    clef, out of range pitches) on each top-level component of ``component``,
+    like the staves of a score, when ``cache`` is true. Later calls with
+    ``cache`` set to true recheck only those top-level components changed (or
+    attached to) since the last call.
+
+    Runs leaf checks of top-level components in a pool of ``workers``
+    processes when ``workers`` is greater than 1. Results are identical to
+    serial checking.
     """
     triples = _call_functions(
         component,
@@ -1021,6 +1306,8 @@ def wellformed(
         check_unmatched_stop_text_spans=check_unmatched_stop_text_spans,
         check_unterminated_hairpins=check_unterminated_hairpins,
         check_unterminated_text_spanners=check_unterminated_text_spanners,
+        cache=cache,
+        workers=workers,
     )
     for violators, total, name in triples:
         if violators:
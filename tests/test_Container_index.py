@@ -12,3 +12,28 @@ def test_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_Container_index_02():
+    """
+    Indices stay current after leaves are selected and container changes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    leaves = abjad.select(staff).leaves()
+    assert staff._order_index is not None
+    assert [staff.index(_) for _ in leaves] == [0, 1, 2, 3]
+
+    staff.insert(1, abjad.Note("cs'4"))
+    assert staff._order_index is None
+    assert staff.index(leaves[1]) == 2
+
+    leaves = abjad.select(staff).leaves()
+    del staff[0]
+    assert [staff.index(_) for _ in leaves[1:]] == [0, 1, 2, 3]
+
+    leaves = abjad.select(staff).leaves()
+    container = abjad.BeforeGraceContainer("b16")
+    abjad.attach(container, staff[0])
+    assert staff._order_index is None
+    assert abjad.select(staff).leaves() == [container[0]] + list(leaves)
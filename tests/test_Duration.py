@@ -0,0 +1,85 @@
+import quicktions
+import pytest
+
+import abjad
+
+
+@pytest.mark.parametrize(
+    "argument",
+    [
+        3,
+        quicktions.Fraction(3, 16),
+        abjad.Duration(3, 16),
+        abjad.Multiplier(3, 16),
+        abjad.Offset(3, 16),
+        abjad.Offset((3, 16), displacement=(-1, 16)),
+    ],
+)
+def test_Duration_01(argument):
+    """
+    Initializes from integers and fractions.
+    """
+
+    duration = abjad.Duration(argument)
+    assert type(duration) is abjad.Duration
+    assert duration == quicktions.Fraction(argument)
+
+
+def test_Duration_02():
+    """
+    Arithmetic returns instances of the left operand's class.
+    """
+
+    duration = abjad.Duration(3, 16)
+    multiplier = abjad.Multiplier(2, 3)
+    offset = abjad.Offset(5, 8)
+
+    assert type(duration + duration) is abjad.Duration
+    assert type(duration * multiplier) is abjad.Duration
+    assert type(multiplier * duration) is abjad.Duration
+    assert type(multiplier * multiplier) is abjad.Multiplier
+    assert type(duration / duration) is abjad.Multiplier
+    assert type(offset + duration) is abjad.Offset
+    assert type(offset - duration) is abjad.Offset
+    assert type(offset - offset) is abjad.Duration
+    assert sum([duration, duration]) == abjad.Duration(3, 8)
+    assert offset - offset == 0
+
+
+def test_Duration_03():
+    """
+    Offsets keep displacement.
+    """
+
+    offset = abjad.Offset((1, 4), displacement=(-1, 16))
+    assert abjad.Offset(offset).displacement == abjad.Duration(-1, 16)
+    assert abjad.Offset(offset) == offset
+    assert abjad.Offset(1, 4) != offset
+
+
+@pytest.mark.parametrize(
+    "pair, string",
+    [
+        ((1, 16), "16"),
+        ((3, 16), "8."),
+        ((7, 16), "4.."),
+        ((2, 1), r"\breve"),
+        ((3, 1), r"\breve."),
+        ((15, 1), r"\maxima..."),
+        ((5, 16), None),
+        ((1, 3), None),
+        ((16, 1), None),
+    ],
+)
+def test_Duration_04(pair, string):
+    """
+    Gets LilyPond duration strings of assignable durations.
+    """
+
+    duration = abjad.Duration(pair)
+    assert duration.is_assignable is (string is not None)
+    if string is None:
+        with pytest.raises(abjad.AssignabilityError):
+            duration.lilypond_duration_string
+    else:
+        assert duration.lilypond_duration_string == string
@@ -0,0 +1,75 @@
+import pytest
+
+import abjad
+
+pitches = [0, None, 13.5, "Eb3", None, 2, 2, 4, None, abjad.NamedPitch("g'")]
+numerators = [1, 5, 3, 9, 1, 1, 2, 15, 7, 1]
+denominators = [4, 16, 8, 16, 12, 6, 12, 16, 32, 1]
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        {},
+        {"forbidden_note_duration": (1, 4)},
+        {"forbidden_rest_duration": (1, 2)},
+        {"increase_monotonic": True},
+        {"skips_instead_of_rests": True},
+        {"use_multimeasure_rests": True},
+        {"tag": abjad.Tag("leaf_maker")},
+    ],
+)
+def test_LeafMaker_batch_01(keywords):
+    """
+    Batch output equals call output.
+    """
+
+    maker = abjad.LeafMaker(**keywords)
+    durations = list(zip(numerators, denominators))
+    target = abjad.Staff(maker(pitches, durations))
+    staff = abjad.Staff(maker.batch(pitches, numerators, denominators))
+    assert abjad.lilypond(staff) == abjad.lilypond(target)
+    assert abjad.wf.wellformed(staff)
+
+
+def test_LeafMaker_batch_02():
+    """
+    Ties notes to following notes; ignores ties into rests.
+    """
+
+    maker = abjad.LeafMaker()
+    staff = abjad.Staff(
+        maker.batch(
+            [0, 0, 2, None],
+            [5, 1, 1, 1],
+            [8, 8, 4, 4],
+            ties=[True, True, True, False],
+        )
+    )
+
+    assert abjad.lilypond(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'2
+            ~
+            c'8
+            ~
+            c'8
+            ~
+            d'4
+            r4
+        }
+        """
+    )
+    assert abjad.wf.wellformed(staff)
+
+
+def test_LeafMaker_batch_03():
+    """
+    Raises value error on unknown pitch.
+    """
+
+    maker = abjad.LeafMaker()
+    with pytest.raises(ValueError):
+        maker.batch([0, [0, 4, 7]], [1, 1], [4, 4])
@@ -68,3 +68,39 @@ def test_Meter___init___09():
         abjad.Meter(time_signature).rtm_format
         == "(11/4 ((3/4 (1/4 1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4))))"
     )
+
+
+def test_Meter___init___10():
+    """
+    Meters with the same pair share one tree and its derived values.
+    """
+
+    meter_1 = abjad.Meter((7, 8))
+    meter_2 = abjad.Meter(abjad.TimeSignature((7, 8)), preferred_boundary_depth=1)
+    meter_3 = abjad.Meter((7, 8), increase_monotonic=True)
+    assert meter_1 is not meter_2
+    assert meter_1.root_node is meter_2.root_node
+    assert meter_1.preferred_boundary_depth is None
+    assert meter_2.preferred_boundary_depth == 1
+    assert meter_1.depthwise_offset_inventory is meter_2.depthwise_offset_inventory
+    kernel_1 = meter_1.generate_offset_kernel_to_denominator(32)
+    assert kernel_1 is meter_2.generate_offset_kernel_to_denominator(32)
+    assert meter_1.root_node is not meter_3.root_node
+    assert meter_3.increase_monotonic is True
+    assert (
+        meter_3.rtm_format
+        == "(7/8 ((2/8 (1/8 1/8)) (2/8 (1/8 1/8)) (3/8 (1/8 1/8 1/8))))"
+    )
+
+
+def test_Meter___init___11():
+    """
+    Meters parsed from the same RTM string share one tree.
+    """
+
+    rtm = "(4/4 ((2/4 (1/4 1/4)) (2/4 (1/4 1/4))))"
+    meter_1 = abjad.Meter(rtm)
+    meter_2 = abjad.Meter(rtm)
+    assert meter_1.root_node is meter_2.root_node
+    assert meter_1.rtm_format == meter_2.rtm_format == rtm
+    assert meter_1.root_node is not abjad.Meter((4, 4)).root_node
@@ -0,0 +1,120 @@
+import itertools
+import random
+
+import abjad
+
+
+def _get_exact_score(session, meters):
+    # scores without integer weight arrays: kernel weights over downbeat weight
+    rtm_format_to_kernel = {_.rtm_format: k for k, _ in session.kernels.items()}
+    score, offset = 0, abjad.Offset(0)
+    for i, meter in enumerate(meters):
+        kernel = rtm_format_to_kernel[meter.rtm_format]
+        downbeat_weight = kernel.kernel[abjad.Offset(0)]
+        for offset_, weight in kernel.kernel.items():
+            if offset_ == kernel.duration and i < len(meters) - 1:
+                continue
+            count = session.offset_counter.get(offset + offset_, 0)
+            score += abjad.Multiplier(weight) / downbeat_weight * count
+        offset += kernel.duration
+    return score
+
+
+def _brute_force_score(offsets, meters, maximum_run_length=None):
+    session = abjad.meter._MeterFittingSession(
+        maximum_run_length=maximum_run_length,
+        meters=meters,
+        offset_counter=offsets,
+        optimal=True,
+    )
+    stop_offset = max(abjad.Offset(_) for _ in offsets)
+    shortest_duration = min(_.duration for _ in session.meters)
+    best_score = None
+    for count in range(1, int(stop_offset / shortest_duration) + 2):
+        for meters_ in itertools.product(session.meters, repeat=count):
+            start_offsets = abjad.math.cumulative_sums([_.duration for _ in meters_])
+            if start_offsets[-2] >= stop_offset or start_offsets[-1] < stop_offset:
+                continue
+            if maximum_run_length is not None:
+                rtm_formats = [_.rtm_format for _ in meters_]
+                runs = [len(list(_)) for _, _ in itertools.groupby(rtm_formats)]
+                if maximum_run_length < max(runs):
+                    continue
+            score = _get_exact_score(session, meters_)
+            if best_score is None or best_score < score:
+                best_score = score
+    return best_score
+
+
+def test_Meter_fit_meters_01():
+    """
+    Optimal fit matches exhaustive search.
+    """
+
+    random.seed(0)
+    meters = [(2, 4), (3, 4), (5, 8)]
+    for _ in range(5):
+        offsets = sorted(set(random.randrange(0, 24) for _ in range(6)))
+        offsets = [(_, 8) for _ in offsets]
+        result, scores = abjad.Meter.fit_meters(
+            offsets, meters, optimal=True, report=True
+        )
+        assert sum(_.score for _ in scores) == _brute_force_score(offsets, meters)
+
+
+def test_Meter_fit_meters_02():
+    """
+    Optimal fit honors maximum run length.
+    """
+
+    offsets = [(_, 4) for _ in range(0, 40, 4)]
+    meters = [(3, 4), (4, 4)]
+    result = abjad.Meter.fit_meters(offsets, meters, optimal=True)
+    assert [str(_.implied_time_signature) for _ in result] == 9 * ["4/4"]
+    result, scores = abjad.Meter.fit_meters(
+        offsets[:4], meters, maximum_run_length=2, optimal=True, report=True
+    )
+    signatures = [str(_.implied_time_signature) for _ in result]
+    assert "4/4" in signatures and "3/4" in signatures
+    assert 2 == max(len(list(_)) for _, _ in itertools.groupby(signatures))
+    assert sum(_.score for _ in scores) == _brute_force_score(
+        offsets[:4], meters, maximum_run_length=2
+    )
+
+
+def test_Meter_fit_meters_03():
+    """
+    Optimal fit reads offsets from components and ignores offsets off the
+    kernel grid.
+    """
+
+    staff = abjad.Staff(r"c'4 d'4 e'4 \times 2/3 { f'4 g'4 a'4 } b'2.")
+    result = abjad.Meter.fit_meters(
+        staff[:], [(3, 4), (4, 4)], denominator=8, optimal=True
+    )
+    assert [str(_.implied_time_signature) for _ in result] == ["3/4", "3/4", "3/4"]
+
+
+def test_Meter_fit_meters_04():
+    """
+    Optimal fit of no offsets is empty.
+    """
+
+    assert abjad.Meter.fit_meters([], [(4, 4)], optimal=True) == abjad.MeterList()
+
+
+def test_Meter_fit_meters_05():
+    """
+    Optimal fit matches exhaustive search with exact kernel weights when
+    weight ratios differ in denominator across meters.
+    """
+
+    random.seed(1)
+    meters = [(3, 4), (3, 8), (5, 8), (7, 8)]
+    for _ in range(5):
+        offsets = sorted(set(random.randrange(0, 16) for _ in range(6)))
+        offsets = [(_, 8) for _ in offsets]
+        result, scores = abjad.Meter.fit_meters(
+            offsets, meters, optimal=True, report=True
+        )
+        assert sum(_.score for _ in scores) == _brute_force_score(offsets, meters)
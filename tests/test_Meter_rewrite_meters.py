@@ -0,0 +1,64 @@
+import random
+
+import abjad
+
+
+def _make_measure_strings(pairs):
+    random.seed(0)
+    strings = [
+        "c'16 d'8.",
+        "e'8. ~ e'16",
+        "r16 r8 f'16 ~",
+        "f'16 ~ f'8.",
+        r"\times 2/3 { g'8 ~ g'8 a'8 }",
+    ]
+    measure_strings = []
+    for pair in pairs:
+        sixteenths = 16 * pair[0] // pair[1]
+        string = " ".join(random.choice(strings) for _ in range(sixteenths // 4))
+        string += " c'16" * (sixteenths % 4)
+        measure_strings.append(string)
+    return measure_strings
+
+
+def test_Meter_rewrite_meters_01():
+    """
+    Rewrites measure containers exactly as per-measure calls do.
+    """
+
+    pairs = [(3, 4), (4, 4), (6, 8), (5, 8), (7, 8), (4, 4)]
+    string = " ".join(f"{{ {_} }}" for _ in _make_measure_strings(pairs))
+    meters = abjad.MeterList(pairs)
+    for keywords in (
+        {},
+        {"boundary_depth": 1},
+        {"maximum_dot_count": 0},
+        {"rewrite_tuplets": False},
+    ):
+        staff_1 = abjad.Staff(string)
+        for container, meter in zip(staff_1, meters):
+            abjad.Meter.rewrite_meter(container[:], meter, **keywords)
+        staff_2 = abjad.Staff(string)
+        abjad.Meter.rewrite_meters(staff_2[:], meters, **keywords)
+        assert abjad.lilypond(staff_1) == abjad.lilypond(staff_2)
+        assert abjad.wf.wellformed(staff_2)
+
+
+def test_Meter_rewrite_meters_02():
+    """
+    Rewrites runs of components in a flat staff exactly as per-measure calls
+    do.
+    """
+
+    pairs = [(3, 4), (4, 4), (6, 8), (5, 8)]
+    measure_strings = _make_measure_strings(pairs)
+    meters = abjad.MeterList(pairs)
+    staff_1 = abjad.Staff()
+    for measure_string, meter in zip(measure_strings, meters):
+        container = abjad.Container(measure_string)
+        abjad.Meter.rewrite_meter(container[:], meter)
+        staff_1.extend(abjad.mutate.eject_contents(container))
+    staff_2 = abjad.Staff(" ".join(measure_strings))
+    abjad.Meter.rewrite_meters(staff_2[:], meters)
+    assert abjad.lilypond(staff_1) == abjad.lilypond(staff_2)
+    assert abjad.wf.wellformed(staff_2)
@@ -47,3 +47,17 @@ def test_init(input_, expected_semitones):
         return
     instance = abjad.NamedPitch(input_)
     assert float(instance) == expected_semitones
+
+
+@pytest.mark.parametrize("input_", ["cs''", "cqf,", 13, 13.5, "c'"])
+def test_init_cached(input_):
+    pitch_1 = abjad.NamedPitch(input_)
+    pitch_2 = abjad.NamedPitch(input_)
+    pitch_3 = abjad.NamedPitch(input_, arrow=abjad.Up)
+    assert pitch_1 is not pitch_2
+    assert pitch_1 == pitch_2
+    assert hash(pitch_1) == hash(pitch_2)
+    assert pitch_1 != pitch_3
+    assert pitch_3.arrow is abjad.Up
+    assert pitch_1.name == pitch_3.name
+    assert pitch_1.number == pitch_3.number
@@ -0,0 +1,50 @@
+import abjad
+
+
+def test_Parentage_prolation_01():
+    """
+    Cached prolation updates when tuplet multiplier changes.
+    """
+
+    staff = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 }")
+    tuplet = staff[0]
+    note = tuplet[0]
+
+    assert abjad.get.parentage(note).prolation == abjad.Multiplier(2, 3)
+    assert abjad.get.duration(note) == abjad.Duration(1, 12)
+
+    tuplet.multiplier = (4, 5)
+
+    assert abjad.get.parentage(note).prolation == abjad.Multiplier(4, 5)
+    assert abjad.get.duration(note) == abjad.Duration(1, 10)
+
+
+def test_Parentage_prolation_02():
+    """
+    Cached parentage and prolation update when components move.
+    """
+
+    staff = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 } f'8")
+    tuplet = staff[0]
+    note = staff[-1]
+    container = abjad.BeforeGraceContainer("cs'16")
+    abjad.attach(container, note)
+
+    assert abjad.get.parentage(container[0])[:] == (container[0], container, staff)
+    assert abjad.get.parentage(container[0]).prolation == 1
+
+    tuplet.append(note)
+
+    assert abjad.get.parentage(note)[:] == (note, tuplet, staff)
+    assert abjad.get.parentage(container[0])[:] == (
+        container[0],
+        container,
+        tuplet,
+        staff,
+    )
+    assert abjad.get.parentage(container[0]).prolation == abjad.Multiplier(2, 3)
+
+    abjad.detach(container, note)
+
+    assert abjad.get.parentage(container[0])[:] == (container[0], container)
+    assert abjad.get.parentage(container[0]).prolation == 1
@@ -0,0 +1,67 @@
+import importlib
+import importlib.util
+
+import pytest
+
+import abjad
+from abjad.parsers.parser import LilyPondParser
+from abjad.parsers.reduced import ReducedLyParser
+from abjad.parsers.scheme import SchemeParser
+
+parsers = [
+    LilyPondParser,
+    ReducedLyParser,
+    SchemeParser,
+    abjad.rhythmtrees.RhythmTreeParser,
+]
+
+
+def _load_module(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _get_tables(module):
+    tables = {k: v for k, v in vars(module).items() if k.startswith("_l")}
+    # ignore source file line numbers of grammar rules:
+    if "_lr_productions" in tables:
+        tables["_lr_productions"] = [_[:4] for _ in tables["_lr_productions"]]
+    return tables
+
+
+@pytest.mark.parametrize("parser_class", parsers)
+def test_Parser__tables_01(parser_class, tmp_path):
+    """
+    Packaged parser tables are current; rerun scr/prime-parser-tables if not.
+    """
+
+    parser = parser_class()
+    parser._write_tables(tmp_path)
+    for name in parser._get_table_module_names():
+        packaged = importlib.import_module(name)
+        current = _load_module(tmp_path / f"{name.split('.')[-1]}.py")
+        assert _get_tables(packaged) == _get_tables(current)
+
+
+def test_Parser__tables_02():
+    """
+    Shared parsers parse valid input after a failed parse.
+    """
+
+    with pytest.raises(Exception):
+        abjad.parse(r'\new Staff \with { instrumentName = #"Flute }')
+    string = r"""\new Staff { \set Staff.instrumentName = #"Flute" c'4 }"""
+    assert abjad.lilypond(abjad.parse(string)) == abjad.lilypond(
+        LilyPondParser()(string)
+    )
+    scheme_parser = SchemeParser._get_shared_parser()
+    with pytest.raises(Exception):
+        scheme_parser('"unterminated')
+    with pytest.raises(abjad.exceptions.SchemeParserFinishedError):
+        scheme_parser("(a b c)")
+    fresh_scheme_parser = SchemeParser()
+    with pytest.raises(abjad.exceptions.SchemeParserFinishedError):
+        fresh_scheme_parser("(a b c)")
+    assert scheme_parser.result == fresh_scheme_parser.result
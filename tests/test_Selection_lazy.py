@@ -0,0 +1,42 @@
+import abjad
+
+
+def test_Selection_lazy_01():
+    """
+    Lazy selections equal eager selections.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 r8 e'8 } r16 f'16 g'8 a'4 ~ a'8")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    eager = abjad.select(staff)
+    lazy = abjad.select(staff, lazy=True)
+
+    for selector in (
+        lambda _: _.leaves(pitched=True).logical_ties(),
+        lambda _: _.leaves(trim=True)[1:-1],
+        lambda _: _.components(reverse=True)[::2],
+        lambda _: _.leaves().group_by_measure().flatten(),
+        lambda _: _.leaves().partition_by_counts([2], cyclic=True),
+        lambda _: _.runs(),
+    ):
+        assert selector(lazy) == selector(eager)
+        assert repr(selector(lazy)) == repr(selector(eager))
+        assert hash(selector(lazy)) == hash(selector(eager))
+
+
+def test_Selection_lazy_02():
+    """
+    Lazy selections materialize once, on first use.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    selection = abjad.select(staff, lazy=True).leaves()[:2]
+    staff.append("g'4")
+    staff.pop(0)
+
+    assert selection.items == (staff[0], staff[1])
+
+    staff.pop(0)
+
+    assert len(selection) == 2
+    assert selection[0] not in staff
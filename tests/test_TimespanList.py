@@ -0,0 +1,118 @@
+import abjad
+
+
+def test_TimespanList_01():
+    """
+    Logical OR keeps annotations and timespan classes.
+    """
+
+    timespans = abjad.TimespanList(
+        [
+            abjad.AnnotatedTimespan((1, 2), 4, annotation="a"),
+            abjad.AnnotatedTimespan(2, 6, annotation="b"),
+            abjad.Timespan(6, 8),
+            abjad.Timespan(7, 9),
+        ]
+    )
+    timespans.compute_logical_or()
+
+    assert [_.offsets for _ in timespans] == [
+        (abjad.Offset(1, 2), abjad.Offset(6)),
+        (abjad.Offset(6), abjad.Offset(9)),
+    ]
+    assert timespans[0].annotation == "a"
+    assert type(timespans[1]) is abjad.Timespan
+
+
+def test_TimespanList_02():
+    """
+    Logical OR folds unsorted timespans in list order.
+    """
+
+    timespans = abjad.TimespanList(
+        [abjad.Timespan(10, 20), abjad.Timespan(0, 2), abjad.Timespan(1, 11)]
+    )
+    timespans.compute_logical_or()
+
+    assert timespans == abjad.TimespanList(
+        [abjad.Timespan(10, 20), abjad.Timespan(0, 11)]
+    )
+
+
+def test_TimespanList_03():
+    """
+    Logical XOR cuts annotated timespans into annotated fragments.
+    """
+
+    timespans = abjad.TimespanList(
+        [
+            abjad.AnnotatedTimespan(0, 10, annotation="a"),
+            abjad.Timespan((5, 3), 12),
+            abjad.Timespan((5, 3), 12),
+            abjad.Timespan(11, 14),
+        ]
+    )
+    timespans.compute_logical_xor()
+
+    assert [_.offsets for _ in timespans] == [
+        (abjad.Offset(0), abjad.Offset(5, 3)),
+        (abjad.Offset(12), abjad.Offset(14)),
+    ]
+    assert timespans[0].annotation == "a"
+
+
+def test_TimespanList_04():
+    """
+    Works with infinite timespans.
+    """
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 10), abjad.Timespan(5)])
+
+    assert len(timespans.partition()) == 1
+    timespans.compute_logical_and()
+    assert timespans == abjad.TimespanList([abjad.Timespan(5, 10)])
+
+
+def test_TimespanList_05():
+    """
+    Explodes timespans into nonoverlapping lists.
+    """
+
+    timespans = abjad.TimespanList(
+        [
+            abjad.Timespan(0, 4),
+            abjad.Timespan(2, 6),
+            abjad.Timespan(4, 8),
+            abjad.Timespan(3, 5),
+        ]
+    )
+    timespan_lists = timespans.explode()
+
+    assert timespan_lists == (
+        abjad.TimespanList([abjad.Timespan(0, 4), abjad.Timespan(4, 8)]),
+        abjad.TimespanList([abjad.Timespan(2, 6)]),
+        abjad.TimespanList([abjad.Timespan(3, 5)]),
+    )
+    for timespan_list in timespan_lists:
+        assert timespan_list.all_are_nonoverlapping
+
+
+def test_TimespanList_06():
+    """
+    Time-relation queries see mutations made after earlier queries.
+    """
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 4), abjad.Timespan(6, 8)])
+    relation = abjad.timespan().intersects_timespan(abjad.Timespan(3, 7))
+    result = timespans.get_timespans_that_satisfy_time_relation(relation)
+    assert result == abjad.TimespanList([abjad.Timespan(0, 4), abjad.Timespan(6, 8)])
+
+    timespans.append(abjad.Timespan(5, 5))
+    timespans.insert(0, abjad.Timespan(7, 9))
+    del timespans[1]
+    result = timespans.get_timespans_that_satisfy_time_relation(relation)
+    assert result == abjad.TimespanList([abjad.Timespan(6, 8), abjad.Timespan(5, 5)])
+
+    timespans.sort()
+    result = timespans.get_timespans_that_satisfy_time_relation(relation)
+    assert result == abjad.TimespanList([abjad.Timespan(5, 5), abjad.Timespan(6, 8)])
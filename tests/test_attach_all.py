@@ -0,0 +1,80 @@
+import pytest
+
+import abjad
+
+
+def test_attach_all_01():
+    """
+    Attaches like one call to abjad.attach() per pair.
+    """
+
+    staff = abjad.Staff("c'4 d' e' f' g' a' b' c''")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 3]
+
+    pairs = [
+        (abjad.Clef("bass"), staff[0]),
+        (abjad.Dynamic("p"), staff[0]),
+        (abjad.Clef("treble"), staff[4]),
+        (abjad.TimeSignature((1, 4)), staff[6]),
+        (abjad.Dynamic("f"), staff[6]),
+    ]
+    abjad.attach_all(pairs)
+
+    assert abjad.get.effective(staff[3], abjad.Clef) == abjad.Clef("bass")
+    assert abjad.get.effective(staff[5], abjad.Clef) == abjad.Clef("treble")
+    assert abjad.get.effective(staff[6], abjad.Dynamic) == abjad.Dynamic("f")
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 4]
+    wrappers = [abjad.get.wrapper(_, abjad.Clef) for _ in (staff[0], staff[4])]
+    assert [_ for _ in staff._dependent_wrappers if _ in wrappers] == wrappers
+    assert abjad.wf.wellformed(staff)
+
+
+def test_attach_all_02():
+    """
+    Raises persistent indicator error on duplicate contexted indicator.
+    """
+
+    staff = abjad.Staff("c'4 d' e' f'")
+    abjad.attach(abjad.Clef("alto"), staff[2])
+    pairs = [
+        (abjad.Clef("bass"), staff[0]),
+        (abjad.Clef("treble"), staff[2]),
+        (abjad.Articulation("."), staff[3]),
+    ]
+
+    with pytest.raises(abjad.PersistentIndicatorError):
+        abjad.attach_all(pairs)
+
+    assert abjad.get.indicators(staff[0]) == [abjad.Clef("bass")]
+    assert abjad.get.indicators(staff[2]) == [abjad.Clef("alto")]
+    assert abjad.get.indicators(staff[3]) == []
+    assert len(staff._dependent_wrappers) == 2
+
+    pairs = [(abjad.Clef("treble"), staff[2])]
+    abjad.attach_all(pairs, deactivate=True, tag=abjad.Tag("+PARTS"))
+
+    assert len(abjad.get.indicators(staff[2])) == 2
+
+
+def test_attach_all_03():
+    """
+    Checks duplicate contexted indicators like abjad.attach() when context is
+    overridden.
+    """
+
+    voice = abjad.Voice("c'4 d' e' f'", name="Voice")
+    staff = abjad.Staff([voice], name="Staff")
+    score = abjad.Score([staff], name="Score")
+    abjad.attach(abjad.MetronomeMark((1, 4), 90), voice[0])
+
+    with pytest.raises(abjad.PersistentIndicatorError):
+        abjad.attach(abjad.MetronomeMark((1, 4), 60), voice[0], context="Voice")
+    with pytest.raises(abjad.PersistentIndicatorError):
+        abjad.attach_all([(abjad.MetronomeMark((1, 4), 60), voice[0])], context="Voice")
+
+    assert abjad.get.indicators(voice[0]) == [abjad.MetronomeMark((1, 4), 90)]
+    assert len(score._dependent_wrappers) == 1
+    assert voice._dependent_wrappers == []
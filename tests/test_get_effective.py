@@ -0,0 +1,53 @@
+import abjad
+
+
+def test_get_effective_01():
+    """
+    Effective indicator updates when indicators attach and detach.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("alto"), staff[0])
+    abjad.attach(abjad.Clef("bass"), staff[2])
+    clefs = [abjad.get.effective(_, abjad.Clef) for _ in staff]
+    assert clefs == [abjad.Clef("alto")] * 2 + [abjad.Clef("bass")] * 2
+
+    abjad.attach(abjad.Clef("treble"), staff[1])
+    clefs = [abjad.get.effective(_, abjad.Clef) for _ in staff]
+    assert clefs[1] == abjad.Clef("treble")
+
+    abjad.detach(abjad.Clef, staff[2])
+    clefs = [abjad.get.effective(_, abjad.Clef) for _ in staff]
+    assert clefs == [abjad.Clef("alto")] + [abjad.Clef("treble")] * 3
+
+
+def test_get_effective_02():
+    """
+    Effective indicator updates when offsets change.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("bass"), staff[2])
+    assert abjad.get.effective(staff[1], abjad.Clef) is None
+
+    staff.insert(0, abjad.Note("c'8"))
+    abjad.attach(abjad.Clef("alto"), staff[1])
+    assert abjad.get.effective(staff[1], abjad.Clef) == abjad.Clef("alto")
+    assert abjad.get.effective(staff[2], abjad.Clef) == abjad.Clef("alto")
+    assert abjad.get.effective(staff[3], abjad.Clef) == abjad.Clef("bass")
+
+
+def test_get_effective_03():
+    """
+    Detaching indicator leaves equal indicator attached elsewhere effective.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    abjad.attach(abjad.Clef("treble"), staff[1])
+    abjad.attach(abjad.Clef("bass"), staff[2])
+    assert abjad.get.effective(staff[3], abjad.Clef) == abjad.Clef("bass")
+
+    abjad.detach(abjad.Clef, staff[2])
+    assert abjad.get.effective(staff[0], abjad.Clef) == abjad.Clef("bass")
+    assert abjad.get.effective(staff[3], abjad.Clef) == abjad.Clef("treble")
@@ -0,0 +1,39 @@
+import abjad
+
+
+def test_get_measure_number_01():
+    """
+    Measure numbers update when time signatures attach and detach.
+    """
+
+    staff = abjad.Staff("c'4 d' e' f' g' a' b' c''")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 3]
+
+    abjad.attach(abjad.TimeSignature((1, 4)), staff[6])
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 4]
+
+    abjad.detach(abjad.TimeSignature, staff[6])
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 3]
+
+
+def test_get_measure_number_02():
+    """
+    Measure numbers update when offsets change.
+    """
+
+    staff = abjad.Staff("c'4 d' e' f' g' a' b' c''")
+    abjad.attach(abjad.TimeSignature((2, 4)), staff[0])
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 2, 2, 3, 3, 4, 4]
+
+    staff.insert(1, abjad.Note("c'2"))
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 2, 3, 3, 4, 4, 5, 5]
+
+    staff[1].written_duration = abjad.Duration(1, 4)
+    numbers = [abjad.get.measure_number(_) for _ in staff]
+    assert numbers == [1, 1, 2, 2, 3, 3, 4, 4, 5]
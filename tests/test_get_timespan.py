@@ -355,3 +355,113 @@ def test_get_timespan_26():
     assert start_offset == abjad.Offset(0)
     start_offset = abjad.get.timespan(staff[1], in_seconds=True).start_offset
     assert start_offset == abjad.Offset(5, 4)
+
+
+def test_get_timespan_27():
+    """
+    Offsets update incrementally after mutation.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    voice = abjad.Voice("g'4 a'4")
+    staff.insert(2, voice)
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(7, 8)
+
+    staff[0].written_duration = abjad.Duration(1, 4)
+    del voice[-1]
+    assert abjad.get.timespan(staff[1]).start_offset == abjad.Offset(1, 4)
+    assert abjad.get.timespan(voice).stop_offset == abjad.Offset(5, 8)
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(3, 4)
+    assert abjad.get.timespan(staff).stop_offset == abjad.Offset(7, 8)
+
+    abjad.mutate.split(staff[-1], [abjad.Duration(1, 16)])
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(13, 16)
+
+
+def test_get_timespan_28():
+    """
+    Offsets update in full when root turns off incremental offsets.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    staff._incremental_offsets = False
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(3, 8)
+
+    staff.insert(0, abjad.Note("c'4"))
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(5, 8)
+    assert staff._dirty_offset_positions == []
+
+
+def test_get_timespan_29():
+    """
+    Offset seconds update when offsets change and when metronome marks attach
+    and detach.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4")
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    timespan = abjad.get.timespan(staff[-1], in_seconds=True)
+    assert timespan == abjad.Timespan(2, 3)
+
+    staff.insert(1, abjad.Note("c'2"))
+    timespan = abjad.get.timespan(staff[-1], in_seconds=True)
+    assert timespan == abjad.Timespan(4, 5)
+
+    abjad.attach(abjad.MetronomeMark((1, 4), 120), staff[1])
+    timespan = abjad.get.timespan(staff[-1], in_seconds=True)
+    assert timespan == abjad.Timespan(abjad.Offset(5, 2), 3)
+
+    abjad.detach(abjad.MetronomeMark, staff[1])
+    timespan = abjad.get.timespan(staff[-1], in_seconds=True)
+    assert timespan == abjad.Timespan(4, 5)
+
+    abjad.detach(abjad.MetronomeMark, staff[0])
+    with pytest.raises(abjad.MissingMetronomeMarkError):
+        abjad.get.timespan(staff[-1], in_seconds=True)
+
+
+def test_get_timespan_30():
+    """
+    Score-initial grace music takes clocktime of the first metronome mark.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    container = abjad.BeforeGraceContainer("g'16 a'16")
+    abjad.attach(container, staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 4), 30), staff[2])
+
+    for leaf in container:
+        timespan = abjad.get.timespan(leaf, in_seconds=True)
+        assert timespan == abjad.Timespan(0, 0)
+    timespan = abjad.get.timespan(staff[-1], in_seconds=True)
+    assert timespan == abjad.Timespan(4, 6)
+
+
+def test_get_timespan_31():
+    """
+    Offsets update incrementally without reiterating score until structural
+    change. Grace music updates when it follows mutation.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    container = abjad.BeforeGraceContainer("g'16")
+    abjad.attach(container, staff[0])
+    after_grace_container = abjad.AfterGraceContainer("a'16")
+    abjad.attach(after_grace_container, staff[2])
+    staff[1].written_duration = abjad.Duration(1, 4)
+    timespan = abjad.get.timespan(after_grace_container[0])
+    assert timespan.stop_offset == abjad.Offset(1, 2)
+    offset_index = staff._offset_index
+    assert offset_index is not None
+
+    staff[1].written_duration = abjad.Duration(1, 2)
+    timespan = abjad.get.timespan(after_grace_container[0])
+    assert timespan.stop_offset == abjad.Offset(3, 4)
+    timespan = abjad.get.timespan(container[0])
+    assert timespan.stop_offset == abjad.Offset(0)
+    assert staff._offset_index is offset_index
+
+    staff.append("g'8")
+    assert staff._offset_index is None
+    assert abjad.get.timespan(staff[-1]).start_offset == abjad.Offset(7, 8)
@@ -23,3 +23,17 @@ def test_io_count_function_calls_02():
         "abjad.Note(-12, (1, 4))", global_context=globals()
     )
     assert result < 400
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="Benchmarking is only for CPython.",
+)
+def test_io_count_function_calls_03():
+    staff = abjad.Staff(100 * "c'8 ")
+    result = abjad.io.count_function_calls(
+        "list(abjad.iterate(staff).leaves())",
+        global_context=globals(),
+        local_context=locals(),
+    )
+    assert result < 1000
@@ -0,0 +1,51 @@
+import abjad
+
+
+def test_iterate_components_01():
+    """
+    Iterates containers nested more deeply than the recursion limit.
+    """
+
+    container = abjad.Container("c'4")
+    for i in range(2000):
+        container = abjad.Container([container])
+
+    components = list(abjad.iterate(container).components())
+    assert len(components) == 2002
+    assert components[0] is container
+    assert components[-1] is abjad.select(container).leaf(0)
+
+    leaves = list(abjad.iterate(container).leaves(reverse=True))
+    assert leaves == [abjad.select(container).leaf(0)]
+
+
+def test_iterate_components_02():
+    """
+    Excludes before-grace music in both directions.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4")
+    container = abjad.BeforeGraceContainer("cs'16 ds'16")
+    abjad.attach(container, voice[1])
+    abjad.attach("RED", container[0])
+    container = abjad.AfterGraceContainer("es'16 fs'16")
+    abjad.attach(container, voice[1])
+    abjad.attach("RED", container[1])
+
+    leaves = list(abjad.iterate(voice).leaves(exclude="RED"))
+    assert leaves == [
+        voice[0],
+        voice[1]._before_grace_container[1],
+        voice[1],
+        voice[1]._after_grace_container[0],
+        voice[2],
+    ]
+
+    leaves = list(abjad.iterate(voice).leaves(exclude="RED", reverse=True))
+    assert leaves == [
+        voice[2],
+        voice[1]._after_grace_container[0],
+        voice[1],
+        voice[1]._before_grace_container[1],
+        voice[0],
+    ]
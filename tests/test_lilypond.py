@@ -0,0 +1,129 @@
+import abjad
+
+
+def test_lilypond_01():
+    """
+    Formats staves in parallel identically to serial formatting.
+    """
+
+    staff_1 = abjad.Staff("c'4 d'4 e'4 f'4", name="Staff_1")
+    staff_2 = abjad.Staff("g4 a4 b4 c'4", name="Staff_2")
+    staff_3 = abjad.Staff("c4 d4 e4 f4", name="Staff_3")
+    staff_group = abjad.StaffGroup([staff_2, staff_3])
+    score = abjad.Score([staff_1, staff_group])
+    abjad.attach(abjad.TimeSignature((2, 4)), staff_1[0])
+    abjad.attach(abjad.Clef("bass"), staff_3[0])
+    abjad.attach(abjad.StartSlur(), staff_2[0])
+    abjad.attach(abjad.StopSlur(), staff_2[-1])
+
+    assert abjad.lilypond(score, workers=2) == abjad.lilypond(score)
+    assert all(_._format_cache is None for _ in score)
+    assert abjad.lilypond(score, cache=True, workers=2) == abjad.lilypond(score)
+
+    lilypond_file = abjad.LilyPondFile(items=[score], lilypond_version_token=False)
+    string = abjad.lilypond(lilypond_file, workers=2)
+    assert string == abjad.lilypond(lilypond_file)
+
+
+def test_lilypond_02():
+    """
+    Memoized format equals fresh format after score changes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    voice = abjad.Voice("g'8 a'8 b'8 c''8")
+    score = abjad.Score([staff, abjad.Staff([voice])])
+
+    def check():
+        assert abjad.lilypond(score, cache=True) == abjad.lilypond(score)
+
+    check()
+    abjad.attach(abjad.Articulation("accent"), staff[1])
+    check()
+    staff[2].written_pitch = "ef'"
+    check()
+    abjad.override(voice).note_head.color = "#red"
+    check()
+    abjad.tweak(staff[0].note_head).color = "#(x11-color 'blue)"
+    check()
+    staff.insert(1, abjad.Rest("r4"))
+    check()
+    abjad.mutate.split(voice[:], [abjad.Duration(3, 16)])
+    check()
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    check()
+    staff.name = "Upper_Staff"
+    check()
+    del voice[0]
+    check()
+    container = abjad.BeforeGraceContainer("cs'16")
+    abjad.attach(container, staff[-1])
+    check()
+    container[0].written_pitch = "d'"
+    check()
+
+
+def test_lilypond_03():
+    """
+    Uncached calls leave no memoized format behind.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.lilypond(staff)
+    assert all(_._format_cache is None for _ in staff)
+    assert staff._format_cache is None
+
+    abjad.lilypond(staff, cache=True)
+    assert all(_._format_cache is not None for _ in staff)
+    assert not staff._memoizes_format
+
+    abjad.attach(abjad.Fermata(), staff[1])
+    assert staff[1]._format_cache is None
+    assert staff._format_cache is None
+    assert staff[0]._format_cache is not None
+
+
+def test_lilypond_04():
+    """
+    Memoized format equals fresh format after engraver commands change.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    score = abjad.Score([staff])
+    abjad.lilypond(score, cache=True)
+
+    staff.remove_commands.append("Time_signature_engraver")
+    string = abjad.lilypond(score, cache=True)
+    assert r"\remove Time_signature_engraver" in string
+    assert string == abjad.lilypond(score)
+
+    staff.consists_commands.append("Horizontal_bracket_engraver")
+    string = abjad.lilypond(score, cache=True)
+    assert r"\consists Horizontal_bracket_engraver" in string
+    assert string == abjad.lilypond(score)
+
+
+def test_lilypond_05():
+    """
+    Reparenting clears memoized formats only in subtrees that hold them.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    score = abjad.Score([staff])
+    container = abjad.Container("g'4 a'4")
+    assert not container._has_caches
+
+    abjad.lilypond(score, cache=True)
+    assert score._has_caches and staff[1]._has_caches
+    abjad.attach(abjad.Fermata(), staff[0])
+    assert staff._format_cache is None
+    assert staff[1]._format_cache is not None
+
+    other_score = abjad.Score()
+    other_score.append(staff)
+    assert staff[1]._format_cache is None
+    assert not staff._has_caches and not staff[1]._has_caches
+
+    staff.append(container)
+    assert not container._has_caches
+    assert abjad.lilypond(staff, cache=True) == abjad.lilypond(staff)
@@ -582,3 +582,31 @@ def test_mutate_copy_08():
         """
     )
     assert abjad.wf.wellformed(staff)
+
+
+def test_mutate_copy_09():
+    """
+    Copies named contexts with effective contexts and named children intact.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8", name="Music_Voice")
+    staff = abjad.Staff([voice], name="Music_Staff")
+    score = abjad.Score([staff], name="Score")
+    abjad.attach(abjad.Clef("bass"), voice[0])
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), voice[0])
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), voice[1])
+
+    new_score = abjad.mutate.copy(score)
+    new_staff = new_score["Music_Staff"]
+    new_voice = new_score["Music_Voice"]
+
+    assert abjad.lilypond(new_score) == abjad.lilypond(score)
+    assert new_score._named_children.keys() == score._named_children.keys()
+    assert new_staff._named_children == {"Music_Voice": [new_voice]}
+    wrapper = abjad.get.wrapper(new_voice[0], abjad.Clef)
+    assert wrapper._effective_context is new_staff
+    assert new_staff._dependent_wrappers == [wrapper]
+    wrapper = abjad.get.wrapper(new_voice[0], abjad.MetronomeMark)
+    assert wrapper._effective_context is new_score
+    assert abjad.get.effective(new_voice[-1], abjad.Clef) == abjad.Clef("bass")
+    assert abjad.wf.wellformed(new_score)
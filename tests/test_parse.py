@@ -0,0 +1,79 @@
+import pytest
+
+import abjad
+from abjad.parsers.parse import _parse_simple_music
+
+
+@pytest.mark.parametrize(
+    "string, language",
+    [
+        ("{ }", "english"),
+        ("{c'4 d'8 e'8. f'}", "english"),
+        ("{ cs''16.. df, eqs'!? bf,,?2 }", "english"),
+        ("{ r4 s8 r c'\n\tr2. }", "english"),
+        ("{ <c' e' g'>4 <df'! f'?>8. <b,> }", "english"),
+        ("{ cis'8 des' <ees as>4 }", "nederlands"),
+        ("{ h b' es'' }", "deutsch"),
+    ],
+)
+def test_parse_01(string, language):
+    """
+    Builds simple music without the LilyPond parser; output matches the
+    LilyPond parser.
+    """
+
+    result = _parse_simple_music(string, language)
+    parser = abjad.parser.LilyPondParser(default_language=language)
+    target = parser(string)
+    assert abjad.lilypond(result) == abjad.lilypond(target)
+    result_leaves = abjad.select(result).leaves()
+    target_leaves = abjad.select(target).leaves()
+    assert [type(_) for _ in result_leaves] == [type(_) for _ in target_leaves]
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "c'4 d'4",
+        "{ c'4 } { d'4 }",
+        "<< { c'4 } >>",
+        "{ c'4~ c'4 }",
+        "{ c'4-. d'4 }",
+        "{ c'4( d'4) }",
+        "{ c'4 \\times 2/3 { d'8 e' f' } }",
+        "{ c'4*1/2 }",
+        "{ c'3 }",
+        "{ c'. }",
+        "{ c'4 % comment\n}",
+        "{ c,' }",
+        "{ c?! }",
+        "{ r' }",
+        "{ R1 }",
+        "{ <c' e'>4 q }",
+        "{ <> }",
+        "{ <c'e'> }",
+        "{ c'4d'4 }",
+        "{ x4 }",
+        "{ bd4 }",
+    ],
+)
+def test_parse_02(string):
+    """
+    Leaves everything else to the LilyPond parser.
+    """
+
+    assert _parse_simple_music(string, "english") is None
+
+
+def test_parse_03():
+    """
+    Carries durations forward like the LilyPond parser.
+    """
+
+    container = abjad.parse("{ c'8. d' r <e' g'>16 f' }")
+    durations = [_.written_duration for _ in container]
+    assert durations == [abjad.Duration(3, 16)] * 3 + [abjad.Duration(1, 16)] * 2
+
+    container = abjad.Container("c' d'2 e'")
+    durations = [_.written_duration for _ in container]
+    assert durations == [abjad.Duration(1, 4)] + [abjad.Duration(1, 2)] * 2
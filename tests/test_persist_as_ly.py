@@ -30,3 +30,31 @@ def test_persist_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist.as_ly(note, ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_persist_as_ly_03():
+    """
+    Writes LilyPond file identical to LilyPond format, with tags aligned.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 } g'2", name="Staff")
+    abjad.attach(abjad.Clef("bass"), staff[0], tag=abjad.Tag("CLEF"))
+    abjad.attach(abjad.Markup("Allegro", direction=abjad.Up), staff[0])
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), staff[-1])
+    abjad.override(staff).stem.color = "#red"
+    score = abjad.Score([staff], tag=abjad.Tag("SCORE"))
+    block = abjad.Block(name="score")
+    block.items.append(score)
+    lilypond_file = abjad.LilyPondFile(
+        comments=["comment"],
+        includes=["stylesheet.ily"],
+        items=[block, abjad.Block(name="layout")],
+        lilypond_version_token=False,
+    )
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist.as_ly(lilypond_file, ly_path, align_tags=40)
+        with open(ly_path) as file_pointer:
+            string = file_pointer.read()
+    lilypond_format = abjad.lilypond(lilypond_file)
+    assert string == abjad.LilyPondFormatManager.align_tags(lilypond_format, 40)
+    assert "%! CLEF" in string
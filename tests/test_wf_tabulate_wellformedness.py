@@ -0,0 +1,52 @@
+import abjad
+
+
+def test_wf_tabulate_wellformedness_01():
+    """
+    Tabulates the same counts as the individual checks.
+    """
+
+    voice = abjad.Voice("c'4 d'4 c,,4 <c' e'>4 r4 f'4", name="Voice")
+    staff = abjad.Staff([voice], name="Staff")
+    abjad.attach(abjad.Violin(), voice[0])
+    abjad.attach(abjad.Clef("bass"), voice[0])
+    abjad.attach(abjad.StartBeam(), voice[0])
+    abjad.attach(abjad.StopBeam(), voice[1])
+    abjad.attach(abjad.StartTextSpan(), voice[1])
+    abjad.attach(abjad.StartTextSpan(), voice[2])
+    abjad.attach(abjad.StopTextSpan(), voice[3])
+    abjad.attach(abjad.StartHairpin("<"), voice[4])
+    staff.append(abjad.Container())
+
+    strings = []
+    for name in (
+        "check_beamed_long_notes",
+        "check_duplicate_ids",
+        "check_empty_containers",
+        "check_missing_parents",
+        "check_notes_on_wrong_clef",
+        "check_out_of_range_pitches",
+        "check_overlapping_text_spanners",
+        "check_unmatched_stop_text_spans",
+        "check_unterminated_hairpins",
+        "check_unterminated_text_spanners",
+    ):
+        violators, total = getattr(abjad.wf, name)(staff)
+        name = name.replace("check_", "").replace("_", " ")
+        strings.append(f"{len(violators)} /    {total} {name}")
+
+    assert abjad.wf.tabulate_wellformedness(staff) == "\n".join(strings)
+    assert abjad.wf.tabulate_wellformedness(staff) == abjad.String.normalize(
+        """
+        2 /    6 beamed long notes
+        0 /    9 duplicate ids
+        1 /    3 empty containers
+        0 /    9 missing parents
+        6 /    6 notes on wrong clef
+        1 /    5 out of range pitches
+        1 /    2 overlapping text spanners
+        0 /    2 unmatched stop text spans
+        1 /    1 unterminated hairpins
+        1 /    2 unterminated text spanners
+        """
+    )
@@ -0,0 +1,125 @@
+import concurrent.futures
+
+import abjad
+
+
+def test_wf_wellformed_01():
+    """
+    Checks staves in parallel identically to serial checking.
+    """
+
+    staff_1 = abjad.Staff("c'4 d'4 c,,4 f'4", name="Staff_1")
+    staff_2 = abjad.Staff("g4 a4 b4 c'4", name="Staff_2")
+    staff_3 = abjad.Staff("c4 d4 e4 f4", name="Staff_3")
+    staff_group = abjad.StaffGroup([staff_2, staff_3])
+    score = abjad.Score([staff_1, staff_group])
+    abjad.attach(abjad.Violin(), staff_1[0])
+    abjad.attach(abjad.Cello(), staff_3[0])
+    abjad.attach(abjad.Clef("treble"), staff_3[0])
+    abjad.attach(abjad.StartBeam(), staff_2[0])
+    abjad.attach(abjad.StopBeam(), staff_2[1])
+
+    string = abjad.wf.tabulate_wellformedness(score)
+    assert abjad.wf.tabulate_wellformedness(score, workers=2) == string
+    assert abjad.wf.tabulate_wellformedness(score, cache=True, workers=2) == string
+    assert not abjad.wf.wellformed(score, workers=2)
+
+
+def test_wf_wellformed_02():
+    """
+    Cached checks equal fresh checks after score changes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    voice = abjad.Voice("g'8 a'8 b'8 c''8")
+    score = abjad.Score([staff, abjad.Staff([voice])])
+
+    def check():
+        string = abjad.wf.tabulate_wellformedness(score, cache=True)
+        assert string == abjad.wf.tabulate_wellformedness(score)
+
+    check()
+    abjad.attach(abjad.Violin(), staff[0])
+    check()
+    staff[2].written_pitch = "c,,"
+    check()
+    abjad.attach(abjad.Clef("bass"), staff[1])
+    check()
+    abjad.attach(abjad.Cello(), voice[0], context="Score")
+    check()
+    abjad.attach(abjad.StartBeam(), voice[0])
+    abjad.attach(abjad.StopBeam(), voice[1])
+    check()
+    voice[0].written_duration = abjad.Duration(1, 4)
+    check()
+    abjad.detach(abjad.Clef, staff[1])
+    check()
+    del voice[0]
+    check()
+    container = abjad.BeforeGraceContainer("c,,16")
+    abjad.attach(container, staff[-1])
+    check()
+
+
+def test_wf_wellformed_03():
+    """
+    Cached checks of one voice equal fresh checks after a sibling voice
+    moves a shared clef.
+    """
+
+    voice_1 = abjad.Voice("c'4 d'4 e'4 f'4", name="Voice_1")
+    voice_2 = abjad.Voice("c'4 d'4 e'4 f'4", name="Voice_2")
+    staff = abjad.Staff([voice_1, voice_2], simultaneous=True)
+    abjad.attach(abjad.Violin(), voice_1[0])
+    abjad.attach(abjad.Clef("treble"), voice_1[0])
+    abjad.attach(abjad.Clef("bass"), voice_1[2])
+
+    string = abjad.wf.tabulate_wellformedness(staff, cache=True)
+    assert "4 /    8 notes on wrong clef" in string
+    voice_1[0].written_duration = abjad.Duration(1, 2)
+    string = abjad.wf.tabulate_wellformedness(staff, cache=True)
+    assert "3 /    8 notes on wrong clef" in string
+    assert string == abjad.wf.tabulate_wellformedness(staff)
+
+
+def test_wf_wellformed_04(monkeypatch):
+    """
+    Checks top-level components in worker processes when more than one needs
+    checking; rechecks only changed components when cached.
+    """
+
+    calls = []
+
+    class ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+        def map(self, function, *iterables, **keywords):
+            indices = list(iterables[0])
+            calls.append((self._max_workers, indices))
+            return super().map(function, indices, **keywords)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", ProcessPoolExecutor)
+    staves = [abjad.Staff("c'4 d'4 c,,4 f'4") for _ in range(3)]
+    score = abjad.Score(staves)
+    abjad.attach(abjad.Violin(), staves[0][0])
+    abjad.attach(abjad.StartBeam(), staves[1][0])
+    abjad.attach(abjad.StopBeam(), staves[1][1])
+    string = abjad.wf.tabulate_wellformedness(score)
+    assert calls == []
+
+    assert abjad.wf.tabulate_wellformedness(score, workers=2) == string
+    assert calls == [(2, [0, 1, 2])]
+
+    calls.clear()
+    assert abjad.wf.tabulate_wellformedness(score, cache=True, workers=4) == string
+    assert calls == [(3, [0, 1, 2])]
+
+    calls.clear()
+    staves[1][2].written_pitch = "c'"
+    string = abjad.wf.tabulate_wellformedness(score)
+    assert abjad.wf.tabulate_wellformedness(score, cache=True, workers=4) == string
+    assert calls == []
+
+    staves[0][2].written_pitch = "c'"
+    staves[2][2].written_pitch = "c'"
+    string = abjad.wf.tabulate_wellformedness(score)
+    assert abjad.wf.tabulate_wellformedness(score, cache=True, workers=4) == string
+    assert calls == [(2, [0, 1])]